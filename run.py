@@ -9,6 +9,7 @@ Usage:
     python run.py --live       # live hardware mode (reads port from system_config.json)
     python run.py --live --port COM5  # live hardware on explicit port
     python run.py --no-3d      # disable 3D view if OpenGL unavailable
+    python run.py analyze FILE…  # headless analysis, JSON lines (no Qt)
 """
 import sys
 import os
@@ -22,6 +23,9 @@ from src.main import main
 def resolve_startup_args(argv: list[str]) -> list[str]:
     """Normalize convenience flags into args accepted by src.main."""
     resolved = list(argv)
+    if len(resolved) > 1 and resolved[1] == "analyze":
+        # Headless subcommand: GUI window defaults do not apply.
+        return resolved
 
     # Product default: open windowed on Overview so the first action is
     # real-data import. Demo mode is opt-in via --demo.
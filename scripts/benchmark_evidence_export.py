@@ -0,0 +1,125 @@
+"""
+Wall-clock benchmark for evidence package generation.
+
+Builds a synthetic three-phase session and times ``generate_evidence_package``
+and ``quick_export`` in serial mode (the pre-concurrency behaviour) and in the
+default process/thread mode.  It also prints the per-artifact timings of the
+serial run: the concurrent wall time is bounded below by the slowest artifact
+(the critical path) plus the assembly steps, given enough cores.
+
+Usage:
+    python scripts/benchmark_evidence_export.py --frames 200000 --repeat 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import src.export_tasks as export_tasks  # noqa: E402
+from src.export_tasks import EXPORT_MODE_ENV, export_mode, shutdown_export_workers  # noqa: E402
+from src.report_generator import generate_evidence_package  # noqa: E402
+from src.session_exporter import quick_export  # noqa: E402
+
+
+def _synthetic_capsule(n_frames: int, sample_rate: float = 10_000.0) -> dict:
+    t = np.arange(n_frames) / sample_rate
+    w = 2.0 * math.pi * 60.0 * t
+    peak = 120.0 * math.sqrt(2.0)
+    cols = {
+        "v_an": peak * np.sin(w),
+        "v_bn": peak * np.sin(w - 2.0 * math.pi / 3.0),
+        "v_cn": peak * np.sin(w + 2.0 * math.pi / 3.0),
+        "i_a": 10.0 * np.sin(w - 0.3),
+        "i_b": 10.0 * np.sin(w - 0.3 - 2.0 * math.pi / 3.0),
+        "i_c": 10.0 * np.sin(w - 0.3 + 2.0 * math.pi / 3.0),
+        "freq": 60.0 + 0.05 * np.sin(2.0 * math.pi * 0.5 * t),
+    }
+    names = list(cols)
+    rows = np.column_stack([t] + [cols[n] for n in names]).tolist()
+    frames = [dict(zip(["ts"] + names, row)) for row in rows]
+    return {
+        "meta": {"session_id": "bench", "frame_count": n_frames, "channels": names},
+        "frames": frames,
+        "events": [],
+        "import_meta": {},
+    }
+
+
+def _time(label: str, fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    print(f"  {label:<28} {best:7.2f} s")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=2)
+    args = parser.parse_args()
+
+    capsule = _synthetic_capsule(args.frames)
+    out = Path(tempfile.mkdtemp(prefix="evidence_bench_"))
+    print(f"{args.frames:,} frames, {os.cpu_count()} CPU(s) → {out}")
+
+    # Record the ExportRun of every export so per-task timings can be shown.
+    runs: list = []
+    original = export_tasks.run_export_tasks
+
+    def _recording(*a, **kw):
+        run = original(*a, **kw)
+        runs.append(run)
+        return run
+
+    import src.report_generator as report_generator
+    report_generator.run_export_tasks = _recording
+    export_tasks.run_export_tasks = _recording
+
+    timings: dict[str, dict[str, float]] = {}
+    for mode in ("serial", "processes"):
+        os.environ[EXPORT_MODE_ENV] = mode
+        print(f"[{mode} → effective '{export_mode()}']")
+        timings[mode] = {
+            "evidence_package": _time(
+                "generate_evidence_package",
+                lambda: generate_evidence_package(
+                    "", output_dir=str(out / mode / "package"), session_data=capsule,
+                ),
+                args.repeat,
+            ),
+            "quick_export": _time(
+                "quick_export",
+                lambda: quick_export(capsule, base_dir=str(out / mode / "quick")),
+                args.repeat,
+            ),
+        }
+        if mode == "serial":
+            for label, run in (("generate_evidence_package", runs[0]), ("quick_export", runs[-1])):
+                total = sum(run.durations.values())
+                slowest = max(run.durations, key=run.durations.get)
+                print(
+                    f"  {label}: artifacts {total:.2f} s serial, critical path "
+                    f"{run.durations[slowest]:.2f} s ({slowest})"
+                )
+    shutdown_export_workers()
+
+    for key in ("evidence_package", "quick_export"):
+        speedup = timings["serial"][key] / timings["processes"][key]
+        print(f"{key}: {speedup:.2f}x speedup")
+
+
+if __name__ == "__main__":
+    main()
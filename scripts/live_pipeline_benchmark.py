@@ -0,0 +1,169 @@
+"""
+End-to-end benchmark of the live telemetry pipeline under synthetic load.
+
+Starts ``scripts/telemetry_load_generator.py`` in a child process and
+connects a real :class:`~src.serial_reader.SerialManager` to it — OPAL-RT
+TCP or serial JSON lines over a pty — with the consumers of a live session:
+a :class:`~src.recorder.Recorder` as frame sink and an
+:class:`~ui.inverter_scope.InverterScope` on the display path, the GUI
+thread running a Qt event loop.  For each transport and rate it reports:
+
+  - frames sent, recorded, and the sustained recorded frame rate;
+  - frames lost (sent, never recorded) and dropped by the display queue;
+  - end-to-end latency, scheduled send → recorder sink (p50 / p99 / max);
+  - p99 latency to the scope's render (latency probes, see
+    :mod:`src.latency_probe`);
+  - how far the generator fell behind its schedule.
+
+Usage:
+    python scripts/live_pipeline_benchmark.py --transports opal,serial --rates 1000,5000,20000
+    python scripts/live_pipeline_benchmark.py --rates 20000 --pattern burst --burst-size 1000 --json out.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np  # noqa: E402
+from PyQt6.QtCore import QEventLoop, QTimer  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from scripts.telemetry_load_generator import PATTERNS, TRANSPORTS, LoadProcess, LoadProfile  # noqa: E402
+from src.frame_queue import DEFAULT_POLICY, POLICIES  # noqa: E402
+from src.recorder import Recorder  # noqa: E402
+from src.serial_reader import SerialManager  # noqa: E402
+
+DRAIN_TIMEOUT_S = 3.0               # wait for stragglers after the sender stops
+
+
+class _ArrivalSink:
+    """Frame sink noting when each frame reached the end of the reader thread."""
+
+    def __init__(self):
+        self.batches: list[tuple[float, list[float]]] = []
+
+    def __call__(self, frames: list[dict]) -> None:
+        self.batches.append((time.time(), [f["ts"] for f in frames]))
+
+    def latencies_ms(self) -> np.ndarray:
+        if not self.batches:
+            return np.zeros(0)
+        return np.concatenate([1000.0 * (arrived - np.asarray(ts)) for arrived, ts in self.batches])
+
+    def span_s(self) -> float:
+        return self.batches[-1][0] - self.batches[0][0] if len(self.batches) > 1 else 0.0
+
+
+def _run_event_loop(until, timeout_s: float) -> None:
+    """Run the Qt event loop until *until()* is true or *timeout_s* passes."""
+    loop = QEventLoop()
+    deadline = time.monotonic() + timeout_s
+    timer = QTimer()
+    timer.timeout.connect(lambda: (until() or time.monotonic() > deadline) and loop.quit())
+    timer.start(20)
+    loop.exec()
+    timer.stop()
+
+
+def run_case(transport: str, profile: LoadProfile, queue_policy: str = DEFAULT_POLICY,
+             acquisition_process: bool = False) -> dict:
+    """Load a live SerialManager from the generator; return throughput, loss and latency."""
+    from ui.inverter_scope import InverterScope
+
+    generator = LoadProcess(transport, profile)
+    endpoint = generator.start()
+    mgr = SerialManager(queue_policy=queue_policy)
+    mgr.latency_probes.enabled = True
+    scope = InverterScope(mgr)
+    arrivals = _ArrivalSink()
+    with tempfile.TemporaryDirectory() as tmp:
+        recorder = Recorder(data_dir=tmp)
+        recorder.start()
+        mgr.add_frame_sink(recorder.log_frames)
+        mgr.add_frame_sink(arrivals)
+        try:
+            mgr.connect_serial(endpoint, protocol="json", acquisition_process=acquisition_process)
+            if not mgr.running:
+                raise RuntimeError(f"{transport}: could not connect to {endpoint}")
+            generator.begin()
+            _run_event_loop(generator.done, profile.duration_s + 60.0)
+            sent = generator.finish()
+            _run_event_loop(lambda: recorder.frame_count >= sent.frames_sent, DRAIN_TIMEOUT_S)
+            stats = mgr.get_live_stats()
+            recorded = recorder.frame_count
+        finally:
+            mgr.stop()
+            QApplication.processEvents()
+            generator.close()
+            scope.render_timer.stop()
+            recorder.stop()
+
+    latency = arrivals.latencies_ms()
+    rendered = mgr.latency_probes.summary()["rendered"]
+    span = arrivals.span_s()
+    return {
+        "transport": transport,
+        "profile": asdict(profile),
+        "acquisition_process": acquisition_process,
+        "sent": sent.frames_sent,
+        "sender_fps": round(sent.fps, 1),
+        "sender_lag_ms_max": sent.lag_ms_max,
+        "recorded": recorded,
+        "recorded_fps": round(recorded / span, 1) if span else 0.0,
+        "lost": sent.frames_sent - recorded,
+        "display_dropped": stats.frames_dropped,
+        "e2e_ms_p50": round(float(np.percentile(latency, 50)), 2) if latency.size else 0.0,
+        "e2e_ms_p99": round(float(np.percentile(latency, 99)), 2) if latency.size else 0.0,
+        "e2e_ms_max": round(float(latency.max()), 2) if latency.size else 0.0,
+        "render_ms_p99": rendered["p99_ms"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--transports", default="opal,serial",
+                        help=f"comma-separated, from {', '.join(TRANSPORTS)}")
+    parser.add_argument("--rates", default="1000,5000,20000", help="comma-separated frames/s")
+    parser.add_argument("--channels", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per case")
+    parser.add_argument("--pattern", choices=PATTERNS, default="steady")
+    parser.add_argument("--burst-size", type=int, default=100)
+    parser.add_argument("--on-s", type=float, default=0.5)
+    parser.add_argument("--off-s", type=float, default=0.5)
+    parser.add_argument("--queue-policy", choices=POLICIES, default=DEFAULT_POLICY)
+    parser.add_argument("--acquisition-process", action="store_true",
+                        help="acquire in a child process (see src.process_acquisition)")
+    parser.add_argument("--json", type=Path, help="also write the results here")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+
+    results = []
+    print(f"{'transport':<10}{'rate':>8}{'sent':>9}{'recorded':>10}{'rec fps':>10}{'lost':>7}"
+          f"{'dropped':>9}{'e2e p50':>10}{'e2e p99':>10}{'e2e max':>10}{'render p99':>12}{'lag max':>10}")
+    for transport in args.transports.split(","):
+        for rate in (float(r) for r in args.rates.split(",")):
+            profile = LoadProfile(rate, args.channels, args.duration, args.pattern,
+                                  args.burst_size, args.on_s, args.off_s)
+            r = run_case(transport, profile, args.queue_policy, args.acquisition_process)
+            results.append(r)
+            print(f"{transport:<10}{rate:>8.0f}{r['sent']:>9}{r['recorded']:>10}{r['recorded_fps']:>10.0f}"
+                  f"{r['lost']:>7}{r['display_dropped']:>9}{r['e2e_ms_p50']:>7.1f} ms{r['e2e_ms_p99']:>7.1f} ms"
+                  f"{r['e2e_ms_max']:>7.1f} ms{r['render_ms_p99']:>9.1f} ms{r['sender_lag_ms_max']:>7.1f} ms")
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
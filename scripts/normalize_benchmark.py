@@ -0,0 +1,91 @@
+"""
+Per-frame cost of ``normalize_frame`` with and without compiled schemas.
+
+Normalizes ``--frames`` frames (default 1M) of each typical source shape —
+canonical keys as the demo / OPAL-RT paths send them, and Arduino-style
+aliases with unit scaling — once key by key (the reference
+implementation) and once through the schema compiled for the key set (frame
+by frame, and in batches through ``normalize_frames`` as the reader thread
+calls it), and reports the cost per frame.  The outputs of both paths are checked to be
+identical first.
+
+Usage:
+    python scripts/normalize_benchmark.py --frames 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.models import _normalize_uncompiled, normalize_frame, normalize_frames  # noqa: E402
+
+POOL = 1000             # distinct frames per shape, cycled to reach --frames
+BATCH = 100             # frames per read_frames() call, for the batch path
+
+
+def canonical_frames(n: int) -> list[dict]:
+    frames = []
+    for k in range(n):
+        t = 1.0 + k / 10_000.0
+        w = 2.0 * math.pi * 60.0 * t
+        frames.append({
+            "ts": t,
+            "v_an": 169.7 * math.sin(w), "v_bn": 169.7 * math.sin(w - 2.0944),
+            "v_cn": 169.7 * math.sin(w + 2.0944),
+            "i_a": 7.07 * math.sin(w - 0.1), "i_b": 7.07 * math.sin(w - 2.1944),
+            "i_c": 7.07 * math.sin(w + 1.9944),
+            "freq": 60.0, "p_mech": 1000.0, "angle": (k * 2.16) % 360.0, "fault_type": None,
+        })
+    return frames
+
+
+def arduino_frames(n: int) -> list[dict]:
+    return [{"t_ms": 1000 + k, "vdc": 400.0 + k % 7, "Ia": 0.5, "f": 60.0, "p_kw": 1.2, "q_kvar": 0.1}
+            for k in range(n)]
+
+
+def per_frame_us(normalize, pool: list[dict], n_frames: int) -> float:
+    rounds = max(1, n_frames // len(pool))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for raw in pool:
+            normalize(raw)
+    return (time.perf_counter() - start) / (rounds * len(pool)) * 1e6
+
+
+def batch_per_frame_us(pool: list[dict], n_frames: int) -> float:
+    batches = [pool[i:i + BATCH] for i in range(0, len(pool), BATCH)]
+    rounds = max(1, n_frames // len(pool))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for batch in batches:
+            normalize_frames(batch)
+    return (time.perf_counter() - start) / (rounds * len(pool)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--frames", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{'source':<12}{'key by key':>14}{'compiled':>12}{'batch':>12}{'speed-up':>10}")
+    for name, pool in (("canonical", canonical_frames(POOL)), ("arduino", arduino_frames(POOL))):
+        for raw in pool:
+            expected, actual = _normalize_uncompiled(raw), normalize_frame(raw)
+            if expected != actual or list(expected) != list(actual):
+                raise SystemExit(f"{name}: compiled output differs for {raw}")
+        reference = per_frame_us(_normalize_uncompiled, pool, args.frames)
+        compiled = per_frame_us(normalize_frame, pool, args.frames)
+        batch = batch_per_frame_us(pool, args.frames)
+        print(f"{name:<12}{reference:>11.2f} us{compiled:>9.2f} us{batch:>9.2f} us"
+              f"{reference / compiled:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
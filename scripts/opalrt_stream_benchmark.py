@@ -0,0 +1,154 @@
+"""
+Throughput benchmark for the OPAL-RT TCP telemetry path.
+
+A local stand-in for OPAL-RT's asynchronous data server accepts one
+connection and streams length-prefixed JSON frames (4-byte big-endian
+length + payload) at a configurable rate.  A real
+:class:`~src.io_adapter.OpalRTAdapter` reads them, so the socket, framing
+and decoding paths are exactly those used against the simulator.  For each
+rate the script reports the frame rate and payload bandwidth the adapter
+sustained and whether it kept up with the sender.
+
+Usage:
+    python scripts/opalrt_stream_benchmark.py --frames 50000 --rates 0,20000,100000
+    (rate 0 = unthrottled)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import socket
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.io_adapter import OpalRTAdapter  # noqa: E402
+
+CHANNELS = ("v_an", "v_bn", "v_cn", "i_a", "i_b", "i_c", "freq", "p_mech")
+_HEADER = struct.Struct(OpalRTAdapter.HEADER_FMT)
+
+
+def message(k: int, rate_hz: float = 10_000.0) -> bytes:
+    """One length-prefixed frame as the simulator sends it."""
+    t = k / rate_hz
+    w = 2.0 * math.pi * 60.0 * t
+    peak = 120.0 * math.sqrt(2.0)
+    values = (
+        peak * math.sin(w), peak * math.sin(w - 2.0944), peak * math.sin(w + 2.0944),
+        7.07 * math.sin(w - 0.1), 7.07 * math.sin(w - 2.1944), 7.07 * math.sin(w + 1.9944),
+        60.0, 1000.0,
+    )
+    frame = {"ts": round(t, 6), **{ch: round(v, 4) for ch, v in zip(CHANNELS, values)}}
+    payload = json.dumps(frame).encode("utf-8")
+    return _HEADER.pack(len(payload)) + payload
+
+
+class OpalRTStandIn:
+    """Local TCP server streaming *n_frames* messages at *rate_hz* (0 = as fast as possible)."""
+
+    SEND_CHUNK_BYTES = 64 * 1024
+
+    def __init__(self, n_frames: int, rate_hz: float = 0.0, messages: list[bytes] | None = None):
+        self.messages = messages if messages is not None else [message(k) for k in range(n_frames)]
+        self.rate_hz = rate_hz
+        self._server = socket.create_server(("127.0.0.1", 0))
+        self.host, self.port = self._server.getsockname()[:2]
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "OpalRTStandIn":
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        try:
+            conn, _ = self._server.accept()
+        except OSError:
+            return                        # closed before a client connected
+        with conn:
+            try:
+                if self.rate_hz > 0:
+                    self._paced(conn)
+                else:
+                    data = b"".join(self.messages)
+                    for i in range(0, len(data), self.SEND_CHUNK_BYTES):
+                        conn.sendall(data[i:i + self.SEND_CHUNK_BYTES])
+                time.sleep(0.2)           # let the client drain before FIN
+            except OSError:
+                pass                      # client went away
+
+    def _paced(self, conn: socket.socket) -> None:
+        sent = 0
+        start = time.perf_counter()
+        total = len(self.messages)
+        while sent < total:
+            due = min(total, int((time.perf_counter() - start) * self.rate_hz) + 1)
+            if due > sent:
+                conn.sendall(b"".join(self.messages[sent:due]))
+                sent = due
+            else:
+                time.sleep(0.0005)
+
+    def close(self) -> None:
+        self._server.close()
+
+
+def run_stream(n_frames: int, rate_hz: float = 0.0, per_frame: bool = False,
+               timeout: float = 60.0, messages: list[bytes] | None = None) -> dict:
+    """Stream *n_frames* through the stand-in into ``OpalRTAdapter``; return rates."""
+    server = OpalRTStandIn(n_frames, rate_hz, messages).start()
+    adapter = OpalRTAdapter()
+    try:
+        if not adapter.connect({"host": server.host, "port": server.port, "timeout": 1.0}):
+            raise RuntimeError("connect to stand-in failed")
+        received = []
+        start = time.perf_counter()
+        deadline = start + timeout
+        while len(received) < n_frames and time.perf_counter() < deadline:
+            if per_frame:
+                frame = adapter.read_frame()
+                if frame:
+                    received.append(frame)
+            else:
+                received.extend(adapter.read_frames())
+        elapsed = time.perf_counter() - start
+        payload_bytes = sum(len(m) for m in server.messages[:len(received)])
+        return {
+            "frames": len(received),
+            "seconds": elapsed,
+            "fps": len(received) / elapsed if elapsed else 0.0,
+            "mb_s": payload_bytes / elapsed / 1e6 if elapsed else 0.0,
+            "first": received[0] if received else None,
+            "last": received[-1] if received else None,
+            "malformed": adapter.malformed_messages,
+        }
+    finally:
+        adapter.disconnect()
+        server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--frames", type=int, default=50_000)
+    parser.add_argument("--rates", default="0,20000,100000",
+                        help="comma-separated sender rates in frames/s (0 = unthrottled)")
+    parser.add_argument("--per-frame", action="store_true",
+                        help="read with read_frame() instead of read_frames()")
+    args = parser.parse_args()
+
+    messages = [message(k) for k in range(args.frames)]
+    print(f"{'sender fps':>12}{'received':>10}{'host fps':>12}{'MB/s':>8}  kept up")
+    for rate in (float(r) for r in args.rates.split(",")):
+        result = run_stream(args.frames, rate, args.per_frame, messages=messages)
+        kept_up = "yes" if rate == 0 or result["fps"] >= 0.95 * rate else "no"
+        label = "max" if rate == 0 else f"{rate:.0f}"
+        print(f"{label:>12}{result['frames']:>10}{result['fps']:>12.0f}{result['mb_s']:>8.1f}  {kept_up}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Loopback benchmark for the serial telemetry protocols.
+
+A device emulator thread drives the master side of a pseudo-terminal and a
+real :class:`~src.io_adapter.SerialAdapter` (pyserial) reads the slave side,
+so the handshake, framing and parsing paths are exactly those used against
+hardware.  For each protocol the script reports:
+
+  - bytes per 8-channel sample on the wire and the frame rate that fits in
+    ``--baud`` (8N1: 10 bits per byte);
+  - the host-side frame rate through the pty with the link unthrottled,
+    i.e. what the parser sustains;
+  - the pure decode rate on an in-memory buffer.
+
+POSIX only (uses :mod:`pty`).
+
+Usage:
+    python scripts/serial_loopback_benchmark.py --frames 20000 --baud 115200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.binary_protocol import FrameDecoder, FrameEncoder  # noqa: E402
+from src.io_adapter import SerialAdapter  # noqa: E402
+
+CHANNELS = ("v_an", "v_bn", "v_cn", "i_a", "i_b", "i_c", "freq", "p_mech")
+
+
+def _sample(k: int, rate_hz: float = 10_000.0) -> tuple[float, list[float]]:
+    t = k / rate_hz
+    w = 2.0 * math.pi * 60.0 * t
+    peak = 120.0 * math.sqrt(2.0)
+    return t, [
+        peak * math.sin(w), peak * math.sin(w - 2.0944), peak * math.sin(w + 2.0944),
+        7.07 * math.sin(w - 0.1), 7.07 * math.sin(w - 2.1944), 7.07 * math.sin(w + 1.9944),
+        60.0, 1000.0,
+    ]
+
+
+def json_stream(n_frames: int) -> bytes:
+    """Newline-delimited JSON as typical firmware writes it (3 decimals)."""
+    lines = []
+    for k in range(n_frames):
+        ts, values = _sample(k)
+        frame = {"ts": round(ts, 6), **{ch: round(v, 3) for ch, v in zip(CHANNELS, values)}}
+        lines.append(json.dumps(frame).encode("utf-8") + b"\n")
+    return b"".join(lines)
+
+
+def binary_stream(n_frames: int, batch: int, encoder: FrameEncoder | None = None) -> bytes:
+    """Binary sample frames carrying *batch* samples each (no channel map)."""
+    encoder = encoder or FrameEncoder(CHANNELS)
+    chunks = []
+    for start in range(0, n_frames, batch):
+        chunks.append(encoder.samples(_sample(k) for k in range(start, min(n_frames, start + batch))))
+    return b"".join(chunks)
+
+
+class PtyDevice:
+    """Device emulator on the master side of a pseudo-terminal."""
+
+    def __init__(self, protocol: str, n_frames: int, batch: int = 1):
+        import pty
+        import tty
+
+        self.protocol = protocol
+        self.n_frames = n_frames
+        self.batch = batch
+        self.master, self._slave = pty.openpty()
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "PtyDevice":
+        self._thread.start()
+        return self
+
+    def _read_command_line(self) -> bytes:
+        line = b""
+        while not line.endswith(b"\n"):
+            line += os.read(self.master, 1)
+        return line
+
+    def _run(self) -> None:
+        try:
+            if self.protocol == "binary":
+                request = self._read_command_line()
+                assert b"set_protocol" in request, request
+                encoder = FrameEncoder(CHANNELS)
+                payload = encoder.channel_map() + binary_stream(self.n_frames, self.batch, encoder)
+            else:
+                time.sleep(0.05)          # let the host finish opening the port
+                payload = json_stream(self.n_frames)
+            view = memoryview(payload)
+            while view:
+                written = os.write(self.master, view[:4096])
+                view = view[written:]
+        except OSError:
+            pass                          # host closed the port
+
+    def close(self) -> None:
+        for fd in (self._slave, self.master):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+def run_loopback(protocol: str, n_frames: int, batch: int = 1, timeout: float = 60.0) -> dict:
+    """Stream *n_frames* through a pty into ``SerialAdapter``; return rates."""
+    device = PtyDevice(protocol, n_frames, batch)
+    adapter = SerialAdapter()
+    try:
+        device.start()
+        if not adapter.connect({"port": device.port, "protocol": protocol, "handshake_timeout": 2.0}):
+            raise RuntimeError(f"{protocol}: connect failed")
+        received = []
+        start = time.perf_counter()
+        deadline = start + timeout
+        while len(received) < n_frames and time.perf_counter() < deadline:
+            frame = adapter.read_frame()
+            if frame:
+                received.append(frame)
+        elapsed = time.perf_counter() - start
+        return {
+            "protocol": adapter.protocol,
+            "frames": len(received),
+            "seconds": elapsed,
+            "fps": len(received) / elapsed if elapsed else 0.0,
+            "last": received[-1] if received else None,
+            "stats": adapter.protocol_stats,
+        }
+    finally:
+        adapter.disconnect()
+        device.close()
+
+
+def _decode_rate(protocol: str, n_frames: int, batch: int) -> float:
+    if protocol == "json":
+        data = json_stream(n_frames)
+        start = time.perf_counter()
+        for line in data.splitlines():
+            json.loads(line)
+    else:
+        decoder = FrameDecoder(CHANNELS)
+        data = binary_stream(n_frames, batch)
+        start = time.perf_counter()
+        decoder.feed(data)
+    return n_frames / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--frames", type=int, default=20_000)
+    parser.add_argument("--baud", type=int, default=115_200)
+    parser.add_argument("--batch", type=int, default=10, help="samples per binary frame")
+    args = parser.parse_args()
+
+    bytes_per_s = args.baud / 10.0
+    cases = [("json", 1), ("binary", 1), ("binary", args.batch)]
+    print(f"{'protocol':<18}{'B/sample':>10}{'wire fps':>12}{'pty fps':>12}{'decode fps':>14}")
+    for protocol, batch in cases:
+        sample_bytes = (
+            len(json_stream(100)) / 100 if protocol == "json"
+            else len(binary_stream(100 * batch, batch)) / (100 * batch)
+        )
+        loop = run_loopback(protocol, args.frames, batch)
+        label = protocol if protocol == "json" else f"binary x{batch}"
+        print(
+            f"{label:<18}{sample_bytes:>10.1f}{bytes_per_s / sample_bytes:>12.0f}"
+            f"{loop['fps']:>12.0f}{_decode_rate(protocol, args.frames, batch):>14.0f}"
+        )
+        if loop["frames"] != args.frames:
+            print(f"  warning: received {loop['frames']} of {args.frames} frames")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""
+High-rate synthetic telemetry load generator.
+
+Serves frames the way the rigs do, at 1–20 kHz and beyond:
+
+  - ``opal``: OPAL-RT's asynchronous data server — a TCP server sending
+    length-prefixed JSON (4-byte big-endian length + payload) to the first
+    client that connects;
+  - ``serial``: newline-delimited JSON as the serial firmware writes it, on
+    the master side of a pseudo-terminal whose slave path is the "port"
+    (POSIX only).
+
+The load is shaped by :class:`LoadProfile`: frame rate, channel count
+(three-phase V/I, frequency and power, then ``aux_NN`` channels) and a
+pattern — ``steady`` (evenly paced), ``burst`` (``burst_size`` frames at
+once, same average rate) or ``on_off`` (``rate_hz`` for ``on_s``, then
+silent for ``off_s``).  Each frame's ``ts`` is the host wall-clock time it
+was scheduled for, so a consumer can measure end-to-end latency as
+``time.time() - frame["ts"]``; the generator reports how far behind
+schedule it fell when the consumer did not keep up.
+
+Channel values are precomputed for one 60 Hz cycle, so the generator costs
+little CPU next to the pipeline it loads.
+
+Usage:
+    python scripts/telemetry_load_generator.py opal --port 5100 --rate 20000 --channels 16
+    python scripts/telemetry_load_generator.py serial --rate 5000 --pattern burst --burst-size 250
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import multiprocessing as mp
+import os
+import socket
+import struct
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.io_adapter import OpalRTAdapter  # noqa: E402
+
+TRANSPORTS = ("opal", "serial")
+PATTERNS = ("steady", "burst", "on_off")
+BASE_CHANNELS = ("v_an", "v_bn", "v_cn", "i_a", "i_b", "i_c", "freq", "p_mech")
+_HEADER = struct.Struct(OpalRTAdapter.HEADER_FMT)
+_MAX_CHUNK_FRAMES = 2_000           # frames per write when catching up
+_MAX_CYCLE_FRAMES = 20_000          # precomputed samples of the 60 Hz cycle
+
+
+@dataclass
+class LoadProfile:
+    """Rate, width and timing pattern of the generated stream."""
+    rate_hz: float = 1_000.0
+    channels: int = 8
+    duration_s: float = 5.0
+    pattern: str = "steady"
+    burst_size: int = 100           # frames per burst ("burst")
+    on_s: float = 0.5               # "on_off" windows
+    off_s: float = 0.5
+
+    def __post_init__(self):
+        if self.pattern not in PATTERNS:
+            raise ValueError(f"unknown pattern '{self.pattern}', expected one of {PATTERNS}")
+        if self.rate_hz <= 0 or self.channels <= 0 or self.burst_size <= 0:
+            raise ValueError("rate_hz, channels and burst_size must be positive")
+
+    def channel_names(self) -> tuple[str, ...]:
+        extra = max(0, self.channels - len(BASE_CHANNELS))
+        return BASE_CHANNELS[:self.channels] + tuple(f"aux_{i:02d}" for i in range(extra))
+
+    def send_time(self, k: int) -> float:
+        """Seconds after the start at which frame *k* is due."""
+        if self.pattern == "burst":
+            return (k // self.burst_size) * self.burst_size / self.rate_hz
+        if self.pattern == "on_off":
+            per_window = self._frames_per_window()
+            window, index = divmod(k, per_window)
+            return window * (self.on_s + self.off_s) + index / self.rate_hz
+        return k / self.rate_hz
+
+    def frames_due(self, elapsed: float) -> int:
+        """Number of frames due by *elapsed* seconds after the start."""
+        if elapsed < 0:
+            return 0
+        if self.pattern == "burst":
+            return (int(elapsed * self.rate_hz / self.burst_size) + 1) * self.burst_size
+        if self.pattern == "on_off":
+            per_window = self._frames_per_window()
+            window, within = divmod(elapsed, self.on_s + self.off_s)
+            in_window = min(per_window, int(within * self.rate_hz) + 1) if within < self.on_s else per_window
+            return int(window) * per_window + in_window
+        return int(elapsed * self.rate_hz) + 1
+
+    def total_frames(self) -> int:
+        return self.frames_due(max(0.0, self.duration_s - 1e-9))
+
+    def _frames_per_window(self) -> int:
+        return max(1, round(self.on_s * self.rate_hz))
+
+
+@dataclass
+class LoadStats:
+    """What the generator sent (a snapshot)."""
+    frames_sent: int = 0
+    bytes_sent: int = 0
+    seconds: float = 0.0
+    lag_ms_max: float = 0.0         # furthest behind schedule a write started
+
+    @property
+    def fps(self) -> float:
+        return self.frames_sent / self.seconds if self.seconds else 0.0
+
+
+class FrameEncoder:
+    """Wire bytes for frames *k*; values repeat every 60 Hz cycle."""
+
+    def __init__(self, profile: LoadProfile, transport: str):
+        if transport not in TRANSPORTS:
+            raise ValueError(f"unknown transport '{transport}', expected one of {TRANSPORTS}")
+        self.transport = transport
+        names = profile.channel_names()
+        cycle = max(1, min(_MAX_CYCLE_FRAMES, round(profile.rate_hz / 60.0)))
+        self._bodies = []
+        for k in range(cycle):
+            w = 2.0 * math.pi * k / cycle
+            values = dict(zip(names, _channel_values(w, len(names))))
+            # everything after '{"ts": <value>'
+            self._bodies.append((", " + json.dumps(values)[1:]).encode("utf-8"))
+
+    def encode(self, start: int, stop: int, t0: float, send_time) -> bytes:
+        bodies = self._bodies
+        cycle = len(bodies)
+        parts = []
+        for k in range(start, stop):
+            payload = b'{"ts": %.6f' % (t0 + send_time(k)) + bodies[k % cycle]
+            if self.transport == "opal":
+                parts.append(_HEADER.pack(len(payload)))
+                parts.append(payload)
+            else:
+                parts.append(payload)
+                parts.append(b"\n")
+        return b"".join(parts)
+
+
+def _channel_values(w: float, n: int) -> list[float]:
+    peak = 120.0 * math.sqrt(2.0)
+    values = [
+        peak * math.sin(w), peak * math.sin(w - 2.0944), peak * math.sin(w + 2.0944),
+        7.07 * math.sin(w - 0.1), 7.07 * math.sin(w - 2.1944), 7.07 * math.sin(w + 1.9944),
+        60.0, 1000.0,
+    ]
+    values += [math.sin(w * (2 + i)) for i in range(max(0, n - len(values)))]
+    return [round(v, 4) for v in values[:n]]
+
+
+def stream(write, profile: LoadProfile, transport: str, stop=None) -> LoadStats:
+    """Write *profile*'s frames with *write(bytes)* on schedule; return what was sent.
+
+    *stop* (an Event) ends the stream early.  ``duration_s`` 0 streams until
+    *stop* is set.
+    """
+    encoder = FrameEncoder(profile, transport)
+    total = profile.total_frames() if profile.duration_s > 0 else None
+    stats = LoadStats()
+    t0 = time.time()
+    start = time.perf_counter()
+    sent = 0
+    while (total is None or sent < total) and not (stop is not None and stop.is_set()):
+        elapsed = time.perf_counter() - start
+        due = profile.frames_due(elapsed)
+        if total is not None:
+            due = min(total, due)
+        due = min(due, sent + _MAX_CHUNK_FRAMES)
+        if due > sent:
+            stats.lag_ms_max = max(stats.lag_ms_max, 1000.0 * (elapsed - profile.send_time(sent)))
+            data = encoder.encode(sent, due, t0, profile.send_time)
+            write(data)
+            stats.bytes_sent += len(data)
+            sent = due
+            stats.frames_sent = sent
+        else:
+            time.sleep(min(0.001, max(0.0, profile.send_time(sent) - elapsed)))
+    stats.seconds = time.perf_counter() - start
+    stats.lag_ms_max = round(stats.lag_ms_max, 3)
+    return stats
+
+
+# ── Transports ───────────────────────────────────────────────────────────────
+
+class OpalRTLoadServer:
+    """OPAL-RT data server stand-in; streams to the first client that connects."""
+
+    def __init__(self, profile: LoadProfile, host: str = "127.0.0.1", port: int = 0):
+        self.profile = profile
+        self._server = socket.create_server((host, port))
+        self.host, self.port = self._server.getsockname()[:2]
+
+    @property
+    def endpoint(self) -> str:
+        """Port name for ``SerialManager.connect_serial``."""
+        return f"OPAL:{self.host}:{self.port}"
+
+    def serve(self, start=None, stop=None) -> LoadStats:
+        """Accept one client, wait for *start* (an Event) if given, then stream."""
+        conn, _ = self._server.accept()
+        with conn:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if start is not None:
+                start.wait()
+            try:
+                return stream(conn.sendall, self.profile, "opal", stop)
+            except OSError:
+                return LoadStats()              # client went away
+
+    def close(self) -> None:
+        self._server.close()
+
+
+class PtyLoadDevice:
+    """Serial firmware stand-in on the master side of a pseudo-terminal."""
+
+    def __init__(self, profile: LoadProfile):
+        import pty
+        import tty
+
+        self.profile = profile
+        self.master, self._slave = pty.openpty()
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+
+    @property
+    def endpoint(self) -> str:
+        return self.port
+
+    def serve(self, start=None, stop=None) -> LoadStats:
+        """Wait for *start* if given, then stream (writes block while nobody reads)."""
+        if start is not None:
+            start.wait()
+
+        def write(data: bytes) -> None:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self.master, view):]
+
+        try:
+            return stream(write, self.profile, "serial", stop)
+        except OSError:
+            return LoadStats()                  # port closed
+
+    def close(self) -> None:
+        for fd in (self._slave, self.master):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+def open_transport(transport: str, profile: LoadProfile, port: int = 0):
+    if transport == "opal":
+        return OpalRTLoadServer(profile, port=port)
+    if transport == "serial":
+        return PtyLoadDevice(profile)
+    raise ValueError(f"unknown transport '{transport}', expected one of {TRANSPORTS}")
+
+
+# ── Child process ────────────────────────────────────────────────────────────
+
+def _generator_main(transport, profile, conn, start, stop):
+    device = open_transport(transport, profile)
+    conn.send(device.endpoint)
+    try:
+        conn.send(device.serve(start, stop))
+        if transport == "serial":
+            stop.wait()                         # keep the pty open until the reader is done
+    finally:
+        device.close()
+
+
+class LoadProcess:
+    """The generator in a child process, so it does not share the consumer's GIL.
+
+    ``start()`` returns the endpoint to connect to; streaming begins at
+    ``begin()``; ``finish()`` waits for the stream to end and returns its
+    :class:`LoadStats`.
+    """
+
+    def __init__(self, transport: str, profile: LoadProfile):
+        ctx = mp.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self._start = ctx.Event()
+        self._stop = ctx.Event()
+        self._process = ctx.Process(
+            target=_generator_main,
+            args=(transport, profile, child_conn, self._start, self._stop),
+            name="telemetry-load-generator",
+            daemon=True,
+        )
+        self._stats = None
+
+    def start(self, timeout: float = 15.0) -> str:
+        self._process.start()
+        if not self._conn.poll(timeout):
+            self.close()
+            raise RuntimeError("load generator did not start")
+        return self._conn.recv()
+
+    def begin(self) -> None:
+        self._start.set()
+
+    def done(self) -> bool:
+        return self._stats is not None or self._conn.poll()
+
+    def finish(self, timeout: float = 60.0) -> LoadStats:
+        if self._stats is None:
+            if not self._conn.poll(timeout):
+                self._stop.set()
+                self._conn.poll(5.0)
+            self._stats = self._conn.recv() if self._conn.poll() else LoadStats()
+        return self._stats
+
+    def close(self) -> None:
+        self._start.set()
+        self._stop.set()
+        self._process.join(timeout=5.0)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("transport", choices=TRANSPORTS)
+    parser.add_argument("--rate", type=float, default=1_000.0, help="frames/s")
+    parser.add_argument("--channels", type=int, default=8)
+    parser.add_argument("--pattern", choices=PATTERNS, default="steady")
+    parser.add_argument("--burst-size", type=int, default=100)
+    parser.add_argument("--on-s", type=float, default=0.5)
+    parser.add_argument("--off-s", type=float, default=0.5)
+    parser.add_argument("--duration", type=float, default=0.0, help="seconds (0 = until Ctrl+C)")
+    parser.add_argument("--port", type=int, default=5100, help="TCP port (opal)")
+    args = parser.parse_args()
+
+    profile = LoadProfile(args.rate, args.channels, args.duration, args.pattern,
+                          args.burst_size, args.on_s, args.off_s)
+    device = open_transport(args.transport, profile, args.port)
+    print(f"Serving {args.transport} at {device.endpoint}  {asdict(profile)}")
+    if args.transport == "opal":
+        print("Waiting for a client…")
+    try:
+        stats = device.serve()
+    except KeyboardInterrupt:
+        print("\nStopped.")
+        return
+    finally:
+        device.close()
+    print(f"Sent {stats.frames_sent:,} frames in {stats.seconds:.1f} s "
+          f"({stats.fps:,.0f} fps, {stats.bytes_sent / 1e6:.1f} MB), "
+          f"max {stats.lag_ms_max:.1f} ms behind schedule")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+"""
+Asyncio acquisition core: several telemetry adapters at once.
+
+:class:`MultiSourceAdapter` runs one asyncio event loop on its own thread and
+reads every configured :class:`AcquisitionSource` concurrently:
+
+  - adapters with a selectable transport (serial port, TCP socket — see
+    :meth:`~src.io_adapter.IOAdapter.fileno`) are switched to non-blocking
+    reads and serviced from ``loop.add_reader`` callbacks, so no source
+    ever waits on another's I/O;
+  - other adapters (e.g. :class:`~src.io_adapter.DemoAdapter`, which paces
+    itself with ``sleep``) are polled on a dedicated single-thread executor
+    each.
+
+Frames are put on a common host-clock timeline and merged in timestamp
+order.  A frame is released once every *live* source has reported a later
+timestamp; a source that has been silent for ``max_skew_s`` stops holding
+the others back, so a slow or stalled sibling costs the rest at most
+``max_skew_s`` of latency.  Each merged frame carries ``source`` (the source
+name) and ``device_ts`` (the timestamp the device sent).
+
+With ``merge=False`` the core skips the merge: every source's frames are
+handed over as soon as they are read, in order within the source but
+interleaved across sources by arrival.  Nothing waits on a sibling, so each
+adapter's latency is its own — use it when consumers tell sources apart by
+``source`` and don't need one global time order.
+
+A frame only carries the channels its own source sent (``frames_sparse``):
+:class:`~src.serial_reader.SerialManager` leaves the other sources'
+channels absent rather than zero-filling them.
+
+Frames arrive at the time their source adapter took them off its transport
+(its ``received_at`` stamp, else when its read returned).  ``read_frames``
+sets ``received_at`` to the oldest arrival among the frames it returns, so
+latency probes (:mod:`src.latency_probe`) include the wait in the merge.
+
+Per-source counters are available from :meth:`MultiSourceAdapter.source_stats`.
+
+To the rest of the application the core is just another
+:class:`~src.io_adapter.IOAdapter`: ``read_frames()`` returns the merged
+frames, so :class:`~src.serial_reader.SerialManager` normalizes and
+publishes them exactly as for a single adapter.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Optional
+
+from src.io_adapter import IOAdapter
+from src.latency_probe import stamp_from_wall, stamp_to_wall
+
+logger = logging.getLogger(__name__)
+
+CLOCKS = ("align", "device", "host")
+DEFAULT_MAX_SKEW_S = 0.2
+_LATENCY_WINDOW = 256
+
+
+@dataclass
+class AcquisitionSource:
+    """One adapter to acquire from.
+
+    ``clock`` maps the frames' timestamps onto the host timeline:
+
+      - ``"align"`` (default): device time plus an offset estimated as the
+        smallest observed ``arrival - device_ts`` (transport delay filtered
+        out; clock drift is not corrected);
+      - ``"device"``: the frame's ``ts`` is already host epoch seconds;
+      - ``"host"``: ignore device time, stamp frames on arrival.
+    """
+    name: str
+    adapter: IOAdapter
+    config: dict = field(default_factory=dict)
+    clock: str = "align"
+
+
+@dataclass
+class SourceStats:
+    """Counters of one source (a snapshot when returned by ``source_stats``)."""
+    name: str
+    transport: str = "—"              # "selectable" or "polled"
+    connected: bool = False
+    frames: int = 0
+    reads: int = 0
+    errors: int = 0
+    clock_offset_s: float = 0.0
+    last_arrival: float = 0.0
+    # Arrival → release by the merger, over the last frames
+    latency_ms_avg: float = 0.0
+    latency_ms_max: float = 0.0
+
+
+def device_time(frame: dict) -> Optional[float]:
+    """Device timestamp of a raw frame in seconds (``ts`` or ``t_ms``)."""
+    ts = frame.get("ts")
+    if isinstance(ts, (int, float)) and not isinstance(ts, bool):
+        return float(ts)
+    t_ms = frame.get("t_ms")
+    if isinstance(t_ms, (int, float)) and not isinstance(t_ms, bool):
+        return t_ms / 1000.0
+    return None
+
+
+class _SourceState:
+    def __init__(self, source: AcquisitionSource):
+        self.source = source
+        self.stats = SourceStats(name=source.name)
+        self.queue: deque = deque()         # (ts, arrival, frame), in arrival order
+        self.last_ts: Optional[float] = None
+        self.offset: Optional[float] = None
+        self.latencies: deque = deque(maxlen=_LATENCY_WINDOW)
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.fd: Optional[int] = None
+
+    def accept(self, frames: list[dict], arrival: float) -> None:
+        stats = self.stats
+        stats.reads += 1
+        if not frames:
+            return
+        stats.frames += len(frames)
+        stats.last_arrival = arrival
+        clock = self.source.clock
+        name = self.source.name
+        for frame in frames:
+            dev = device_time(frame)
+            if clock == "host" or dev is None:
+                ts = arrival
+            elif clock == "device":
+                ts = dev
+            else:
+                offset = arrival - dev
+                if self.offset is None or offset < self.offset:
+                    self.offset = offset
+                ts = dev + self.offset
+            if self.last_ts is not None and ts < self.last_ts:
+                ts = self.last_ts                # keep each source monotonic
+            self.last_ts = ts
+            frame["device_ts"] = dev
+            frame["ts"] = ts
+            frame["source"] = name
+            self.queue.append((ts, arrival, frame))
+        if self.offset is not None:
+            stats.clock_offset_s = self.offset
+
+
+class MultiSourceAdapter(IOAdapter):
+    """IOAdapter that acquires from several adapters and merges their frames."""
+
+    # Frames hold only their own source's channels; never zero-fill the rest.
+    frames_sparse = True
+
+    def __init__(self, sources: list[AcquisitionSource], max_skew_s: float = DEFAULT_MAX_SKEW_S,
+                 merge: bool = True):
+        names = [s.name for s in sources]
+        if len(set(names)) != len(names):
+            raise ValueError(f"source names must be unique: {names}")
+        for s in sources:
+            if s.clock not in CLOCKS:
+                raise ValueError(f"source '{s.name}': unknown clock '{s.clock}'")
+        self.sources = list(sources)
+        self.max_skew_s = max_skew_s
+        self.merge = merge
+        self._states = {s.name: _SourceState(s) for s in self.sources}
+        self._out: deque = deque()
+        self._out_arrival: Optional[float] = None   # oldest arrival in _out
+        self._out_ready = threading.Condition()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    # ── IOAdapter ────────────────────────────────────────────────────────────
+
+    def connect(self, config=None):
+        """Connect every source; succeeds if at least one source connects."""
+        any_connected = False
+        for state in self._states.values():
+            src = state.source
+            try:
+                ok = bool(src.adapter.connect(src.config))
+            except Exception as e:
+                logger.error(f"Acquisition: source '{src.name}' connect failed: {e}")
+                ok = False
+            state.stats.connected = ok
+            any_connected = any_connected or ok
+        if not any_connected:
+            return False
+        self._running = True
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="acquisition-loop", daemon=True)
+        self._thread.start()
+        return True
+
+    def disconnect(self):
+        self._running = False
+        loop, thread = self._loop, self._thread
+        if loop is not None and thread is not None:
+            try:
+                loop.call_soon_threadsafe(loop.stop)
+            except RuntimeError:
+                pass                     # loop already closed
+            thread.join(timeout=2.0)
+        for state in self._states.values():
+            if state.executor is not None:
+                state.executor.shutdown(wait=False, cancel_futures=True)
+                state.executor = None
+            try:
+                state.source.adapter.disconnect()
+            except Exception as e:
+                logger.warning(f"Acquisition: source '{state.source.name}' disconnect failed: {e}")
+            state.stats.connected = False
+        self._loop = self._thread = None
+        with self._out_ready:
+            self._out_ready.notify_all()
+
+    def read_frame(self):
+        frames = self.read_frames()
+        if len(frames) > 1:
+            with self._out_ready:
+                self._out.extendleft(reversed(frames[1:]))
+        return frames[0] if frames else None
+
+    def read_frames(self, timeout: float = 0.1):
+        """Merged frames released so far, waiting up to *timeout* for the first."""
+        with self._out_ready:
+            if not self._out and self._running:
+                self._out_ready.wait(timeout)
+            frames = list(self._out)
+            self._out.clear()
+            arrival, self._out_arrival = self._out_arrival, None
+        if arrival is not None:
+            self.received_at = stamp_from_wall(arrival)
+        return frames
+
+    def write_command(self, command_type, payload=None):
+        """Send to ``payload["source"]`` if given, else to the first source."""
+        payload = dict(payload or {})
+        name = payload.pop("source", None) or self.sources[0].name
+        state = self._states.get(name)
+        if state is None:
+            logger.error(f"Acquisition: unknown source '{name}' for command '{command_type}'")
+            return False
+        return state.source.adapter.write_command(command_type, payload or None)
+
+    def source_stats(self) -> list[SourceStats]:
+        """Snapshot of every source's counters, in configuration order."""
+        snapshots = []
+        for state in self._states.values():
+            lat = list(state.latencies)
+            snapshots.append(replace(
+                state.stats,
+                latency_ms_avg=round(1000.0 * sum(lat) / len(lat), 3) if lat else 0.0,
+                latency_ms_max=round(1000.0 * max(lat), 3) if lat else 0.0,
+            ))
+        return snapshots
+
+    # ── Event loop ───────────────────────────────────────────────────────────
+
+    def _run_loop(self) -> None:
+        loop = self._loop
+        asyncio.set_event_loop(loop)
+        try:
+            for state in self._states.values():
+                if state.stats.connected:
+                    self._start_source(state)
+            loop.create_task(self._release_timer())
+            loop.run_forever()
+        finally:
+            for state in self._states.values():
+                if state.fd is not None:
+                    loop.remove_reader(state.fd)
+                    state.fd = None
+            for task in asyncio.all_tasks(loop):
+                task.cancel()
+            loop.run_until_complete(asyncio.sleep(0))
+            loop.close()
+
+    def _start_source(self, state: _SourceState) -> None:
+        adapter = state.source.adapter
+        fd = adapter.fileno()
+        if fd is not None and adapter.set_nonblocking():
+            state.stats.transport = "selectable"
+            state.fd = fd
+            self._loop.add_reader(fd, self._on_readable, state)
+        else:
+            state.stats.transport = "polled"
+            state.executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"acquisition-{state.source.name}")
+            self._loop.create_task(self._poll(state))
+
+    def _on_readable(self, state: _SourceState) -> None:
+        adapter = state.source.adapter
+        try:
+            frames = adapter.read_frames()
+        except Exception as e:
+            state.stats.errors += 1
+            logger.error(f"Acquisition: source '{state.source.name}' read failed: {e}")
+            frames = []
+        state.accept(frames, _arrival_time(adapter))
+        if adapter.fileno() is None:                 # transport closed
+            self._loop.remove_reader(state.fd)
+            state.fd = None
+            state.stats.connected = False
+            logger.warning(f"Acquisition: source '{state.source.name}' disconnected")
+        self._release()
+
+    async def _poll(self, state: _SourceState) -> None:
+        loop = asyncio.get_running_loop()
+        adapter = state.source.adapter
+        while self._running:
+            try:
+                frames = await loop.run_in_executor(state.executor, adapter.read_frames)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                state.stats.errors += 1
+                logger.error(f"Acquisition: source '{state.source.name}' read failed: {e}")
+                await asyncio.sleep(0.05)
+                continue
+            state.accept(frames, _arrival_time(adapter))
+            self._release()
+
+    async def _release_timer(self) -> None:
+        # Releases frames held for a source that has since gone quiet.
+        while True:
+            await asyncio.sleep(self.max_skew_s / 2)
+            self._release()
+
+    # ── Merge ────────────────────────────────────────────────────────────────
+
+    def _release(self) -> None:
+        now = time.time()
+        if self.merge:
+            live_ts = [
+                state.last_ts for state in self._states.values()
+                if state.stats.connected and state.last_ts is not None
+                and now - state.stats.last_arrival < self.max_skew_s
+            ]
+            watermark = min(live_ts) if live_ts else float("inf")
+        else:
+            watermark = float("inf")              # unmerged: release on arrival
+
+        released = []
+        oldest = float("inf")
+        for state in self._states.values():
+            queue = state.queue
+            while queue and queue[0][0] <= watermark:
+                ts, arrival, frame = queue.popleft()
+                state.latencies.append(now - arrival)
+                released.append((ts, frame))
+                oldest = min(oldest, arrival)
+        if not released:
+            return
+        released.sort(key=lambda item: item[0])     # stable: sources stay in order
+        with self._out_ready:
+            self._out.extend(frame for _, frame in released)
+            if self._out_arrival is None or oldest < self._out_arrival:
+                self._out_arrival = oldest
+            self._out_ready.notify()
+
+
+def _arrival_time(adapter: IOAdapter) -> float:
+    """Host time the adapter's last read came off its transport (now if unstamped)."""
+    stamp = adapter.received_at
+    return time.time() if stamp is None else stamp_to_wall(stamp)
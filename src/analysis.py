@@ -18,6 +18,7 @@ from typing import Dict, List, Optional
 
 import numpy as np
 
+from src.resampling import resample_uniform
 from src.signal_processing import compute_rms, compute_thd
 from src.event_detector import run_summary
 
@@ -67,8 +68,11 @@ class AnalysisEngine:
             dt = max(dt_ref, dt_test, 1e-6)
 
         t_common = np.arange(0.0, t_end + dt * 0.5, dt)
-        ref_vals = np.interp(t_common, ref["t_rel"], ref["vals"])
-        test_vals = np.interp(t_common, test["t_rel"], test["vals"])
+        # Anti-alias the finer run before sampling it on the coarser grid.
+        ref_t, ref_y = resample_uniform(ref["t_rel"], ref["vals"], 1.0 / dt)
+        test_t, test_y = resample_uniform(test["t_rel"], test["vals"], 1.0 / dt)
+        ref_vals = np.interp(t_common, ref_t, ref_y)
+        test_vals = np.interp(t_common, test_t, test_y)
         return t_common, ref_vals, test_vals
 
     # ------------------------------------------------------------------
@@ -0,0 +1,300 @@
+"""
+Persistent sidecar store for offline analysis results.
+
+Session metrics, detected events and per-profile compliance results are
+stored as one JSON document per analysis key under ``data/analysis_cache``
+(override with ``REDBYTE_ANALYSIS_CACHE``).  The key is derived from:
+
+  - the source file's ``source_hash_sha256``
+  - the applied channel mapping
+  - the applied scale factors
+  - the data actually analysed: its provenance (raw import, saved capsule,
+    live), row count, sample rate and a digest of its time axis — a
+    capsule saved from an import holds decimated frames, whose metrics
+    differ from the full-resolution import of the same file
+  - :func:`analysis_code_version`: ``APP_VERSION`` plus a digest of the
+    analysis modules' source
+
+so a cached entry is only ever reused for the same samples analysed the
+same way by the same code.  Events are kept per detection resolution:
+events detected on a copy decimated to ``max_samples`` are stored apart
+from full-resolution ones (see :meth:`AnalysisCache.load_events`).  Capsules without a source hash (live
+recordings, hand-built capsules) are never cached.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from src.event_detector import DetectedEvent
+from src.session_analysis import APP_VERSION, capsule_provenance
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "data/analysis_cache"
+CACHE_DIR_ENV = "REDBYTE_ANALYSIS_CACHE"
+_SCHEMA_VERSION = 3
+# Modules whose source determines metrics, events and compliance results.
+_ANALYSIS_MODULES = (
+    "session_analysis.py",
+    "signal_processing.py",
+    "event_detector.py",
+    "compliance_checker.py",
+    "derived_channels.py",
+    "comparison.py",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def analysis_code_version() -> str:
+    """Digest of ``APP_VERSION`` and the analysis modules' source."""
+    digest = hashlib.sha256(APP_VERSION.encode("utf-8"))
+    src_dir = Path(__file__).resolve().parent
+    for name in _ANALYSIS_MODULES:
+        try:
+            digest.update((src_dir / name).read_bytes())
+        except OSError:
+            digest.update(name.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def analysed_time_axis(capsule: dict) -> np.ndarray:
+    """
+    Time axis of the data :func:`~src.session_analysis.dataset_for_analysis`
+    analyses for *capsule*, without building the dataset.
+    """
+    dataset = capsule.get("_dataset")
+    if dataset is not None:
+        return np.ascontiguousarray(dataset.time, dtype=np.float64)
+    frames = capsule.get("frames") or []
+    # Same construction as comparison.dataset_from_capsule
+    t = np.array([f.get("ts", float(i)) for i, f in enumerate(frames)], dtype=np.float64)
+    if t.size:
+        t -= t[0]
+    return t
+
+
+def json_default(value):
+    """``json.dump`` *default* for numpy scalars and arrays and dataclasses; anything else as ``str``."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    return str(value)
+
+
+def _key_material(capsule: dict) -> dict | None:
+    import_meta = capsule.get("import_meta", {}) or {}
+    meta = capsule.get("meta", {}) or {}
+    dataset = capsule.get("_dataset")
+    dataset_meta = getattr(dataset, "meta", {}) or {}
+
+    source_hash = (
+        import_meta.get("source_hash_sha256")
+        or meta.get("source_hash_sha256")
+        or dataset_meta.get("source_hash_sha256")
+    )
+    if not source_hash:
+        return None
+
+    mapping = import_meta.get("applied_mapping") or dataset_meta.get("applied_mapping") or {}
+    scale_factors = import_meta.get("scale_factors") or dataset_meta.get("scale_factors") or {}
+    time_axis = analysed_time_axis(capsule)
+    span = float(time_axis[-1] - time_axis[0]) if time_axis.size > 1 else 0.0
+    return {
+        "source_hash_sha256": str(source_hash),
+        "applied_mapping": {str(k): v for k, v in sorted(mapping.items())},
+        "scale_factors": {str(k): float(v) for k, v in sorted(scale_factors.items())},
+        "data": {
+            "provenance": capsule_provenance(capsule),
+            "rows": int(time_axis.size),
+            "sample_rate": round((time_axis.size - 1) / span, 6) if span > 0 else 0.0,
+            "time_sha256": hashlib.sha256(time_axis.data).hexdigest(),
+        },
+        "app_version": APP_VERSION,
+        "analysis_code": analysis_code_version(),
+    }
+
+
+def _digest(material: dict) -> str:
+    blob = json.dumps(material, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def analysis_cache_key(capsule: dict) -> str | None:
+    """
+    Return the cache key for *capsule*, or None when it cannot be cached.
+    """
+    material = _key_material(capsule)
+    if material is None:
+        return None
+    return _digest(material)
+
+
+def _events_variant(material: dict, max_samples: int | None) -> str:
+    """Events slot: ``"full"``, or ``"decimated:<max_samples>"`` when the cap applied."""
+    if max_samples is None or material["data"]["rows"] <= max_samples:
+        return "full"
+    return f"decimated:{int(max_samples)}"
+
+
+def _event_to_record(event: DetectedEvent) -> dict:
+    return dataclasses.asdict(event)
+
+
+def _event_from_record(record: dict) -> DetectedEvent:
+    fields = {f.name for f in dataclasses.fields(DetectedEvent)}
+    return DetectedEvent(**{k: v for k, v in record.items() if k in fields})
+
+
+class AnalysisCache:
+    """
+    JSON sidecar store for metrics, events and compliance results.
+
+    All methods are safe to call from background worker threads.  Reads
+    and writes never raise; a corrupt or unreadable entry is treated as a
+    miss and logged.
+    """
+
+    def __init__(self, root: str | os.PathLike | None = None):
+        self.root = Path(root or os.getenv(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def _read(self, key: str) -> dict:
+        path = self._path(key)
+        if not path.exists():
+            return {}
+        try:
+            with open(path, encoding="utf-8") as fh:
+                doc = json.load(fh)
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable analysis cache entry %s: %s", path, exc)
+            return {}
+        if doc.get("schema_version") != _SCHEMA_VERSION:
+            return {}
+        return doc
+
+    def _update(self, capsule: dict, section: str, value) -> bool:
+        material = _key_material(capsule)
+        if material is None:
+            return False
+        key = _digest(material)
+        with self._lock:
+            doc = self._read(key) or {
+                "schema_version": _SCHEMA_VERSION,
+                "key": material,
+            }
+            if section == "compliance":
+                profile, results = value
+                doc.setdefault("compliance", {})[profile] = results
+            elif section == "events":
+                max_samples, records = value
+                doc.setdefault("events", {})[_events_variant(material, max_samples)] = records
+            else:
+                doc[section] = value
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(doc, fh, default=json_default, allow_nan=True)
+                os.replace(tmp, self._path(key))
+            except OSError as exc:
+                logger.warning("Failed to write analysis cache entry %s: %s", key, exc)
+                return False
+        return True
+
+    def _section(self, capsule: dict, section: str):
+        key = analysis_cache_key(capsule)
+        if key is None:
+            return None
+        with self._lock:
+            return self._read(key).get(section)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def load_metrics(self, capsule: dict) -> dict | None:
+        """Return the cached ``compute_session_metrics`` summary, if any."""
+        return self._section(capsule, "metrics")
+
+    def store_metrics(self, capsule: dict, summary: dict) -> bool:
+        return self._update(capsule, "metrics", summary)
+
+    def load_events(self, capsule: dict, max_samples: int | None = None) -> list[DetectedEvent] | None:
+        """Return cached detected events, if any.
+
+        *max_samples* is the cap detection ran under: data longer than that
+        was decimated to at most *max_samples* samples first.  None means
+        full resolution.
+        """
+        material = _key_material(capsule)
+        if material is None:
+            return None
+        with self._lock:
+            events = self._read(_digest(material)).get("events") or {}
+        records = events.get(_events_variant(material, max_samples))
+        if records is None:
+            return None
+        try:
+            return [_event_from_record(rec) for rec in records]
+        except TypeError as exc:
+            logger.warning("Ignoring malformed cached events: %s", exc)
+            return None
+
+    def store_events(self, capsule: dict, events: list[DetectedEvent],
+                     max_samples: int | None = None) -> bool:
+        records = [_event_to_record(evt) for evt in events]
+        return self._update(capsule, "events", (max_samples, records))
+
+    def load_compliance(self, capsule: dict, profile: str) -> list[dict] | None:
+        """Return cached ``evaluate_session`` results for *profile*, if any."""
+        return (self._section(capsule, "compliance") or {}).get(profile)
+
+    def store_compliance(self, capsule: dict, profile: str, results: list[dict]) -> bool:
+        return self._update(capsule, "compliance", (profile, results))
+
+    def clear(self) -> int:
+        """Delete every cache entry; return the number of files removed."""
+        removed = 0
+        with self._lock:
+            if not self.root.exists():
+                return 0
+            for path in self.root.glob("*.json"):
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+
+_default_cache: AnalysisCache | None = None
+
+
+def default_analysis_cache() -> AnalysisCache:
+    """Return the process-wide cache rooted at the configured directory."""
+    global _default_cache
+    root = Path(os.getenv(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+    if _default_cache is None or _default_cache.root != root:
+        _default_cache = AnalysisCache(root)
+    return _default_cache
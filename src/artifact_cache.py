@@ -0,0 +1,338 @@
+"""
+Content-addressed cache for evidence package artifacts.
+
+Each expensive artifact (plots, normalized CSV, binary dataset, capsule
+JSON) is identified by a fingerprint of everything it is built from:
+
+  - the dataset — a digest of the analysed arrays themselves (time axis and
+    every channel) plus the row count, sample rate, provenance and mapping
+    the writers print, so a full-resolution import and a decimated capsule
+    of the same file never share artifacts;
+  - the artifact's own options (events drawn as markers, CSV mode, …);
+  - the code that renders it: ``APP_VERSION`` plus a digest of the source of
+    the writer modules and every ``src`` module they import, directly or
+    not, so an edited renderer or analysis step never serves stale output.
+
+The compliance profile and thresholds only feed the small JSON and HTML
+artifacts, so changing them leaves every fingerprint above untouched and a
+re-export reuses the cached files.
+
+Entries live under ``data/artifact_cache`` (override with
+``REDBYTE_ARTIFACT_CACHE``) as ``<fingerprint><suffix>`` plus a
+``<fingerprint>.entry.json`` sidecar holding the task's return value.  Reuse
+hardlinks the cached file into the output directory (copying across
+filesystems).  Outputs are always replaced, never written through, so a
+later export can't modify a shared inode.
+
+The store is bounded: once it holds more than ``max_bytes`` (default
+:data:`DEFAULT_MAX_BYTES`, override with ``REDBYTE_ARTIFACT_CACHE_MAX_MB``)
+the least recently used entries are evicted.  A hit refreshes the entry's
+sidecar mtime, which is the recency the eviction goes by.
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.session_analysis import APP_VERSION, capsule_provenance
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "data/artifact_cache"
+CACHE_DIR_ENV = "REDBYTE_ARTIFACT_CACHE"
+MAX_MB_ENV = "REDBYTE_ARTIFACT_CACHE_MAX_MB"
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+_SCHEMA_VERSION = 2
+_SIDECAR_SUFFIX = ".entry.json"
+# Artifact writers; the code fingerprint also covers everything they import.
+_RENDER_MODULES = (
+    "report_generator",
+    "plot_decimation",
+    "columnar_csv",
+    "dataset_archive",
+    "derived_channels",
+    "session_analysis",
+)
+
+
+def _src_imports(path: Path) -> set[str]:
+    """Names of the ``src`` modules imported anywhere in the file at *path*."""
+    names: set[str] = set()
+    for node in ast.walk(ast.parse(path.read_bytes(), filename=str(path))):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        names.update(m.split(".")[1] for m in modules if m.startswith("src."))
+    return names
+
+
+@functools.lru_cache(maxsize=1)
+def code_fingerprint() -> str:
+    """
+    Digest of ``APP_VERSION`` and the source of the artifact writers and of
+    every ``src`` module they depend on, transitively.
+    """
+    src_dir = Path(__file__).resolve().parent
+    seen: set[str] = set()
+    pending = list(_RENDER_MODULES)
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        try:
+            pending.extend(_src_imports(src_dir / f"{name}.py") - seen)
+        except (OSError, SyntaxError, ValueError):
+            pass
+    digest = hashlib.sha256(APP_VERSION.encode("utf-8"))
+    for name in sorted(seen):
+        digest.update(name.encode("utf-8"))
+        try:
+            digest.update((src_dir / f"{name}.py").read_bytes())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+def dataset_fingerprint(capsule: dict, dataset) -> str:
+    """
+    Identify the analysed data of *capsule* / *dataset*.
+
+    Hashes the time axis and every channel array, together with the row
+    count, sample rate, provenance, source and applied mapping that the
+    artifacts record.
+    """
+    time_axis = np.ascontiguousarray(dataset.time)
+    meta = dataset.meta or {}
+    header = {
+        "rows": int(time_axis.size),
+        "sample_rate": float(dataset.sample_rate or 0.0),
+        "provenance": capsule_provenance(capsule),
+        "source": [dataset.source_type, dataset.source_path],
+        "applied_mapping": meta.get("applied_mapping", {}),
+        "channels": [
+            [name, np.asarray(dataset.channels[name]).dtype.str] for name in sorted(dataset.channels)
+        ],
+        "time_dtype": time_axis.dtype.str,
+    }
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(json.dumps(header, sort_keys=True, default=str).encode("utf-8"))
+    digest.update(time_axis.data)
+    for name in sorted(dataset.channels):
+        digest.update(np.ascontiguousarray(dataset.channels[name]).data)
+    return digest.hexdigest()
+
+
+def artifact_fingerprint(kind: str, **inputs: Any) -> str:
+    """Fingerprint of artifact *kind* built from *inputs* by the current code."""
+    blob = json.dumps(
+        {"kind": kind, "inputs": inputs, "code": code_fingerprint(), "schema": _SCHEMA_VERSION},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=_json_value,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _json_value(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def _touch(path: Path) -> None:
+    """Mark *path* as used now (explicit times avoid the coarse fs clock)."""
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+
+def _replace_with_link(source: Path, dest: Path) -> None:
+    """Make *dest* a hardlink to (or copy of) *source*, replacing *dest*."""
+    if dest.exists() and os.path.samefile(source, dest):
+        return
+    fd, tmp = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.", suffix=".tmp")
+    os.close(fd)
+    os.unlink(tmp)
+    try:
+        os.link(source, tmp)
+    except OSError:
+        shutil.copyfile(source, tmp)
+    os.replace(tmp, dest)
+
+
+class ArtifactCache:
+    """
+    File store of rendered artifacts keyed by :func:`artifact_fingerprint`.
+
+    Safe to call from export worker threads.  Cache failures never fail an
+    export: a broken entry is a miss, and a failed store is logged.  Stores
+    evict least recently used entries beyond *max_bytes*.
+    """
+
+    def __init__(self, root: str | os.PathLike | None = None, max_bytes: int | None = None):
+        self.root = Path(root or os.getenv(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+        if max_bytes is None:
+            max_mb = os.getenv(MAX_MB_ENV)
+            max_bytes = int(float(max_mb) * 1024 ** 2) if max_mb else DEFAULT_MAX_BYTES
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _sidecar(self, fingerprint: str) -> Path:
+        return self.root / f"{fingerprint}{_SIDECAR_SUFFIX}"
+
+    def fetch(self, fingerprint: str, dest: Path) -> tuple[bool, Any]:
+        """
+        Materialise a cached artifact at *dest*.
+
+        Returns ``(True, result)`` on a hit, where *result* is the original
+        task's return value with its file path rewritten to *dest*;
+        ``(False, None)`` on a miss.
+        """
+        dest = Path(dest)
+        try:
+            with open(self._sidecar(fingerprint), encoding="utf-8") as fh:
+                entry = json.load(fh)
+            if entry.get("schema_version") != _SCHEMA_VERSION:
+                raise ValueError("schema version mismatch")
+            stored = entry.get("file")
+            if stored is not None:
+                source = self.root / stored
+                if source.stat().st_size != entry.get("size_bytes"):
+                    raise ValueError("cached file size mismatch")
+                _replace_with_link(source, dest)
+            _touch(self._sidecar(fingerprint))
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return False, None
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unusable artifact cache entry %s: %s", fingerprint[:12], exc)
+            with self._lock:
+                self.misses += 1
+            return False, None
+
+        with self._lock:
+            self.hits += 1
+        return True, _rebase_result(entry.get("result"), dest if stored is not None else None)
+
+    def store(self, fingerprint: str, produced: Path | None, result: Any) -> bool:
+        """Record *result*, and the file at *produced* (None: no file), under *fingerprint*."""
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            entry = {"schema_version": _SCHEMA_VERSION, "result": result, "file": None}
+            if produced is not None:
+                produced = Path(produced)
+                name = fingerprint + "".join(produced.suffixes)
+                _replace_with_link(produced, self.root / name)
+                entry["file"] = name
+                entry["size_bytes"] = (self.root / name).stat().st_size
+            fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(entry, fh, default=_json_value)
+            os.replace(tmp, self._sidecar(fingerprint))
+            _touch(self._sidecar(fingerprint))
+        except OSError as exc:
+            logger.warning("Failed to store artifact %s: %s", fingerprint[:12], exc)
+            return False
+        self._evict(keep=fingerprint)
+        return True
+
+    def size_bytes(self) -> int:
+        """Total size of the entries on disk."""
+        return sum(size for _, _, size in self._entries())
+
+    def _entries(self) -> list[tuple[int, str, int]]:
+        """``(last used, fingerprint, bytes)`` of every entry, oldest first."""
+        entries = []
+        if not self.root.exists():
+            return entries
+        for sidecar in self.root.glob(f"*{_SIDECAR_SUFFIX}"):
+            fingerprint = sidecar.name[: -len(_SIDECAR_SUFFIX)]
+            try:
+                stat = sidecar.stat()
+                size = stat.st_size + sum(
+                    p.stat().st_size for p in self.root.glob(f"{fingerprint}.*") if p != sidecar
+                )
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, fingerprint, size))
+        entries.sort()
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        """Drop least recently used entries until the store fits ``max_bytes``."""
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, _, size in entries)
+            for _, fingerprint, size in entries:
+                if total <= self.max_bytes:
+                    break
+                if fingerprint == keep:
+                    continue
+                # Sidecar first: a concurrent fetch then sees a clean miss.
+                for path in [self._sidecar(fingerprint), *self.root.glob(f"{fingerprint}.*")]:
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+                total -= size
+                self.evictions += 1
+
+    def clear(self) -> int:
+        """Delete every cache entry; return the number of files removed."""
+        removed = 0
+        with self._lock:
+            if not self.root.exists():
+                return 0
+            for path in self.root.iterdir():
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+
+def _rebase_result(result: Any, dest: Path | None) -> Any:
+    """Point the path(s) in a cached task result at *dest*."""
+    if dest is None:
+        return result
+    resolved = str(dest.resolve())
+    if isinstance(result, str):
+        return resolved
+    if isinstance(result, dict) and "path" in result:
+        return {**result, "path": resolved}
+    return result
+
+
+_default_cache: ArtifactCache | None = None
+
+
+def default_artifact_cache() -> ArtifactCache:
+    """Return the process-wide cache rooted at the configured directory."""
+    global _default_cache
+    root = Path(os.getenv(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+    if _default_cache is None or _default_cache.root != root:
+        _default_cache = ArtifactCache(root)
+    return _default_cache
@@ -0,0 +1,196 @@
+"""
+Compact binary telemetry framing for serial links.
+
+The JSON line protocol spends most of a 115200-baud link on key names and
+decimal text, and the host runs ``json.loads`` on every line.  The binary
+protocol carries the same samples as packed little-endian floats:
+
+    A5 5A | type u8 | seq u16 | length u16 | payload[length] | crc32 u32
+
+  - ``seq`` counts frames modulo 2**16; gaps are reported as dropped frames;
+  - ``crc32`` (zlib polynomial) covers ``type .. payload``; a frame that
+    fails the check is discarded and the decoder resynchronises on the next
+    ``A5 5A`` marker, so line noise costs a frame, never the stream.
+
+Frame types:
+
+  - ``MSG_CHANNEL_MAP`` — ``version u8`` + UTF-8 JSON ``{"channels": [...]}``.
+    Sent by the device in answer to the handshake and whenever its channel
+    set changes.  Samples are meaningless until a map has been received.
+  - ``MSG_SAMPLES`` — one or more samples of ``ts f64`` followed by one
+    ``f32`` per mapped channel, in channel-map order.  Batching several
+    samples per frame amortises the 11 bytes of framing.
+
+Handshake: the host sends the JSON command line
+``CMD:{"cmd": "set_protocol", "protocol": "binary", "version": 1}`` and waits
+for a channel map.  A device that does not answer keeps talking JSON lines
+(see :class:`src.io_adapter.SerialAdapter`).  Commands host → device stay
+JSON lines in both modes.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence
+
+MAGIC = b"\xa5\x5a"
+PROTOCOL_VERSION = 1
+MSG_CHANNEL_MAP = 0x01
+MSG_SAMPLES = 0x02
+MAX_PAYLOAD = 4096
+
+_HEADER = struct.Struct("<2sBHH")
+_CRC = struct.Struct("<I")
+FRAME_OVERHEAD = _HEADER.size + _CRC.size
+_SEQ_MOD = 1 << 16
+
+
+def sample_struct(n_channels: int) -> struct.Struct:
+    """Layout of one sample: ``ts`` float64 then *n_channels* float32."""
+    return struct.Struct(f"<d{n_channels}f")
+
+
+def encode_frame(msg_type: int, seq: int, payload: bytes) -> bytes:
+    """Wrap *payload* in a checked frame."""
+    if len(payload) > MAX_PAYLOAD:
+        raise ValueError(f"payload of {len(payload)} bytes exceeds {MAX_PAYLOAD}")
+    header = _HEADER.pack(MAGIC, msg_type, seq % _SEQ_MOD, len(payload))
+    crc = zlib.crc32(payload, zlib.crc32(header[2:]))
+    return header + payload + _CRC.pack(crc)
+
+
+class FrameEncoder:
+    """
+    Device-side encoder (firmware reference and loopback harness).
+
+    Numbers frames itself; call :meth:`channel_map` first, then
+    :meth:`samples` for data.
+    """
+
+    def __init__(self, channels: Sequence[str]):
+        self.channels = tuple(channels)
+        self._sample = sample_struct(len(self.channels))
+        self._seq = 0
+        self.max_samples_per_frame = MAX_PAYLOAD // self._sample.size
+
+    def _next_seq(self) -> int:
+        seq = self._seq
+        self._seq = (seq + 1) % _SEQ_MOD
+        return seq
+
+    def channel_map(self) -> bytes:
+        body = json.dumps({"channels": list(self.channels)}).encode("utf-8")
+        return encode_frame(MSG_CHANNEL_MAP, self._next_seq(), bytes([PROTOCOL_VERSION]) + body)
+
+    def samples(self, rows: Iterable[tuple[float, Sequence[float]]]) -> bytes:
+        """Encode ``(ts, values)`` rows as one frame (at most ``max_samples_per_frame``)."""
+        pack = self._sample.pack
+        payload = b"".join(pack(ts, *values) for ts, values in rows)
+        return encode_frame(MSG_SAMPLES, self._next_seq(), payload)
+
+
+@dataclass
+class DecoderStats:
+    """Running counters of a :class:`FrameDecoder`."""
+    frames: int = 0
+    samples: int = 0
+    crc_errors: int = 0
+    bytes_discarded: int = 0
+    dropped_frames: int = 0
+    unmapped_samples: int = 0
+    malformed: int = 0
+
+
+class FrameDecoder:
+    """
+    Incremental host-side decoder.
+
+    :meth:`feed` accepts arbitrary byte chunks (partial frames carry over to
+    the next call) and returns the complete samples as frame dicts
+    ``{"ts": …, <channel>: …}``.
+    """
+
+    def __init__(self, channels: Optional[Sequence[str]] = None):
+        self._buf = bytearray()
+        self._last_seq: Optional[int] = None
+        self.stats = DecoderStats()
+        self.channels: Optional[tuple[str, ...]] = None
+        self._sample: Optional[struct.Struct] = None
+        if channels is not None:
+            self._set_channels(channels)
+
+    def _set_channels(self, channels: Sequence[str]) -> None:
+        self.channels = tuple(channels)
+        self._sample = sample_struct(len(self.channels))
+
+    def feed(self, data: bytes) -> list[dict]:
+        buf = self._buf
+        buf += data
+        frames: list[dict] = []
+        pos = 0
+        size = len(buf)
+        while True:
+            start = buf.find(MAGIC, pos)
+            if start < 0:
+                # Keep a trailing first magic byte: it may start the next frame.
+                keep_from = size - 1 if size and buf[-1] == MAGIC[0] else size
+                self.stats.bytes_discarded += max(0, keep_from - pos)
+                pos = max(pos, keep_from)
+                break
+            self.stats.bytes_discarded += start - pos
+            pos = start
+            if size - start < _HEADER.size:
+                break
+            _, msg_type, seq, length = _HEADER.unpack_from(buf, start)
+            if length > MAX_PAYLOAD:
+                self.stats.malformed += 1
+                pos = start + 1
+                continue
+            body_end = start + _HEADER.size + length
+            if body_end + _CRC.size > size:
+                break
+            (crc,) = _CRC.unpack_from(buf, body_end)
+            if zlib.crc32(buf[start + 2:body_end]) != crc:
+                self.stats.crc_errors += 1
+                pos = start + 1
+                continue
+            self._on_frame(msg_type, seq, bytes(buf[start + _HEADER.size:body_end]), frames)
+            pos = body_end + _CRC.size
+        del buf[:pos]
+        return frames
+
+    def _on_frame(self, msg_type: int, seq: int, payload: bytes, out: list[dict]) -> None:
+        stats = self.stats
+        stats.frames += 1
+        if self._last_seq is not None:
+            stats.dropped_frames += (seq - self._last_seq - 1) % _SEQ_MOD
+        self._last_seq = seq
+
+        if msg_type == MSG_CHANNEL_MAP:
+            try:
+                if not payload or payload[0] != PROTOCOL_VERSION:
+                    raise ValueError("unsupported protocol version")
+                self._set_channels(json.loads(payload[1:].decode("utf-8"))["channels"])
+            except (ValueError, KeyError, TypeError):
+                stats.malformed += 1
+            return
+        if msg_type != MSG_SAMPLES:
+            stats.malformed += 1
+            return
+
+        sample = self._sample
+        if sample is None:
+            stats.unmapped_samples += 1
+            return
+        if not payload or len(payload) % sample.size:
+            stats.malformed += 1
+            return
+        channels = self.channels
+        for values in sample.iter_unpack(payload):
+            frame = dict(zip(channels, values[1:]))
+            frame["ts"] = values[0]
+            out.append(frame)
+        stats.samples += len(payload) // sample.size
@@ -259,6 +259,51 @@ def apply_rigol_three_phase_defaults(
     return updated
 
 
+_VOLTAGE_TARGETS = frozenset({"v_an", "v_bn", "v_cn", "v_ab", "v_bc", "v_ca"})
+# Mapped Rigol voltages with a raw RMS below this are read as ×100 probe output.
+_PROBE_SCALE_RMS_LIMIT_V = 5.0
+_PROBE_SCALE_FACTOR = 100.0
+
+
+def detect_probe_scale(dataset, mapping: dict[str, str]) -> tuple[dict[str, float], str]:
+    """Detect ×100 probe attenuation on a Rigol CSV's mapped voltage channels.
+
+    Rigol oscilloscopes with a ×100 probe write reduced-amplitude values.  If
+    the first mapped phase/line voltage has a raw RMS below 5 V (vs the
+    expected ~120 V), every mapped voltage channel gets a ×100 scale factor.
+
+    Returns ``(scale_factors, note)`` where *scale_factors* is keyed by
+    canonical channel name (ready for :meth:`ChannelMapper.apply`) and *note*
+    is a human-readable provenance line; both are empty when no scaling
+    applies.
+    """
+    import numpy as np
+
+    if dataset.source_type != "rigol_csv":
+        return {}, ""
+    mapped_voltage_channels = {
+        target: src
+        for src, target in mapping.items()
+        if target in _VOLTAGE_TARGETS and src in dataset.channels
+    }
+    if not mapped_voltage_channels:
+        return {}, ""
+
+    raw_arr = dataset.channels[next(iter(mapped_voltage_channels.values()))]
+    raw_rms = float(np.sqrt(np.mean(raw_arr.astype(np.float64) ** 2)))
+    if not 0.0 < raw_rms < _PROBE_SCALE_RMS_LIMIT_V:
+        return {}, ""
+
+    scale_factors = {canonical: _PROBE_SCALE_FACTOR for canonical in mapped_voltage_channels}
+    note = (
+        f"Rigol ×100 probe scale auto-applied to "
+        f"{', '.join(sorted(mapped_voltage_channels))} "
+        f"(raw RMS was {raw_rms:.3f} V → scaled to "
+        f"{raw_rms * _PROBE_SCALE_FACTOR:.1f} V)"
+    )
+    return scale_factors, note
+
+
 # ---------------------------------------------------------------------------
 # ChannelMapper class
 # ---------------------------------------------------------------------------
@@ -0,0 +1,331 @@
+"""
+Chunked, columnar CSV writing.
+
+Exports used to build one Python object per row (a DataFrame, a dict per
+frame, a joined string per frame) before anything reached the disk.  The
+helpers here format whole blocks of rows at once: a chunk of column arrays
+is stacked into a small matrix and rendered with a single ``%``-format over
+a repeated row template, which runs at C speed.  Only one chunk is alive at
+a time, so peak memory is independent of the row count.
+
+Truthfulness rule: a column that is absent (``None``), a frame that lacks
+a key, and any NaN sample are written as empty cells, never as zeros.
+
+A column's format is decided once, from the first chunk that carries data
+for it — integer, float, whole-valued float (``str(float)`` style,
+``120.0``) or text — and kept for every later chunk, so a value renders the
+same wherever the chunk boundaries fall.
+
+:func:`write_csv_blocks` streams array data (evidence packages);
+:func:`write_frames_csv` streams frame dicts (session, smart and legacy
+exports).
+
+Precision: numeric cells are written with :data:`DEFAULT_FLOAT_FORMAT`
+(``%.12g``, twelve significant digits) and timestamps with
+:data:`TIME_FORMAT` (``%.16g``) — deliberately, not ``repr``.  Twelve digits
+are far beyond the resolution of any instrument or ADC feeding these files,
+and ``%.12g`` formats about three times faster than the shortest round-trip
+``repr``; a float that needs more digits than that to round-trip is written
+rounded.  Exports state this in their comment header
+(:data:`PRECISION_NOTE`).
+
+Optional compression uses only the standard library (gzip, bz2, xz).
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
+from itertools import chain
+from operator import itemgetter
+from pathlib import Path
+from typing import IO, Callable, Optional, Sequence, Union
+
+import numpy as np
+
+CSV_COMPRESSIONS = {
+    "gzip": ".gz",
+    "bz2": ".bz2",
+    "xz": ".xz",
+}
+DEFAULT_CHUNK_ROWS = 32_768
+DEFAULT_FLOAT_FORMAT = "%.12g"
+# Epoch timestamps need more digits than measurements to keep microseconds.
+TIME_FORMAT = "%.16g"
+PRECISION_NOTE = "values to 12 significant digits, timestamps to 16"
+_FRAME_COLUMN_FORMATS = {"ts": TIME_FORMAT, "timestamp": TIME_FORMAT}
+_WHOLE_FLOAT_LIMIT = 1e15
+_EXACT_INT_LIMIT = 2 ** 53
+_QUOTE_CHARS = (",", '"', "\n", "\r")
+
+# One CSV column of a block: None (absent), a numpy array, or raw values.
+Column = Union[None, np.ndarray, Sequence]
+# Block provider: ``block(start, stop)`` returns one entry per CSV column,
+# each holding ``stop - start`` values (or None for a column with no data).
+BlockProvider = Callable[[int, int], Sequence[Column]]
+RowProgress = Callable[[int, int], None]
+
+
+def compressed_path(path: Path, compression: str | None) -> Path:
+    """Return *path* with the suffix for *compression* appended (if missing)."""
+    path = Path(path)
+    if not compression:
+        return path
+    suffix = _suffix_for(compression)
+    return path if path.name.endswith(suffix) else path.with_name(path.name + suffix)
+
+
+def open_csv_output(path: Path, compression: str | None = None) -> IO[str]:
+    """Open *path* for text CSV output, optionally through a compressor."""
+    if not compression:
+        return open(path, "w", newline="", encoding="utf-8")
+    _suffix_for(compression)
+    # Low levels: exports are written interactively, and for numeric CSV the
+    # higher levels cost several times the time for a few percent of size.
+    if compression == "gzip":
+        return gzip.open(path, "wt", compresslevel=1, newline="", encoding="utf-8")
+    if compression == "bz2":
+        return bz2.open(path, "wt", compresslevel=1, newline="", encoding="utf-8")
+    return lzma.open(path, "wt", preset=1, newline="", encoding="utf-8")
+
+
+def format_block(
+    columns: Sequence[Column],
+    n_rows: int,
+    float_format: str = DEFAULT_FLOAT_FORMAT,
+    formats: Optional[Sequence[Optional[str]]] = None,
+) -> str:
+    """
+    Render *n_rows* CSV lines from per-column data in one formatting pass.
+
+    Each column is ``None`` (absent: empty cells), a numpy array, or a list
+    of raw Python values (as pulled from frame dicts).  Numeric data uses
+    *float_format* unless *formats* gives a per-column override; ``None``
+    and NaN cells are written empty; text is quoted as ``csv`` would.
+    """
+    return _format_block(columns, n_rows, float_format, formats, [None] * len(columns))
+
+
+def _format_block(
+    columns: Sequence[Column],
+    n_rows: int,
+    float_format: str,
+    formats: Optional[Sequence[Optional[str]]],
+    kinds: list[Optional[str]],
+) -> str:
+    """:func:`format_block` with the column kinds decided so far; undecided entries are filled in."""
+    if n_rows <= 0:
+        return ""
+    specs = list(formats or [])
+    specs += [None] * (len(columns) - len(specs))
+    prepared = []
+    for i, (col, spec) in enumerate(zip(columns, specs)):
+        spec, values, kinds[i] = _prepare_column(col, n_rows, spec or float_format, kinds[i])
+        prepared.append((spec, values))
+    has_text = any(spec == "%s" for spec, _ in prepared)
+    has_nan = False
+    for i, (spec, values) in enumerate(prepared):
+        if isinstance(values, np.ndarray) and values.dtype.kind == "f" and np.isnan(values).any():
+            if has_text:
+                prepared[i] = ("%s", [spec % v if v == v else "" for v in values.tolist()])
+            else:
+                has_nan = True
+
+    row = ",".join(spec for spec, _ in prepared) + "\n"
+    cells = [values for _, values in prepared if values is not None]
+    if not cells:
+        return row * n_rows
+    if all(isinstance(values, np.ndarray) for values in cells):
+        flat = np.column_stack(cells).ravel().tolist()
+    else:
+        flat = list(chain.from_iterable(zip(*(
+            values.tolist() if isinstance(values, np.ndarray) else values for values in cells
+        ))))
+    text = (row * n_rows) % tuple(flat)
+    # Only numeric columns are present here, and "nan" cannot occur inside a
+    # formatted number, so this blanks exactly the NaN cells.
+    return text.replace("nan", "") if has_nan else text
+
+
+def write_csv_blocks(
+    handle: IO[str],
+    header: Sequence[str],
+    n_rows: int,
+    block: BlockProvider,
+    *,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    float_format: str = DEFAULT_FLOAT_FORMAT,
+    formats: Optional[Sequence[Optional[str]]] = None,
+    progress: Optional[RowProgress] = None,
+) -> int:
+    """
+    Write *header* and *n_rows* data rows fetched chunk by chunk from *block*.
+
+    Args:
+        handle:       Open text handle (see :func:`open_csv_output`).
+        header:       Column names.
+        n_rows:       Total data rows.
+        block:        ``block(start, stop)`` → one array (or None) per column.
+        chunk_rows:   Rows formatted per pass; bounds peak memory.
+        float_format: printf-style format for numeric cells.
+        formats:      Optional per-column overrides of *float_format*, by
+                      position; missing or None entries use the default.
+        progress:     Called as ``progress(rows_written, n_rows)`` per chunk.
+
+    Returns:
+        Number of data rows written.
+    """
+    handle.write(",".join(header) + "\n")
+    chunk_rows = max(1, int(chunk_rows))
+    kinds: list[Optional[str]] = [None] * len(header)     # decided once per column
+    written = 0
+    for start in range(0, n_rows, chunk_rows):
+        stop = min(n_rows, start + chunk_rows)
+        handle.write(_format_block(block(start, stop), stop - start, float_format, formats, kinds))
+        written = stop
+        if progress is not None:
+            progress(written, n_rows)
+    return written
+
+
+def write_frames_csv(
+    handle: IO[str],
+    frames: Sequence[dict],
+    columns: Sequence[str],
+    *,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    float_format: str = DEFAULT_FLOAT_FORMAT,
+    formats: Optional[dict[str, str]] = None,
+    progress: Optional[RowProgress] = None,
+) -> int:
+    """
+    Write frame dicts as CSV columns *columns*, a block of frames at a time.
+
+    A frame without a key gets an empty cell for that column — never a
+    zero.  Time columns default to :data:`TIME_FORMAT`; *formats* maps
+    column names to further overrides.
+    """
+    column_formats = {**_FRAME_COLUMN_FORMATS, **(formats or {})}
+    columns = list(columns)
+    getter = itemgetter(*columns) if len(columns) > 1 else None
+
+    def _row(frame: dict) -> tuple:
+        try:
+            return getter(frame)
+        except KeyError:
+            return tuple(map(frame.get, columns))
+
+    def _block(start: int, stop: int) -> list[Sequence]:
+        chunk = frames[start:stop]
+        if getter is None:
+            return [[frame.get(name) for frame in chunk] for name in columns]
+        # Pull whole rows at C speed, then transpose into column tuples.
+        return list(zip(*map(_row, chunk)))
+
+    return write_csv_blocks(
+        handle, columns, len(frames), _block,
+        chunk_rows=chunk_rows,
+        float_format=float_format,
+        formats=[column_formats.get(name) for name in columns],
+        progress=progress,
+    )
+
+
+def _prepare_column(
+    col: Column, n_rows: int, spec: str, kind: Optional[str] = None,
+) -> tuple[str, object, Optional[str]]:
+    """
+    Return ``(printf spec, values, kind)`` for one column of a block.
+
+    *kind* is the column's format decided by an earlier chunk ("int",
+    "float", "whole" or "text"), or None to decide it from this one.
+    """
+    if col is None:
+        return "", None, kind
+    if isinstance(col, np.ndarray):
+        if col.dtype.kind in "iu" and kind in (None, "int"):
+            return "%d", col[:n_rows], "int"
+        if col.dtype.kind in "fb" and kind in (None, "float"):
+            return spec, col[:n_rows].astype(np.float64, copy=False), "float"
+        col = col[:n_rows].tolist()
+    values = col if len(col) == n_rows else col[:n_rows]
+
+    types = set(map(type, values))
+    types.discard(type(None))
+    if not types:
+        return "", None, kind
+    ints = all(issubclass(t, (int, np.integer)) and t is not bool for t in types)
+    numeric = ints or all(issubclass(t, (int, float, np.number)) and t is not bool for t in types)
+    arr = np.array(values, dtype=np.float64) if numeric and not (ints and None not in values) else None
+    if kind is None:
+        if ints:
+            kind = "int"
+        elif numeric:
+            kind = "whole" if _whole(arr) else "float"
+        else:
+            kind = "text"
+
+    if kind == "text":
+        return "%s", [_text_cell(v) for v in values], kind
+    if kind == "int" and ints and None not in values:
+        try:
+            exact = np.array(values, dtype=np.float64)
+        except OverflowError:
+            return "%d", values, kind
+        if np.abs(exact).max() < _EXACT_INT_LIMIT:
+            # Exact as a float, and "%d" renders it as the integer; an array
+            # keeps the block on the all-numpy path in format_block.
+            return "%d", exact, kind
+        return "%d", values, kind
+    if kind == "float" and numeric:
+        return spec, arr if arr is not None else np.array(values, dtype=np.float64), kind
+    if kind == "whole" and numeric:
+        arr = arr if arr is not None else np.array(values, dtype=np.float64)
+        if _whole(arr):
+            # Whole-valued float columns keep str(float) output ("120.0").
+            return "%.1f", arr, kind
+    # This chunk does not fit the column's format: cell by cell, same rules.
+    return "%s", [_cell(v, kind, spec) for v in values], kind
+
+
+def _whole(arr: np.ndarray) -> bool:
+    """True if every finite value is integral and small enough for "%.1f" to be exact."""
+    finite = arr[np.isfinite(arr)]
+    return bool(finite.size) and bool(np.all(finite == np.round(finite))) \
+        and float(np.abs(finite).max()) < _WHOLE_FLOAT_LIMIT
+
+
+def _cell(value, kind: str, spec: str) -> str:
+    """One cell of a numeric column whose chunk needs per-cell formatting."""
+    if value is None:
+        return ""
+    if isinstance(value, (int, np.integer)) and not isinstance(value, bool) and kind == "int":
+        return "%d" % value
+    if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+        value = float(value)
+        if value != value:
+            return ""
+        if kind == "whole" and abs(value) < _WHOLE_FLOAT_LIMIT and value == round(value):
+            return "%.1f" % value
+        return spec % value
+    return _text_cell(value)
+
+
+def _text_cell(value) -> str:
+    if value is None:
+        return ""
+    text = str(value)
+    if any(ch in text for ch in _QUOTE_CHARS):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _suffix_for(compression: str) -> str:
+    try:
+        return CSV_COMPRESSIONS[compression]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported CSV compression {compression!r}; "
+            f"expected one of {sorted(CSV_COMPRESSIONS)}"
+        ) from None
@@ -3,7 +3,8 @@ Comparison engine for RedByte GFM HIL Suite.
 
 Compares two ImportedDataset objects channel-by-channel:
   - Finds the canonical-name intersection (unmapped originals never compared)
-  - Optionally aligns datasets via cross-correlation to remove timing skew
+  - Optionally aligns datasets via bounded-lag cross-correlation (one channel
+    or several jointly) to remove timing skew
   - Computes RMS error, peak absolute error, Pearson correlation
   - Generates delta (difference) traces on a common time grid
 
@@ -29,12 +30,14 @@ from typing import Optional
 import numpy as np
 
 from src.file_ingestion import ImportedDataset
+from src.resampling import native_rate, nice_rate, resample_channel
 from src.signal_processing import compute_rms, compute_thd
 
 logger = logging.getLogger(__name__)
 
 # Maximum points to interpolate onto when computing delta traces.
 _DEFAULT_MAX_POINTS = 2_000
+_COMPARE_MAX_POINTS = 1_000_000
 
 
 def _unit_for_channel(channel: str) -> str:
@@ -254,6 +257,223 @@ def find_overlapping_channels(
     return sorted(keys_a & keys_b)
 
 
+# ---------------------------------------------------------------------------
+# Alignment
+# ---------------------------------------------------------------------------
+
+# Inputs at or below this length are correlated exactly over every lag.
+_ALIGN_DIRECT_MAX_SAMPLES = 65_536
+# Coarse stage: at most this many decimated samples / searched lags.
+_ALIGN_COARSE_MAX_SAMPLES = 65_536
+_ALIGN_COARSE_MAX_LAGS = 2_048
+# Refine stage: full-rate correlation window length.
+_ALIGN_REFINE_WINDOW = 65_536
+
+
+def _normalised(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float64)
+    finite = np.isfinite(x)
+    if not finite.all():
+        x = np.where(finite, x, 0.0)
+    std = x.std()
+    if std < 1e-12:
+        return np.zeros_like(x)
+    return (x - x.mean()) / std
+
+
+def _alignment_pair(
+    dataset_a: ImportedDataset,
+    dataset_b: ImportedDataset,
+    channel: str,
+    sr: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    a = dataset_a.channels[channel]
+    b = dataset_b.channels[channel]
+    # Lags are counted in A's samples; put B on A's rate if it differs.
+    sr_b = dataset_b.sample_rate
+    if sr_b > 0 and abs(sr_b - sr) > 1e-3 * sr and len(dataset_b.time) == len(b) and len(b) > 1:
+        t_b = dataset_b.time
+        n_b = max(2, int(round((float(t_b[-1]) - float(t_b[0])) * sr)) + 1)
+        b = np.interp(float(t_b[0]) + np.arange(n_b) / sr, t_b, b)
+    return _normalised(a), _normalised(b)
+
+
+def _overlap_count(n_a: int, n_b: int, lags: np.ndarray) -> np.ndarray:
+    """Samples overlapping at each lag when pairing a[n + lag] with b[n]."""
+    lags = np.asarray(lags)
+    return np.maximum(np.minimum(n_b, n_a - lags) - np.maximum(0, -lags), 0)
+
+
+def _bounded_full_correlation(
+    a: np.ndarray, b: np.ndarray, max_lag: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Exact ``sum a[n + lag] * b[n]`` for ``|lag| <= max_lag``."""
+    try:
+        from scipy.signal import correlate as _correlate, correlation_lags as _lags
+        corr = _correlate(a, b, mode="full")
+        lags = _lags(len(a), len(b), mode="full")
+    except ImportError:
+        corr = np.correlate(a, b, mode="full")
+        lags = np.arange(-(len(b) - 1), len(a))
+    mask = np.abs(lags) <= max_lag
+    return lags[mask], corr[mask]
+
+
+def _envelope(x: np.ndarray, factor: int) -> np.ndarray:
+    """Per-block (max, min) envelope, shape ``(2, len(x) // factor)``."""
+    n_blocks = len(x) // factor
+    blocks = x[: n_blocks * factor].reshape(n_blocks, factor)
+    env = np.vstack((blocks.max(axis=1), blocks.min(axis=1)))
+    return env - env.mean(axis=1, keepdims=True)
+
+
+def _coarse_lag(pairs, max_lag: int, factor: int) -> int:
+    """Best lag (in full-rate samples) from correlating decimated envelopes."""
+    coarse_max = max(1, -(-max_lag // factor))
+    score = None
+    lags = None
+    for a, b in pairs:
+        env_a = _envelope(a, factor)
+        env_b = _envelope(b, factor)
+        if env_a.shape[1] < 2 or env_b.shape[1] < 2:
+            continue
+        curve = None
+        for fa, fb in zip(env_a, env_b):
+            lags_c, corr = _bounded_full_correlation(fa, fb, coarse_max)
+            curve = corr if curve is None else curve + corr
+        curve = np.abs(curve)
+        peak = curve.max()
+        if peak > 0:
+            curve = curve / peak
+        if score is None:
+            score, lags = curve, lags_c
+        elif curve.shape == score.shape:
+            score = score + curve
+    if score is None:
+        return 0
+    return int(np.clip(lags[int(np.argmax(score))] * factor, -max_lag, max_lag))
+
+
+def _refine_scores(pairs, centre: int, radius: int, max_lag: int):
+    """
+    Full-rate correlation for lags ``centre ± radius`` over a short window,
+    scaled by each lag's overlap so it ranks lags like a full correlation.
+    """
+    lag_lo = max(-max_lag, centre - radius)
+    lag_hi = min(max_lag, centre + radius)
+    lags = np.arange(lag_lo, lag_hi + 1)
+    score = np.zeros(lags.size)
+    for a, b in pairs:
+        n_a, n_b = len(a), len(b)
+        # b[s : s + w] against a[s + lag_lo : s + lag_hi + w]
+        s_lo = max(0, -lag_lo)
+        s_hi = min(n_b, n_a - lag_hi)
+        w = min(_ALIGN_REFINE_WINDOW, s_hi - s_lo)
+        if w < 8:
+            continue
+        s = s_lo + (s_hi - s_lo - w) // 2
+        a_seg = a[s + lag_lo: s + lag_hi + w]
+        b_win = b[s: s + w]
+        try:
+            from scipy.signal import correlate as _correlate
+            corr = _correlate(a_seg, b_win, mode="valid")
+        except ImportError:
+            corr = np.correlate(a_seg, b_win, mode="valid")
+        score += np.abs(corr) / w * _overlap_count(n_a, n_b, lags)
+    return lags, score
+
+
+def _subsample_peak(score: np.ndarray, idx: int) -> float:
+    """Parabolic interpolation of the peak at *idx*; returns a fractional shift."""
+    if idx <= 0 or idx >= score.size - 1:
+        return 0.0
+    y0, y1, y2 = float(score[idx - 1]), float(score[idx]), float(score[idx + 1])
+    denom = y0 - 2.0 * y1 + y2
+    if denom >= 0.0:
+        return 0.0
+    return float(np.clip(0.5 * (y0 - y2) / denom, -0.5, 0.5))
+
+
+def _lag_confidence(a: np.ndarray, b: np.ndarray, lag: int) -> float:
+    n_a, n_b = len(a), len(b)
+    lo = max(0, -lag)
+    hi = min(n_b, n_a - lag)
+    if hi <= lo:
+        return 0.0
+    dot = float(np.dot(a[lo + lag: hi + lag], b[lo:hi]))
+    denom = np.sqrt(n_a * n_b)
+    return float(np.clip(abs(dot) / denom if denom > 0 else 0.0, 0.0, 1.0))
+
+
+def _align_pairs(pairs, max_lag: int) -> tuple[float, int]:
+    """Return (fractional best lag, integer best lag) for the channel pairs."""
+    n_max = max(max(len(a), len(b)) for a, b in pairs)
+    if n_max <= _ALIGN_DIRECT_MAX_SAMPLES:
+        score = None
+        for a, b in pairs:
+            lags, corr = _bounded_full_correlation(a, b, max_lag)
+            score = np.abs(corr) if score is None else score + np.abs(corr)
+        if score is None or score.size == 0:
+            return 0.0, 0
+    else:
+        factor = max(
+            1,
+            -(-max_lag // _ALIGN_COARSE_MAX_LAGS),
+            -(-n_max // _ALIGN_COARSE_MAX_SAMPLES),
+        )
+        centre = _coarse_lag(pairs, max_lag, factor)
+        radius = 2 * factor
+        lags, score = _refine_scores(pairs, centre, radius, max_lag)
+        if not score.any():
+            return 0.0, 0
+    best = int(np.argmax(score))
+    best_lag = int(lags[best])
+    return best_lag + _subsample_peak(score, best), best_lag
+
+
+def align_datasets_joint(
+    dataset_a: ImportedDataset,
+    dataset_b: ImportedDataset,
+    channels: list[str],
+    max_offset_s: float = 0.5,
+) -> tuple[float, float]:
+    """
+    Estimate one timing offset from several channels at once.
+
+    Per-channel correlation curves are summed before the peak is picked, so
+    channels that agree reinforce each other and a single noisy channel
+    cannot pull the result off.  Channels missing from either dataset are
+    ignored.  Returns ``(offset_s, confidence)`` with the same conventions
+    as :func:`align_datasets`; confidence is the mean over the channels used.
+
+    Long captures are never correlated end to end.  The search first
+    correlates decimated min/max envelopes over the full ±``max_offset_s``
+    range.  It then refines around the coarse peak with a short full-rate
+    window and finishes with parabolic sub-sample interpolation.
+    """
+    used = [ch for ch in channels if ch in dataset_a.channels and ch in dataset_b.channels]
+    if not used:
+        logger.debug("align_datasets: none of %s present in both datasets", channels)
+        return 0.0, 0.0
+
+    # Use the sample rate of dataset A as the reference.
+    sr = dataset_a.sample_rate if dataset_a.sample_rate > 0 else 1000.0
+    max_lag = int(max_offset_s * sr)
+
+    pairs = [_alignment_pair(dataset_a, dataset_b, ch, sr) for ch in used]
+    pairs = [(a, b) for a, b in pairs if len(a) and len(b)]
+    if not pairs:
+        return 0.0, 0.0
+
+    frac_lag, best_lag = _align_pairs(pairs, max_lag)
+    confidence = float(np.mean([_lag_confidence(a, b, best_lag) for a, b in pairs]))
+
+    offset_s = frac_lag / sr
+    # Clamp to declared max
+    offset_s = float(np.clip(offset_s, -max_offset_s, max_offset_s))
+    return offset_s, confidence
+
+
 def align_datasets(
     dataset_a: ImportedDataset,
     dataset_b: ImportedDataset,
@@ -267,7 +487,7 @@ def align_datasets(
     Returns (offset_s, confidence) where:
       offset_s   — how many seconds dataset B lags behind dataset A
                    (positive → B starts later; apply as ``t_b - offset_s``
-                   to align to A's timeline).
+                   to align to A's timeline).  Sub-sample precision.
       confidence — normalised peak correlation height [0, 1].  Values below
                    ~0.3 indicate that the two channels may not be the same
                    physical signal; the offset should not be trusted blindly.
@@ -275,6 +495,10 @@ def align_datasets(
     If ``channel`` is missing from either dataset the function returns
     (0.0, 0.0) so callers can degrade gracefully.
 
+    Only lags within ±``max_offset_s`` are evaluated, so aligning two long
+    captures costs roughly the same as aligning two short ones (see
+    :func:`align_datasets_joint`).
+
     Args:
         dataset_a:    First (reference) dataset.
         dataset_b:    Second dataset.
@@ -284,55 +508,52 @@ def align_datasets(
     if channel not in dataset_a.channels or channel not in dataset_b.channels:
         logger.debug("align_datasets: channel '%s' missing from one dataset", channel)
         return 0.0, 0.0
+    return align_datasets_joint(dataset_a, dataset_b, [channel], max_offset_s=max_offset_s)
 
-    a = dataset_a.channels[channel].copy()
-    b = dataset_b.channels[channel].copy()
-
-    # Normalise both signals to zero-mean / unit-variance to make correlation
-    # independent of amplitude differences.
-    def _norm(x: np.ndarray) -> np.ndarray:
-        std = x.std()
-        if std < 1e-12:
-            return np.zeros_like(x)
-        return (x - x.mean()) / std
-
-    a_n = _norm(a)
-    b_n = _norm(b)
-
-    # Use the sample rate of dataset A as the reference.
-    sr = dataset_a.sample_rate if dataset_a.sample_rate > 0 else 1000.0
-    max_lag_samples = int(max_offset_s * sr)
-
-    # Full cross-correlation — scipy gives better results but numpy is
-    # sufficient and avoids an optional dependency.
-    try:
-        from scipy.signal import correlate as _correlate, correlation_lags as _lags
-        corr = _correlate(a_n, b_n, mode="full")
-        lags = _lags(len(a_n), len(b_n), mode="full")
-    except ImportError:
-        corr = np.correlate(a_n, b_n, mode="full")
-        lags = np.arange(-(len(b_n) - 1), len(a_n))
-
-    # Restrict search to ±max_lag_samples
-    mask     = np.abs(lags) <= max_lag_samples
-    corr_win = corr[mask]
-    lags_win = lags[mask]
-
-    if len(corr_win) == 0:
-        return 0.0, 0.0
 
-    best_idx    = int(np.argmax(np.abs(corr_win)))
-    best_lag    = int(lags_win[best_idx])
-    best_corr   = float(corr_win[best_idx])
+def _common_grid(
+    dataset_a: ImportedDataset,
+    dataset_b: ImportedDataset,
+    channel: str,
+    timing_offset_s: float,
+    overlap_s: float,
+    max_points: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """
+    Put *channel* of A and B on one uniform grid over their overlap.
 
-    # Normalise confidence: peak / max-possible (sqrt(N_a * N_b))
-    denom = np.sqrt(len(a_n) * len(b_n))
-    confidence = float(np.clip(abs(best_corr) / denom if denom > 0 else 0.0, 0.0, 1.0))
+    The grid rate is the lower of the two native rates, reduced (on the
+    1-2-5 series) when the overlap would exceed *max_points*.  Both signals
+    are anti-alias resampled to that rate via the shared resample cache and
+    B is then interpolated onto A's grid, which only ever interpolates
+    between samples at the comparison rate.
 
-    offset_s = float(best_lag) / sr
-    # Clamp to declared max
-    offset_s = float(np.clip(offset_s, -max_offset_s, max_offset_s))
-    return offset_s, confidence
+    Returns:
+        (t_grid, a_values, b_values, rate_hz); empty arrays when the overlap
+        holds no grid point.
+    """
+    rate = min(native_rate(dataset_a.time), native_rate(dataset_b.time))
+    if overlap_s > 0 and max_points > 0:
+        rate = min(rate, nice_rate(max_points / overlap_s))
+    if not rate > 0:
+        empty = np.empty(0)
+        return empty, empty, empty, 0.0
+
+    t_ra, y_ra = resample_channel(dataset_a, channel, rate)
+    t_rb, y_rb = resample_channel(dataset_b, channel, rate)
+    t_rb = t_rb + timing_offset_s
+
+    t_start = max(float(t_ra[0]), float(t_rb[0]))
+    t_end = min(float(t_ra[-1]), float(t_rb[-1]))
+    i0 = int(np.searchsorted(t_ra, t_start, side="left"))
+    i1 = int(np.searchsorted(t_ra, t_end, side="right"))
+    if i1 - i0 > max_points > 0:
+        step = -(-(i1 - i0) // max_points)
+        sl = slice(i0, i1, step)
+    else:
+        sl = slice(i0, i1)
+    t_grid = t_ra[sl]
+    return t_grid, y_ra[sl], np.interp(t_grid, t_rb, y_rb), rate
 
 
 def compare_channels(
@@ -345,8 +566,10 @@ def compare_channels(
     """
     Compute comparison metrics for a single channel between two datasets.
 
-    Interpolates both signals onto a common time grid (the overlap region
-    after applying ``timing_offset_s``), then computes:
+    Resamples both signals onto a common uniform grid at the lower of the
+    two native rates (anti-aliased polyphase filtering for uniform inputs,
+    see :mod:`src.resampling`) over the overlap region after applying
+    ``timing_offset_s``, then computes:
       - RMS error              sqrt(mean((A − B)²))
       - Peak absolute error    max(|A − B|)
       - Pearson correlation    r(A, B)
@@ -404,12 +627,18 @@ def compare_channels(
             warnings=warnings,
         )
 
-    # Build a common time grid with at most 10 000 points for the overlap
-    n_grid  = min(10_000, max(len(t_a), len(t_b)))
-    t_grid  = np.linspace(t_start, t_end, n_grid)
-
-    a_interp = np.interp(t_grid, t_a, sig_a)
-    b_interp = np.interp(t_grid, t_b, sig_b)
+    t_grid, a_interp, b_interp, grid_rate = _common_grid(
+        dataset_a, dataset_b, channel, timing_offset_s,
+        overlap_s=t_end - t_start, max_points=_COMPARE_MAX_POINTS,
+    )
+    n_grid = int(t_grid.size)
+    if n_grid < 2:
+        # Overlap shorter than one comparison-rate sample: compare raw points.
+        n_grid = 2
+        t_grid = np.array([t_start, t_end])
+        a_interp = np.interp(t_grid, t_a, sig_a)
+        b_interp = np.interp(t_grid, t_b, sig_b)
+        grid_rate = 1.0 / (t_end - t_start)
 
     diff  = a_interp - b_interp
     rms   = float(np.sqrt(np.mean(diff ** 2)))
@@ -429,8 +658,8 @@ def compare_channels(
     delta_rms = float(test_rms - ref_rms)
 
     if channel.startswith(("v_", "i_")) and channel != "v_dc":
-        ref_thd = float(compute_thd(a_interp, fs=dataset_a.sample_rate or 0.0, time_data=t_grid))
-        test_thd = float(compute_thd(b_interp, fs=dataset_a.sample_rate or 0.0, time_data=t_grid))
+        ref_thd = float(compute_thd(a_interp, fs=grid_rate, time_data=t_grid))
+        test_thd = float(compute_thd(b_interp, fs=grid_rate, time_data=t_grid))
     else:
         ref_thd = float("nan")
         test_thd = float("nan")
@@ -465,9 +694,9 @@ def generate_delta_trace(
     """
     Build a delta (difference) trace: delta(t) = A(t) − B(t + timing_offset_s).
 
-    Both signals are interpolated onto a common, evenly-spaced time grid
-    covering only the overlapping region.  The output is decimated to at most
-    ``max_points`` for display.
+    Both signals are anti-alias resampled onto a common, evenly-spaced grid
+    covering only the overlapping region, at a rate chosen so the output
+    holds at most ``max_points`` samples for display.
 
     Args:
         dataset_a:        Reference dataset.
@@ -489,16 +718,11 @@ def generate_delta_trace(
     if t_start >= t_end:
         return np.empty(0), np.empty(0)
 
-    n_grid = min(max_points, max(len(t_a), len(t_b)))
-    t_grid = np.linspace(t_start, t_end, n_grid)
-
-    sig_a = dataset_a.channels[channel]
-    sig_b = dataset_b.channels[channel]
-
-    a_interp = np.interp(t_grid, t_a, sig_a)
-    b_interp = np.interp(t_grid, t_b, sig_b)
-
-    return t_grid, a_interp - b_interp
+    t_grid, a_vals, b_vals, _ = _common_grid(
+        dataset_a, dataset_b, channel, timing_offset_s,
+        overlap_s=t_end - t_start, max_points=max_points,
+    )
+    return t_grid, a_vals - b_vals
 
 
 def compare_datasets(
@@ -40,6 +40,7 @@ from typing import Dict, List, Optional
 
 import numpy as np
 
+from src.event_detector import DetectedEvent
 from src.signal_processing import compute_rms, compute_thd
 from src.session_analysis import compute_session_metrics, dataset_for_analysis, events_for_capsule
 
@@ -858,8 +859,13 @@ def evaluate_session(
     session_data: Dict,
     profile: str = "project_demo",
     thresholds: Optional[Dict] = None,
+    events: Optional[List[DetectedEvent]] = None,
 ) -> List[Dict]:
-    """Run the selected profile against a session; return list of check results."""
+    """
+    Run the selected profile against a session; return list of check results.
+
+    Pass *events* already detected for this session to skip re-detection.
+    """
     capsule = _build_capsule(session_data)
     frames = capsule.get("frames", [])
     if not frames:
@@ -894,7 +900,8 @@ def evaluate_session(
 
     dataset = dataset_for_analysis(capsule)
     arr = _dataset_arrays_for_checks(dataset)
-    events = events_for_capsule(capsule)
+    if events is None:
+        events = events_for_capsule(capsule)
     summary = compute_session_metrics(capsule, events=events)
 
     # Auto-adjust nominal_v_rms when probe/sensor scale differs from expected.
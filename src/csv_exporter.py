@@ -2,7 +2,6 @@
 Robust CSV Export with validation and metadata
 Designed for GFM senior design capstone evaluation
 """
-import csv
 import json
 import os
 import logging
@@ -10,8 +9,22 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 
+import numpy as np
+
+from src.columnar_csv import PRECISION_NOTE, TIME_FORMAT, write_csv_blocks, write_frames_csv
+
 logger = logging.getLogger(__name__)
 
+_SIMPLE_KEYS = ["ts", "v_an", "v_bn", "v_cn", "i_a", "i_b", "i_c", "freq"]
+_ANALYSIS_COLUMNS = [
+    "timestamp", "sample_index",
+    "v_an", "v_bn", "v_cn", "v_rms", "v_imbalance_pct",
+    "i_a", "i_b", "i_c", "i_rms",
+    "freq", "freq_deviation_hz",
+    "power_real_w", "power_reactive_var",
+    "fault_active", "event_marker",
+]
+
 class CSVExporter:
     """
     Export telemetry data to CSV with validation and rich metadata.
@@ -119,23 +132,15 @@ class CSVExporter:
                 if include_metadata:
                     self._write_metadata_header(csvfile, session_data, "simple")
                 
-                writer = csv.writer(csvfile)
-                
-                # Header row
-                writer.writerow(["timestamp", "v_an", "v_bn", "v_cn", "i_a", "i_b", "i_c", "freq"])
-                
-                # Data rows
-                for frame in frames:
-                    writer.writerow([
-                        frame.get("ts", 0.0),
-                        frame.get("v_an", 0.0),
-                        frame.get("v_bn", 0.0),
-                        frame.get("v_cn", 0.0),
-                        frame.get("i_a", 0.0),
-                        frame.get("i_b", 0.0),
-                        frame.get("i_c", 0.0),
-                        frame.get("freq", 60.0)
-                    ])
+                # Absent channels are written as empty cells, never as zeros
+                def _block(start, stop):
+                    chunk = frames[start:stop]
+                    return [[frame.get(key) for frame in chunk] for key in _SIMPLE_KEYS]
+
+                write_csv_blocks(
+                    csvfile, ["timestamp", *_SIMPLE_KEYS[1:]], len(frames), _block,
+                    formats=[TIME_FORMAT],
+                )
             
             self.last_export_stats = {
                 "format": "simple",
@@ -166,12 +171,7 @@ class CSVExporter:
                 if include_metadata:
                     self._write_metadata_header(csvfile, session_data, "detailed")
                 
-                writer = csv.DictWriter(csvfile, fieldnames=field_list, extrasaction='ignore')
-                writer.writeheader()
-                
-                # Write all frames
-                for frame in frames:
-                    writer.writerow(frame)
+                write_frames_csv(csvfile, frames, field_list)
             
             self.last_export_stats = {
                 "format": "detailed",
@@ -194,53 +194,13 @@ class CSVExporter:
                 if include_metadata:
                     self._write_metadata_header(csvfile, session_data, "analysis")
                 
-                writer = csv.writer(csvfile)
-                
-                # Header with computed fields
-                writer.writerow([
-                    "timestamp", "sample_index",
-                    "v_an", "v_bn", "v_cn", "v_rms", "v_imbalance_pct",
-                    "i_a", "i_b", "i_c", "i_rms",
-                    "freq", "freq_deviation_hz",
-                    "power_real_w", "power_reactive_var",
-                    "fault_active", "event_marker"
-                ])
-                
-                # Compute reference values
-                freq_nominal = 60.0
                 events_by_ts = {e.get("ts"): e.get("type", "unknown") for e in session_data.get("events", [])}
-                
-                # Data rows with computed metrics
-                for idx, frame in enumerate(frames):
-                    ts = frame.get("ts", 0.0)
-                    v_an = frame.get("v_an", 0.0)
-                    v_bn = frame.get("v_bn", 0.0)
-                    v_cn = frame.get("v_cn", 0.0)
-                    i_a = frame.get("i_a", 0.0)
-                    i_b = frame.get("i_b", 0.0)
-                    i_c = frame.get("i_c", 0.0)
-                    freq = frame.get("freq", freq_nominal)
-                    
-                    # Compute derived metrics
-                    v_rms = (abs(v_an) + abs(v_bn) + abs(v_cn)) / (3.0 * 1.414)  # Approx
-                    v_avg = (abs(v_an) + abs(v_bn) + abs(v_cn)) / 3.0
-                    v_imbalance = max(abs(v_an - v_avg), abs(v_bn - v_avg), abs(v_cn - v_avg)) / v_avg * 100 if v_avg > 0 else 0.0
-                    i_rms = (abs(i_a) + abs(i_b) + abs(i_c)) / (3.0 * 1.414)  # Approx
-                    freq_deviation = freq - freq_nominal
-                    power_real = v_rms * i_rms  # Simplified, ignoring power factor
-                    power_reactive = 0.0  # Placeholder
-                    
-                    fault_active = 1 if frame.get("fault_type") else 0
-                    event_marker = events_by_ts.get(ts, "")
-                    
-                    writer.writerow([
-                        ts, idx,
-                        v_an, v_bn, v_cn, v_rms, v_imbalance,
-                        i_a, i_b, i_c, i_rms,
-                        freq, freq_deviation,
-                        power_real, power_reactive,
-                        fault_active, event_marker
-                    ])
+
+                write_csv_blocks(
+                    csvfile, _ANALYSIS_COLUMNS, len(frames),
+                    lambda start, stop: self._analysis_block(frames, start, stop, events_by_ts),
+                    formats=[TIME_FORMAT],
+                )
             
             self.last_export_stats = {
                 "format": "analysis",
@@ -253,6 +213,43 @@ class CSVExporter:
             logger.error(f"Analysis export failed: {e}")
             return False
     
+    @staticmethod
+    def _analysis_block(frames: List[Dict], start: int, stop: int, events_by_ts: Dict) -> List[Any]:
+        """Columns of the analysis export for frames[start:stop], computed vectorized.
+
+        Missing channels are NaN, so every metric derived from them is written
+        as an empty cell rather than a value computed from a stand-in zero.
+        """
+        chunk = frames[start:stop]
+
+        def channel(key: str) -> np.ndarray:
+            return np.array([frame.get(key) for frame in chunk], dtype=np.float64)
+
+        freq_nominal = 60.0
+        v_an, v_bn, v_cn = channel("v_an"), channel("v_bn"), channel("v_cn")
+        i_a, i_b, i_c = channel("i_a"), channel("i_b"), channel("i_c")
+        freq = channel("freq")
+        ts = [frame.get("ts") for frame in chunk]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            v_abs = np.abs(v_an) + np.abs(v_bn) + np.abs(v_cn)
+            v_rms = v_abs / (3.0 * 1.414)  # Approx
+            v_avg = v_abs / 3.0
+            spread = np.maximum.reduce([np.abs(v_an - v_avg), np.abs(v_bn - v_avg), np.abs(v_cn - v_avg)])
+            v_imbalance = np.where(v_avg > 0, spread / v_avg * 100, np.where(np.isnan(v_avg), np.nan, 0.0))
+            i_rms = (np.abs(i_a) + np.abs(i_b) + np.abs(i_c)) / (3.0 * 1.414)  # Approx
+            power_real = v_rms * i_rms  # Simplified, ignoring power factor
+
+        return [
+            ts, np.arange(start, stop),
+            v_an, v_bn, v_cn, v_rms, v_imbalance,
+            i_a, i_b, i_c, i_rms,
+            freq, freq - freq_nominal,
+            power_real, np.zeros(len(chunk)),  # Reactive power: placeholder
+            [1 if frame.get("fault_type") else 0 for frame in chunk],
+            [events_by_ts.get(t, "") for t in ts],
+        ]
+
     def _write_metadata_header(self, csvfile, session_data: Dict, format_type: str):
         """Write metadata as commented header lines"""
         meta = session_data.get("meta", {})
@@ -264,6 +261,7 @@ class CSVExporter:
         csvfile.write(f"# Session Start: {meta.get('start_time', 'unknown')}\n")
         csvfile.write(f"# Frame Count: {meta.get('frame_count', len(session_data.get('frames', [])))}\n")
         csvfile.write(f"# Event Count: {len(session_data.get('events', []))}\n")
+        csvfile.write(f"# Precision: {PRECISION_NOTE}\n")
         csvfile.write("#\n")
         csvfile.write("# Column Units:\n")
         csvfile.write("#   timestamp: seconds (Unix epoch)\n")
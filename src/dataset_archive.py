@@ -0,0 +1,162 @@
+"""
+Binary columnar dataset archive for evidence packages.
+
+``normalized_frames.csv`` is convenient to eyeball but slow to re-parse and
+is usually a downsampled preview.  ``normalized_dataset.npz`` carries the
+same normalized dataset at full resolution as raw float arrays:
+
+  - ``time``        the dataset's time axis in seconds, exactly as imported
+                    (``dataset.time``: not re-zeroed, so an absolute or
+                    epoch-based axis stays absolute);
+  - ``ch_000`` …    one array per channel, in ``schema["channels"]`` order
+                    (channel names are kept in the schema, not in the zip
+                    member names, so any header text is safe);
+  - ``schema``      a JSON document (0-d unicode array) describing the
+                    arrays — name, unit, dtype, applied scale factor —
+                    plus source provenance.
+
+Canonical channels take their unit from ``CANONICAL_SIGNALS``; any other
+channel keeps the unit of the source column it was mapped from (the import
+mapping), as inferred from its header — e.g. ``Pinv(W)`` → ``W``.
+
+Values are engineering units.  ``scale_factor`` is the factor that was
+already applied at import/mapping time (``raw = value / scale_factor``);
+it is recorded for traceability, not for the reader to apply.
+
+The archive is a plain, uncompressed ``.npz`` written straight from the
+in-memory arrays, so it costs about as much as copying the bytes to disk.
+Read it with :func:`load_dataset_npz` (no pickle involved), or with
+``numpy.load`` and ``json.loads(str(archive["schema"]))``.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.channel_mapping import CANONICAL_SIGNALS, infer_unit_from_header
+from src.file_ingestion import ImportedDataset
+
+ARCHIVE_FORMAT = "redbyte-columnar-npz"
+ARCHIVE_VERSION = 1
+
+
+def dataset_schema(dataset: ImportedDataset, scale_factors: dict | None = None) -> dict:
+    """Describe *dataset* as it is laid out by :func:`write_dataset_npz`."""
+    factors = dict(dataset.meta.get("scale_factors", {}))
+    factors.update(scale_factors or {})
+    channels = []
+    for index, (name, values) in enumerate(dataset.channels.items()):
+        signal = CANONICAL_SIGNALS.get(name, {})
+        channels.append({
+            "name": name,
+            "key": f"ch_{index:03d}",
+            "unit": _channel_unit(dataset, name),
+            "label": signal.get("label", name),
+            "dtype": np.asarray(values).dtype.str,
+            "scale_factor": float(factors.get(name, 1.0)),
+        })
+    return {
+        "format": ARCHIVE_FORMAT,
+        "version": ARCHIVE_VERSION,
+        "row_count": int(dataset.row_count),
+        "sample_rate_hz": float(dataset.sample_rate or 0.0),
+        "duration_s": float(dataset.duration or 0.0),
+        "source_type": dataset.source_type,
+        "source_path": dataset.source_path,
+        "time": {"key": "time", "unit": "s", "dtype": np.asarray(dataset.time).dtype.str},
+        "channels": channels,
+    }
+
+
+def _channel_unit(dataset: ImportedDataset, name: str) -> str:
+    """Unit of channel *name*: canonical, recorded, or from its source header."""
+    if name in CANONICAL_SIGNALS:
+        return CANONICAL_SIGNALS[name].get("unit", "")
+    known = dataset.meta.get("units", {}).get(name)
+    if known:
+        return known
+    mapping = dataset.meta.get("applied_mapping", {})
+    sources = [header for header, target in mapping.items() if target == name]
+    for header in (*sources, name):
+        unit = infer_unit_from_header(header)
+        if unit:
+            return unit
+    return ""
+
+
+def write_dataset_npz(
+    dataset: ImportedDataset,
+    path: Path,
+    *,
+    scale_factors: dict | None = None,
+) -> dict:
+    """
+    Write *dataset* to an uncompressed ``.npz`` archive at *path*.
+
+    Arrays are passed to numpy as-is (no dtype conversion or stacking), so
+    nothing larger than numpy's write buffer is copied.
+
+    Returns:
+        Summary dict for the package metadata: path, size, rows, channels.
+    """
+    path = Path(path)
+    schema = dataset_schema(dataset, scale_factors)
+    arrays: dict[str, Any] = {"time": np.asarray(dataset.time)}
+    for entry in schema["channels"]:
+        arrays[entry["key"]] = np.asarray(dataset.channels[entry["name"]])
+    arrays["schema"] = np.array(json.dumps(schema, sort_keys=True))
+
+    with open(path, "wb") as handle:
+        np.savez(handle, **arrays)
+    return {
+        "path": str(path.resolve()),
+        "format": ARCHIVE_FORMAT,
+        "version": ARCHIVE_VERSION,
+        "rows_written": schema["row_count"],
+        "channels": [entry["name"] for entry in schema["channels"]],
+        "size_bytes": path.stat().st_size,
+    }
+
+
+def load_dataset_npz(path: str | Path) -> ImportedDataset:
+    """
+    Load an archive written by :func:`write_dataset_npz`.
+
+    Returns an :class:`ImportedDataset` with the original channel names;
+    the schema is available as ``dataset.meta["schema"]`` and per-channel
+    units as ``dataset.meta["units"]``.
+
+    Raises:
+        ValueError: *path* is not a columnar dataset archive.
+    """
+    with np.load(path, allow_pickle=False) as archive:
+        if "schema" not in archive.files:
+            raise ValueError(f"{path} is not a columnar dataset archive (no schema)")
+        schema = json.loads(str(archive["schema"]))
+        if schema.get("format") != ARCHIVE_FORMAT:
+            raise ValueError(f"{path}: unsupported archive format {schema.get('format')!r}")
+        time = archive[schema["time"]["key"]]
+        channels = {entry["name"]: archive[entry["key"]] for entry in schema["channels"]}
+
+    return ImportedDataset(
+        source_type=schema.get("source_type", ""),
+        source_path=schema.get("source_path", ""),
+        channels=channels,
+        time=time,
+        sample_rate=float(schema.get("sample_rate_hz", 0.0)),
+        duration=float(schema.get("duration_s", 0.0)),
+        meta={
+            "schema": schema,
+            "units": {entry["name"]: entry["unit"] for entry in schema["channels"]},
+            "scale_factors": {
+                entry["name"]: entry["scale_factor"]
+                for entry in schema["channels"]
+                if entry["scale_factor"] != 1.0
+            },
+        },
+        raw_headers=list(channels),
+    )
@@ -0,0 +1,237 @@
+"""
+Concurrent execution of independent export artifacts.
+
+Evidence packages are a handful of artifacts that do not depend on each
+other: matplotlib figures, CSV files and JSON dumps.  ``run_export_tasks``
+runs them side by side:
+
+  - ``"plot"`` tasks run in a process pool.  matplotlib is not thread-safe,
+    and rendering is CPU-bound, so separate processes are the only way to
+    draw several figures at once.  The pool uses the ``spawn`` start method
+    (safe next to Qt threads) and is kept alive between exports so only the
+    first export pays the worker start-up cost.
+  - ``"io"`` tasks (CSV/JSON writers, metric computation) run in a thread
+    pool alongside the plots.
+
+Every task is isolated: an exception is captured in
+``ExportRun.errors`` and never cancels the other artifacts.
+
+``REDBYTE_EXPORT_MODE`` selects the strategy:
+
+  - ``processes`` (default) — as above;
+  - ``threads`` — plot tasks run one at a time in the thread pool (also
+    the automatic fallback for frozen builds, single-core hosts where
+    worker processes are pure overhead, or a broken worker pool);
+  - ``serial`` — every task runs in order on the calling thread, which is
+    the pre-concurrency behaviour and the benchmark baseline.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+EXPORT_MODE_ENV = "REDBYTE_EXPORT_MODE"
+_EXPORT_MODES = ("processes", "threads", "serial")
+_MAX_PLOT_WORKERS = 4
+_MAX_IO_WORKERS = 4
+
+ProgressCallback = Callable[[int, int, str], None]
+
+
+@dataclass
+class ExportTask:
+    """One independent artifact: ``func(*args, **kwargs)``."""
+    name:   str
+    func:   Callable[..., Any]
+    args:   tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    kind:   str = "io"        # "plot" → process pool, "io" → thread pool
+
+
+@dataclass
+class ExportRun:
+    """Results of :func:`run_export_tasks` keyed by task name."""
+    results:   dict[str, Any] = field(default_factory=dict)
+    errors:    dict[str, BaseException] = field(default_factory=dict)
+    durations: dict[str, float] = field(default_factory=dict)   # per-task seconds
+    elapsed_s: float = 0.0
+
+    def raise_first_error(self, order: list[str]) -> None:
+        """Re-raise the first failed task in *order*, if any."""
+        for name in order:
+            if name in self.errors:
+                raise self.errors[name]
+
+
+# ---------------------------------------------------------------------------
+# Plot worker pool
+# ---------------------------------------------------------------------------
+
+_pool_lock = threading.Lock()
+_plot_pool: Optional[ProcessPoolExecutor] = None
+_inline_plot_lock = threading.Lock()
+
+
+def export_mode() -> str:
+    """Return the configured export strategy (see module docstring)."""
+    mode = os.getenv(EXPORT_MODE_ENV, "processes").strip().lower()
+    if mode not in _EXPORT_MODES:
+        logger.warning("Unknown %s=%r; using 'processes'", EXPORT_MODE_ENV, mode)
+        mode = "processes"
+    if mode == "processes" and (getattr(sys, "frozen", False) or (os.cpu_count() or 1) < 2):
+        return "threads"
+    return mode
+
+
+def _get_plot_pool() -> Optional[ProcessPoolExecutor]:
+    global _plot_pool
+    if export_mode() != "processes":
+        return None
+    with _pool_lock:
+        if _plot_pool is None:
+            try:
+                workers = max(1, min(_MAX_PLOT_WORKERS, os.cpu_count() or 1))
+                _plot_pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            except (OSError, ValueError, NotImplementedError) as exc:
+                logger.warning("Export plot workers unavailable, rendering inline: %s", exc)
+                return None
+        return _plot_pool
+
+
+def _discard_plot_pool() -> None:
+    global _plot_pool
+    with _pool_lock:
+        pool, _plot_pool = _plot_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_export_workers() -> None:
+    """Stop the shared plot worker processes (also registered at exit)."""
+    global _plot_pool
+    with _pool_lock:
+        pool, _plot_pool = _plot_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_export_workers)
+
+
+def _run_plot_inline(task: ExportTask) -> Any:
+    # matplotlib's pyplot state is global: one figure at a time per process.
+    with _inline_plot_lock:
+        return task.func(*task.args, **task.kwargs)
+
+
+def _timed(run: "ExportRun", task: ExportTask, func: Callable[..., Any], *args) -> Any:
+    started = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        run.durations[task.name] = time.perf_counter() - started
+
+
+def _call(task: ExportTask) -> Any:
+    return task.func(*task.args, **task.kwargs)
+
+
+def _run_plot(task: ExportTask) -> Any:
+    """Render *task* in a worker process; fall back to inline rendering."""
+    pool = _get_plot_pool()
+    if pool is None:
+        return _run_plot_inline(task)
+    try:
+        return pool.submit(task.func, *task.args, **task.kwargs).result()
+    except BrokenProcessPool as exc:
+        logger.warning("Export plot worker died (%s); rendering '%s' inline", exc, task.name)
+        _discard_plot_pool()
+        return _run_plot_inline(task)
+
+
+def _report(progress: Optional[ProgressCallback], done: int, total: int, name: str) -> None:
+    if progress is None:
+        return
+    try:
+        progress(done, total, name)
+    except Exception as exc:
+        logger.debug("Export progress callback failed: %s", exc)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def run_export_tasks(
+    tasks: list[ExportTask],
+    progress: Optional[ProgressCallback] = None,
+    max_io_workers: int = _MAX_IO_WORKERS,
+) -> ExportRun:
+    """
+    Run *tasks* concurrently and wait for all of them.
+
+    Args:
+        tasks:          Independent tasks; names must be unique.
+        progress:       Called as ``progress(done, total, name)`` from the
+                        calling thread after each task finishes.
+        max_io_workers: Thread pool size for ``"io"`` tasks.
+
+    Returns:
+        ExportRun with per-task results and captured exceptions.
+    """
+    run = ExportRun()
+    if not tasks:
+        return run
+    started = time.perf_counter()
+    n_plot = sum(1 for t in tasks if t.kind == "plot")
+
+    if export_mode() == "serial":
+        for done, task in enumerate(tasks, start=1):
+            try:
+                run.results[task.name] = _timed(run, task, _call, task)
+            except Exception as exc:
+                logger.warning("Export task '%s' failed: %s", task.name, exc)
+                run.errors[task.name] = exc
+            _report(progress, done, len(tasks), task.name)
+        run.elapsed_s = time.perf_counter() - started
+        return run
+
+    # Plot tasks only block a thread while waiting on their worker process.
+    workers = max(1, min(max_io_workers, len(tasks) - n_plot)) + n_plot
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="export") as pool:
+        futures: dict[Future, ExportTask] = {}
+        for task in tasks:
+            runner = _run_plot if task.kind == "plot" else _call
+            futures[pool.submit(_timed, run, task, runner, task)] = task
+
+        for done, future in enumerate(as_completed(futures), start=1):
+            task = futures[future]
+            try:
+                run.results[task.name] = future.result()
+            except Exception as exc:
+                logger.warning("Export task '%s' failed: %s", task.name, exc)
+                run.errors[task.name] = exc
+            _report(progress, done, len(tasks), task.name)
+
+    run.elapsed_s = time.perf_counter() - started
+    logger.info(
+        "Export tasks: %d done (%d plot, %d failed) in %.2fs",
+        len(tasks), n_plot, len(run.errors), run.elapsed_s,
+    )
+    return run
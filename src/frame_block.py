@@ -0,0 +1,117 @@
+"""
+Column blocks of live telemetry frames.
+
+At kHz frame rates one cross-thread signal per frame floods the Qt event
+queue.  :class:`~src.serial_reader.SerialManager` therefore packs the frames
+it reads into a :class:`FrameBlock` and emits ``frames_received(block)`` at
+a capped rate.  A block holds:
+
+  - ``ts`` and one float64 array per numeric key (NaN where a frame lacks
+    the key), for widgets that append whole columns to their buffers;
+  - ``extras`` — per-frame lists for non-numeric keys (``fault_type`` …);
+  - ``frames`` — the original frame dicts, for consumers that log or
+    inspect individual frames (recorder, insight engine);
+  - ``received_at`` — the ``perf_counter()`` receive stamp of the oldest
+    read in the block while latency probes are on (see :mod:`src.latency_probe`), else
+    None.
+
+This module has no Qt dependency.
+"""
+
+from __future__ import annotations
+
+import math
+from numbers import Real
+from typing import Any, Callable, Iterable, Optional
+
+import numpy as np
+
+_NAN = float("nan")
+
+
+class FrameBlock:
+    """An ordered batch of telemetry frames in columnar form."""
+
+    __slots__ = ("ts", "columns", "extras", "frames", "received_at")
+
+    def __init__(
+        self,
+        ts: np.ndarray,
+        columns: dict[str, np.ndarray],
+        extras: Optional[dict[str, list]] = None,
+        frames: Optional[list[dict]] = None,
+    ):
+        self.ts = ts
+        self.columns = columns
+        self.extras = extras or {}
+        self.frames = frames if frames is not None else []
+        self.received_at: Optional[float] = None
+
+    @classmethod
+    def from_frames(cls, frames: Iterable[dict]) -> "FrameBlock":
+        """Pack frame dicts; keys are taken from the union of all frames."""
+        frames = list(frames)
+        keys: dict[str, None] = {}
+        for frame in frames:
+            keys.update(dict.fromkeys(frame))
+        keys.pop("ts", None)
+
+        columns: dict[str, np.ndarray] = {}
+        extras: dict[str, list] = {}
+        for key in keys:
+            values = [frame.get(key) for frame in frames]
+            if all(v is None or (isinstance(v, Real) and not isinstance(v, bool)) for v in values):
+                columns[key] = np.fromiter(
+                    (_NAN if v is None else v for v in values), dtype=np.float64, count=len(values)
+                )
+            else:
+                extras[key] = values
+        ts = np.fromiter(
+            (_float_or_nan(frame.get("ts")) for frame in frames), dtype=np.float64, count=len(frames)
+        )
+        return cls(ts, columns, extras, frames)
+
+    def __len__(self) -> int:
+        return int(self.ts.size)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.columns or key in self.extras
+
+    def column(self, key: str, default: float = _NAN) -> np.ndarray:
+        """Values of numeric *key*; absent keys and missing samples read as *default*."""
+        values = self.columns.get(key)
+        if values is None:
+            return np.full(len(self), default, dtype=np.float64)
+        if math.isnan(default):
+            return values
+        return np.where(np.isnan(values), default, values)
+
+    def last(self, key: str, default: Any = None) -> Any:
+        """Latest non-missing value of *key* in the block."""
+        for frame in reversed(self.frames):
+            value = frame.get(key)
+            if value is not None:
+                return value
+        return default
+
+
+def _float_or_nan(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+def connect_frame_stream(source, on_block: Callable[[FrameBlock], None]) -> None:
+    """
+    Deliver *source*'s telemetry to *on_block* as frame blocks.
+
+    Uses ``source.frames_received`` when available (SerialManager); sources
+    that only have the per-frame ``frame_received`` signal get each frame
+    wrapped in a one-frame block.
+    """
+    blocks = getattr(source, "frames_received", None)
+    if blocks is not None:
+        blocks.connect(on_block)
+    else:
+        source.frame_received.connect(lambda frame: on_block(FrameBlock.from_frames([frame])))
@@ -0,0 +1,128 @@
+"""
+Bounded hand-off of frame blocks from the reader thread to the GUI thread.
+
+Without a bound, blocks the GUI thread has not got to yet pile up in the Qt
+event loop.  :class:`FrameQueue` holds at most ``capacity`` frames and
+applies one of :data:`POLICIES` when a new block does not fit:
+
+  - ``"block"``: the reader thread waits for the GUI thread to make room
+    (the adapter's own buffers absorb the backlog);
+  - ``"drop_oldest"``: whole blocks are discarded from the front until the
+    new one fits;
+  - ``"coalesce"``: the queue only ever holds the newest block — anything
+    not yet delivered is replaced, full or not.
+
+Dropped frames, the current and peak depth and the time blocks wait before
+delivery are counted (:meth:`FrameQueue.stats`).
+
+Only the display path goes through the queue: consumers that must see
+every frame (the recorder) are fed before it, see
+:meth:`~src.serial_reader.SerialManager.add_frame_sink`.
+
+This module has no Qt dependency.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+POLICIES = ("block", "drop_oldest", "coalesce")
+DEFAULT_POLICY = "drop_oldest"
+DEFAULT_CAPACITY = 50_000           # frames
+_WAIT_WINDOW = 256                  # blocks
+
+
+@dataclass
+class QueueStats:
+    """Snapshot of a :class:`FrameQueue`."""
+    policy: str = DEFAULT_POLICY
+    capacity: int = DEFAULT_CAPACITY
+    depth: int = 0                  # frames queued now
+    depth_peak: int = 0
+    dropped: int = 0                # frames discarded by the policy
+    wait_ms_avg: float = 0.0        # enqueue → delivery, recent blocks
+    wait_ms_max: float = 0.0
+
+
+class FrameQueue:
+    """Thread-safe bounded queue of frame blocks (anything with ``len()``)."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, policy: str = DEFAULT_POLICY):
+        if policy not in POLICIES:
+            raise ValueError(f"unknown queue policy '{policy}', expected one of {POLICIES}")
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = int(capacity)
+        self.policy = policy
+        self._blocks: deque = deque()               # (enqueued_at, block)
+        self._depth = 0
+        self._depth_peak = 0
+        self._dropped = 0
+        self._waits: deque = deque(maxlen=_WAIT_WINDOW)
+        self._closed = False
+        self._armed = True                          # consumer needs a wake-up
+        self._cond = threading.Condition()
+
+    def put(self, block) -> bool:
+        """Enqueue *block*; True if the consumer should be woken to drain.
+
+        With the ``"block"`` policy this waits for room unless the queue is
+        closed; a block larger than the whole capacity is let through once
+        the queue is empty.
+        """
+        n = len(block)
+        with self._cond:
+            if self.policy == "block":
+                while (not self._closed and self._blocks
+                       and self._depth + n > self.capacity):
+                    self._cond.wait(0.1)
+            elif self.policy == "coalesce":
+                self._drop_front(len(self._blocks))
+            else:
+                while self._blocks and self._depth + n > self.capacity:
+                    self._drop_front(1)
+            self._blocks.append((time.monotonic(), block))
+            self._depth += n
+            self._depth_peak = max(self._depth_peak, self._depth)
+            wake, self._armed = self._armed, False
+            return wake
+
+    def drain(self) -> list:
+        """Remove and return every queued block, oldest first."""
+        with self._cond:
+            now = time.monotonic()
+            blocks = [block for _, block in self._blocks]
+            self._waits.extend(now - enqueued for enqueued, _ in self._blocks)
+            self._blocks.clear()
+            self._depth = 0
+            self._armed = True
+            self._cond.notify_all()
+        return blocks
+
+    def close(self) -> None:
+        """Stop ``put`` from waiting (used when the reader thread shuts down)."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def stats(self) -> QueueStats:
+        with self._cond:
+            waits = list(self._waits)
+            return QueueStats(
+                policy=self.policy,
+                capacity=self.capacity,
+                depth=self._depth,
+                depth_peak=self._depth_peak,
+                dropped=self._dropped,
+                wait_ms_avg=round(1000.0 * sum(waits) / len(waits), 3) if waits else 0.0,
+                wait_ms_max=round(1000.0 * max(waits), 3) if waits else 0.0,
+            )
+
+    def _drop_front(self, count: int) -> None:
+        for _ in range(count):
+            _, block = self._blocks.popleft()
+            self._depth -= len(block)
+            self._dropped += len(block)
@@ -0,0 +1,335 @@
+"""
+Headless analysis pipeline behind ``redbyte-hil-suite analyze``.
+
+Runs the same chain as the import dialog and the compliance page —
+ingest → map (+ derived channels) → capsule → detect → metrics →
+compliance → optional evidence package — without importing Qt, so it runs
+on build agents that have no display stack.
+
+    redbyte-hil-suite analyze scope_a.csv scope_b.csv run.xlsx \\
+        --mapping-profile rigol_3phase --profile ieee_2800_inspired \\
+        --export exports/batch --jobs 4 --output results.jsonl
+
+Every input produces one JSON object per line, in input order:
+
+  - ``status`` is ``"ok"`` or ``"error"`` (with ``stage`` and ``error``);
+  - ``events``, ``compliance`` and ``metrics`` summarise the analysis;
+  - ``timings_s`` holds the wall time of each stage, so pipeline
+    throughput can be measured directly from the output.
+
+Channel mapping uses a saved :class:`~src.channel_mapping.ChannelMapper`
+profile when ``--mapping-profile`` is given, otherwise the same automatic
+suggestion (plus Rigol three-phase defaults) the import dialog starts from.
+Rigol ×100 probe scaling is detected exactly as on import.
+
+Exit status: 0 when every file was analysed, 1 when any file failed,
+2 on usage errors.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional
+
+from src.analysis_cache import json_default
+from src.channel_mapping import (
+    _PROFILES_PATH,
+    ChannelMapper,
+    apply_rigol_three_phase_defaults,
+    detect_probe_scale,
+)
+from src.compliance_checker import available_profiles, evaluate_session
+from src.dataset_converter import dataset_to_session
+from src.event_detector import detect_events
+from src.export_tasks import EXPORT_MODE_ENV
+from src.file_ingestion import ingest_file
+from src.session_analysis import APP_VERSION, compute_session_metrics, dataset_for_analysis
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("ingest", "map", "capsule", "detect", "metrics", "compliance", "export")
+AUTO_MAPPING = "auto"
+
+
+def _timed_stage(timings: dict, stage: str, func, *args, **kwargs):
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        timings[stage] = round(time.perf_counter() - start, 6)
+
+
+def resolve_mapping(dataset, mapper: ChannelMapper, mapping_profile: Optional[str]) -> dict[str, str]:
+    """
+    Return the source → canonical mapping for *dataset*.
+
+    Raises:
+        ValueError: *mapping_profile* names a profile that is not saved.
+    """
+    if not mapping_profile or mapping_profile == AUTO_MAPPING:
+        suggested = mapper.auto_suggest(dataset.raw_headers)
+        return apply_rigol_three_phase_defaults(dataset.raw_headers, suggested)
+    mapping = mapper.load_profile(mapping_profile)
+    if mapping is None:
+        raise ValueError(
+            f"Unknown channel mapping profile {mapping_profile!r}; "
+            f"saved profiles: {mapper.list_profiles() or 'none'}"
+        )
+    return mapping
+
+
+def _compliance_summary(profile: str, checks: list[dict]) -> dict:
+    statuses = Counter(str(check.get("status", "")) for check in checks)
+    return {
+        "profile": profile,
+        "passed": bool(checks) and "FAIL" not in statuses,
+        "status_counts": dict(sorted(statuses.items())),
+        "checks": [
+            {
+                "name": check.get("name"),
+                "status": check.get("status"),
+                "measured": check.get("measured"),
+                "threshold": check.get("threshold"),
+                "units": check.get("units"),
+            }
+            for check in checks
+        ],
+    }
+
+
+def analyze_file(
+    path: str,
+    *,
+    mapping_profile: Optional[str] = None,
+    profile: str = "project_demo",
+    export_dir: Optional[str] = None,
+    profiles_path: str = _PROFILES_PATH,
+    artifact_cache_dir: Optional[str] = None,
+) -> dict:
+    """
+    Run the full analysis pipeline on one file and return its result record.
+
+    Never raises for a bad input: failures are reported in the record as
+    ``status="error"`` with the ``stage`` that failed.
+    """
+    timings: dict[str, float] = {}
+    record: dict = {"path": str(path), "status": "ok"}
+    started = time.perf_counter()
+    stage = STAGES[0]
+    try:
+        dataset = _timed_stage(timings, stage, ingest_file, str(path))
+        record.update(
+            source_type=dataset.source_type,
+            rows=int(dataset.row_count),
+            sample_rate_hz=round(float(dataset.sample_rate), 6),
+            duration_s=round(float(dataset.duration), 6),
+        )
+
+        stage = "map"
+        mapper = ChannelMapper(profiles_path)
+
+        def _map():
+            mapping = resolve_mapping(dataset, mapper, mapping_profile)
+            scale_factors, probe_note = detect_probe_scale(dataset, mapping)
+            mapped = mapper.apply(dataset, mapping, scale_factors=scale_factors or None)
+            return mapped, scale_factors, probe_note
+
+        mapped, scale_factors, probe_note = _timed_stage(timings, stage, _map)
+        record.update(
+            mapping_profile=mapping_profile or AUTO_MAPPING,
+            channels=sorted(mapped.channels),
+            scale_factors=scale_factors,
+        )
+
+        stage = "capsule"
+        capsule = _timed_stage(timings, stage, dataset_to_session, mapped)
+        capsule["_dataset"] = mapped
+        if probe_note:
+            capsule.setdefault("import_meta", {}).setdefault("notes", []).append(probe_note)
+
+        stage = "detect"
+        events = _timed_stage(timings, stage, lambda: detect_events(dataset_for_analysis(capsule)))
+        record["events"] = {
+            "total": len(events),
+            "by_type": dict(sorted(Counter(event.kind for event in events).items())),
+        }
+
+        stage = "metrics"
+        metrics = _timed_stage(timings, stage, compute_session_metrics, capsule, events=events)
+        record["metrics"] = metrics
+
+        stage = "compliance"
+        checks = _timed_stage(timings, stage, evaluate_session, capsule, profile=profile, events=events)
+        record["compliance"] = _compliance_summary(profile, checks)
+
+        if export_dir:
+            stage = "export"
+            from src.artifact_cache import ArtifactCache
+            from src.report_generator import generate_evidence_package
+
+            package = _timed_stage(
+                timings, stage, generate_evidence_package,
+                session_path=str(path),
+                output_dir=export_dir,
+                profile=profile,
+                compliance_results=checks,
+                events=events,
+                metrics=metrics,
+                session_data=capsule,
+                artifact_cache=ArtifactCache(artifact_cache_dir) if artifact_cache_dir else None,
+            )
+            record["package"] = str(Path(package["html"]).parent)
+    except Exception as exc:
+        logger.debug("analyze %s failed at %s", path, stage, exc_info=True)
+        record["status"] = "error"
+        record["stage"] = stage
+        record["error"] = f"{type(exc).__name__}: {exc}"
+
+    record["timings_s"] = timings
+    record["total_s"] = round(time.perf_counter() - started, 6)
+    return record
+
+
+def _package_dirs(paths: list[str], export_root: Optional[str]) -> list[Optional[str]]:
+    """One evidence folder per input under *export_root*, unique by file stem."""
+    if not export_root:
+        return [None] * len(paths)
+    seen: Counter = Counter()
+    dirs = []
+    for path in paths:
+        stem = Path(path).stem or "session"
+        seen[stem] += 1
+        name = stem if seen[stem] == 1 else f"{stem}_{seen[stem]}"
+        dirs.append(str(Path(export_root) / name))
+    return dirs
+
+
+def _init_worker() -> None:
+    # Files are already analysed in parallel; nested plot worker pools would
+    # only oversubscribe the CPUs.
+    os.environ.setdefault(EXPORT_MODE_ENV, "threads")
+
+
+def _analyze_job(job: tuple[str, dict]) -> dict:
+    path, options = job
+    return analyze_file(path, **options)
+
+
+def analyze_files(
+    paths: Iterable[str],
+    *,
+    jobs: int = 1,
+    export_dir: Optional[str] = None,
+    **options,
+) -> Iterator[dict]:
+    """
+    Analyse *paths* with up to *jobs* worker processes.
+
+    Yields one record per path, in input order, as soon as it (and every
+    earlier path) is finished.  *options* are passed to :func:`analyze_file`.
+    """
+    paths = [str(path) for path in paths]
+    work = [
+        (path, {**options, "export_dir": package_dir})
+        for path, package_dir in zip(paths, _package_dirs(paths, export_dir))
+    ]
+    jobs = max(1, min(int(jobs), len(work) or 1))
+    if jobs == 1:
+        for job in work:
+            yield _analyze_job(job)
+        return
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    ) as pool:
+        yield from pool.map(_analyze_job, work)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="redbyte-hil-suite analyze",
+        description="Analyse recorded captures without the GUI and emit JSON lines.",
+    )
+    parser.add_argument("inputs", nargs="+", help="Rigol CSV, simulation Excel or Data Capsule JSON files")
+    parser.add_argument(
+        "--mapping-profile", default=None,
+        help="Saved channel mapping profile (default: automatic suggestion)",
+    )
+    parser.add_argument(
+        "--mapping-file", default=_PROFILES_PATH,
+        help=f"Channel mapping profiles file (default: {_PROFILES_PATH})",
+    )
+    parser.add_argument(
+        "--profile", default="project_demo", choices=available_profiles(),
+        help="Compliance profile (default: project_demo)",
+    )
+    parser.add_argument("--export", metavar="DIR", default=None,
+                        help="Write an evidence package per input under DIR")
+    parser.add_argument("--artifact-cache", metavar="DIR", default=None,
+                        help="Reuse unchanged evidence artifacts from DIR")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Files analysed in parallel (default: 1)")
+    parser.add_argument("--output", "-o", default="-",
+                        help="JSON-lines output file (default: stdout)")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    return parser
+
+
+def _emit(handle: IO[str], record: dict) -> None:
+    handle.write(json.dumps(record, default=json_default, sort_keys=True) + "\n")
+    handle.flush()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Entry point for ``redbyte-hil-suite analyze``; returns the exit status."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        stream=sys.stderr,
+    )
+
+    handle = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    failures = 0
+    started = time.perf_counter()
+    try:
+        for record in analyze_files(
+            args.inputs,
+            jobs=args.jobs,
+            export_dir=args.export,
+            mapping_profile=args.mapping_profile,
+            profile=args.profile,
+            profiles_path=args.mapping_file,
+            artifact_cache_dir=args.artifact_cache,
+        ):
+            failures += record["status"] != "ok"
+            _emit(handle, record)
+    finally:
+        if handle is not sys.stdout:
+            handle.close()
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"analyzed {len(args.inputs)} file(s) in {elapsed:.2f}s "
+        f"({failures} failed, jobs={args.jobs}, app {APP_VERSION})",
+        file=sys.stderr,
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
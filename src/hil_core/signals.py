@@ -3,10 +3,11 @@ SignalEngine: Core signal processing and data management
 Shared by all RedByte applications for consistent signal handling
 """
 
-from collections import deque
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 import numpy as np
 
+from src.ring_buffer import RingBuffer
+
 
 _CHANNEL_ALIASES: Dict[str, str] = {
     "Va": "v_an",
@@ -17,13 +18,16 @@ _CHANNEL_ALIASES: Dict[str, str] = {
     "Ic": "i_c",
 }
 
+# Canonical TelemetryFrame keys held by the engine
+_CHANNELS: Tuple[str, ...] = ('v_an', 'v_bn', 'v_cn', 'i_a', 'i_b', 'i_c')
+
 
 class SignalEngine:
     """
     Unified signal processing engine for HIL data
     
     Features:
-    - Circular buffer management
+    - Circular buffer management (one preallocated RingBuffer, time in row 0)
     - Real-time streaming
     - Signal statistics
     - FFT computation
@@ -33,48 +37,61 @@ class SignalEngine:
         self.buffer_size = buffer_size
         self.sample_rate = sample_rate
         
-        # Signal buffers (circular deques for efficiency)
-        # Keys match canonical TelemetryFrame schema: v_an, v_bn, v_cn, i_a, i_b, i_c
-        self.buffers: Dict[str, deque] = {
-            'v_an': deque(maxlen=buffer_size),
-            'v_bn': deque(maxlen=buffer_size),
-            'v_cn': deque(maxlen=buffer_size),
-            'i_a':  deque(maxlen=buffer_size),
-            'i_b':  deque(maxlen=buffer_size),
-            'i_c':  deque(maxlen=buffer_size),
-        }
-        
-        self.time_buffer = deque(maxlen=buffer_size)
+        # Time plus the canonical channels, sample-aligned; a channel missing
+        # from a pushed sample is stored as NaN and skipped on read.
+        self._ring = RingBuffer(('ts',) + _CHANNELS, buffer_size)
         self.current_time = 0.0
-        
+
+    @property
+    def buffers(self) -> Dict[str, np.ndarray]:
+        """Per-channel views of the buffered samples (valid until the next push)"""
+        return {ch: self._ring.channel(ch) for ch in _CHANNELS}
+
+    @property
+    def time_buffer(self) -> np.ndarray:
+        return self._ring.channel('ts')
+
     def push_sample(self, channels: Dict[str, float], timestamp: float):
         """Add new sample to all channel buffers"""
+        row = np.full(len(self._ring.channels), np.nan)
+        row[0] = timestamp
         for ch, value in channels.items():
             canonical = _CHANNEL_ALIASES.get(ch, ch)
-            if canonical in self.buffers:
-                self.buffers[canonical].append(value)
-        self.time_buffer.append(timestamp)
+            if canonical in self._ring and canonical != 'ts':
+                row[self._ring.index(canonical)] = value
+        self._ring.push(row)
         self.current_time = timestamp
-    
+
+    def push_samples(self, timestamps: Sequence[float], channels: Mapping[str, Sequence[float]]):
+        """Add a block of samples: one timestamp array plus per-channel arrays"""
+        columns = {_CHANNEL_ALIASES.get(ch, ch): values for ch, values in channels.items()}
+        columns.pop('ts', None)
+        columns['ts'] = timestamps
+        self._ring.push_columns(columns)
+        if len(timestamps):
+            self.current_time = float(timestamps[-1])
+
     def get_channel_data(self, channel: str, num_samples: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Get time and data arrays for a channel
-        
+
+        Views into the ring buffer when the channel has no gaps in the
+        window (the common case), otherwise compacted copies.
+
         Returns:
             (time_array, data_array)
         """
         canonical = _CHANNEL_ALIASES.get(channel, channel)
-        if canonical not in self.buffers:
+        if canonical not in _CHANNELS:
             return np.array([]), np.array([])
-        
-        if num_samples:
-            data = list(self.buffers[canonical])[-num_samples:]
-            time = list(self.time_buffer)[-num_samples:]
-        else:
-            data = list(self.buffers[canonical])
-            time = list(self.time_buffer)
-        
-        return np.array(time), np.array(data)
+
+        window = self._ring.latest(num_samples or None)
+        time, data = window[0], window[self._ring.index(canonical)]
+        missing = np.isnan(data)
+        if missing.any():
+            present = ~missing
+            return time[present], data[present]
+        return time, data
     
     def get_rms(self, channel: str, num_samples: Optional[int] = None) -> float:
         """Calculate RMS value for channel"""
@@ -147,12 +164,10 @@ class SignalEngine:
     def get_all_channels(self) -> Dict[str, List[float]]:
         """Export all channel data as dict"""
         return {
-            ch: list(buf) for ch, buf in self.buffers.items()
+            ch: self.get_channel_data(ch)[1].tolist() for ch in _CHANNELS
         }
     
     def clear(self):
         """Reset all buffers"""
-        for buf in self.buffers.values():
-            buf.clear()
-        self.time_buffer.clear()
+        self._ring.clear()
         self.current_time = 0.0
@@ -6,11 +6,19 @@ import json
 import socket
 import struct
 import logging
+from collections import deque
+
+from src.binary_protocol import PROTOCOL_VERSION, FrameDecoder
 
 logger = logging.getLogger(__name__)
 
 
 class IOAdapter(abc.ABC):
+    # time.perf_counter() when the frames of the last read_frames() call
+    # came off the transport, before parsing (see src.latency_probe).
+    # None for adapters that do not stamp their reads.
+    received_at = None
+
     @abc.abstractmethod
     def connect(self, config):
         pass
@@ -24,6 +32,32 @@ class IOAdapter(abc.ABC):
         """Returns a dict frame or None."""
         pass
 
+    def read_frames(self):
+        """
+        Returns every frame available now as a list (possibly empty).
+
+        Adapters that receive frames in bulk override this; the default
+        wraps :meth:`read_frame`.
+        """
+        frame = self.read_frame()
+        return [frame] if frame else []
+
+    def fileno(self):
+        """
+        File descriptor of the transport for readiness polling, or None.
+
+        None means the adapter is not connected or cannot be selected on
+        and must be polled by calling :meth:`read_frames`.
+        """
+        return None
+
+    def set_nonblocking(self):
+        """
+        Make :meth:`read_frames` return immediately with whatever is
+        available.  Returns False if the adapter cannot do that.
+        """
+        return False
+
     def write_command(self, command_type, payload=None):
         """
         Sends a command to the connected hardware.
@@ -218,40 +252,176 @@ class DemoAdapter(IOAdapter):
 
 
 class SerialAdapter(IOAdapter):
+    """
+    Serial telemetry adapter.
+
+    ``config["protocol"]`` selects the telemetry encoding:
+
+      - ``"json"`` (default) — newline-delimited JSON frames;
+      - ``"binary"`` — the framed float32 protocol of
+        :mod:`src.binary_protocol`; connect fails if the device does not
+        answer the handshake;
+      - ``"auto"`` — try the binary handshake, fall back to JSON lines.
+
+    Commands are sent as ``CMD:{json}`` lines in every mode.
+    """
+
     COMMAND_PREFIX = b"CMD:"
+    PROTOCOLS = ("json", "binary", "auto")
+    HANDSHAKE_TIMEOUT_S = 0.5
+    # A partial JSON line longer than this is line noise, not a frame.
+    MAX_LINE_BYTES = 65536
 
     def __init__(self):
         self.conn = None
+        self.protocol = "json"
+        self._decoder = None
+        self._pending = deque()
+        self._rx = bytearray()
+        self.malformed_lines = 0
+
+    @property
+    def protocol_stats(self):
+        """Binary decoder counters (None in JSON mode)."""
+        return self._decoder.stats if self._decoder else None
 
     def connect(self, config):
         import serial
         port = config.get("port", "COM3")
         baud = config.get("baud", 115200)
+        requested = config.get("protocol", "json")
+        if requested not in self.PROTOCOLS:
+            logger.error(f"SerialAdapter: unknown protocol '{requested}'")
+            return False
         try:
             self.conn = serial.Serial(port, baud, timeout=0.1)
             logger.info(f"SerialAdapter connected to {port}")
-            return True
         except Exception as e:
             logger.error(f"Serial connect failed: {e}")
             return False
 
+        self.protocol = "json"
+        self._decoder = None
+        self._pending.clear()
+        self._rx.clear()
+        self.malformed_lines = 0
+        if requested != "json":
+            timeout = config.get("handshake_timeout", self.HANDSHAKE_TIMEOUT_S)
+            if self._negotiate_binary(timeout):
+                logger.info(f"SerialAdapter: binary telemetry, channels={list(self._decoder.channels)}")
+            elif requested == "binary":
+                logger.error("SerialAdapter: device did not answer the binary protocol handshake")
+                self.disconnect()
+                return False
+            else:
+                logger.info("SerialAdapter: no binary handshake answer, using JSON lines")
+        return True
+
+    def _negotiate_binary(self, timeout):
+        """Request binary telemetry and wait up to *timeout* s for a channel map."""
+        if not self.write_command("set_protocol", {"protocol": "binary", "version": PROTOCOL_VERSION}):
+            return False
+        decoder = FrameDecoder()
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            chunk = self._read_available()
+            if chunk:
+                # Samples that follow the map in the same read are kept.
+                self._rx += chunk
+                self._pending.extend(decoder.feed(chunk))
+            if decoder.channels is not None:
+                self._decoder = decoder
+                self._rx.clear()
+                self.protocol = "binary"
+                return True
+        # Whatever arrived meanwhile was JSON lines: parse it as such.
+        self._pending.clear()
+        return False
+
     def disconnect(self):
         if self.conn:
             self.conn.close()
             self.conn = None
 
+    def fileno(self):
+        try:
+            return self.conn.fileno() if self.conn else None
+        except Exception:               # no descriptor on this platform/port type
+            return None
+
+    def set_nonblocking(self):
+        if not self.conn:
+            return False
+        self.conn.timeout = 0
+        return True
+
+    def _read_available(self):
+        """Everything buffered by the port, waiting up to the timeout for the first byte."""
+        try:
+            waiting = self.conn.in_waiting
+        except Exception:
+            waiting = 0
+        return self.conn.read(max(1, waiting))
+
     def read_frame(self):
+        if not self._pending:
+            self._pending.extend(self.read_frames())
+        return self._pending.popleft() if self._pending else None
+
+    def read_frames(self):
+        """
+        Read all available bytes in one call and return every complete frame.
+
+        JSON lines split across reads are carried over in a reusable buffer;
+        binary frames are carried over by the decoder.
+        """
+        frames = list(self._pending)
+        self._pending.clear()
         if not self.conn:
-            return None
+            return frames
         try:
-            line = self.conn.readline()
+            chunk = self._read_available()
+        except Exception as e:
+            # pyserial raises when the device goes away (unplugged, pty closed).
+            logger.error(f"SerialAdapter: read failed, closing port: {e}")
+            self.disconnect()
+            return frames
+        if not chunk:
+            return frames
+        self.received_at = time.perf_counter()
+        if self.protocol == "binary":
+            frames.extend(self._decoder.feed(chunk))
+        else:
+            frames.extend(self._parse_json_lines(chunk))
+        return frames
+
+    def _parse_json_lines(self, chunk):
+        rx = self._rx
+        rx += chunk
+        end = rx.rfind(b"\n")
+        if end < 0:
+            if len(rx) > self.MAX_LINE_BYTES:
+                self.malformed_lines += 1
+                rx.clear()
+            return []
+        complete = bytes(rx[:end])
+        del rx[:end + 1]
+
+        frames = []
+        for line in complete.split(b"\n"):
+            line = line.strip()
             if not line:
-                return None
-            return json.loads(line.decode('utf-8').strip())
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            return None
-        except Exception:
-            return None
+                continue
+            try:
+                frame = json.loads(line)
+            except ValueError:           # JSONDecodeError, UnicodeDecodeError
+                self.malformed_lines += 1
+                continue
+            if isinstance(frame, dict):
+                frames.append(frame)
+            else:
+                self.malformed_lines += 1
+        return frames
 
     def write_command(self, command_type, payload=None):
         """
@@ -280,18 +450,30 @@ class OpalRTAdapter(IOAdapter):
     TCP-based adapter for OPAL-RT real-time simulator.
     Connects to OPAL-RT's asynchronous data server which streams
     signal values as length-prefixed JSON over TCP.
+
+    The socket is read with ``recv_into`` a preallocated receive buffer;
+    every complete message in the buffer is decoded straight from it and
+    only a trailing partial message is moved back to the front.
     """
 
     HEADER_FMT = '>I'  # 4-byte big-endian message length
     HEADER_SIZE = struct.calcsize(HEADER_FMT)
+    RECV_BUFFER_BYTES = 1 << 16
+    # A length prefix beyond this means the stream is out of step.
+    MAX_MESSAGE_BYTES = 1 << 20
 
     def __init__(self):
         self.sock = None
         self.host = "127.0.0.1"
         self.port = 5100
         self.timeout = 1.0
-        self._buffer = b""
         self._connected = False
+        self._rx = bytearray(self.RECV_BUFFER_BYTES)
+        self._rx_view = memoryview(self._rx)
+        self._rx_start = 0       # first unparsed byte
+        self._rx_end = 0         # end of received data
+        self._pending = deque()
+        self.malformed_messages = 0
 
     def connect(self, config):
         self.host = config.get("host", "127.0.0.1")
@@ -302,6 +484,9 @@ class OpalRTAdapter(IOAdapter):
             self.sock.settimeout(self.timeout)
             self.sock.connect((self.host, self.port))
             self._connected = True
+            self._rx_start = self._rx_end = 0
+            self._pending.clear()
+            self.malformed_messages = 0
             logger.info(f"OpalRTAdapter connected to {self.host}:{self.port}")
             return True
         except ConnectionRefusedError:
@@ -326,47 +511,95 @@ class OpalRTAdapter(IOAdapter):
                 pass
             self.sock = None
 
+    def fileno(self):
+        return self.sock.fileno() if self._connected and self.sock else None
+
+    def set_nonblocking(self):
+        if not self.sock:
+            return False
+        self.sock.setblocking(False)
+        return True
+
     def read_frame(self):
+        if not self._pending:
+            self._pending.extend(self.read_frames())
+        return self._pending.popleft() if self._pending else None
+
+    def read_frames(self):
         """
-        Reads a length-prefixed JSON frame from the TCP stream.
+        Receive what the socket has (waiting up to the timeout) and return
+        every complete length-prefixed JSON frame.
         Protocol: [4-byte big-endian length][JSON payload bytes]
         """
+        frames = list(self._pending)
+        self._pending.clear()
         if not self._connected or not self.sock:
-            return None
+            return frames
         try:
-            while len(self._buffer) < self.HEADER_SIZE:
-                chunk = self.sock.recv(4096)
-                if not chunk:
-                    self._connected = False
-                    return None
-                self._buffer += chunk
-
-            msg_len = struct.unpack(self.HEADER_FMT, self._buffer[:self.HEADER_SIZE])[0]
-            self._buffer = self._buffer[self.HEADER_SIZE:]
-
-            while len(self._buffer) < msg_len:
-                chunk = self.sock.recv(4096)
-                if not chunk:
-                    self._connected = False
-                    return None
-                self._buffer += chunk
-
-            payload = self._buffer[:msg_len]
-            self._buffer = self._buffer[msg_len:]
-
-            frame = json.loads(payload.decode('utf-8'))
-            return frame
-
-        except socket.timeout:
-            return None
-        except (json.JSONDecodeError, struct.error) as e:
-            logger.warning(f"OpalRTAdapter: Malformed frame: {e}")
-            self._buffer = b""
-            return None
+            if self._rx_end == len(self._rx):
+                self._make_room(self.HEADER_SIZE)
+            received = self.sock.recv_into(self._rx_view[self._rx_end:])
+            if not received:
+                self._connected = False
+                return frames
+            self.received_at = time.perf_counter()
+            self._rx_end += received
+            frames.extend(self._parse_messages())
+        except (socket.timeout, BlockingIOError):
+            pass
         except Exception as e:
             logger.error(f"OpalRTAdapter read error: {e}")
             self._connected = False
-            return None
+        return frames
+
+    def _parse_messages(self):
+        rx, view = self._rx, self._rx_view
+        start, end = self._rx_start, self._rx_end
+        header = self.HEADER_SIZE
+        frames = []
+        while end - start >= header:
+            (msg_len,) = struct.unpack_from(self.HEADER_FMT, rx, start)
+            if msg_len > self.MAX_MESSAGE_BYTES:
+                logger.warning(f"OpalRTAdapter: Malformed frame: length {msg_len}, dropping buffered data")
+                self.malformed_messages += 1
+                start = end
+                break
+            body = start + header
+            if end - body < msg_len:
+                break
+            try:
+                frame = json.loads(str(view[body:body + msg_len], 'utf-8'))
+            except ValueError as e:          # JSONDecodeError, UnicodeDecodeError
+                logger.warning(f"OpalRTAdapter: Malformed frame: {e}")
+                frame = None
+            if isinstance(frame, dict):
+                frames.append(frame)
+            else:
+                self.malformed_messages += 1
+            start = body + msg_len
+
+        if start == end:
+            start = end = 0
+        self._rx_start, self._rx_end = start, end
+        if end - start >= header:
+            # Make sure the rest of the partial message will fit.
+            (msg_len,) = struct.unpack_from(self.HEADER_FMT, rx, start)
+            if start + header + msg_len > len(rx):
+                self._make_room(header + msg_len)
+        return frames
+
+    def _make_room(self, needed):
+        """Move the partial message to the front; grow if it cannot fit."""
+        start, end = self._rx_start, self._rx_end
+        size = end - start
+        if needed > len(self._rx):
+            grown = bytearray(max(needed, 2 * len(self._rx)))
+            grown[:size] = self._rx_view[start:end]
+            self._rx_view.release()
+            self._rx, self._rx_view = grown, memoryview(grown)
+        elif start:
+            self._rx[:size] = bytes(self._rx_view[start:end])
+        self._rx_start, self._rx_end = 0, size
 
     def write_command(self, command_type, payload=None):
         """Sends a length-prefixed JSON command to OPAL-RT."""
@@ -0,0 +1,198 @@
+"""
+Stage latency probes for the live telemetry pipeline.
+
+Answers "how long from a frame arriving until it is on screen".  Every
+stage is timed from ``receive``: the moment the adapter took the frames'
+bytes off its transport, before parsing them
+(:attr:`~src.io_adapter.IOAdapter.received_at`).  That includes the
+acquisition child of :class:`~src.process_acquisition.ProcessAcquisitionAdapter`
+and the merge of :class:`~src.acquisition.MultiSourceAdapter`; adapters
+that do not stamp their reads are timed from the reader thread getting the
+frames.
+
+  - ``normalize``: the batch is normalized (reader thread);
+  - ``emit``: the GUI thread emits the block on ``frames_received``;
+  - ``handled``: every subscriber connected to ``frames_received`` returned;
+  - ``rendered``: the plot's render tick drew the block into its curves.
+    Several plots may show the same stream (console and diagnostics pages);
+    only the one designated view records, see
+    :meth:`LatencyProbes.claim_renderer`.
+
+A block packs several reads; it is timed from its oldest one, so the
+figures are the worst case within a block.  Each stage keeps a
+:class:`LatencyHistogram` (log-spaced buckets, fixed memory) from which
+p50 / p95 / p99 are read; :meth:`LatencyProbes.export_json` writes them out.
+
+Probes are off by default.  Disabled, the pipeline pays one
+``perf_counter()`` call in the adapter and one attribute test per read and
+per delivered block: :class:`~src.serial_reader.SerialManager` only stamps
+blocks while ``enabled`` is set, and the later stages only time stamped
+blocks.
+
+This module has no Qt dependency.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Iterable, Union
+
+RECEIVE_STAGE = "receive"
+STAGES = ("normalize", "emit", "handled", "rendered")
+
+_MIN_S = 1e-6                       # lower edge of the first bucket
+_BUCKETS_PER_DECADE = 20            # ~12 % wide buckets
+_DECADES = 8                        # 1 µs … 100 s
+_N_BUCKETS = _BUCKETS_PER_DECADE * _DECADES
+
+
+class LatencyHistogram:
+    """Counts of latencies in log-spaced buckets, plus exact count / mean / max."""
+
+    __slots__ = ("counts", "count", "total_s", "max_s")
+
+    def __init__(self):
+        self.counts = [0] * _N_BUCKETS
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def record(self, seconds: float) -> None:
+        if seconds <= _MIN_S:
+            index = 0
+        else:
+            index = min(int(math.log10(seconds / _MIN_S) * _BUCKETS_PER_DECADE), _N_BUCKETS - 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total_s += seconds
+        if seconds > self.max_s:
+            self.max_s = seconds
+
+    def percentile(self, q: float) -> float:
+        """Upper edge of the bucket holding the *q*-th percentile, in seconds.
+
+        Capped at the largest recorded value; 0.0 while empty.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q / 100.0 * self.count))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(_upper_edge(index), self.max_s)
+        return self.max_s
+
+    def summary(self) -> dict:
+        """count, mean, p50 / p95 / p99 and max, latencies in ms."""
+        return {
+            "count": self.count,
+            "mean_ms": _ms(self.total_s / self.count) if self.count else 0.0,
+            "p50_ms": _ms(self.percentile(50)),
+            "p95_ms": _ms(self.percentile(95)),
+            "p99_ms": _ms(self.percentile(99)),
+            "max_ms": _ms(self.max_s),
+        }
+
+    def to_dict(self) -> dict:
+        """:meth:`summary` plus the non-empty buckets as ``[upper_edge_ms, count]``."""
+        result = self.summary()
+        result["buckets"] = [
+            [_ms(_upper_edge(index)), n] for index, n in enumerate(self.counts) if n
+        ]
+        return result
+
+
+class LatencyProbes:
+    """Per-stage latency histograms, shared by the reader and GUI threads.
+
+    Stamps are ``time.perf_counter()`` values taken at ``receive``; a stage
+    is recorded as the time elapsed since its block's stamp.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._histograms = {stage: LatencyHistogram() for stage in STAGES}
+        self._started_at = time.time()
+        self._renderer = None           # weakref to the view timing "rendered"
+
+    def set_renderer(self, view) -> None:
+        """Make *view* the one view that records the ``rendered`` stage."""
+        self._renderer = weakref.ref(view)
+
+    def claim_renderer(self, view) -> bool:
+        """True if *view* records ``rendered``; the first view to ask gets it.
+
+        A view that has been garbage-collected releases the stage to the
+        next one to ask.
+        """
+        current = self._renderer() if self._renderer is not None else None
+        if current is None:
+            self.set_renderer(view)
+            return True
+        return current is view
+
+    def record(self, stage: str, received_at: float) -> None:
+        elapsed = time.perf_counter() - received_at
+        with self._lock:
+            self._histograms[stage].record(elapsed)
+
+    def record_many(self, stage: str, received_at: Iterable[float]) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            histogram = self._histograms[stage]
+            for stamp in received_at:
+                histogram.record(now - stamp)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms = {stage: LatencyHistogram() for stage in STAGES}
+            self._started_at = time.time()
+
+    def summary(self) -> dict[str, dict]:
+        """``{stage: LatencyHistogram.summary()}`` in pipeline order."""
+        with self._lock:
+            return {stage: h.summary() for stage, h in self._histograms.items()}
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            stages = {stage: h.to_dict() for stage, h in self._histograms.items()}
+            started_at = self._started_at
+        return {
+            "reference_stage": RECEIVE_STAGE,
+            "enabled": self.enabled,
+            "started_at": started_at,
+            "exported_at": time.time(),
+            "stages": stages,
+        }
+
+    def export_json(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.to_dict(), fh, indent=2)
+        return path
+
+
+def stamp_to_wall(stamp: float) -> float:
+    """``time.time()`` at the moment of a ``perf_counter()`` *stamp*."""
+    return time.time() - (time.perf_counter() - stamp)
+
+
+def stamp_from_wall(wall_time: float) -> float:
+    """``perf_counter()`` stamp of a ``time.time()`` reading, e.g. one from another process."""
+    return time.perf_counter() - (time.time() - wall_time)
+
+
+def _upper_edge(index: int) -> float:
+    return _MIN_S * 10.0 ** ((index + 1) / _BUCKETS_PER_DECADE)
+
+
+def _ms(seconds: float) -> float:
+    return round(1000.0 * seconds, 3)
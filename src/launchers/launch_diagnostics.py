@@ -24,6 +24,7 @@ from ui.phasor_view import PhasorView
 from ui.fault_injector import FaultInjector
 from ui.system_3d_view import System3DView
 from ui.insights_panel import InsightsPanel
+from ui.latency_panel import LatencyPanel
 from ui.splash_screen import RotorSplashScreen
 
 # Import backend dependencies
@@ -176,6 +177,8 @@ class DiagnosticsWindow(LauncherBase):
         tools_menu = menubar.addMenu("Tools")
         tools_menu.addAction("Clear Insights", self.insight_engine.clear)
         tools_menu.addAction("Reset Signals", self.signal_engine.clear)
+        tools_menu.addSeparator()
+        tools_menu.addAction("Pipeline Latency…", self.show_latency_panel)
 
     def apply_diagnostics_layout(self):
         """Apply diagnostics-optimized layout"""
@@ -215,6 +218,17 @@ class DiagnosticsWindow(LauncherBase):
         # Detect insights
         self.detect_insights(frame)
 
+    def show_latency_panel(self):
+        """Show the stage latency panel (created on first use)."""
+        if getattr(self, "latency_panel", None) is None:
+            self.latency_panel = LatencyPanel(self.serial_mgr.latency_probes)
+            sub = self.mdi.addSubWindow(self.latency_panel)
+            sub.setWindowTitle("⏱ Pipeline Latency")
+            sub.resize(520, 260)
+            self._register_subwindow(sub)
+        self.latency_panel.parentWidget().show()
+        self.latency_panel.setFocus()
+
     def _on_scenario_event(self, event_type, details):
         """Handle scenario controller events"""
         self.statusBar().showMessage(f"Event: {event_type}")
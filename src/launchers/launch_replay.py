@@ -43,7 +43,7 @@ class ReplayWindow(LauncherBase):
         # Initialize backend dependencies
         self.serial_mgr = SerialManager()
         self.recorder = Recorder()
-        self.serial_mgr.frame_received.connect(self.recorder.log_frame)
+        self.serial_mgr.add_frame_sink(self.recorder.log_frames)
 
         # Playback state
         self.playback_position = 0
@@ -1,23 +1,30 @@
 import sys
 import logging
 import os
-import pyqtgraph as pg
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer
-from ui.style import get_global_stylesheet
-from ui.splash_screen import RotorSplashScreen
-from ui.app_shell import AppShell
-from src.opengl_check import check_opengl_available
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+
 logger = logging.getLogger(__name__)
 
 
 def main():
+    # `redbyte-hil-suite analyze …` runs headless: dispatch before anything
+    # below imports Qt, pyqtgraph or the UI package.
+    if len(sys.argv) > 1 and sys.argv[1] == "analyze":
+        from src.headless_analysis import main as analyze_main
+        sys.exit(analyze_main(sys.argv[2:]))
+
     import argparse
+    import pyqtgraph as pg
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QTimer
+    from ui.style import get_global_stylesheet
+    from ui.splash_screen import RotorSplashScreen
+    from ui.app_shell import AppShell
+    from src.opengl_check import check_opengl_available
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     parser = argparse.ArgumentParser()
     parser.add_argument("--demo", action="store_true", help="Start in Demo Mode")
     parser.add_argument("--mock", action="store_true", help="Use mock demo input (alias for --demo)")
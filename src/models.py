@@ -2,7 +2,9 @@
 Canonical data models and normalisation helpers for RedByte HIL Suite.
 
     normalize_frame()         – normalise raw frames into TelemetryFrame schema
+    normalize_frames()        – normalise a batch, plus the channels it carries
     present_canonical_keys()  – frozenset of canonical keys PRESENT in a raw frame
+    frame_schema()            – compiled normaliser for a raw frame's key set
     make_insight_event()      – build canonical InsightEvent dicts
 
 Canonical TelemetryFrame keys
@@ -87,6 +89,143 @@ _PRE_ALIAS_SCALE: dict[str, float] = {
 }
 
 
+class FrameSchema:
+    """Normaliser compiled for one sequence of raw frame keys.
+
+    A hardware source sends the same keys in the same order on every frame,
+    so everything ``normalize_frame`` decides per key — alias, unit scale,
+    which of several aliases of one canonical key wins, which required
+    channels are missing — is decided once here and turned into a
+    straight-line function: one dict display that renames and zero-fills,
+    the unit scales, the ``ts`` check and the float conversions.
+
+    :meth:`fit` normalises a frame only if it has this schema's keys, which
+    costs a ``len()`` and the key lookups the copy does anyway (a full key
+    comparison when aliases collide, as the winner then depends on order).
+    A frame with the same keys in another order is accepted; its result
+    then lists the keys in this schema's order.
+
+    With ``fill_missing=False`` the required channels a frame lacks stay
+    absent instead of being zero-filled — for merged multi-source frames,
+    where a gap means "another source's channel", not a measured zero.
+    """
+
+    __slots__ = ("keys", "present", "fill_missing", "fit")
+
+    def __init__(self, keys: tuple[str, ...], fill_missing: bool = True):
+        # Same collision rule as the key-by-key loop: the first alias of a
+        # canonical key wins unless the canonical key itself comes later.
+        source: dict[str, str] = {}
+        for raw_key in keys:
+            canonical = _KEY_ALIASES.get(raw_key, raw_key)
+            if canonical not in source or raw_key == canonical:
+                source[canonical] = raw_key
+        self.keys = keys
+        self.present: frozenset[str] = frozenset(source) - {"ts"}
+        self.fill_missing = fill_missing
+        missing = [key for key in _REQUIRED_FLOAT_KEYS if key not in source] if fill_missing else []
+        for key in missing:
+            if key not in _WARNED_MISSING:
+                logger.warning("normalize_frame: missing key '%s', defaulting to 0.0", key)
+                _WARNED_MISSING.add(key)
+        self.fit = self._compile(source, missing)
+
+    def normalize(self, raw: dict[str, Any]) -> dict[str, Any]:
+        """Normalise *raw*, which must have this schema's keys."""
+        frame = self.fit(raw)
+        if frame is None:
+            raise KeyError(f"frame keys {tuple(raw)} do not match schema {self.keys}")
+        return frame
+
+    def _compile(self, source: dict[str, str], missing: list[str]):
+        items = [f"{canonical!r}: raw[{raw_key!r}]" for canonical, raw_key in source.items()]
+        if "ts" not in source:
+            items.append("'ts': time.time()")
+        items.extend(f"{key!r}: 0.0" for key in missing)
+
+        if len(source) == len(self.keys):
+            lines = [f"    if len(raw) != {len(self.keys)}:", "        return None"]
+        else:
+            lines = ["    if tuple(raw) != _keys:", "        return None"]
+        lines += ["    try:", f"        frame = {{{', '.join(items)}}}",
+                  "    except KeyError:", "        return None"]
+        for canonical, raw_key in source.items():
+            scale = _PRE_ALIAS_SCALE.get(raw_key)
+            if scale is not None:
+                lines += ["    try:", f"        frame[{canonical!r}] = float(raw[{raw_key!r}]) * {scale!r}",
+                          "    except (TypeError, ValueError):", "        pass"]
+        if "ts" in source:
+            lines += ["    ts = frame['ts']",
+                      "    if not isinstance(ts, (int, float)) or ts <= 0:",
+                      "        frame['ts'] = time.time()"]
+        floats = [key for key in _REQUIRED_FLOAT_KEYS if key in source]
+        if floats:
+            lines.append("    try:")
+            lines += [f"        frame[{key!r}] = float(frame[{key!r}])" for key in floats]
+            lines += ["    except (TypeError, ValueError):", "        _coerce_floats(frame, _floats)"]
+        lines.append("    return frame")
+
+        namespace = {"time": time, "_keys": self.keys, "_floats": tuple(floats),
+                     "_coerce_floats": _coerce_floats}
+        exec("def fit(raw):\n" + "\n".join(lines), namespace)
+        return namespace["fit"]
+
+
+def _coerce_floats(frame: dict[str, Any], keys: tuple[str, ...]) -> None:
+    for key in keys:
+        try:
+            frame[key] = float(frame[key])
+        except (TypeError, ValueError):
+            frame[key] = 0.0
+
+
+# Compiled schemas by (key sequence, fill_missing).  A source whose key set
+# keeps changing stops being cached once the limit is reached and is
+# compiled per frame.
+_SCHEMA_CACHE: dict[tuple[tuple[str, ...], bool], FrameSchema] = {}
+_SCHEMA_CACHE_LIMIT = 1024
+# Schema of the previous frame: consecutive frames nearly always share it.
+_last_schema: Optional[FrameSchema] = None
+
+
+def frame_schema(raw: dict[str, Any], fill_missing: bool = True) -> FrameSchema:
+    """Return the (cached) compiled schema for the keys of *raw*."""
+    cache_key = (tuple(raw), fill_missing)
+    schema = _SCHEMA_CACHE.get(cache_key)
+    if schema is None:
+        schema = FrameSchema(cache_key[0], fill_missing)
+        if len(_SCHEMA_CACHE) < _SCHEMA_CACHE_LIMIT:
+            _SCHEMA_CACHE[cache_key] = schema
+    return schema
+
+
+def normalize_frames(
+    raws: list[dict[str, Any]], fill_missing: bool = True
+) -> tuple[list[dict[str, Any]], frozenset[str]]:
+    """Normalise a batch; also return the canonical keys present in any raw frame.
+
+    ``fill_missing=False`` leaves absent required channels absent (see
+    :class:`FrameSchema`) rather than zero-filling them.
+    """
+    global _last_schema
+    schema = _last_schema
+    if schema is not None and schema.fill_missing is not fill_missing:
+        schema = None
+    seen = None
+    present: frozenset[str] = frozenset()
+    frames = []
+    for raw in raws:
+        frame = schema.fit(raw) if schema is not None else None
+        if frame is None:
+            schema = _last_schema = frame_schema(raw, fill_missing)
+            frame = schema.fit(raw)
+        if schema is not seen:
+            present = schema.present if seen is None else present | schema.present
+            seen = schema
+        frames.append(frame)
+    return frames, present
+
+
 def normalize_frame(raw: dict[str, Any]) -> dict[str, Any]:
     """Normalise a raw telemetry dict into the canonical TelemetryFrame schema.
 
@@ -99,7 +238,23 @@ def normalize_frame(raw: dict[str, Any]) -> dict[str, Any]:
 
     Returns a **new** dict.  Extra non-canonical keys are preserved so callers
     can still access pass-through fields (e.g. ``angle``, ``fault_type``).
+
+    The work is done by the :class:`FrameSchema` compiled for the frame's key
+    sequence; :func:`_normalize_uncompiled` is the same algorithm applied
+    key by key.
     """
+    global _last_schema
+    schema = _last_schema
+    if schema is not None and schema.fill_missing:
+        frame = schema.fit(raw)
+        if frame is not None:
+            return frame
+    schema = _last_schema = frame_schema(raw)
+    return schema.normalize(raw)
+
+
+def _normalize_uncompiled(raw: dict[str, Any]) -> dict[str, Any]:
+    """Key-by-key reference implementation of :func:`normalize_frame`."""
     frame: dict[str, Any] = {}
 
     # 1. Apply pre-alias scaling then rename
@@ -152,12 +307,7 @@ def present_canonical_keys(raw: dict[str, Any]) -> frozenset[str]:
     Returns:
         frozenset of canonical channel key strings.
     """
-    keys: set[str] = set()
-    for raw_key in raw:
-        canonical = _KEY_ALIASES.get(raw_key, raw_key)
-        keys.add(canonical)
-    keys.discard("ts")
-    return frozenset(keys)
+    return frame_schema(raw).present
 
 
 # ---------------------------------------------------------------------------
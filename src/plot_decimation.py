@@ -0,0 +1,124 @@
+"""
+Envelope-preserving decimation for static report figures.
+
+A PNG cannot show more than one value range per pixel column, so drawing
+more samples than that only costs time.  Taking every n-th sample, on the
+other hand, drops sag troughs and transient peaks that fall between the
+kept samples.  ``envelope_decimate`` keeps, for every pixel column, the
+minimum and the maximum sample in their original order.  The resulting
+polyline covers exactly the same vertical extent per column as the
+full-resolution trace, with at most two points per column.
+
+``add_envelope_line`` draws such a series as a single rasterized
+``LineCollection``.  The evidence report and the session HTML report
+share this path.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+
+def columns_for(width_in: float, dpi: float) -> int:
+    """Pixel columns of a figure *width_in* inches wide saved at *dpi*."""
+    return max(1, int(math.ceil(float(width_in) * float(dpi))))
+
+
+def envelope_decimate(
+    time: np.ndarray,
+    values: np.ndarray,
+    n_columns: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce ``values(time)`` to the min/max envelope over *n_columns* buckets.
+
+    Samples are split into *n_columns* equal-count buckets; each bucket
+    contributes its minimum and maximum sample (in sample order), so the
+    output holds at most ``2 * n_columns`` points.  Non-finite samples are
+    ignored, and a bucket with no finite sample contributes a NaN point so
+    that the line breaks across the gap.  Series that are already small
+    enough are returned unchanged.
+
+    Returns:
+        (time_out, values_out) as float64 arrays.
+    """
+    t = np.asarray(time, dtype=np.float64).reshape(-1)
+    y = np.asarray(values, dtype=np.float64).reshape(-1)
+    n = min(t.size, y.size)
+    t, y = t[:n], y[:n]
+    n_columns = max(1, int(n_columns))
+    if n <= 2 * n_columns:
+        return t, y
+
+    per_bucket = -(-n // n_columns)
+    n_buckets = -(-n // per_bucket)
+    if bool(np.isfinite(y).all()):
+        # Fast path: argmin/argmax on a reshaped view, no masked copies.
+        full = n // per_bucket
+        blocks = y[: full * per_bucket].reshape(full, per_bucket)
+        lo = blocks.argmin(axis=1)
+        hi = blocks.argmax(axis=1)
+        if full < n_buckets:
+            tail = y[full * per_bucket:]
+            lo = np.append(lo, tail.argmin())
+            hi = np.append(hi, tail.argmax())
+        has_data = None
+    else:
+        padded = np.full(n_buckets * per_bucket, np.nan)
+        padded[:n] = y
+        blocks = padded.reshape(n_buckets, per_bucket)
+        finite = np.isfinite(blocks)
+        lo = np.argmin(np.where(finite, blocks, np.inf), axis=1)
+        hi = np.argmax(np.where(finite, blocks, -np.inf), axis=1)
+        has_data = finite.any(axis=1)
+
+    first = np.minimum(lo, hi)
+    second = np.maximum(lo, hi)
+    base = np.arange(n_buckets) * per_bucket
+    idx = np.empty(2 * n_buckets, dtype=np.intp)
+    idx[0::2] = base + first
+    idx[1::2] = base + second
+
+    t_out = t[idx]
+    y_out = y[idx].copy()
+    if has_data is not None and not bool(has_data.all()):
+        gap = np.repeat(~has_data, 2)
+        y_out[gap] = np.nan
+    return t_out, y_out
+
+
+def add_envelope_line(
+    ax,
+    time: np.ndarray,
+    values: np.ndarray,
+    *,
+    n_columns: int,
+    color: str,
+    linewidth: float = 1.0,
+    label: str | None = None,
+):
+    """
+    Draw ``values(time)`` on *ax* as one rasterized ``LineCollection``.
+
+    The series is envelope-decimated to *n_columns* first (a no-op for
+    series that are already reduced).  Axis limits are updated to the data.
+    """
+    from matplotlib.collections import LineCollection
+
+    t_plot, y_plot = envelope_decimate(time, values, n_columns)
+    points = np.column_stack([t_plot, y_plot])
+    collection = LineCollection(
+        [points],
+        colors=color,
+        linewidths=linewidth,
+        label=label,
+        rasterized=True,
+    )
+    ax.add_collection(collection)
+    finite = np.isfinite(points).all(axis=1)
+    if finite.any():
+        ax.update_datalim(points[finite])
+        ax.autoscale_view()
+    return collection
@@ -0,0 +1,325 @@
+"""
+Telemetry acquisition in a child process.
+
+Reading, parsing and normalizing frames in a thread of the GUI process
+competes with rendering for the GIL: a heavy repaint delays the reader and
+a burst of frames stalls the UI.  :class:`ProcessAcquisitionAdapter` moves
+the adapter's read loop and :func:`~src.models.normalize_frame` into a
+child process.  The child writes each normalized frame as one row of a
+:class:`~src.shared_ring.SharedRing`; the GUI process only copies rows out
+and turns them back into frame dicts.
+
+Rows have a fixed layout (:data:`FRAME_FIELDS`): the canonical numeric
+channels, the text fields ``fault_type`` and ``status`` as ids into a
+string table the child sends over a pipe when a new value first appears,
+and two bookkeeping columns — a bit mask of the fields the raw frame
+actually carried and the host time the child read the frame (when the
+child's adapter took it off the transport, if the adapter stamps its reads).  Keys outside
+the layout are not carried across.
+
+Frame loss (rows the child overwrote before the GUI process read them) and
+latency (child read → GUI-process dequeue) are counted here and reported
+in :class:`~src.serial_reader.LiveStats`.  ``received_at`` is the oldest
+child read time of the rows a ``read_frames`` call returns, so latency
+probes (:mod:`src.latency_probe`) time the child's parsing and the ring too.
+
+The child is started with the ``spawn`` method, so the adapter factory must
+be picklable (an adapter class, not a lambda).
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import multiprocessing as mp
+import time
+from collections import deque
+from numbers import Real
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from src.io_adapter import IOAdapter
+from src.latency_probe import stamp_from_wall, stamp_to_wall
+from src.models import frame_schema
+from src.shared_ring import SharedRing
+
+logger = logging.getLogger(__name__)
+
+NUMERIC_FIELDS = (
+    "ts", "v_an", "v_bn", "v_cn", "i_a", "i_b", "i_c", "freq", "p_mech",
+    "angle", "v_dc", "i_dc", "q", "s", "pf", "v_rms", "i_rms", "thd",
+)
+TEXT_FIELDS = ("fault_type", "status")
+FRAME_FIELDS = NUMERIC_FIELDS + TEXT_FIELDS
+_PRESENT_COL = len(FRAME_FIELDS)
+_READ_AT_COL = _PRESENT_COL + 1
+ROW_WIDTH = _READ_AT_COL + 1
+# ts and the eight channels normalize_frame fills even when the raw frame lacks them
+_REQUIRED_MASK = (1 << 9) - 1
+
+DEFAULT_RING_CAPACITY = 65_536
+CONNECT_TIMEOUT_S = 15.0            # spawn + imports + adapter.connect
+_LATENCY_WINDOW = 1024
+_NAN = float("nan")
+
+
+# ── Child process ────────────────────────────────────────────────────────────
+
+class _RowEncoder:
+    """Raw frames → normalized ring rows; new text values go out on *events*."""
+
+    def __init__(self, events):
+        self._events = events
+        self._text_ids: dict[Any, int] = {}
+        self._col = {name: i for i, name in enumerate(FRAME_FIELDS)}
+        self._masks: dict[frozenset, int] = {}
+
+    def encode(self, raw_frames: list[dict], read_at: float) -> np.ndarray:
+        rows = np.full((len(raw_frames), ROW_WIDTH), _NAN)
+        col = self._col
+        for r, raw in enumerate(raw_frames):
+            schema = frame_schema(raw)
+            frame = schema.normalize(raw)
+            mask = self._masks.get(schema.present)
+            if mask is None:
+                mask = 1                                    # ts: always present
+                for key in schema.present:
+                    i = col.get(key)
+                    if i is not None:
+                        mask |= 1 << i
+                self._masks[schema.present] = mask
+            row = rows[r]
+            for i, name in enumerate(NUMERIC_FIELDS):
+                value = frame.get(name)
+                if isinstance(value, Real) and not isinstance(value, bool):
+                    row[i] = value
+                else:
+                    mask &= ~(1 << i)                      # not representable
+            for i, name in enumerate(TEXT_FIELDS, start=len(NUMERIC_FIELDS)):
+                if mask >> i & 1:
+                    row[i] = self._text_id(frame.get(name))
+            row[_PRESENT_COL] = mask
+            row[_READ_AT_COL] = read_at
+        return rows
+
+    def _text_id(self, value: Any) -> int:
+        try:
+            return self._text_ids[value]
+        except KeyError:
+            pass
+        except TypeError:                                   # unhashable
+            value = str(value)
+            if value in self._text_ids:
+                return self._text_ids[value]
+        text_id = len(self._text_ids)
+        self._text_ids[value] = text_id
+        self._events.send(("text", text_id, value))        # before the row is published
+        return text_id
+
+
+def _acquisition_main(adapter_factory, config, ring_name, capacity, commands, events, stop):
+    """Child process: read, normalize and publish frames until *stop* is set."""
+    ring = SharedRing(capacity, ROW_WIDTH, name=ring_name)
+    adapter = adapter_factory()
+    try:
+        connected = bool(adapter.connect(config))
+    except Exception as e:
+        logger.error(f"Acquisition process: connect failed: {e}")
+        connected = False
+    events.send(("connected", connected))
+    if not connected:
+        ring.close()
+        return
+    encoder = _RowEncoder(events)
+    read_frames = getattr(adapter, "read_frames", None)
+    try:
+        while not stop.is_set():
+            while commands.poll():
+                command_type, payload = commands.recv()
+                adapter.write_command(command_type, payload)
+            if read_frames is not None:
+                raw_frames = read_frames()
+            else:
+                raw_frame = adapter.read_frame()
+                raw_frames = [raw_frame] if raw_frame else []
+            if raw_frames:
+                stamp = adapter.received_at
+                read_at = time.time() if stamp is None else stamp_to_wall(stamp)
+                ring.write(encoder.encode(raw_frames, read_at))
+            else:
+                time.sleep(0.001)
+    except (EOFError, OSError):
+        pass                                                # parent went away
+    finally:
+        adapter.disconnect()
+        ring.close()
+
+
+# ── GUI process ──────────────────────────────────────────────────────────────
+
+class ProcessAcquisitionAdapter(IOAdapter):
+    """Runs ``adapter_factory()`` in a child process; frames arrive normalized."""
+
+    # SerialManager skips normalize_frame and takes channel presence from
+    # present_channels for adapters that set this.
+    frames_normalized = True
+
+    def __init__(self, adapter_factory: Callable[[], IOAdapter],
+                 capacity: int = DEFAULT_RING_CAPACITY):
+        self.adapter_factory = adapter_factory
+        self.capacity = capacity
+        self.present_channels: frozenset = frozenset()
+        self._ring: Optional[SharedRing] = None
+        self._process = None
+        self._commands = None
+        self._events = None
+        self._stop = None
+        self._pending: deque = deque()
+        self._texts: dict[int, Any] = {}
+        self._layouts: dict[int, tuple[tuple[str, ...], tuple[int, ...], tuple[int, ...]]] = {}
+        self._latencies: deque = deque(maxlen=_LATENCY_WINDOW)
+        self._child_exited = False
+
+    @property
+    def frames_lost(self) -> int:
+        return self._ring.lost if self._ring else 0
+
+    def latency_ms(self) -> tuple[float, float]:
+        """(mean, max) child-read → dequeue latency over the recent frames, in ms."""
+        if not self._latencies:
+            return 0.0, 0.0
+        lat = np.fromiter(self._latencies, dtype=np.float64)
+        return round(1000.0 * float(lat.mean()), 3), round(1000.0 * float(lat.max()), 3)
+
+    # ── IOAdapter ────────────────────────────────────────────────────────────
+
+    def connect(self, config=None):
+        ctx = mp.get_context("spawn")
+        self._ring = SharedRing(self.capacity, ROW_WIDTH)
+        cmd_recv, self._commands = ctx.Pipe(duplex=False)
+        self._events, evt_send = ctx.Pipe(duplex=False)
+        self._stop = ctx.Event()
+        self._process = ctx.Process(
+            target=_acquisition_main,
+            args=(self.adapter_factory, config, self._ring.name, self.capacity,
+                  cmd_recv, evt_send, self._stop),
+            name="telemetry-acquisition",
+            daemon=True,
+        )
+        try:
+            self._process.start()
+        except BaseException:
+            self._process = None
+            self.disconnect()
+            raise
+        finally:
+            cmd_recv.close()
+            evt_send.close()
+        connected = False
+        deadline = time.monotonic() + CONNECT_TIMEOUT_S
+        try:
+            while time.monotonic() < deadline and self._process.is_alive():
+                if self._events.poll(0.05):
+                    event = self._events.recv()
+                    if event[0] == "connected":
+                        connected = event[1]
+                        break
+        except (EOFError, OSError):
+            pass
+        if not connected:
+            logger.error("Acquisition process failed to connect its adapter")
+            self.disconnect()
+        return connected
+
+    def disconnect(self):
+        if self._stop is not None:
+            self._stop.set()
+        process, self._process = self._process, None
+        if process is not None:
+            process.join(timeout=2.0)
+            if process.is_alive():
+                logger.warning("Acquisition process did not stop; terminating it")
+                process.terminate()
+                process.join(timeout=1.0)
+                if process.is_alive():
+                    process.kill()
+                    process.join()
+            process.close()
+        for conn in (self._commands, self._events):
+            if conn is not None:
+                conn.close()
+        self._commands = self._events = self._stop = None
+        if self._ring is not None:
+            self._ring.close()
+
+    def read_frame(self):
+        if not self._pending:
+            self._pending.extend(self.read_frames())
+        return self._pending.popleft() if self._pending else None
+
+    def read_frames(self):
+        """Frames the child has published since the last call (normalized)."""
+        if self._pending:
+            frames = list(self._pending)
+            self._pending.clear()
+            return frames + self.read_frames()
+        if self._process is None:
+            return []
+        rows = self._ring.read()
+        self._drain_events()
+        if not len(rows):
+            if self._process.exitcode is not None and not self._child_exited:
+                self._child_exited = True
+                logger.error(f"Acquisition process exited (code {self._process.exitcode})")
+            return []
+        now = time.time()
+        read_at = rows[:, _READ_AT_COL]
+        self._latencies.extend((now - read_at).tolist())
+        self.received_at = stamp_from_wall(float(read_at.min()))
+        return self._decode(rows)
+
+    def write_command(self, command_type, payload=None):
+        """Queue a command for the child's adapter (delivery is asynchronous)."""
+        if self._commands is None:
+            return False
+        try:
+            self._commands.send((command_type, payload))
+        except (OSError, ValueError) as e:
+            logger.error(f"Acquisition process: command '{command_type}' not sent: {e}")
+            return False
+        return True
+
+    # ── Decoding ─────────────────────────────────────────────────────────────
+
+    def _drain_events(self) -> None:
+        try:
+            while self._events.poll():
+                event = self._events.recv()
+                if event[0] == "text":
+                    self._texts[event[1]] = event[2]
+        except (EOFError, OSError):
+            pass                                            # child exited
+
+    def _layout(self, mask: int):
+        layout = self._layouts.get(mask)
+        if layout is None:
+            present = [i for i in range(len(FRAME_FIELDS)) if (mask | _REQUIRED_MASK) >> i & 1]
+            numeric = tuple(i for i in present if i < len(NUMERIC_FIELDS))
+            text = tuple(i for i in present if i >= len(NUMERIC_FIELDS))
+            keys = tuple(FRAME_FIELDS[i] for i in numeric + text)
+            layout = self._layouts[mask] = (keys, numeric, text)
+            self.present_channels = self.present_channels | {
+                FRAME_FIELDS[i] for i in range(1, len(FRAME_FIELDS)) if mask >> i & 1
+            }
+        return layout
+
+    def _decode(self, rows: np.ndarray) -> list[dict]:
+        texts = self._texts
+        frames = []
+        for row in rows.tolist():
+            keys, numeric, text = self._layout(int(row[_PRESENT_COL]))
+            values = [row[i] for i in numeric]
+            values.extend(texts.get(int(row[i])) if not math.isnan(row[i]) else None for i in text)
+            frames.append(dict(zip(keys, values)))
+        return frames
@@ -1,14 +1,167 @@
 import logging
 import json
+import queue
+import threading
 import time
 import os
 from datetime import datetime
 from pathlib import Path
+from src.columnar_csv import TIME_FORMAT, write_csv_blocks
 from src.signal_processing import compute_rms, compute_thd
 
 logger = logging.getLogger(__name__)
 
 _SESSION_FORMAT_VERSION = "1.2"
+_SMART_CSV_COLUMNS = [
+    "ts", "v_an", "v_bn", "v_cn", "i_a", "i_b", "i_c", "freq",
+    "thd", "rms", "fault", "compliance", "insight",
+]
+_CANONICAL_CHANNELS = frozenset(
+    {"ts", "v_an", "v_bn", "v_cn", "i_a", "i_b", "i_c", "freq", "p_mech"}
+)
+_CHANNEL_SAMPLE_FRAMES = 20         # meta["channels"] comes from the first N frames
+
+# Spool (recording in progress): one JSON value per line.  Frames are written
+# as-is; the header, insights and events are objects with a single "__"-key.
+_SPOOL_SUFFIX = ".recording.jsonl"
+_SPOOL_TAG_PREFIX = '{"__'
+_SPOOL_HEADER = "__session__"
+_SPOOL_INSIGHT = "__insight__"
+_SPOOL_EVENT = "__event__"
+
+
+def _frame_lines(spool_path: str, validate: bool = False, limit: int | None = None):
+    """Serialized frames of a spool file, header and tagged lines skipped.
+
+    With *limit*, only the first *limit* bytes of the file are read (the
+    part known to be complete).
+    """
+    if not spool_path or not os.path.exists(spool_path):
+        return
+    consumed = 0
+    with open(spool_path, "rb") as f:
+        for raw in f:
+            consumed += len(raw)
+            if limit is not None and consumed > limit:
+                return
+            line = raw.decode("utf-8").rstrip("\r\n")
+            if not line or line.startswith(_SPOOL_TAG_PREFIX):
+                continue
+            if validate:
+                try:
+                    json.loads(line)
+                except ValueError:      # torn last line after a crash
+                    continue
+            yield line
+
+
+def _write_capsule(filepath: str, meta: dict, frame_lines, insights: list, events: list) -> None:
+    """Stream a session file; *frame_lines* are already-serialized frames."""
+    def block(value):
+        return json.dumps(value, indent=2).replace("\n", "\n  ")
+
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write('{\n  "meta": ' + block(meta) + ',\n  "frames": [')
+        sep = "\n    "
+        for line in frame_lines:
+            f.write(sep)
+            f.write(line)
+            sep = ",\n    "
+        f.write('\n  ],\n  "insights": ' + block(insights))
+        f.write(',\n  "events": ' + block(events) + "\n}\n")
+
+
+class _FrameStats:
+    """Running meta of recorded frames: count, channel keys, timestamp span."""
+
+    def __init__(self):
+        self.count = 0
+        self.keys: set[str] = set()
+        self.first_ts: float | None = None
+        self.last_ts: float | None = None
+
+    def note(self, frame: dict) -> None:
+        self.count += 1
+        if self.count <= _CHANNEL_SAMPLE_FRAMES:
+            self.keys.update(frame.keys())
+        ts = frame.get("ts")
+        if isinstance(ts, (int, float)) and ts > 0:
+            if self.first_ts is None:
+                self.first_ts = ts
+            self.last_ts = ts
+
+    def sample_rate(self) -> float:
+        """Estimate Hz from recorded timestamps."""
+        if self.count < 2 or self.first_ts is None or self.last_ts is None:
+            return 0.0
+        duration = self.last_ts - self.first_ts
+        if duration <= 0:
+            return 0.0
+        return round((self.count - 1) / duration, 2)
+
+    def channels(self) -> list[str]:
+        """Sorted canonical channel keys present in the first frames."""
+        return sorted(self.keys & _CANONICAL_CHANNELS)
+
+
+class _SpoolWriter(threading.Thread):
+    """
+    Background writer appending recorded chunks to a session's spool file.
+
+    Chunks are ``(frames, tagged)`` pairs: frames become one JSON line each,
+    tagged records (insights, events) become ``{"<tag>": record}`` lines.
+    The file is opened on the first chunk, starting with a header line,
+    and flushed after every chunk.
+    """
+
+    def __init__(self, path: str, header: dict, max_queued_chunks: int):
+        super().__init__(name=f"recorder-spool-{os.path.basename(path)}", daemon=True)
+        self.path = path
+        self.header = header
+        self.failed = False
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queued_chunks)
+
+    def submit(self, frames: list[dict], tagged: list[tuple[str, dict]]) -> None:
+        # Blocks while the queue is full: a slow disk throttles the producer
+        # instead of growing memory.
+        self._queue.put((frames, tagged))
+
+    def sync(self) -> None:
+        """Wait until every submitted chunk is on disk."""
+        self._queue.join()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self.join()
+
+    def run(self) -> None:
+        f = None
+        try:
+            while True:
+                chunk = self._queue.get()
+                try:
+                    if chunk is None:
+                        return
+                    if self.failed:
+                        continue
+                    try:
+                        if f is None:
+                            f = open(self.path, "a", encoding="utf-8")
+                            f.write(json.dumps({_SPOOL_HEADER: self.header}) + "\n")
+                        frames, tagged = chunk
+                        lines = [json.dumps(frame) for frame in frames]
+                        lines += [json.dumps({tag: record}) for tag, record in tagged]
+                        if lines:
+                            f.write("\n".join(lines) + "\n")
+                        f.flush()
+                    except Exception as e:
+                        logger.error(f"Recorder: writing {self.path} failed: {e}")
+                        self.failed = True
+                finally:
+                    self._queue.task_done()
+        finally:
+            if f is not None:
+                f.close()
 
 
 class Recorder:
@@ -29,133 +182,259 @@ class Recorder:
         "insights": [InsightEvent, ...],
         "events":   [legacy event dicts, ...]
     }
+
+    While recording, frames are kept in memory only until a chunk of
+    ``chunk_frames`` frames (or ``flush_interval_s`` worth) has built up;
+    the chunk is then handed to a background thread that appends it to
+    ``<session_id>.recording.jsonl`` — one JSON frame per line after a
+    header line, with insights and events as tagged lines.  Memory use is
+    therefore independent of recording length, and a crash loses at most
+    the unflushed tail: :meth:`recover` turns a leftover spool into a
+    session file.  ``stop()`` streams the spool into the session file and
+    deletes it.
+
+    The recorder is thread-safe: live sessions feed it from the telemetry
+    reader thread (see ``SerialManager.add_frame_sink``) while the GUI
+    thread starts, stops and snapshots it.
     """
 
-    def __init__(self, data_dir: str = "data/sessions"):
+    CHUNK_FRAMES = 1000
+    FLUSH_INTERVAL_S = 1.0
+    MAX_QUEUED_CHUNKS = 16
+
+    def __init__(self, data_dir: str = "data/sessions", chunk_frames: int = CHUNK_FRAMES,
+                 flush_interval_s: float = FLUSH_INTERVAL_S):
         self.data_dir = data_dir
         os.makedirs(self.data_dir, exist_ok=True)
+        self.chunk_frames = chunk_frames
+        self.flush_interval_s = flush_interval_s
         self.is_recording = False
+        # Frames not yet handed to the spool writer
         self.buffer: list[dict] = []
         self.insights: list[dict] = []
         self.events: list[dict] = []
         self.start_time: datetime | None = None
         self.session_id: str | None = None
-        self._first_ts: float | None = None
-        self._last_ts: float | None = None
+        self.spool_path: str | None = None
+        self._stats = _FrameStats()
+        self._tagged: list[tuple[str, dict]] = []
+        self._writer: _SpoolWriter | None = None
+        self._last_handoff = 0.0
+        self._lock = threading.RLock()
+
+    @property
+    def frame_count(self) -> int:
+        """Frames logged since ``start()`` (spooled and in memory)."""
+        return self._stats.count
 
     def start(self):
-        self.is_recording = True
-        self.buffer = []
-        self.insights = []
-        self.events = []
-        self.start_time = datetime.now()
-        self.session_id = f"session_{self.start_time.strftime('%Y%m%d_%H%M%S')}"
-        self._first_ts = None
-        self._last_ts = None
+        with self._lock:
+            self._close_writer()
+            self.buffer = []
+            self.insights = []
+            self.events = []
+            self._tagged = []
+            self._stats = _FrameStats()
+            self.start_time = datetime.now()
+            self.session_id = f"session_{self.start_time.strftime('%Y%m%d_%H%M%S')}"
+            os.makedirs(self.data_dir, exist_ok=True)
+            self.spool_path = os.path.join(self.data_dir, f"{self.session_id}{_SPOOL_SUFFIX}")
+            self._last_handoff = time.monotonic()
+            self.is_recording = True
         logger.info(f"Recording started: {self.session_id}")
 
     def stop(self) -> str | None:
-        if not self.is_recording:
-            return None
-        self.is_recording = False
-        filepath = self._save_to_disk()
+        with self._lock:
+            if not self.is_recording:
+                return None
+            self.is_recording = False
+            filepath = self._save_to_disk()
         logger.info(f"Recording stopped. Saved to {filepath}")
         return filepath
 
     def log_frame(self, frame: dict):
         if self.is_recording:
-            self.buffer.append(frame)
-            ts = frame.get("ts")
-            if isinstance(ts, (int, float)) and ts > 0:
-                if self._first_ts is None:
-                    self._first_ts = ts
-                self._last_ts = ts
+            self.log_frames((frame,))
+
+    def log_frames(self, frames):
+        """Log a batch of frames (one lock round-trip for the whole batch)."""
+        if not self.is_recording:
+            return
+        with self._lock:
+            if not self.is_recording:          # stopped while we waited
+                return
+            self.buffer.extend(frames)
+            note = self._stats.note
+            for frame in frames:
+                note(frame)
+            if (len(self.buffer) >= self.chunk_frames
+                    or time.monotonic() - self._last_handoff >= self.flush_interval_s):
+                self._hand_off()
 
     def log_insight(self, insight: dict):
         """Log a canonical InsightEvent dict to the session."""
-        if self.is_recording:
-            self.insights.append(insight)
+        with self._lock:
+            if self.is_recording:
+                self.insights.append(insight)
+                self._tagged.append((_SPOOL_INSIGHT, insight))
 
     def log_event(self, event_type: str, details: str):
-        if self.is_recording:
+        with self._lock:
+            if not self.is_recording:
+                return
             event = {
                 "ts": time.time(),
                 "type": event_type,
                 "details": details,
             }
             self.events.append(event)
-            logger.info(f"Event logged: {event_type}")
+            self._tagged.append((_SPOOL_EVENT, event))
+        logger.info(f"Event logged: {event_type}")
 
-    def _estimate_sample_rate(self) -> float:
-        """Estimate Hz from recorded timestamps."""
-        if len(self.buffer) < 2 or self._first_ts is None or self._last_ts is None:
-            return 0.0
-        duration = self._last_ts - self._first_ts
-        if duration <= 0:
-            return 0.0
-        return round((len(self.buffer) - 1) / duration, 2)
-
-    def _detected_channels(self) -> list[str]:
-        """Return sorted list of canonical channel keys present in frames."""
-        if not self.buffer:
-            return []
-        canonical = {"ts", "v_an", "v_bn", "v_cn", "i_a", "i_b", "i_c", "freq", "p_mech"}
-        found: set[str] = set()
-        for f in self.buffer[:20]:          # sample first 20 frames
-            found.update(f.keys())
-        return sorted(found & canonical)
+    # ── Spool ─────────────────────────────────────────────────────────────────
+
+    def _hand_off(self) -> None:
+        """Pass the in-memory tail to the spool writer (started on first use)."""
+        self._last_handoff = time.monotonic()
+        if not self.buffer and not self._tagged:
+            return
+        if self._writer is None:
+            header = {
+                "version":    _SESSION_FORMAT_VERSION,
+                "session_id": self.session_id,
+                "start_time": self.start_time.isoformat() if self.start_time else "",
+            }
+            self._writer = _SpoolWriter(self.spool_path, header, self.MAX_QUEUED_CHUNKS)
+            self._writer.start()
+        self._writer.submit(self.buffer, self._tagged)
+        self.buffer = []
+        self._tagged = []
+
+    def _close_writer(self) -> bool:
+        """Flush and stop the writer; False if any chunk failed to write."""
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return True
+        writer.close()
+        return not writer.failed
+
+    # ── Capsule ───────────────────────────────────────────────────────────────
+
+    def _meta(self) -> dict:
+        return {
+            "version":              _SESSION_FORMAT_VERSION,
+            "session_id":           self.session_id,
+            "start_time":           self.start_time.isoformat() if self.start_time else "",
+            "frame_count":          self._stats.count,
+            "sample_rate_estimate": self._stats.sample_rate(),
+            "channels":             self._stats.channels(),
+        }
 
     def to_capsule(self) -> dict:
         """Return the current recorded data as an in-memory Data Capsule dict.
 
         Unlike ``stop()``, this does NOT stop recording or write to disk.
-        The returned dict has the same schema as a saved session file (v1.2)
-        and can be passed directly to ``ActiveSession.from_capsule()`` or the
-        ReplayStudio without first saving to disk.
+        Frames come from the spool (after waiting for pending chunks) plus
+        the in-memory tail.  The returned dict has the same schema as a
+        saved session file (v1.2) and can be passed directly to
+        ``ActiveSession.from_capsule()`` or the ReplayStudio without first
+        saving to disk.
 
         Returns an empty capsule (zero frames) if recording has not started.
+
+        The lock is held only to sync the spool and snapshot the tail and
+        metadata; the spool is parsed afterwards, up to the size it had at
+        the snapshot, so recording carries on meanwhile.
         """
+        with self._lock:
+            spool_path, spool_bytes = self.spool_path, 0
+            if self._writer is not None:
+                self._writer.sync()
+                try:
+                    spool_bytes = os.path.getsize(spool_path)
+                except OSError:
+                    pass
+            tail = list(self.buffer)
+            meta = self._meta()
+            meta["session_id"] = self.session_id or "live"
+            meta["source_type"] = "live"
+            insights = list(self.insights)
+            events = list(self.events)
+
+        frames = []
+        if spool_bytes:
+            frames = [json.loads(line) for line in _frame_lines(spool_path, limit=spool_bytes)]
+            if not frames and not os.path.exists(spool_path):
+                logger.warning(f"Spool {spool_path} was removed while building a capsule")
+        frames.extend(tail)
         return {
-            "meta": {
-                "version":              _SESSION_FORMAT_VERSION,
-                "session_id":           self.session_id or "live",
-                "start_time":           self.start_time.isoformat() if self.start_time else "",
-                "frame_count":          len(self.buffer),
-                "sample_rate_estimate": self._estimate_sample_rate(),
-                "channels":             self._detected_channels(),
-                "source_type":          "live",
-            },
-            "frames":   list(self.buffer),    # copy — caller must not mutate
-            "insights": list(self.insights),
-            "events":   list(self.events),
+            "meta":     meta,
+            "frames":   frames,
+            "insights": insights,
+            "events":   events,
         }
 
     def _save_to_disk(self) -> str | None:
         Path(self.data_dir).mkdir(parents=True, exist_ok=True)
-        capsule = {
-            "meta": {
-                "version":              _SESSION_FORMAT_VERSION,
-                "session_id":           self.session_id,
-                "start_time":           self.start_time.isoformat() if self.start_time else "",
-                "frame_count":          len(self.buffer),
-                "sample_rate_estimate": self._estimate_sample_rate(),
-                "channels":             self._detected_channels(),
-            },
-            "frames":   self.buffer,
-            "insights": self.insights,
-            "events":   self.events,
-        }
-
-        filename = f"{self.session_id}.json"
-        filepath = os.path.join(self.data_dir, filename)
-
+        self._hand_off()
+        spool_ok = self._close_writer()
+        filepath = os.path.join(self.data_dir, f"{self.session_id}.json")
+        if not spool_ok:
+            logger.error(f"Failed to save session: spool {self.spool_path} is incomplete")
+            return None
         try:
-            with open(filepath, "w") as f:
-                json.dump(capsule, f, indent=2)
-            return filepath
+            _write_capsule(filepath, self._meta(), _frame_lines(self.spool_path),
+                           self.insights, self.events)
         except Exception as e:
             logger.error(f"Failed to save session: {e}")
             return None
+        if os.path.exists(self.spool_path):
+            os.remove(self.spool_path)
+        return filepath
+
+    @staticmethod
+    def recover(spool_path: str) -> str | None:
+        """
+        Build a session file from the spool of an interrupted recording.
+
+        Returns the session file path (next to the spool), or None if the
+        spool has no header line.  A torn last line is skipped.
+        """
+        header = None
+        insights: list[dict] = []
+        events: list[dict] = []
+        with open(spool_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.startswith(_SPOOL_TAG_PREFIX):
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if _SPOOL_HEADER in record:
+                    header = record[_SPOOL_HEADER]
+                elif _SPOOL_INSIGHT in record:
+                    insights.append(record[_SPOOL_INSIGHT])
+                elif _SPOOL_EVENT in record:
+                    events.append(record[_SPOOL_EVENT])
+        if header is None:
+            return None
+
+        stats = _FrameStats()
+        for line in _frame_lines(spool_path, validate=True):
+            stats.note(json.loads(line))
+        meta = {
+            "version":              header.get("version", _SESSION_FORMAT_VERSION),
+            "session_id":           header.get("session_id"),
+            "start_time":           header.get("start_time", ""),
+            "frame_count":          stats.count,
+            "sample_rate_estimate": stats.sample_rate(),
+            "channels":             stats.channels(),
+            "recovered":            True,
+        }
+        filepath = os.path.join(os.path.dirname(spool_path) or ".", f"{meta['session_id']}.json")
+        _write_capsule(filepath, meta, _frame_lines(spool_path, validate=True), insights, events)
+        return filepath
 
     def export_smart_csv(self, session_path, insights=None, compliance=None, out_path="data/session_export.csv"):
         try:
@@ -168,16 +447,14 @@ class Recorder:
         if not frames:
             return None
 
-        ts    = [f.get("ts") for f in frames]
-        v_an  = [f.get("v_an", 0.0) for f in frames]
-        v_bn  = [f.get("v_bn", 0.0) for f in frames]
-        v_cn  = [f.get("v_cn", 0.0) for f in frames]
-        i_a   = [f.get("i_a",  0.0) for f in frames]
-        i_b   = [f.get("i_b",  0.0) for f in frames]
-        i_c   = [f.get("i_c",  0.0) for f in frames]
-        freq  = [f.get("freq", 60.0) for f in frames]
-        thd   = compute_thd(v_an, time_data=ts)
-        rms   = compute_rms(v_an)
+        # THD/RMS are computed from the frames that actually carry v_an;
+        # channels a frame lacks are written as empty cells, not zeros.
+        with_v_an = [f for f in frames if f.get("v_an") is not None]
+        if with_v_an:
+            thd = compute_thd([f["v_an"] for f in with_v_an], time_data=[f.get("ts") for f in with_v_an])
+            rms = compute_rms([f["v_an"] for f in with_v_an])
+        else:
+            thd = rms = None
 
         insight_ts = set()
         if insights:
@@ -190,18 +467,19 @@ class Recorder:
                 [f"{c['name']}={'PASS' if c['passed'] else 'FAIL'}" for c in compliance]
             )
 
+        def _block(start, stop):
+            chunk = frames[start:stop]
+            n = stop - start
+            columns = [[fr.get(name) for fr in chunk] for name in _SMART_CSV_COLUMNS[:8]]
+            return columns + [
+                [thd] * n,
+                [rms] * n,
+                [fr.get("fault_type") for fr in chunk],
+                [compliance_str] * n,
+                [1 if fr.get("ts") in insight_ts else 0 for fr in chunk],
+            ]
+
         os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
-        with open(out_path, "w") as f:
-            f.write("ts,v_an,v_bn,v_cn,i_a,i_b,i_c,freq,thd,rms,fault,compliance,insight\n")
-            for idx, frame in enumerate(frames):
-                line = [
-                    frame.get("ts"),
-                    v_an[idx], v_bn[idx], v_cn[idx],
-                    i_a[idx],  i_b[idx],  i_c[idx],
-                    freq[idx], thd, rms,
-                    frame.get("fault_type"),
-                    compliance_str,
-                    "1" if frame.get("ts") in insight_ts else "0",
-                ]
-                f.write(",".join([str(x) for x in line]) + "\n")
+        with open(out_path, "w", newline="", encoding="utf-8") as f:
+            write_csv_blocks(f, _SMART_CSV_COLUMNS, len(frames), _block, formats=[TIME_FORMAT])
         return out_path
@@ -0,0 +1,401 @@
+"""
+N-way regression comparison against a golden baseline run.
+
+Firmware regression testing compares many candidate runs against one
+reference capture.  Instead of rebuilding the pairwise comparison for every
+run, :class:`BaselineReference` prepares the baseline once:
+
+  - baseline channels are anti-alias resampled onto a fixed uniform time
+    grid (relative to the run start) and kept in memory;
+  - baseline features (per-phase THD, frequency nadir, recovery time) are
+    computed once.
+
+:func:`run_regression` then evaluates all candidates in parallel workers and
+returns a :class:`RegressionMatrix`.  The matrix holds RMSE, THD delta,
+nadir delta and recovery delta for every run and channel, with runs ranked
+from largest to smallest deviation.
+
+Usage::
+    from src.regression import run_regression
+
+    matrix = run_regression(baseline_dataset, ["run_01.csv", "run_02.csv"], max_workers=4)
+    for label in matrix.ranking:
+        print(label, matrix.run_scores[label])
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+import numpy as np
+
+from src.derived_channels import derive_dataset_channels
+from src.event_detector import detect_events
+from src.file_ingestion import ImportedDataset
+from src.resampling import native_rate, nice_rate, resample_uniform
+from src.signal_processing import compute_thd
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_GRID_POINTS = 10_000
+_PHASE_VOLTAGE_CHANNELS = ("v_an", "v_bn", "v_cn")
+_NON_SIGNAL_CHANNELS = frozenset({"status", "display_time_s"})
+
+Candidate = Union[ImportedDataset, dict, str, os.PathLike]
+
+
+# ---------------------------------------------------------------------------
+# Result dataclasses
+# ---------------------------------------------------------------------------
+
+@dataclass
+class RunFeatures:
+    """Scalar features of one run used for regression deltas."""
+    thd_pct:         dict[str, float] = field(default_factory=dict)
+    nadir_hz:        Optional[float] = None
+    recovery_time_s: float = 0.0
+
+
+@dataclass
+class RegressionEntry:
+    """One cell row of the regression matrix: one run × one channel."""
+    run_label:        str
+    channel:          str
+    rmse:             float
+    normalized_rmse:  float           # rmse / baseline channel RMS
+    thd_delta_pct:    Optional[float]  # phase voltages only
+    nadir_delta_hz:   Optional[float]
+    recovery_delta_s: float
+    n_samples:        int
+
+    def to_dict(self) -> dict:
+        return {
+            "run": self.run_label,
+            "channel": self.channel,
+            "rmse": self.rmse,
+            "normalized_rmse": self.normalized_rmse,
+            "thd_delta_pct": self.thd_delta_pct,
+            "nadir_delta_hz": self.nadir_delta_hz,
+            "recovery_delta_s": self.recovery_delta_s,
+            "n_samples": self.n_samples,
+        }
+
+
+@dataclass
+class RegressionMatrix:
+    """Ranked regression results for every candidate run."""
+    baseline_label: str
+    channels:       list[str]
+    entries:        list[RegressionEntry] = field(default_factory=list)
+    run_scores:     dict[str, float] = field(default_factory=dict)
+    ranking:        list[str] = field(default_factory=list)   # worst first
+    errors:         dict[str, str] = field(default_factory=dict)
+
+    def rows(self) -> list[dict]:
+        """Entries as dicts, ordered by run rank and then channel."""
+        rank = {label: i for i, label in enumerate(self.ranking)}
+        ordered = sorted(
+            self.entries,
+            key=lambda e: (rank.get(e.run_label, len(rank)), self.channels.index(e.channel)),
+        )
+        return [
+            {"rank": rank.get(e.run_label, len(rank)) + 1, **e.to_dict()}
+            for e in ordered
+        ]
+
+    def to_csv(self, out_path: str) -> str:
+        os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+        columns = [
+            "rank", "run", "channel", "rmse", "normalized_rmse",
+            "thd_delta_pct", "nadir_delta_hz", "recovery_delta_s", "n_samples",
+        ]
+        with open(out_path, "w", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=columns, restval="")
+            writer.writeheader()
+            for row in self.rows():
+                writer.writerow({k: ("" if v is None else v) for k, v in row.items()})
+        return os.path.abspath(out_path)
+
+
+# ---------------------------------------------------------------------------
+# Features
+# ---------------------------------------------------------------------------
+
+def run_features(dataset: ImportedDataset) -> RunFeatures:
+    """
+    Compute the scalar regression features for *dataset*.
+
+    ``recovery_time_s`` is the longest time a detected voltage sag took to
+    recover — from its onset until the cycle RMS is back above the sag
+    threshold (0.0 when no sag is detected).
+    ``nadir_hz`` is the minimum of the ``freq`` channel, or None without one.
+    """
+    thd = {
+        ch: float(compute_thd(dataset.channels[ch], fs=dataset.sample_rate, time_data=dataset.time))
+        for ch in _PHASE_VOLTAGE_CHANNELS
+        if ch in dataset.channels
+    }
+
+    nadir = None
+    freq = dataset.channels.get("freq")
+    if freq is not None:
+        finite = np.asarray(freq, dtype=np.float64)
+        finite = finite[np.isfinite(finite)]
+        if finite.size:
+            nadir = float(finite.min())
+
+    sags = [e for e in detect_events(dataset) if e.kind == "voltage_sag"]
+    recovery = max((float(e.ts_end - e.ts_start) for e in sags), default=0.0)
+    return RunFeatures(thd_pct=thd, nadir_hz=nadir, recovery_time_s=recovery)
+
+
+def _relative_time(dataset: ImportedDataset) -> np.ndarray:
+    t = np.asarray(dataset.time, dtype=np.float64)
+    return t - t[0] if t.size else t
+
+
+# ---------------------------------------------------------------------------
+# Baseline
+# ---------------------------------------------------------------------------
+
+class BaselineReference:
+    """
+    Baseline run prepared once for repeated regression comparisons.
+
+    Args:
+        dataset:     Baseline ImportedDataset (mapped; derived channels are added).
+        label:       Display label.
+        channels:    Channels to compare.  Defaults to every numeric channel.
+        grid_points: Upper bound on the length of the uniform grid the
+                     baseline is cached on (the native rate is kept when
+                     it already fits).
+    """
+
+    def __init__(
+        self,
+        dataset: ImportedDataset,
+        label: str = "baseline",
+        channels: Optional[list[str]] = None,
+        grid_points: int = _DEFAULT_GRID_POINTS,
+    ):
+        dataset = derive_dataset_channels(dataset)
+        self.label = label
+        self.mapping = dict(dataset.meta.get("applied_mapping", {}))
+        self.scale_factors = dict(dataset.meta.get("scale_factors", {}))
+        self.channels = [
+            ch for ch in (channels or sorted(dataset.channels))
+            if ch in dataset.channels and ch not in _NON_SIGNAL_CHANNELS
+        ]
+        t_rel = _relative_time(dataset)
+        self.duration_s = float(t_rel[-1]) if t_rel.size else 0.0
+        self.rate = native_rate(t_rel)
+        if self.duration_s > 0:
+            self.rate = min(self.rate, nice_rate(grid_points / self.duration_s))
+        if self.rate > 0:
+            self.grid = np.arange(int(self.duration_s * self.rate + 1e-9) + 1) / self.rate
+        else:
+            self.grid = np.linspace(0.0, self.duration_s, 2)
+        self.arrays = {
+            ch: self._on_grid(t_rel, dataset.channels[ch], self.grid)
+            for ch in self.channels
+        }
+        self.rms = {
+            ch: float(np.sqrt(np.nanmean(arr * arr))) if arr.size else 0.0
+            for ch, arr in self.arrays.items()
+        }
+        self.features = run_features(dataset)
+
+    def _on_grid(self, t_rel: np.ndarray, values, grid: np.ndarray) -> np.ndarray:
+        if self.rate > 0:
+            t_rel, values = resample_uniform(t_rel, values, self.rate)
+        return np.interp(grid, t_rel, np.asarray(values, dtype=np.float64))
+
+    def compare(self, candidate: ImportedDataset, label: str) -> list[RegressionEntry]:
+        """Compare one candidate run against the cached baseline."""
+        candidate = derive_dataset_channels(candidate)
+        t_rel = _relative_time(candidate)
+        features = run_features(candidate)
+
+        nadir_delta = None
+        if features.nadir_hz is not None and self.features.nadir_hz is not None:
+            nadir_delta = features.nadir_hz - self.features.nadir_hz
+        recovery_delta = features.recovery_time_s - self.features.recovery_time_s
+
+        # Only the part of the baseline grid the candidate actually covers.
+        end = float(t_rel[-1]) if t_rel.size else 0.0
+        n_overlap = int(np.searchsorted(self.grid, end, side="right"))
+
+        entries: list[RegressionEntry] = []
+        for ch in self.channels:
+            if ch not in candidate.channels or n_overlap < 2:
+                continue
+            ref = self.arrays[ch][:n_overlap]
+            test = self._on_grid(t_rel, candidate.channels[ch], self.grid[:n_overlap])
+            diff = test - ref
+            diff = diff[np.isfinite(diff)]
+            rmse = float(np.sqrt(np.mean(diff * diff))) if diff.size else float("nan")
+            base_rms = self.rms.get(ch, 0.0)
+            thd_delta = None
+            if ch in features.thd_pct and ch in self.features.thd_pct:
+                thd_delta = features.thd_pct[ch] - self.features.thd_pct[ch]
+            entries.append(
+                RegressionEntry(
+                    run_label=label,
+                    channel=ch,
+                    rmse=rmse,
+                    normalized_rmse=rmse / base_rms if base_rms > 1e-12 else rmse,
+                    thd_delta_pct=thd_delta,
+                    nadir_delta_hz=nadir_delta,
+                    recovery_delta_s=recovery_delta,
+                    n_samples=int(diff.size),
+                )
+            )
+        return entries
+
+
+# ---------------------------------------------------------------------------
+# Candidate loading and workers
+# ---------------------------------------------------------------------------
+
+def _load_candidate(
+    candidate: Candidate,
+    mapping: dict[str, str],
+    scale_factors: dict[str, float],
+) -> ImportedDataset:
+    if isinstance(candidate, ImportedDataset):
+        return candidate
+    if isinstance(candidate, dict):
+        from src.session_analysis import dataset_for_analysis
+        return dataset_for_analysis(candidate)
+
+    from src.file_ingestion import ingest_file
+    dataset = ingest_file(os.fspath(candidate))
+    # Runs of the same rig share raw headers; reuse the baseline's mapping.
+    if mapping and any(src in dataset.channels for src in mapping):
+        from src.channel_mapping import ChannelMapper
+        dataset = ChannelMapper().apply(dataset, mapping, scale_factors or None)
+    return dataset
+
+
+def _evaluate(baseline: BaselineReference, label: str, candidate: Candidate):
+    try:
+        dataset = _load_candidate(candidate, baseline.mapping, baseline.scale_factors)
+        return label, baseline.compare(dataset, label), None
+    except Exception as exc:
+        logger.warning("Regression run '%s' failed: %s", label, exc)
+        return label, [], str(exc)
+
+
+_WORKER_BASELINE: Optional[BaselineReference] = None
+
+
+def _init_process_worker(baseline: BaselineReference) -> None:
+    global _WORKER_BASELINE
+    _WORKER_BASELINE = baseline
+
+
+def _evaluate_in_process(label: str, candidate: Candidate):
+    return _evaluate(_WORKER_BASELINE, label, candidate)
+
+
+def _candidate_label(candidate: Candidate, index: int) -> str:
+    if isinstance(candidate, ImportedDataset):
+        return os.path.basename(candidate.source_path) or f"run_{index + 1}"
+    if isinstance(candidate, dict):
+        return candidate.get("meta", {}).get("session_id") or f"run_{index + 1}"
+    return os.path.basename(os.fspath(candidate))
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def run_regression(
+    baseline: Union[BaselineReference, ImportedDataset],
+    candidates: Union[list[Candidate], dict[str, Candidate]],
+    channels: Optional[list[str]] = None,
+    max_workers: Optional[int] = None,
+    use_processes: Optional[bool] = None,
+    baseline_label: str = "baseline",
+) -> RegressionMatrix:
+    """
+    Evaluate every candidate run against *baseline* and rank the results.
+
+    Args:
+        baseline:      Prepared :class:`BaselineReference` (reused as-is) or a
+                       dataset to prepare one from.
+        candidates:    Datasets, capsule dicts or file paths; a dict supplies
+                       explicit labels.  File candidates are mapped with the
+                       baseline's applied channel mapping and scale factors.
+        channels:      Channels to compare (default: all baseline channels).
+        max_workers:   Worker count (default: CPU count, capped at 8).
+        use_processes: Evaluate in a process pool.  Defaults to True when
+                       every candidate is a file path (parsing dominates and
+                       holds the GIL), otherwise threads are used so
+                       in-memory arrays are not copied.
+
+    Returns:
+        RegressionMatrix; runs that fail to load are listed in ``errors``.
+    """
+    if not isinstance(baseline, BaselineReference):
+        baseline = BaselineReference(baseline, label=baseline_label, channels=channels)
+
+    if isinstance(candidates, dict):
+        labelled = list(candidates.items())
+    else:
+        labelled = [(_candidate_label(c, i), c) for i, c in enumerate(candidates)]
+    # Keep labels unique so matrix rows never merge two runs.
+    seen: dict[str, int] = {}
+    unique: list[tuple[str, Candidate]] = []
+    for label, cand in labelled:
+        count = seen.get(label, 0)
+        seen[label] = count + 1
+        unique.append((f"{label} ({count + 1})" if count else label, cand))
+
+    workers = max(1, min(max_workers or os.cpu_count() or 1, 8, len(unique) or 1))
+    if use_processes is None:
+        use_processes = workers > 1 and all(
+            isinstance(c, (str, os.PathLike)) for _, c in unique
+        )
+
+    if workers == 1:
+        results = [_evaluate(baseline, label, cand) for label, cand in unique]
+    elif use_processes:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_process_worker,
+            initargs=(baseline,),
+        ) as pool:
+            results = list(pool.map(_evaluate_in_process, *zip(*unique)))
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="regression") as pool:
+            results = list(pool.map(lambda lc: _evaluate(baseline, *lc), unique))
+
+    matrix = RegressionMatrix(baseline_label=baseline.label, channels=list(baseline.channels))
+    for label, entries, error in results:
+        if error is not None:
+            matrix.errors[label] = error
+            continue
+        matrix.entries.extend(entries)
+        scores = [e.normalized_rmse for e in entries if np.isfinite(e.normalized_rmse)]
+        matrix.run_scores[label] = float(np.mean(scores)) if scores else float("nan")
+
+    matrix.ranking = sorted(
+        matrix.run_scores,
+        key=lambda lbl: (
+            -matrix.run_scores[lbl] if np.isfinite(matrix.run_scores[lbl]) else float("inf")
+        ),
+    )
+    logger.info(
+        "Regression vs '%s': %d runs (%d failed), %d workers (%s)",
+        baseline.label, len(unique), len(matrix.errors), workers,
+        "processes" if use_processes and workers > 1 else "threads",
+    )
+    return matrix
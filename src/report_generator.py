@@ -14,7 +14,8 @@ import os
 import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from types import SimpleNamespace
+from typing import Any, Callable
 
 import matplotlib
 import numpy as np
@@ -23,16 +24,25 @@ matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 
 from src.analysis import AnalysisEngine
+from src.artifact_cache import ArtifactCache, artifact_fingerprint, dataset_fingerprint
+from src.columnar_csv import PRECISION_NOTE, compressed_path, open_csv_output, write_csv_blocks
 from src.compliance_checker import available_profiles, evaluate_session
+from src.dataset_archive import write_dataset_npz
 from src.derived_channels import ensure_capsule_derived_channels
 from src.event_detector import DetectedEvent
+from src.export_tasks import ExportTask, run_export_tasks
+from src.plot_decimation import add_envelope_line, columns_for, envelope_decimate
 from src.session_analysis import APP_VERSION, compute_session_metrics, dataset_for_analysis, events_for_capsule
 
 
 _PHASE_CHANNELS = ("v_an", "v_bn", "v_cn")
 _LINE_CHANNELS = ("v_ab", "v_bc", "v_ca")
 _CURRENT_CHANNELS = ("i_a", "i_b", "i_c")
+_AUX_CHANNELS = ("freq", "p_mech", "v_dc")
 _DEFAULT_PREVIEW_CSV_ROWS = 50_000
+_REPORT_DPI = 140
+_FIGURE_WIDTH_IN = 12
+_PLOT_COLUMNS = columns_for(_FIGURE_WIDTH_IN, _REPORT_DPI)
 _COLORS = {
     "v_an": "#f97316",
     "v_bn": "#3b82f6",
@@ -109,11 +119,22 @@ def _write_dataset_csv(
     *,
     include_full_resolution: bool = False,
     max_preview_rows: int = _DEFAULT_PREVIEW_CSV_ROWS,
+    compression: str | None = None,
+    progress: Callable[[int, int], None] | None = None,
 ) -> dict:
+    """
+    Write the normalized dataset CSV, streamed in row chunks.
+
+    Rows are formatted straight from the channel arrays a chunk at a time
+    (see :mod:`src.columnar_csv`), so peak memory does not grow with the
+    row count.  *compression* (``"gzip"``, ``"bz2"``, ``"xz"``) appends the
+    matching suffix to *path*; *progress* is called as
+    ``progress(rows_written, rows_total)``.
+    """
     del capsule
 
     total_rows = int(dataset.row_count)
-    indices = np.arange(total_rows, dtype=np.int64)
+    indices = None
     mode = "full_resolution"
     note = "Full-resolution normalized CSV export."
     if total_rows > max_preview_rows and not include_full_resolution:
@@ -125,38 +146,35 @@ def _write_dataset_csv(
             f"Preview CSV downsampled to {len(indices):,} rows for package size; "
             "metrics computed on full-resolution data."
         )
+    rows = total_rows if indices is None else int(indices.size)
+
+    columns = ["ts"] + sorted(dataset.channels.keys())
+    arrays = [np.asarray(dataset.time)] + [np.asarray(dataset.channels[c]) for c in columns[1:]]
 
-    with open(path, "w", newline="", encoding="utf-8") as handle:
+    def _block(start: int, stop: int) -> list[np.ndarray]:
+        if indices is None:
+            return [arr[start:stop] for arr in arrays]
+        picked = indices[start:stop]
+        return [arr[picked] for arr in arrays]
+
+    path = compressed_path(path, compression)
+    with open_csv_output(path, compression) as handle:
         handle.write("# VSM Evidence Workbench - Normalized Data Export\n")
-        handle.write(f"# Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
         handle.write(f"# Source file: {dataset.source_path}\n")
         handle.write(f"# Samples: {dataset.row_count}\n")
         handle.write(f"# CSV mode: {mode}\n")
         handle.write(f"# Note: {note}\n")
+        handle.write(f"# Precision: {PRECISION_NOTE}\n")
         if dataset.sample_rate:
             handle.write(f"# Sample rate: {dataset.sample_rate} Hz\n")
         handle.write("#\n")
-
-        columns = ["ts"] + sorted(dataset.channels.keys())
-        try:
-            import pandas as pd
-
-            data = {"ts": np.asarray(dataset.time, dtype=np.float64)[indices]}
-            for channel in columns[1:]:
-                data[channel] = np.asarray(dataset.channels[channel], dtype=np.float64)[indices]
-            pd.DataFrame(data, columns=columns).to_csv(handle, index=False)
-        except Exception:
-            handle.write(",".join(columns) + "\n")
-            matrix = np.column_stack(
-                [np.asarray(dataset.time, dtype=np.float64)[indices]]
-                + [np.asarray(dataset.channels[channel], dtype=np.float64)[indices] for channel in columns[1:]]
-            )
-            np.savetxt(handle, matrix, delimiter=",", fmt="%.12g")
+        rows_written = write_csv_blocks(handle, columns, rows, _block, progress=progress)
     return {
         "path": str(path.resolve()),
         "mode": mode,
-        "rows_written": int(indices.size),
+        "rows_written": rows_written,
         "source_rows": total_rows,
+        "compression": compression,
         "note": note,
     }
 
@@ -225,25 +243,37 @@ def _apply_axes_style(ax, title: str, y_label: str, *, show_xlabel: bool = False
         spine.set_edgecolor("#334155")
 
 
-def _plot_ready_series(time_s, values, max_points: int = 10_000):
-    arr_t = np.asarray(time_s, dtype=np.float64)
-    arr_y = np.asarray(values, dtype=np.float64)
-    if arr_t.size <= max_points:
-        return arr_t, arr_y
-    step = max(1, int(np.ceil(arr_t.size / max_points)))
-    return arr_t[::step], arr_y[::step]
+def _plot_ready_series(time_s, values, n_columns: int = _PLOT_COLUMNS):
+    """Min/max envelope of *values* sized to the report figure's pixel width."""
+    return envelope_decimate(time_s, values, n_columns)
 
 
-def _plot_group(ax, time_s, dataset, channels: tuple[str, ...], title: str, y_label: str) -> bool:
-    plotted = False
-    for channel in channels:
+def _plot_source(dataset) -> SimpleNamespace:
+    """
+    Picklable copy of the plotted channels, already reduced by
+    ``_plot_ready_series`` so plot workers receive kilobytes, not the
+    full-resolution capture.  Each channel keeps its own time vector
+    because envelope points fall on different samples per channel.
+    """
+    series = {}
+    for channel in _PHASE_CHANNELS + _LINE_CHANNELS + _CURRENT_CHANNELS + _AUX_CHANNELS:
         values = dataset.channels.get(channel)
         if values is None:
             continue
-        plot_t, plot_y = _plot_ready_series(time_s, values)
-        ax.plot(
-            plot_t,
-            plot_y,
+        series[channel] = _plot_ready_series(dataset.time, values)
+    return SimpleNamespace(series=series)
+
+
+def _plot_group(ax, source, channels: tuple[str, ...], title: str, y_label: str) -> bool:
+    plotted = False
+    for channel in channels:
+        series = source.series.get(channel)
+        if series is None:
+            continue
+        add_envelope_line(
+            ax,
+            *series,
+            n_columns=_PLOT_COLUMNS,
             color=_COLORS.get(channel, "#38bdf8"),
             linewidth=1.0,
             label=channel.replace("v_", "V_").replace("i_", "I_"),
@@ -267,29 +297,32 @@ def _plot_group(ax, time_s, dataset, channels: tuple[str, ...], title: str, y_la
     return plotted
 
 
-def _save_waveform_overview_png(dataset, event_payloads: list[dict], path: Path) -> str:
-    time_s = dataset.time
-    fig, axes = plt.subplots(4, 1, figsize=(12, 10), sharex=True, facecolor="#0f1115")
+def _save_waveform_overview_png(source, event_payloads: list[dict], path: Path) -> str:
+    fig, axes = plt.subplots(4, 1, figsize=(_FIGURE_WIDTH_IN, 10), sharex=True, facecolor="#0f1115")
     markers = _event_marker_groups(event_payloads)
 
-    _plot_group(axes[0], time_s, dataset, _PHASE_CHANNELS, "Phase-to-Neutral Voltage", "Voltage (V)")
-    _plot_group(axes[1], time_s, dataset, _LINE_CHANNELS, "Line-to-Line Voltage Overlay", "Voltage (V)")
-    _plot_group(axes[2], time_s, dataset, _CURRENT_CHANNELS, "Current Channels", "Current (A)")
+    _plot_group(axes[0], source, _PHASE_CHANNELS, "Phase-to-Neutral Voltage", "Voltage (V)")
+    _plot_group(axes[1], source, _LINE_CHANNELS, "Line-to-Line Voltage Overlay", "Voltage (V)")
+    _plot_group(axes[2], source, _CURRENT_CHANNELS, "Current Channels", "Current (A)")
 
     aux_plotted = False
-    freq_values = dataset.channels.get("freq")
-    if freq_values is not None:
-        plot_t, plot_y = _plot_ready_series(time_s, freq_values)
-        axes[3].plot(plot_t, plot_y, color=_COLORS["freq"], linewidth=1.15, label="Frequency")
+    freq_series = source.series.get("freq")
+    if freq_series is not None:
+        add_envelope_line(
+            axes[3], *freq_series, n_columns=_PLOT_COLUMNS,
+            color=_COLORS["freq"], linewidth=1.15, label="Frequency",
+        )
         axes[3].axhline(59.5, color="#ef4444", linewidth=0.8, linestyle="--", alpha=0.7)
         axes[3].axhline(60.5, color="#ef4444", linewidth=0.8, linestyle="--", alpha=0.7)
         aux_plotted = True
     for channel in ("p_mech", "v_dc"):
-        values = dataset.channels.get(channel)
-        if values is None:
+        series = source.series.get(channel)
+        if series is None:
             continue
-        plot_t, plot_y = _plot_ready_series(time_s, values)
-        axes[3].plot(plot_t, plot_y, color=_COLORS[channel], linewidth=1.0, label=channel)
+        add_envelope_line(
+            axes[3], *series, n_columns=_PLOT_COLUMNS,
+            color=_COLORS[channel], linewidth=1.0, label=channel,
+        )
         aux_plotted = True
     _apply_axes_style(axes[3], "Frequency / Auxiliary Channels", "Hz / mixed", show_xlabel=True)
     if aux_plotted:
@@ -317,21 +350,21 @@ def _save_waveform_overview_png(dataset, event_payloads: list[dict], path: Path)
             ax.axvline(start, color=color, linewidth=0.8, linestyle="--", alpha=0.5)
 
     fig.tight_layout()
-    fig.savefig(path, dpi=140, bbox_inches="tight", facecolor="#0f1115")
+    fig.savefig(path, dpi=_REPORT_DPI, bbox_inches="tight", facecolor="#0f1115")
     plt.close(fig)
     return str(path.resolve())
 
 
-def _save_line_to_line_png(dataset, path: Path) -> str | None:
-    available = [channel for channel in _LINE_CHANNELS if dataset.channels.get(channel) is not None]
+def _save_line_to_line_png(source, path: Path) -> str | None:
+    available = [channel for channel in _LINE_CHANNELS if channel in source.series]
     if not available:
         return None
 
-    fig, ax = plt.subplots(figsize=(12, 4.5), facecolor="#0f1115")
-    _plot_group(ax, dataset.time, dataset, tuple(available), "Line-to-Line Voltage Overlay", "Voltage (V)")
+    fig, ax = plt.subplots(figsize=(_FIGURE_WIDTH_IN, 4.5), facecolor="#0f1115")
+    _plot_group(ax, source, tuple(available), "Line-to-Line Voltage Overlay", "Voltage (V)")
     _apply_axes_style(ax, "Line-to-Line Voltage Overlay", "Voltage (V)", show_xlabel=True)
     fig.tight_layout()
-    fig.savefig(path, dpi=140, bbox_inches="tight", facecolor="#0f1115")
+    fig.savefig(path, dpi=_REPORT_DPI, bbox_inches="tight", facecolor="#0f1115")
     plt.close(fig)
     return str(path.resolve())
 
@@ -414,6 +447,7 @@ def _build_metadata_payload(
     profile: str,
     *,
     normalized_csv: dict | None = None,
+    normalized_npz: dict | None = None,
 ) -> dict:
     session = summary["session"]
     import_meta = capsule.get("import_meta", {})
@@ -424,6 +458,7 @@ def _build_metadata_payload(
         "source_file_path": session["source_path"],
         "source_hash_sha256": session.get("source_hash_sha256"),
         "import_timestamp": import_meta.get("imported_at"),
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         "sample_count": session["sample_count"],
         "sample_rate_hz": session["sample_rate_hz"],
         "time_range_s": {
@@ -436,6 +471,7 @@ def _build_metadata_payload(
         "scale_factors": session["scale_factors"],
         "compliance_profile": profile,
         "normalized_csv": normalized_csv or {},
+        "normalized_npz": normalized_npz or {},
         "app_version": session.get("app_version", APP_VERSION),
         "git_commit": _git_commit(),
         "meta_channels": list(meta.get("channels", [])),
@@ -665,6 +701,7 @@ def _build_report_html(
     <tr><td>Compliance profile</td><td><code>{profile}</code></td></tr>
     <tr><td>Normalized CSV mode</td><td><code>{metadata.get('normalized_csv', {}).get('mode', 'N/A')}</code></td></tr>
     <tr><td>Normalized CSV note</td><td>{metadata.get('normalized_csv', {}).get('note', 'N/A')}</td></tr>
+    <tr><td>Binary dataset (full resolution)</td><td><code>{Path(metadata.get('normalized_npz', {}).get('path', 'N/A')).name}</code></td></tr>
     <tr><td>App version</td><td><code>{metadata.get('app_version') or APP_VERSION}</code></td></tr>
     <tr><td>Git commit</td><td><code>{metadata.get('git_commit') or 'N/A'}</code></td></tr>
   </table>
@@ -701,14 +738,17 @@ def _resolve_inputs(
         raw_events = events_for_capsule(capsule)
     event_payloads = _event_payloads(raw_events)
 
+    detected = None
+    if raw_events is not None and all(isinstance(event, DetectedEvent) for event in raw_events):
+        detected = list(raw_events)
+
     summary = metrics
     if summary is None:
-        if raw_events and all(isinstance(event, DetectedEvent) for event in raw_events):
-            summary = compute_session_metrics(capsule, events=raw_events)
-        else:
-            summary = compute_session_metrics(capsule)
+        summary = compute_session_metrics(capsule, events=detected)
 
-    checks = compliance_results or evaluate_session(capsule, profile=profile, thresholds=thresholds)
+    checks = compliance_results or evaluate_session(
+        capsule, profile=profile, thresholds=thresholds, events=detected,
+    )
     return capsule, checks, event_payloads, summary, dataset
 
 
@@ -743,8 +783,9 @@ def generate_report(
     line_name = f"line_to_line_plot_{stamp}.png"
     waveform_path = output / waveform_name
     line_path = output / line_name
-    _save_waveform_overview_png(dataset, event_payloads, waveform_path)
-    line_plot_path = _save_line_to_line_png(dataset, line_path)
+    plot_source = _plot_source(dataset)
+    _save_waveform_overview_png(plot_source, event_payloads, waveform_path)
+    line_plot_path = _save_line_to_line_png(plot_source, line_path)
 
     report_html = _build_report_html(
         summary,
@@ -762,6 +803,35 @@ def generate_report(
     return str(html_path.resolve())
 
 
+def _artifact_cache_keys(
+    capsule: dict,
+    dataset,
+    event_payloads: list[dict],
+    *,
+    paths: dict[str, Path],
+    csv_options: dict,
+    scale_factors: dict | None,
+) -> dict[str, tuple[Path, str]]:
+    """Destination path and fingerprint of every cacheable artifact."""
+    dataset_fp = dataset_fingerprint(capsule, dataset)
+    inputs = {
+        "waveform_png": {"dataset": dataset_fp, "markers": _event_marker_groups(event_payloads)},
+        "line_png": {"dataset": dataset_fp},
+        "csv": {"dataset": dataset_fp, **csv_options},
+        "npz": {"dataset": dataset_fp, "scale_factors": scale_factors},
+        "capsule_json": {
+            "dataset": dataset_fp,
+            "meta": capsule.get("meta", {}),
+            "import_meta": capsule.get("import_meta", {}),
+            "events": capsule.get("events", []),
+        },
+    }
+    return {
+        name: (paths[name], artifact_fingerprint(name, **inputs[name]))
+        for name in paths
+    }
+
+
 def generate_evidence_package(
     session_path: str,
     output_dir: str = "exports",
@@ -775,9 +845,25 @@ def generate_evidence_package(
     session_data: dict | None = None,
     include_full_resolution_csv: bool = False,
     preview_csv_max_rows: int = _DEFAULT_PREVIEW_CSV_ROWS,
+    csv_compression: str | None = None,
+    progress: Callable[[int, int, str], None] | None = None,
+    csv_progress: Callable[[int, int], None] | None = None,
+    artifact_cache: ArtifactCache | None = None,
 ) -> dict:
     """
     Generate an evidence package that matches the app's recorded-data analysis.
+
+    Independent artifacts are produced concurrently (see
+    :mod:`src.export_tasks`); *progress* is called as
+    ``progress(done, total, artifact_name)`` as each one completes, and
+    *csv_progress* as ``csv_progress(rows_written, rows_total)`` while the
+    normalized CSV streams out.  *csv_compression* selects ``"gzip"``,
+    ``"bz2"`` or ``"xz"`` for that CSV.
+
+    With an *artifact_cache* (see :mod:`src.artifact_cache`), plots, the
+    normalized CSV, the binary dataset and the capsule JSON are reused when
+    their inputs are unchanged, so re-exports after a profile or threshold
+    change only rewrite the compliance-dependent files.
     """
     del insights_path
 
@@ -797,28 +883,13 @@ def generate_evidence_package(
     waveform_png = output / "waveform_overview.png"
     line_png = output / "line_to_line_overlay.png"
     csv_path = output / "normalized_frames.csv"
+    npz_path = output / "normalized_dataset.npz"
     metadata_json = output / "metadata.json"
     metrics_json = output / "metrics.json"
     compliance_json = output / "compliance.json"
     events_json = output / "events.json"
     capsule_json = output / "session_capsule.json"
 
-    _save_waveform_overview_png(dataset, event_payloads, waveform_png)
-    line_plot_path = _save_line_to_line_png(dataset, line_png)
-    csv_export = _write_dataset_csv(
-        dataset,
-        capsule,
-        csv_path,
-        include_full_resolution=include_full_resolution_csv,
-        max_preview_rows=preview_csv_max_rows,
-    )
-
-    metadata_payload = _build_metadata_payload(
-        capsule,
-        summary,
-        profile,
-        normalized_csv=csv_export,
-    )
     compliance_payload = {
         "profile": profile,
         "profile_label": _profile_label(profile),
@@ -834,16 +905,94 @@ def generate_evidence_package(
         "events": event_payloads,
     }
 
-    _write_json(metadata_json, metadata_payload)
-    _write_json(metrics_json, summary)
-    _write_json(compliance_json, compliance_payload)
-    _write_json(events_json, events_payload)
-    _write_json(capsule_json, _safe_capsule_copy(capsule))
+    scale_factors = summary["session"].get("scale_factors")
+    csv_options = {
+        "include_full_resolution": include_full_resolution_csv,
+        "max_preview_rows": preview_csv_max_rows,
+        "compression": csv_compression,
+    }
 
-    comparison_html = ""
-    comparison_csv = None
+    # Artifacts whose inputs are unchanged since an earlier export are
+    # reused from the artifact cache instead of being rendered again.
+    cache_keys: dict[str, tuple[Path, str]] = {}
+    reused: dict[str, Any] = {}
+    if artifact_cache is not None:
+        cache_keys = _artifact_cache_keys(
+            capsule, dataset, event_payloads,
+            paths={
+                "waveform_png": waveform_png,
+                "line_png": line_png,
+                "csv": compressed_path(csv_path, csv_compression),
+                "npz": npz_path,
+                "capsule_json": capsule_json,
+            },
+            csv_options=csv_options,
+            scale_factors=scale_factors,
+        )
+        for name, (dest, fingerprint) in cache_keys.items():
+            hit, result = artifact_cache.fetch(fingerprint, dest)
+            if hit:
+                reused[name] = result
+            else:
+                # Never write through a hardlink left by an earlier reuse.
+                dest.unlink(missing_ok=True)
+
+    # Plots render in worker processes while the CSV and JSON artifacts are
+    # written on threads; the metadata and HTML need the CSV summary and
+    # are written afterwards.
+    plot_source = None
+    if not {"waveform_png", "line_png"} <= reused.keys():
+        plot_source = _plot_source(dataset)
+    tasks = [
+        ExportTask("waveform_png", _save_waveform_overview_png,
+                   (plot_source, event_payloads, waveform_png), kind="plot"),
+        ExportTask("line_png", _save_line_to_line_png, (plot_source, line_png), kind="plot"),
+        ExportTask("csv", _write_dataset_csv, (dataset, capsule, csv_path), {
+            **csv_options,
+            "progress": csv_progress,
+        }),
+        ExportTask("npz", write_dataset_npz, (dataset, npz_path), {"scale_factors": scale_factors}),
+        ExportTask("metrics_json", _write_json, (metrics_json, summary)),
+        ExportTask("compliance_json", _write_json, (compliance_json, compliance_payload)),
+        ExportTask("events_json", _write_json, (events_json, events_payload)),
+        ExportTask("capsule_json", lambda: _write_json(capsule_json, _safe_capsule_copy(capsule))),
+    ]
     if compare_path:
-        comparison_html, comparison_csv = _build_comparison_section(compare_path, session_path, str(output))
+        tasks.append(ExportTask(
+            "comparison", _build_comparison_section, (compare_path, session_path, str(output)),
+        ))
+    tasks = [task for task in tasks if task.name not in reused]
+    total_steps = len(tasks) + len(reused) + 1
+    if progress:
+        for done, name in enumerate(reused, start=1):
+            progress(done, total_steps, name)
+    run = run_export_tasks(
+        tasks,
+        progress=(
+            (lambda done, _total, name: progress(len(reused) + done, total_steps, name))
+            if progress else None
+        ),
+    )
+    run.raise_first_error([task.name for task in tasks])
+    for name, (dest, fingerprint) in cache_keys.items():
+        if name in run.results:
+            result = run.results[name]
+            artifact_cache.store(fingerprint, dest if result is not None else None, result)
+
+    results = {**run.results, **reused}
+    line_plot_path = results["line_png"]
+    csv_export = results["csv"]
+    npz_export = results["npz"]
+    comparison_html, comparison_csv = results.get("comparison", ("", None))
+
+    metadata_payload = _build_metadata_payload(
+        capsule,
+        summary,
+        profile,
+        normalized_csv=csv_export,
+        normalized_npz=npz_export,
+    )
+    _write_json(metadata_json, metadata_payload)
 
     html = _build_report_html(
         summary,
@@ -859,12 +1008,15 @@ def generate_evidence_package(
     )
     html_path = output / "evidence_report.html"
     html_path.write_text(html, encoding="utf-8")
+    if progress:
+        progress(total_steps, total_steps, "evidence_report")
 
     result = {
         "html": str(html_path.resolve()),
         "plot": str(waveform_png.resolve()),
         "line_plot": str(line_png.resolve()) if line_plot_path else "",
         "csv": csv_export["path"],
+        "dataset_npz": npz_export["path"],
         "capsule_json": str(capsule_json.resolve()),
         "metrics_json": str(metrics_json.resolve()),
         "summary_json": str(metrics_json.resolve()),
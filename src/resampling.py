@@ -0,0 +1,211 @@
+"""
+Anti-aliased resampling onto a target rate for cross-rate comparison.
+
+Comparing a 10 MSa/s scope capture against a 10 kHz simulation export by
+linear interpolation onto a common grid aliases everything above the grid's
+Nyquist frequency into the comparison.  This module puts signals on a
+uniform grid at a chosen rate:
+
+  - uniformly sampled inputs are resampled with a polyphase rational filter
+    (``scipy.signal.resample_poly``), which low-pass filters before
+    decimating;
+  - non-uniform inputs (jittery timestamps, frame-rebuilt datasets) and
+    inputs with non-finite samples fall back to linear interpolation.
+
+``resample_channel`` caches results per (dataset, channel, target rate), so
+repeated comparisons of the same datasets — every Refresh Compare on the
+Comparison tab — reuse the filtered arrays.  Cache entries are dropped when
+their dataset is garbage-collected.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import weakref
+from collections import OrderedDict
+from fractions import Fraction
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_UNIFORM_TOLERANCE = 0.01            # max deviation from the ideal grid, in samples
+_MAX_POLY_FACTOR = 1_000             # cap on up/down so filter length stays bounded
+_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+# ---------------------------------------------------------------------------
+# Grid helpers
+# ---------------------------------------------------------------------------
+
+def uniform_rate(time: np.ndarray) -> float | None:
+    """
+    Return the sample rate of *time* if it is uniformly sampled, else None.
+
+    A time axis counts as uniform when every timestamp lies within 1 % of a
+    sample period of the ideal grid ``t0 + k * dt``.
+    """
+    t = np.asarray(time, dtype=np.float64).reshape(-1)
+    if t.size < 2 or not np.isfinite(t[0]) or not np.isfinite(t[-1]):
+        return None
+    dt = (t[-1] - t[0]) / (t.size - 1)
+    if not dt > 0:
+        return None
+    deviation = np.abs(t - (t[0] + dt * np.arange(t.size)))
+    if not float(deviation.max()) <= _UNIFORM_TOLERANCE * dt:
+        return None
+    return 1.0 / dt
+
+
+def native_rate(time: np.ndarray) -> float:
+    """Median sample rate of *time* (0.0 for fewer than two samples)."""
+    t = np.asarray(time, dtype=np.float64).reshape(-1)
+    if t.size < 2:
+        return 0.0
+    dt = float(np.median(np.diff(t)))
+    return 1.0 / dt if dt > 0 else 0.0
+
+
+def nice_rate(rate: float) -> float:
+    """Round *rate* down to the 1-2-5 series so nearby requests share cache entries."""
+    if not rate > 0:
+        return 0.0
+    decade = 10.0 ** math.floor(math.log10(rate))
+    for step in (5.0, 2.0, 1.0):
+        if rate >= step * decade:
+            return step * decade
+    return decade
+
+
+def _poly_factors(ratio: float) -> tuple[int, int]:
+    """Rational approximation ``up / down`` of *ratio* (output / input rate)."""
+    if ratio <= 1.0:
+        inverse = 1.0 / ratio
+        if abs(inverse - round(inverse)) <= 1e-6 * inverse:
+            return 1, int(round(inverse))
+    frac = Fraction(ratio).limit_denominator(_MAX_POLY_FACTOR)
+    if frac.numerator == 0:
+        return 1, int(round(1.0 / ratio))
+    return frac.numerator, frac.denominator
+
+
+# ---------------------------------------------------------------------------
+# Resampling
+# ---------------------------------------------------------------------------
+
+def resample_uniform(
+    time: np.ndarray,
+    values: np.ndarray,
+    target_rate: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Resample ``values(time)`` onto a uniform grid starting at ``time[0]``.
+
+    Uniform, finite inputs go through a polyphase anti-aliasing filter; the
+    output grid is then ``time[0] + k / r`` where ``r`` is the rational
+    approximation of *target_rate* actually achieved.  Anything else is
+    linearly interpolated onto ``time[0] + k / target_rate``.
+
+    Returns:
+        (time_out, values_out) as float64 arrays.
+    """
+    t = np.asarray(time, dtype=np.float64).reshape(-1)
+    y = np.asarray(values, dtype=np.float64).reshape(-1)
+    if t.size < 2 or y.size != t.size or not target_rate > 0:
+        return t.copy(), y.copy()
+
+    rate_in = uniform_rate(t)
+    if rate_in is not None and bool(np.isfinite(y).all()):
+        up, down = _poly_factors(target_rate / rate_in)
+        if up == down:
+            return t.copy(), y.copy()
+        from scipy.signal import resample_poly
+
+        out = resample_poly(y, up, down, padtype="line")
+        rate_out = rate_in * up / down
+        return t[0] + np.arange(out.size) / rate_out, out
+
+    n_out = int(math.floor((t[-1] - t[0]) * target_rate + 1e-9)) + 1
+    t_out = t[0] + np.arange(max(n_out, 1)) / target_rate
+    return t_out, np.interp(t_out, t, y)
+
+
+class ResampleCache:
+    """
+    LRU cache of resampled channels keyed by (dataset, channel, rate).
+
+    Datasets are tracked by identity; an entry disappears when its dataset
+    is garbage-collected or when the cache exceeds *max_bytes*.
+    """
+
+    def __init__(self, max_bytes: int = _CACHE_MAX_BYTES):
+        self.max_bytes = int(max_bytes)
+        self._entries: OrderedDict[tuple, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+        self._tracked: set[int] = set()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, dataset, channel: str, target_rate: float) -> tuple[np.ndarray, np.ndarray]:
+        values = dataset.channels[channel]
+        key = (id(dataset), channel, float(target_rate), id(values))
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return hit
+            self.misses += 1
+
+        result = resample_uniform(dataset.time, values, target_rate)
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = result
+                self._bytes += result[0].nbytes + result[1].nbytes
+                if id(dataset) not in self._tracked:
+                    self._tracked.add(id(dataset))
+                    weakref.finalize(dataset, self._forget, id(dataset))
+                while self._bytes > self.max_bytes and len(self._entries) > 1:
+                    _, (t_old, y_old) = self._entries.popitem(last=False)
+                    self._bytes -= t_old.nbytes + y_old.nbytes
+        return result
+
+    def _forget(self, dataset_id: int) -> None:
+        with self._lock:
+            self._tracked.discard(dataset_id)
+            for key in [k for k in self._entries if k[0] == dataset_id]:
+                t_old, y_old = self._entries.pop(key)
+                self._bytes -= t_old.nbytes + y_old.nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_default_cache = ResampleCache()
+
+
+def resample_channel(
+    dataset,
+    channel: str,
+    target_rate: float,
+    cache: ResampleCache | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return *channel* of *dataset* resampled to *target_rate* (cached).
+
+    The returned arrays are shared with the cache and must not be modified.
+    """
+    return (cache or _default_cache).get(dataset, channel, target_rate)
+
+
+def default_resample_cache() -> ResampleCache:
+    return _default_cache
@@ -0,0 +1,128 @@
+"""
+Preallocated multi-channel ring buffer for live telemetry.
+
+All channels share one float64 array of shape ``(n_channels, 2 * capacity)``
+allocated once.  Every sample is written twice, at position ``i`` and at
+``i + capacity``, so the most recent *n* samples of every channel are always
+one contiguous slice of the storage: reads return views and never unwrap or
+copy.  A push of *m* samples costs at most four slice assignments, however
+many samples the buffer already holds.
+
+Views returned by :meth:`RingBuffer.latest` and :meth:`RingBuffer.channel`
+alias the storage and are only valid until the next push — copy them to keep
+a snapshot (e.g. before handing arrays to a plot that renders later).
+
+This module has no Qt dependency.
+"""
+
+from __future__ import annotations
+
+from typing import Mapping, Optional, Sequence
+
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-capacity sample history for a fixed set of channels."""
+
+    def __init__(self, channels: Sequence[str], capacity: int):
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.channels = tuple(channels)
+        self.capacity = int(capacity)
+        self._index = {name: i for i, name in enumerate(self.channels)}
+        self._data = np.full((len(self.channels), 2 * self.capacity), np.nan)
+        self._head = 0          # next write position, in [0, capacity)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, channel: str) -> bool:
+        return channel in self._index
+
+    def index(self, channel: str) -> int:
+        """Row of *channel* in arrays returned by :meth:`latest` and the stats."""
+        return self._index[channel]
+
+    # ── Writing ──────────────────────────────────────────────────────────────
+
+    def push(self, values: Sequence[float]) -> None:
+        """Append one sample (one value per channel, in channel order)."""
+        self.push_block(np.asarray(values, dtype=np.float64).reshape(-1, 1))
+
+    def push_block(self, block: np.ndarray) -> None:
+        """Append ``block`` of shape ``(n_channels, m)``; oldest samples drop out."""
+        block = np.asarray(block, dtype=np.float64)
+        if block.ndim != 2 or block.shape[0] != len(self.channels):
+            raise ValueError(
+                f"expected a ({len(self.channels)}, m) block, got shape {block.shape}"
+            )
+        cap = self.capacity
+        m = block.shape[1]
+        if m > cap:
+            block = block[:, m - cap:]
+            m = cap
+        if m == 0:
+            return
+        data = self._data
+        head = self._head
+        first = min(m, cap - head)
+        data[:, head:head + first] = block[:, :first]
+        data[:, cap + head:cap + head + first] = block[:, :first]
+        rest = m - first
+        if rest:
+            data[:, :rest] = block[:, first:]
+            data[:, cap:cap + rest] = block[:, first:]
+        self._head = (head + m) % cap
+        self._count = min(cap, self._count + m)
+
+    def push_columns(self, columns: Mapping[str, Sequence[float]]) -> None:
+        """Append equal-length per-channel arrays; channels not given read NaN."""
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"columns have different lengths: {sorted(lengths)}")
+        block = np.full((len(self.channels), lengths.pop() if lengths else 0), np.nan)
+        for name, values in columns.items():
+            row = self._index.get(name)
+            if row is not None:
+                block[row] = values
+        self.push_block(block)
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+
+    # ── Reading (zero-copy views) ────────────────────────────────────────────
+
+    def latest(self, n: Optional[int] = None) -> np.ndarray:
+        """The last *n* samples (all when ``None``) as an ``(n_channels, k)`` view."""
+        k = self._count if n is None else max(0, min(int(n), self._count))
+        end = self._head + self.capacity
+        return self._data[:, end - k:end]
+
+    def channel(self, channel: str, n: Optional[int] = None) -> np.ndarray:
+        """The last *n* samples of one channel as a 1-D view."""
+        return self.latest(n)[self._index[channel]]
+
+    # ── Windowed statistics (one value per channel) ──────────────────────────
+    # A channel with a NaN sample inside the window reads NaN.
+
+    def mean(self, n: Optional[int] = None) -> np.ndarray:
+        window = self.latest(n)
+        if window.shape[1] == 0:
+            return np.zeros(len(self.channels))
+        return window.mean(axis=1)
+
+    def rms(self, n: Optional[int] = None) -> np.ndarray:
+        window = self.latest(n)
+        if window.shape[1] == 0:
+            return np.zeros(len(self.channels))
+        return np.sqrt(np.einsum("ij,ij->i", window, window) / window.shape[1])
+
+    def peak(self, n: Optional[int] = None) -> np.ndarray:
+        """Largest absolute value per channel."""
+        window = self.latest(n)
+        if window.shape[1] == 0:
+            return np.zeros(len(self.channels))
+        return np.maximum(window.max(axis=1), -window.min(axis=1))
@@ -4,13 +4,21 @@ import threading
 from dataclasses import dataclass, field
 from collections import deque
 from PyQt6.QtCore import QObject, pyqtSignal
+from src.config_manager import ConfigManager
+from src.frame_block import FrameBlock
+from src.frame_queue import DEFAULT_CAPACITY, DEFAULT_POLICY, FrameQueue
+from src.acquisition import DEFAULT_MAX_SKEW_S, MultiSourceAdapter
 from src.io_adapter import SerialAdapter, DemoAdapter, OpalRTAdapter
-from src.models import normalize_frame, present_canonical_keys
+from src.latency_probe import LatencyProbes
+from src.process_acquisition import ProcessAcquisitionAdapter
+from src.models import normalize_frames, present_canonical_keys
 
 logger = logging.getLogger(__name__)
 
 # Keep the most recent N frame timestamps for rolling fps estimate
 _FPS_WINDOW = 20
+# Cap on frames_received emissions per second (one GUI repaint's worth).
+DEFAULT_BLOCK_RATE_HZ = 60.0
 
 
 @dataclass
@@ -27,6 +35,19 @@ class LiveStats:
         last_frame_age:   Seconds since the last frame was received (0 if none).
         session_start_ts: Unix timestamp when the session started.
         warnings:         Human-readable warnings (e.g. "DC bus only").
+        sources:          Per-source SourceStats snapshots when acquiring
+                          from several adapters (see connect_sources).
+        frames_lost:      Frames dropped between the acquisition process and
+                          this one (0 unless acquiring out of process).
+        latency_ms_avg:   Mean / max delay from the acquisition process
+        latency_ms_max:   reading a frame to this process receiving it.
+        queue_policy:     Display queue policy (see src.frame_queue).
+        queue_depth:      Frames waiting for the GUI thread now / at peak.
+        queue_depth_peak:
+        frames_dropped:   Frames the display queue discarded (never recorded
+                          frames — frame sinks see every frame).
+        queue_wait_ms_avg: Mean / max time blocks waited for the GUI thread.
+        queue_wait_ms_max:
     """
     source:           str              = "—"
     connected:        bool             = False
@@ -36,26 +57,71 @@ class LiveStats:
     last_frame_age:   float            = 0.0
     session_start_ts: float            = 0.0
     warnings:         list[str]        = field(default_factory=list)
+    sources:          list             = field(default_factory=list)
+    frames_lost:      int              = 0
+    latency_ms_avg:   float            = 0.0
+    latency_ms_max:   float            = 0.0
+    queue_policy:     str              = DEFAULT_POLICY
+    queue_depth:      int              = 0
+    queue_depth_peak: int              = 0
+    frames_dropped:   int              = 0
+    queue_wait_ms_avg: float           = 0.0
+    queue_wait_ms_max: float           = 0.0
 
 
 class SerialManager(QObject):
+    """
+    Runs the telemetry adapter on a reader thread and publishes its frames.
+
+    The reader thread packs the frames it reads into a ``FrameBlock`` at most
+    ``block_rate_hz`` times per second and queues it for the GUI thread,
+    which emits ``frames_received(FrameBlock)``.  The queue holds at most
+    ``queue_capacity`` frames; ``queue_policy`` decides what happens when the
+    GUI falls behind (see :mod:`src.frame_queue`).  Frame sinks
+    (:meth:`add_frame_sink`) are called on the reader thread with every
+    frame before the queue, so they never miss one.
+    ``latency_probes`` times each block through the pipeline while enabled
+    (see :mod:`src.latency_probe`).
+    ``frame_received(dict)`` is kept for legacy
+    subscribers: blocks are unpacked into it on the GUI thread, and only
+    while something is connected to it.  Frames emitted directly on
+    ``frame_received`` (replay, signal injection) are forwarded to block
+    subscribers as one-frame blocks.
+    """
+
     frame_received = pyqtSignal(dict)
+    frames_received = pyqtSignal(object)
     connection_status = pyqtSignal(bool, str)
     # Emitted ~every second while connected, carrying a LiveStats snapshot.
     live_stats_updated = pyqtSignal(object)
+    # Reader thread → GUI thread: the display queue has blocks to deliver.
+    _display_ready = pyqtSignal()
 
-    def __init__(self):
+    def __init__(self, block_rate_hz: float = DEFAULT_BLOCK_RATE_HZ,
+                 queue_policy: str = DEFAULT_POLICY, queue_capacity: int = DEFAULT_CAPACITY):
         super().__init__()
         self.adapter = None
         self.running = False
         self.thread = None
         self.lock = threading.Lock()
+        self.block_interval_s = 1.0 / block_rate_hz if block_rate_hz > 0 else 0.0
+        # Changes to these apply from the next connect
+        self.queue_policy = queue_policy
+        self.queue_capacity = queue_capacity
+        self._display_queue = FrameQueue(queue_capacity, queue_policy)
+        self._frame_sinks: list = []
+        self.latency_probes = LatencyProbes()
+        self._relaying = False
+        self.frames_received.connect(self._relay_block_to_frames)
+        self.frame_received.connect(self._relay_frame_to_blocks)
+        self._display_ready.connect(self._deliver_queued_blocks)
 
         # Live session stats (reset each connect)
         self._source_label: str = "—"
         self._frame_count: int = 0
         self._ts_window: deque = deque(maxlen=_FPS_WINDOW)
         self._present_channels: set = set()
+        self._last_channels: frozenset | None = None
         self._last_frame_wall: float = 0.0
         self._session_start: float = 0.0
         self._warnings: list[str] = []
@@ -64,37 +130,107 @@ class SerialManager(QObject):
     # Connection management
     # ──────────────────────────────────────────────────────────────
 
-    def connect_serial(self, port_name="COM3"):
-        """Connects using the specified port. If MOCK, uses DemoAdapter."""
+    def connect_serial(self, port_name="COM3", protocol=None, acquisition_process=None):
+        """Connects using the specified port. If MOCK, uses DemoAdapter.
+
+        ``"OPAL"`` connects to the OPAL-RT data server on 127.0.0.1:5100,
+        ``"OPAL:<host>:<port>"`` to one elsewhere.
+
+        *protocol* ("json", "binary" or "auto") selects the serial telemetry
+        encoding; by default ``hardware.protocol`` from system_config.json,
+        else JSON lines.
+
+        *acquisition_process* True runs the adapter and normalization in a
+        child process (see :mod:`src.process_acquisition`); by default
+        ``hardware.acquisition_process`` from system_config.json, else a
+        reader thread in this process.
+        """
         with self.lock:
             if self.running:
                 self._stop_internal()
 
             self._reset_stats()
+            ConfigManager.load()
+            hardware = ConfigManager.get("hardware", {}) or {}
+            if acquisition_process is None:
+                acquisition_process = bool(hardware.get("acquisition_process", False))
 
             if port_name == "MOCK":
-                self.adapter = DemoAdapter()
+                adapter_factory = DemoAdapter
                 config = {}
                 self._source_label = "DEMO"
-            elif port_name == "OPAL":
-                self.adapter = OpalRTAdapter()
+            elif port_name == "OPAL" or port_name.startswith("OPAL:"):
+                adapter_factory = OpalRTAdapter
                 config = {}
+                if port_name != "OPAL":
+                    host, _, port = port_name[len("OPAL:"):].rpartition(":")
+                    port = int(port) if port.isdigit() else 0
+                    if not 0 < port < 65536:
+                        logger.error(f"Invalid OPAL-RT address '{port_name}' "
+                                     "(expected OPAL:<host>:<port>)")
+                        self.connection_status.emit(False, port_name)
+                        return
+                    config = {"host": host or "127.0.0.1", "port": port}
                 self._source_label = "OPAL-RT"
             else:
-                self.adapter = SerialAdapter()
-                config = {"port": port_name, "baud": 115200}
+                adapter_factory = SerialAdapter
+                config = {
+                    "port": port_name,
+                    "baud": 115200,
+                    "protocol": protocol or hardware.get("protocol", "json"),
+                }
                 self._source_label = f"SERIAL:{port_name}"
 
-            if self.adapter.connect(config):
-                self.running = True
-                self._session_start = time.time()
-                self.thread = threading.Thread(target=self._reader_loop, daemon=True)
-                self.thread.start()
-                self.connection_status.emit(True, port_name)
+            if acquisition_process:
+                self.adapter = ProcessAcquisitionAdapter(adapter_factory)
             else:
-                logger.error(f"Failed to connect adapter: {port_name}")
-                self.adapter = None
-                self.connection_status.emit(False, port_name)
+                self.adapter = adapter_factory()
+            self._start_adapter(config, port_name)
+
+    def connect_sources(self, sources, max_skew_s=DEFAULT_MAX_SKEW_S, merge=True):
+        """Acquire from several adapters at once (see :mod:`src.acquisition`).
+
+        *sources* is a list of :class:`~src.acquisition.AcquisitionSource`;
+        their frames are tagged with ``source`` and, unless *merge* is
+        False, merged onto one timeline.  Channels a source does not send
+        are left out of its frames, not zero-filled.
+        """
+        label = "+".join(s.name for s in sources)
+        with self.lock:
+            if self.running:
+                self._stop_internal()
+            self._reset_stats()
+            self.adapter = MultiSourceAdapter(sources, max_skew_s=max_skew_s, merge=merge)
+            self._source_label = f"MULTI:{label}"
+            self._start_adapter(None, label)
+
+    def add_frame_sink(self, sink) -> None:
+        """Call ``sink(frames)`` with every normalized frame, on the reader thread.
+
+        Unlike ``frames_received`` subscribers, sinks see every frame whatever
+        the display queue drops; they must be thread-safe and quick (e.g.
+        ``Recorder.log_frames``).  Frames emitted directly on
+        ``frame_received`` reach sinks on the emitting thread.
+        """
+        if sink not in self._frame_sinks:
+            self._frame_sinks = self._frame_sinks + [sink]
+
+    def remove_frame_sink(self, sink) -> None:
+        self._frame_sinks = [s for s in self._frame_sinks if s != sink]
+
+    def _start_adapter(self, config, port_name):
+        """Connect ``self.adapter`` and start the reader thread (lock held)."""
+        self._display_queue = FrameQueue(self.queue_capacity, self.queue_policy)
+        if self.adapter.connect(config):
+            self.running = True
+            self._session_start = time.time()
+            self.thread = threading.Thread(target=self._reader_loop, daemon=True)
+            self.thread.start()
+            self.connection_status.emit(True, port_name)
+        else:
+            logger.error(f"Failed to connect adapter: {port_name}")
+            self.adapter = None
+            self.connection_status.emit(False, port_name)
 
     def start_mock_mode(self):
         self.connect_serial("MOCK")
@@ -115,6 +251,7 @@ class SerialManager(QObject):
         self.running = False
         thread = self.thread
         self.thread = None
+        self._display_queue.close()             # a blocked put must not hold us up
         if thread:
             # Release lock briefly to allow reader thread to exit
             self.lock.release()
@@ -140,6 +277,11 @@ class SerialManager(QObject):
         """Return a snapshot of live session statistics (thread-safe copy)."""
         now = time.time()
         age = (now - self._last_frame_wall) if self._last_frame_wall > 0 else 0.0
+        adapter = self.adapter
+        source_stats = getattr(adapter, "source_stats", None)
+        latency_ms = getattr(adapter, "latency_ms", None)
+        latency_avg, latency_max = latency_ms() if latency_ms else (0.0, 0.0)
+        queue = self._display_queue.stats()
         return LiveStats(
             source=self._source_label,
             connected=self.running,
@@ -149,12 +291,23 @@ class SerialManager(QObject):
             last_frame_age=age,
             session_start_ts=self._session_start,
             warnings=list(self._warnings),
+            sources=source_stats() if source_stats else [],
+            frames_lost=getattr(adapter, "frames_lost", 0),
+            latency_ms_avg=latency_avg,
+            latency_ms_max=latency_max,
+            queue_policy=queue.policy,
+            queue_depth=queue.depth,
+            queue_depth_peak=queue.depth_peak,
+            frames_dropped=queue.dropped,
+            queue_wait_ms_avg=queue.wait_ms_avg,
+            queue_wait_ms_max=queue.wait_ms_max,
         )
 
     def _reset_stats(self) -> None:
         self._frame_count = 0
         self._ts_window.clear()
         self._present_channels = set()
+        self._last_channels = None
         self._last_frame_wall = 0.0
         self._session_start = 0.0
         self._warnings = []
@@ -169,14 +322,21 @@ class SerialManager(QObject):
 
     def _update_stats(self, raw_frame: dict, normalized: dict) -> None:
         """Update internal stats from a freshly-read raw+normalized frame pair."""
+        self._count_frame(normalized)
+        # Track which canonical channels had real source data in this raw frame
+        self._note_channels(present_canonical_keys(raw_frame))
+
+    def _count_frame(self, normalized: dict) -> None:
         self._frame_count += 1
         self._last_frame_wall = time.time()
         ts = normalized.get("ts", 0.0)
         if ts > 0:
             self._ts_window.append(ts)
 
-        # Track which canonical channels had real source data in this raw frame
-        new_channels = present_canonical_keys(raw_frame)
+    def _note_channels(self, new_channels: frozenset) -> None:
+        if new_channels is self._last_channels:        # same schema as last batch
+            return
+        self._last_channels = new_channels
         self._present_channels.update(new_channels)
 
         # Warn once if only DC-bus channels present (no 3-phase voltages/currents)
@@ -195,32 +355,125 @@ class SerialManager(QObject):
                     "No phase voltages or currents detected — check hardware connection"
                 )
 
+    # ──────────────────────────────────────────────────────────────
+    # Block / per-frame bridging (GUI thread)
+    # ──────────────────────────────────────────────────────────────
+
+    def _relay_block_to_frames(self, block):
+        # Our own relay slot is always connected; more means legacy subscribers.
+        if self._relaying or self.receivers(self.frame_received) <= 1:
+            return
+        self._relaying = True
+        try:
+            for frame in block.frames:
+                self.frame_received.emit(frame)
+        finally:
+            self._relaying = False
+
+    def _relay_frame_to_blocks(self, frame):
+        if self._relaying:
+            return
+        self._feed_sinks([frame])
+        if self.receivers(self.frames_received) <= 1:
+            return
+        self._relaying = True
+        try:
+            self.frames_received.emit(FrameBlock.from_frames([frame]))
+        finally:
+            self._relaying = False
+
+    def _deliver_queued_blocks(self):
+        probes = self.latency_probes
+        for block in self._display_queue.drain():
+            received_at = block.received_at
+            if received_at is None or not probes.enabled:
+                self.frames_received.emit(block)
+                continue
+            probes.record("emit", received_at)
+            self.frames_received.emit(block)
+            probes.record("handled", received_at)
+
     # ──────────────────────────────────────────────────────────────
     # Reader thread
     # ──────────────────────────────────────────────────────────────
 
+    def _feed_sinks(self, frames: list[dict]) -> None:
+        for sink in self._frame_sinks:
+            try:
+                sink(frames)
+            except Exception as e:
+                logger.error(f"Frame sink {sink!r} failed: {e}")
+
+    def _publish(self, frames: list[dict], received_at: float | None = None) -> None:
+        block = FrameBlock.from_frames(frames)
+        block.received_at = received_at
+        if self._display_queue.put(block):
+            self._display_ready.emit()
+
     def _reader_loop(self):
         last_stats_emit = time.time()
+        last_block_emit = 0.0
+        pending: list[dict] = []
+        pending_received_at = None
+        probes = self.latency_probes
         while self.running:
             with self.lock:
                 adapter = self.adapter
-            if adapter:
+            if not adapter:
+                break
+            # Adapters that read in bulk hand over every frame that arrived
+            # since the last call; the rest are wrapped one frame at a time.
+            read_frames = getattr(adapter, "read_frames", None)
+            if read_frames is not None:
+                raw_frames = read_frames()
+            else:
                 raw_frame = adapter.read_frame()
-                if raw_frame:
-                    # Normalize raw frames from all adapters to canonical keys.
-                    # DemoAdapter already emits canonical keys; SerialAdapter
-                    # and OpalRTAdapter return raw hardware JSON that may use
-                    # non-canonical field names (e.g. t_ms, vdc, p_kw).
-                    normalized = normalize_frame(raw_frame)
-                    self._update_stats(raw_frame, normalized)
-                    self.frame_received.emit(normalized)
-
-                    # Emit stats snapshot ~once per second
-                    now = time.time()
-                    if now - last_stats_emit >= 1.0:
-                        self.live_stats_updated.emit(self.get_live_stats())
-                        last_stats_emit = now
-                else:
-                    time.sleep(0.001)
+                raw_frames = [raw_frame] if raw_frame else []
+            received_at = None
+            if raw_frames and probes.enabled:
+                # The adapter's own stamp covers its parsing (and, for the
+                # process and multi-source adapters, the child and merge).
+                received_at = getattr(adapter, "received_at", None) or time.perf_counter()
+
+            if getattr(adapter, "frames_normalized", False):
+                # Normalized in the acquisition process already
+                frames = raw_frames
+                for frame in frames:
+                    self._count_frame(frame)
+                if frames:
+                    self._note_channels(adapter.present_channels)
             else:
-                break
+                # Normalize raw frames from all adapters to canonical keys.
+                # DemoAdapter already emits canonical keys; SerialAdapter
+                # and OpalRTAdapter return raw hardware JSON that may use
+                # non-canonical field names (e.g. t_ms, vdc, p_kw).  Merged
+                # multi-source frames keep only their own source's channels.
+                frames, present = normalize_frames(
+                    raw_frames, fill_missing=not getattr(adapter, "frames_sparse", False))
+                if received_at is not None:
+                    probes.record("normalize", received_at)
+                for frame in frames:
+                    self._count_frame(frame)
+                if frames:
+                    self._note_channels(present)
+            if frames:
+                self._feed_sinks(frames)
+                if not pending:
+                    pending_received_at = received_at
+                pending.extend(frames)
+
+            now = time.monotonic()
+            if pending and now - last_block_emit >= self.block_interval_s:
+                self._publish(pending, pending_received_at)
+                pending = []
+                last_block_emit = now
+
+            # Emit stats snapshot ~once per second
+            if raw_frames and time.time() - last_stats_emit >= 1.0:
+                self.live_stats_updated.emit(self.get_live_stats())
+                last_stats_emit = time.time()
+            if not raw_frames:
+                time.sleep(0.001)
+
+        if pending:
+            self._publish(pending, pending_received_at)
@@ -14,7 +14,7 @@ from src.comparison import dataset_from_capsule
 from src.derived_channels import derive_dataset_channels, ensure_capsule_derived_channels
 from src.event_detector import DetectedEvent, detect_events
 from src.file_ingestion import ImportedDataset
-from src.signal_processing import compute_rms, compute_thd
+from src.signal_processing import compute_channel_stats, compute_rms, compute_thd
 
 APP_VERSION = "1.0.0"
 FREQUENCY_NOMINAL_HZ = 60.0
@@ -45,15 +45,34 @@ _VSM_MODE_CHANNELS = frozenset(
 )
 
 
+def capsule_provenance(capsule: dict) -> str:
+    """
+    Where the data analysed for *capsule* comes from.
+
+    ``"raw_import"`` for the full-resolution dataset of a file import,
+    ``"saved_capsule"`` for the (decimated) frames of a capsule saved from
+    an import, ``"live"`` for the frames of a live recording.
+    """
+    dataset = capsule.get("_dataset")
+    if dataset is not None:
+        return (getattr(dataset, "meta", {}) or {}).get("provenance", "raw_import")
+    meta = capsule.get("meta", {}) or {}
+    if capsule.get("import_meta") or meta.get("source_hash_sha256"):
+        return "saved_capsule"
+    return "live"
+
+
 def dataset_for_analysis(capsule: dict) -> ImportedDataset:
     """
     Return the best-available full-resolution dataset for *capsule*.
     """
     dataset = capsule.get("_dataset")
     if dataset is None:
+        provenance = capsule_provenance(capsule)
         dataset = dataset_from_capsule(
             capsule, label=capsule.get("meta", {}).get("source_path", "")
         )
+        dataset.meta["provenance"] = provenance
 
     dataset = derive_dataset_channels(dataset)
     ensure_capsule_derived_channels(capsule)
@@ -68,21 +87,42 @@ def events_for_capsule(capsule: dict) -> list[DetectedEvent]:
     return detect_events(dataset_for_analysis(capsule))
 
 
+def _collect_channel_stats(
+    dataset: ImportedDataset,
+    channels: list[str] | tuple[str, ...],
+) -> dict[str, dict]:
+    """
+    Run the fused stats kernel once over every present channel in *channels*.
+    """
+    present = [ch for ch in dict.fromkeys(channels) if ch in dataset.channels]
+    if not present:
+        return {}
+    stats = compute_channel_stats([dataset.channels[ch] for ch in present])
+    return {
+        channel: {name: values[idx] for name, values in stats.items()}
+        for idx, channel in enumerate(present)
+    }
+
+
 def _channel_metrics(
     dataset: ImportedDataset,
     channel: str,
     unit: str,
     *,
     include_thd: bool = False,
+    stats: dict | None = None,
 ) -> dict:
     arr = dataset.channels.get(channel)
     if arr is None:
         return {"available": False, "unit": unit, "reason": f"{channel} not present"}
 
+    if stats is None:
+        stats = _collect_channel_stats(dataset, (channel,))[channel]
+    rms = float(stats["rms"]) if stats["count"] else 0.0
     value = {
         "available": True,
         "unit": unit,
-        "rms": round(float(compute_rms(arr)), 6),
+        "rms": round(rms, 6),
         "sample_count": int(arr.size),
     }
     if include_thd:
@@ -93,26 +133,32 @@ def _channel_metrics(
     return value
 
 
-def _basic_channel_stats(dataset: ImportedDataset, channel: str) -> dict:
+def _basic_channel_stats(
+    dataset: ImportedDataset,
+    channel: str,
+    stats: dict | None = None,
+) -> dict:
     arr = dataset.channels.get(channel)
     unit = CANONICAL_SIGNALS.get(channel, {}).get("unit") or infer_unit_from_header(channel) or ""
     if arr is None:
         return {"available": False, "unit": unit, "reason": f"{channel} not present"}
 
-    valid = np.asarray(arr, dtype=np.float64)
-    valid = valid[np.isfinite(valid)]
-    if valid.size == 0:
+    if stats is None:
+        stats = _collect_channel_stats(dataset, (channel,))[channel]
+    if not stats["count"]:
         return {"available": False, "unit": unit, "reason": f"{channel} has no finite numeric samples"}
 
+    lo = float(stats["min"])
+    hi = float(stats["max"])
     return {
         "available": True,
         "unit": unit,
-        "min": round(float(np.min(valid)), 6),
-        "max": round(float(np.max(valid)), 6),
-        "mean": round(float(np.mean(valid)), 6),
-        "rms": round(float(compute_rms(valid)), 6),
-        "peak_to_peak": round(float(np.max(valid) - np.min(valid)), 6),
-        "sample_count": int(valid.size),
+        "min": round(lo, 6),
+        "max": round(hi, 6),
+        "mean": round(float(stats["mean"]), 6),
+        "rms": round(float(stats["rms"]), 6),
+        "peak_to_peak": round(hi - lo, 6),
+        "sample_count": int(stats["count"]),
     }
 
 
@@ -276,15 +322,26 @@ def _balance_metrics(phase_metrics: dict[str, dict]) -> dict:
     }
 
 
-def _current_metrics(dataset: ImportedDataset) -> dict:
+def _current_metrics(
+    dataset: ImportedDataset,
+    channel_stats: dict[str, dict] | None = None,
+) -> dict:
+    channel_stats = channel_stats or {}
     result: dict[str, dict] = {}
     for channel in _CURRENT_CHANNELS:
-        result[channel] = _channel_metrics(dataset, channel, "A")
+        result[channel] = _channel_metrics(
+            dataset, channel, "A", stats=channel_stats.get(channel)
+        )
     return result
 
 
-def _current_threshold_metrics(dataset: ImportedDataset, event_counts: Counter) -> dict:
-    present = [dataset.channels[ch] for ch in _CURRENT_CHANNELS if ch in dataset.channels]
+def _current_threshold_metrics(
+    dataset: ImportedDataset,
+    event_counts: Counter,
+    channel_stats: dict[str, dict] | None = None,
+) -> dict:
+    channel_stats = channel_stats or {}
+    present = [ch for ch in _CURRENT_CHANNELS if ch in dataset.channels]
     if not present:
         return {
             "available": False,
@@ -295,11 +352,12 @@ def _current_threshold_metrics(dataset: ImportedDataset, event_counts: Counter)
 
     baseline_rms: list[float] = []
     max_rms: list[float] = []
-    for arr in present:
-        arr = np.asarray(arr, dtype=np.float64)
+    for channel in present:
+        arr = np.asarray(dataset.channels[channel], dtype=np.float64)
         baseline_n = max(8, int(arr.size * 0.2))
         baseline_rms.append(float(compute_rms(arr[:baseline_n])))
-        max_rms.append(float(compute_rms(arr)))
+        stats = channel_stats.get(channel)
+        max_rms.append(float(stats["rms"]) if stats is not None else float(compute_rms(arr)))
 
     baseline = float(np.mean(baseline_rms))
     measured = float(np.max(max_rms))
@@ -362,24 +420,36 @@ def compute_session_metrics(
         for channel in dataset.channels
         if channel not in _GENERIC_NUMERIC_EXCLUDES
     )
+    # One fused pass over every channel the summary reports on.
+    channel_stats = _collect_channel_stats(
+        dataset,
+        (
+            *generic_numeric_channels,
+            *_PHASE_VOLTAGE_CHANNELS,
+            *_LINE_VOLTAGE_CHANNELS,
+            *_CURRENT_CHANNELS,
+        ),
+    )
     generic_stats = {
-        channel: _basic_channel_stats(dataset, channel)
+        channel: _basic_channel_stats(dataset, channel, channel_stats.get(channel))
         for channel in generic_numeric_channels
     }
     sample_interval_s = _sample_interval_s(dataset)
 
     phase_voltage = {
-        channel: _channel_metrics(dataset, channel, "V", include_thd=True)
+        channel: _channel_metrics(
+            dataset, channel, "V", include_thd=True, stats=channel_stats.get(channel)
+        )
         for channel in _PHASE_VOLTAGE_CHANNELS
     }
     line_voltage = {
-        channel: _channel_metrics(dataset, channel, "V")
+        channel: _channel_metrics(dataset, channel, "V", stats=channel_stats.get(channel))
         for channel in _LINE_VOLTAGE_CHANNELS
     }
-    current = _current_metrics(dataset)
+    current = _current_metrics(dataset, channel_stats)
     frequency = _frequency_metrics(dataset, event_counts)
     balance = _balance_metrics(phase_voltage)
-    current_thresholds = _current_threshold_metrics(dataset, event_counts)
+    current_thresholds = _current_threshold_metrics(dataset, event_counts, channel_stats)
     scale_factors = dict(import_meta.get("scale_factors") or dataset.meta.get("scale_factors", {}))
 
     return {
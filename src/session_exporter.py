@@ -25,13 +25,21 @@ import os
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
+
+from src.columnar_csv import PRECISION_NOTE, write_frames_csv
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from src.event_detector import DetectedEvent
 
 logger = logging.getLogger(__name__)
 
+# Size of the embedded HTML report plots; decimation targets its pixel width.
+_HTML_PLOT_WIDTH_IN = 9
+_HTML_PLOT_DPI = 90
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Internal helpers
 # ─────────────────────────────────────────────────────────────────────────────
@@ -81,6 +89,7 @@ def _write_csv_preamble(fh: io.TextIOWrapper, capsule: dict) -> None:
         fh.write(f"# Sample rate:  {m['sample_rate']} Hz\n")
     if m["duration_s"]:
         fh.write(f"# Duration:     {m['duration_s']:.3f} s\n")
+    fh.write(f"# Precision:    {PRECISION_NOTE}\n")
     if m["warnings"]:
         fh.write(f"# Import warnings ({len(m['warnings'])}):\n")
         for w in m["warnings"]:
@@ -111,12 +120,7 @@ def export_session_csv(capsule: dict, path: str) -> dict:
 
     with open(path, "w", newline="", encoding="utf-8") as fh:
         _write_csv_preamble(fh, capsule)
-        writer = csv.DictWriter(
-            fh, fieldnames=cols, extrasaction="ignore", restval=""
-        )
-        writer.writeheader()
-        for frame in frames:
-            writer.writerow(frame)
+        write_frames_csv(fh, frames, cols)
 
     stats = {"format": "session_csv", "rows": len(frames),
              "columns": cols, "path": path}
@@ -277,48 +281,64 @@ _SEVERITY_COLOR = {
 }
 
 
-def _plot_group_base64(
+def _group_series(
     frames: list[dict],
     channels: list[str],
+) -> list[tuple[int, str, np.ndarray, np.ndarray]] | None:
+    """
+    Extract ``[(slot, channel, t, values), ...]`` for the channels in a plot
+    group that have real data, or None when nothing can be plotted.
+
+    Each series is envelope-decimated to the pixel width of the rendered
+    figure, so plot workers receive a few thousand points per channel.
+    """
+    import numpy as np
+
+    from src.plot_decimation import columns_for, envelope_decimate
+
+    ts_raw = [f.get("ts") for f in frames]
+    if not ts_raw or ts_raw[0] is None:
+        return None
+    t0 = ts_raw[0]
+    t  = np.array(ts_raw, dtype=np.float64) - t0   # missing ts → NaN
+
+    n_columns = columns_for(_HTML_PLOT_WIDTH_IN, _HTML_PLOT_DPI)
+    series = []
+    for idx, ch in enumerate(channels):
+        raw = [f.get(ch) for f in frames]
+        if all(v is None for v in raw):
+            continue  # channel absent — do NOT plot zeros
+        values = np.array(raw, dtype=np.float64)       # None → NaN
+        series.append((idx, ch, *envelope_decimate(t, values, n_columns)))
+    if not series:
+        return None
+    return series
+
+
+def _render_series_base64(
+    series: list[tuple[int, str, np.ndarray, np.ndarray]],
     title: str,
     y_label: str,
 ) -> str | None:
-    """
-    Plot the given channels from frames.  Returns base64-encoded PNG, or None
-    if no channel in the group has actual data.
-    """
+    """Render output of :func:`_group_series` to a base64-encoded PNG."""
     try:
         import warnings as _w
         _w.filterwarnings("ignore", category=DeprecationWarning)
         import matplotlib
         matplotlib.use("Agg")
         import matplotlib.pyplot as plt
-        import numpy as np
     except ImportError:
         logger.warning("matplotlib not available — skipping plot")
         return None
+    from src.plot_decimation import add_envelope_line, columns_for
 
-    ts_raw = [f.get("ts") for f in frames]
-    if not ts_raw or ts_raw[0] is None:
-        return None
-    t0 = ts_raw[0]
-    t  = [v - t0 if v is not None else float("nan") for v in ts_raw]
-
-    plotted_any = False
-    fig, ax = plt.subplots(figsize=(9, 2.8))
+    fig, ax = plt.subplots(figsize=(_HTML_PLOT_WIDTH_IN, 2.8))
     colors = ["#38bdf8", "#34d399", "#fb923c", "#a78bfa", "#f472b6", "#fbbf24"]
+    n_columns = columns_for(_HTML_PLOT_WIDTH_IN, _HTML_PLOT_DPI)
 
-    for idx, ch in enumerate(channels):
-        raw = [f.get(ch) for f in frames]
-        if all(v is None for v in raw):
-            continue  # channel absent — do NOT plot zeros
-        y = np.array([float(v) if v is not None else float("nan") for v in raw])
-        ax.plot(t, y, label=ch, color=colors[idx % len(colors)], linewidth=0.9)
-        plotted_any = True
-
-    if not plotted_any:
-        plt.close(fig)
-        return None
+    for idx, ch, t, values in series:
+        add_envelope_line(ax, t, values, n_columns=n_columns,
+                          color=colors[idx % len(colors)], linewidth=0.9, label=ch)
 
     ax.set_title(title, fontsize=11, color="#e6e9ef", pad=4)
     ax.set_xlabel("Time (s)", fontsize=9, color="#94a3b8")
@@ -333,21 +353,48 @@ def _plot_group_base64(
 
     buf = io.BytesIO()
     fig.tight_layout()
-    fig.savefig(buf, format="png", dpi=90, bbox_inches="tight",
+    fig.savefig(buf, format="png", dpi=_HTML_PLOT_DPI, bbox_inches="tight",
                 facecolor="#0f1115")
     plt.close(fig)
     return base64.b64encode(buf.getvalue()).decode("ascii")
 
 
+def _plot_group_base64(
+    frames: list[dict],
+    channels: list[str],
+    title: str,
+    y_label: str,
+) -> str | None:
+    """
+    Plot the given channels from frames.  Returns base64-encoded PNG, or None
+    if no channel in the group has actual data.
+    """
+    extracted = _group_series(frames, channels)
+    if extracted is None:
+        return None
+    return _render_series_base64(extracted, title, y_label)
+
+
+def _group_y_label(group_title: str) -> str:
+    return "Voltage (V)" if "Voltage" in group_title else (
+        "Current (A)" if "Current" in group_title else "Frequency (Hz)"
+    )
+
+
 def generate_html_report(
     capsule: dict,
     events: list | None,
     compliance_results: list[dict] | None,
     output_dir: str,
+    plot_images: dict[str, str | None] | None = None,
 ) -> str:
     """
     Generate a self-contained HTML engineering report and return its path.
 
+    *plot_images* optionally supplies pre-rendered base64 PNGs keyed by
+    waveform group title (see ``_WAVEFORM_GROUPS``); groups missing from it
+    are rendered here.
+
     The report includes:
       - Source file and dataset metadata
       - Channel mapping (from import_meta)
@@ -365,10 +412,10 @@ def generate_html_report(
     # ── Build plots ──────────────────────────────────────────────────────────
     plots_html = ""
     for group_title, channels in _WAVEFORM_GROUPS:
-        y_label = "Voltage (V)" if "Voltage" in group_title else (
-            "Current (A)" if "Current" in group_title else "Frequency (Hz)"
-        )
-        b64 = _plot_group_base64(frames, channels, group_title, y_label)
+        if plot_images is not None and group_title in plot_images:
+            b64 = plot_images[group_title]
+        else:
+            b64 = _plot_group_base64(frames, channels, group_title, _group_y_label(group_title))
         if b64:
             plots_html += (
                 f'<img src="data:image/png;base64,{b64}" '
@@ -587,17 +634,25 @@ def quick_export(
     compliance_results: list[dict] | None = None,
     base_dir: str = "artifacts/evidence_exports",
     preview_csv_max_rows: int = 5000,
+    progress: Callable[[int, int, str], None] | None = None,
 ) -> dict:
     """
     Write a complete evidence package to a timestamped subfolder WITHOUT a
     QFileDialog.  Designed to be non-blocking for large files.
 
+    Plots render concurrently in worker processes while the JSON and CSV
+    artifacts are written on threads (see :mod:`src.export_tasks`); each
+    artifact fails independently.  *progress* is called as
+    ``progress(done, total, artifact_name)``.
+
     Returns a dict with:
         export_dir   — absolute path to the created folder
         artifacts    — list of {name, path, size_bytes, description}
         session_id   — session identifier string
         timestamp    — ISO timestamp string
     """
+    from src.export_tasks import ExportTask, run_export_tasks
+
     m = _session_meta(capsule)
     sid = m["session_id"].replace(" ", "_").replace("/", "-")
     ts_str = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -616,64 +671,41 @@ def quick_export(
         })
         logger.info("quick_export artifact: %s (%d bytes)", path.name, size)
 
-    # 1. HTML report
-    try:
-        html_path_str = generate_html_report(
-            capsule, events, compliance_results, output_dir=str(export_dir)
-        )
-        _add("HTML Report", Path(html_path_str), "Self-contained engineering analysis report")
-    except Exception as exc:
-        logger.warning("quick_export HTML report failed: %s", exc)
-
-    # 2. Waveform PNG (phase voltages)
-    try:
-        frames = capsule.get("frames", [])
-        _phase_chs = ["v_an", "v_bn", "v_cn"]
-        b64_phase = _plot_group_base64(frames, _phase_chs, "Phase Voltages", "Voltage (V)")
-        if b64_phase:
-            img_path = export_dir / "waveform_phase.png"
-            import base64 as _b64
-            img_path.write_bytes(_b64.b64decode(b64_phase))
-            _add("Phase Voltage PNG", img_path, "Phase-to-neutral voltage waveforms")
-    except Exception as exc:
-        logger.warning("quick_export phase PNG failed: %s", exc)
-
-    # 3. Line-to-line PNG
-    try:
-        _line_chs = ["v_ab", "v_bc", "v_ca"]
-        b64_line = _plot_group_base64(frames, _line_chs, "Line-to-Line Voltages", "Voltage (V)")
-        if b64_line:
-            img_path = export_dir / "waveform_line.png"
-            img_path.write_bytes(_b64.b64decode(b64_line))
-            _add("Line-to-Line Voltage PNG", img_path, "Line-to-line voltage waveforms")
-    except Exception as exc:
-        logger.warning("quick_export line PNG failed: %s", exc)
-
-    # 4. Metrics JSON
-    try:
+    frames = capsule.get("frames", [])
+    ev_list = events or []
+
+    # ── Plot tasks: series are extracted here so workers only get arrays ──
+    # The phase-voltage PNG is the report's "Voltage Waveforms" plot, so it
+    # is rendered once for both.
+    plot_groups = [(f"html:{title}", title, channels, _group_y_label(title))
+                   for title, channels in _WAVEFORM_GROUPS]
+    plot_groups += [
+        ("line_png", "Line-to-Line Voltages", ["v_ab", "v_bc", "v_ca"], "Voltage (V)"),
+    ]
+    tasks: list[ExportTask] = []
+    plot_results: dict[str, str | None] = {}
+    for key, title, channels, y_label in plot_groups:
+        extracted = _group_series(frames, channels)
+        if extracted is None:
+            plot_results[key] = None
+            continue
+        tasks.append(ExportTask(key, _render_series_base64, (extracted, title, y_label), kind="plot"))
+
+    # ── I/O tasks ────────────────────────────────────────────────────────────
+    def _metrics_json() -> Path:
         from src.session_analysis import compute_session_metrics
-        from src.event_detector import detect_events as _detect_events
-        from src.session_analysis import dataset_for_analysis
-        ev_list = events if events is not None else []
-        metrics_payload = compute_session_metrics(capsule, events=ev_list)
         metrics_path = export_dir / "metrics.json"
-        _write_json(metrics_path, metrics_payload)
-        _add("Metrics JSON", metrics_path, "Session engineering metrics summary")
-    except Exception as exc:
-        logger.warning("quick_export metrics JSON failed: %s", exc)
+        _write_json(metrics_path, compute_session_metrics(capsule, events=ev_list))
+        return metrics_path
 
-    # 5. Compliance JSON
-    try:
-        if compliance_results is not None:
-            comp_path = export_dir / "compliance.json"
-            _write_json(comp_path, compliance_results)
-            _add("Compliance JSON", comp_path, "Standards-inspired check results")
-    except Exception as exc:
-        logger.warning("quick_export compliance JSON failed: %s", exc)
+    def _compliance_json() -> Path | None:
+        if compliance_results is None:
+            return None
+        comp_path = export_dir / "compliance.json"
+        _write_json(comp_path, compliance_results)
+        return comp_path
 
-    # 6. Events JSON
-    try:
-        ev_list = events or []
+    def _events_json() -> Path:
         events_path = export_dir / "events.json"
         _write_json(events_path, [
             {
@@ -684,12 +716,9 @@ def quick_export(
             }
             for e in ev_list
         ])
-        _add("Events JSON", events_path, "Detected power-quality events")
-    except Exception as exc:
-        logger.warning("quick_export events JSON failed: %s", exc)
+        return events_path
 
-    # 7. Metadata JSON
-    try:
+    def _metadata_json() -> Path:
         meta_path = export_dir / "metadata.json"
         _write_json(meta_path, {
             "exported_at":    datetime.now().isoformat(),
@@ -703,23 +732,84 @@ def quick_export(
             "warnings":       m["warnings"],
             "applied_mapping": m["applied_mapping"],
         })
-        _add("Metadata JSON", meta_path, "Session and import provenance")
-    except Exception as exc:
-        logger.warning("quick_export metadata JSON failed: %s", exc)
+        return meta_path
 
-    # 8. Preview CSV (capped at preview_csv_max_rows)
+    def _preview_csv() -> tuple[Path, str] | None:
+        preview_frames = frames[:preview_csv_max_rows] if len(frames) > preview_csv_max_rows else frames
+        if not preview_frames:
+            return None
+        preview_capsule = dict(capsule)
+        preview_capsule["frames"] = preview_frames
+        csv_path = export_dir / "preview.csv"
+        export_session_csv(preview_capsule, str(csv_path))
+        note = f"Capped at {preview_csv_max_rows:,} rows" if len(frames) > preview_csv_max_rows else ""
+        return csv_path, note
+
+    tasks += [
+        ExportTask("metrics", _metrics_json),
+        ExportTask("compliance", _compliance_json),
+        ExportTask("events", _events_json),
+        ExportTask("metadata", _metadata_json),
+        ExportTask("preview_csv", _preview_csv),
+    ]
+    total_steps = len(tasks) + 1
+    run = run_export_tasks(
+        tasks,
+        progress=(lambda done, _total, name: progress(done, total_steps, name)) if progress else None,
+    )
+    for name, exc in run.errors.items():
+        logger.warning("quick_export %s failed: %s", name, exc)
+    plot_results.update({k: v for k, v in run.results.items() if k.endswith("_png") or k.startswith("html:")})
+    plot_results["phase_png"] = plot_results.get("html:Voltage Waveforms")
+
+    # ── Assemble in the original artifact order ──────────────────────────────
+    # 1. HTML report (needs the group plots)
     try:
-        frames_all = capsule.get("frames", [])
-        preview_frames = frames_all[:preview_csv_max_rows] if len(frames_all) > preview_csv_max_rows else frames_all
-        if preview_frames:
-            preview_capsule = dict(capsule)
-            preview_capsule["frames"] = preview_frames
-            csv_path = export_dir / "preview.csv"
-            export_session_csv(preview_capsule, str(csv_path))
-            note = f"Capped at {preview_csv_max_rows:,} rows" if len(frames_all) > preview_csv_max_rows else ""
-            _add("Preview CSV", csv_path, f"Session data preview{' — ' + note if note else ''}")
+        html_images = {
+            title: plot_results.get(f"html:{title}")
+            for title, _ in _WAVEFORM_GROUPS
+            if f"html:{title}" not in run.errors
+        }
+        html_path_str = generate_html_report(
+            capsule, events, compliance_results, output_dir=str(export_dir),
+            plot_images=html_images,
+        )
+        _add("HTML Report", Path(html_path_str), "Self-contained engineering analysis report")
     except Exception as exc:
-        logger.warning("quick_export preview CSV failed: %s", exc)
+        logger.warning("quick_export HTML report failed: %s", exc)
+    if progress:
+        progress(total_steps, total_steps, "html_report")
+
+    # 2./3. Waveform PNGs
+    for key, filename, name, description in (
+        ("phase_png", "waveform_phase.png", "Phase Voltage PNG", "Phase-to-neutral voltage waveforms"),
+        ("line_png", "waveform_line.png", "Line-to-Line Voltage PNG", "Line-to-line voltage waveforms"),
+    ):
+        try:
+            b64_png = plot_results.get(key)
+            if b64_png:
+                img_path = export_dir / filename
+                img_path.write_bytes(base64.b64decode(b64_png))
+                _add(name, img_path, description)
+        except Exception as exc:
+            logger.warning("quick_export %s failed: %s", key, exc)
+
+    # 4.–7. JSON artifacts
+    for key, name, description in (
+        ("metrics", "Metrics JSON", "Session engineering metrics summary"),
+        ("compliance", "Compliance JSON", "Standards-inspired check results"),
+        ("events", "Events JSON", "Detected power-quality events"),
+        ("metadata", "Metadata JSON", "Session and import provenance"),
+    ):
+        path = run.results.get(key)
+        if path is not None:
+            _add(name, path, description)
+
+    # 8. Preview CSV (capped at preview_csv_max_rows)
+    preview = run.results.get("preview_csv")
+    if preview is not None:
+        csv_path, note = preview
+        _add("Preview CSV", csv_path, f"Session data preview{' — ' + note if note else ''}")
 
     total_bytes = sum(a["size_bytes"] for a in artifacts)
     logger.info(
@@ -0,0 +1,151 @@
+"""
+Single-producer / single-consumer ring of float64 rows in shared memory.
+
+One process creates the ring and hands its :attr:`SharedRing.name` to
+another, which attaches to it.  The producer appends rows with
+:meth:`SharedRing.write`; the consumer drains them with
+:meth:`SharedRing.read`.  Neither side ever blocks or takes a lock; the
+two counters of a seqlock order them instead.  Before touching any row the
+producer advances a *claim* counter ("writing up to"), and once the rows are
+in place it advances the *write* counter to the same value, which publishes
+them.  The consumer keeps its own read counter.
+
+The producer never waits for a slow consumer.  If it gets more than
+``capacity`` rows ahead, the oldest unread rows are overwritten and the
+consumer reports them as lost.  The consumer copies only published rows and
+afterwards re-reads the claim counter: any row below ``claim - capacity``
+may have been (or be being) overwritten during the copy, so it is discarded
+as lost rather than returned torn.
+
+Layout of the block: an int64 header (write counter, capacity, row width,
+claim counter) followed by ``capacity`` rows of ``width`` float64 values.
+
+This module has no Qt dependency.
+"""
+
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+_HEADER_WORDS = 4
+_W_COUNT, _W_CAPACITY, _W_WIDTH, _W_CLAIM = 0, 1, 2, 3
+
+
+class SharedRing:
+    """Fixed-capacity ring of ``width``-wide float64 rows in shared memory."""
+
+    def __init__(self, capacity: int, width: int, name: Optional[str] = None):
+        """Create a ring, or attach to the existing ring *name*."""
+        if name is None:
+            if capacity <= 0 or width <= 0:
+                raise ValueError(f"capacity and width must be positive, got {capacity}, {width}")
+            size = 8 * (_HEADER_WORDS + capacity * width)
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self._owner = True
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            self._owner = False
+        self._header = np.ndarray((_HEADER_WORDS,), dtype=np.int64, buffer=self._shm.buf)
+        if self._owner:
+            self._header[:] = 0
+            self._header[_W_CAPACITY] = capacity
+            self._header[_W_WIDTH] = width
+        elif (self._header[_W_CAPACITY], self._header[_W_WIDTH]) != (capacity, width):
+            shape = (int(self._header[_W_CAPACITY]), int(self._header[_W_WIDTH]))
+            self.close()
+            raise ValueError(f"ring '{name}' is {shape}, expected {(capacity, width)}")
+        self.capacity = int(capacity)
+        self.width = int(width)
+        self._rows = np.ndarray(
+            (self.capacity, self.width), dtype=np.float64, buffer=self._shm.buf, offset=8 * _HEADER_WORDS
+        )
+        self._read_count = 0
+        self.lost = 0
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def written(self) -> int:
+        """Rows written since the ring was created."""
+        return int(self._header[_W_COUNT])
+
+    # ── Producer ─────────────────────────────────────────────────────────────
+
+    def write(self, rows: np.ndarray) -> None:
+        """Append ``rows`` of shape ``(m, width)``."""
+        rows = np.asarray(rows, dtype=np.float64)
+        if rows.ndim != 2 or rows.shape[1] != self.width:
+            raise ValueError(f"expected (m, {self.width}) rows, got shape {rows.shape}")
+        m = rows.shape[0]
+        if m == 0:
+            return
+        cap = self.capacity
+        count = int(self._header[_W_COUNT])
+        if m > cap:                     # only the newest rows can survive
+            count += m - cap
+            rows = rows[m - cap:]
+            m = cap
+        self._header[_W_CLAIM] = count + m          # claim before writing
+        start = count % cap
+        first = min(m, cap - start)
+        self._rows[start:start + first] = rows[:first]
+        if m > first:
+            self._rows[:m - first] = rows[first:]
+        self._header[_W_COUNT] = count + m          # publish
+
+    # ── Consumer ─────────────────────────────────────────────────────────────
+
+    def read(self, max_rows: Optional[int] = None) -> np.ndarray:
+        """Copy out the rows written since the last read, oldest first.
+
+        Rows the producer overwrote, or was overwriting, before they could
+        be read are skipped and added to :attr:`lost`.
+        """
+        cap = self.capacity
+        count = int(self._header[_W_COUNT])
+        claim = int(self._header[_W_CLAIM])
+        start = self._read_count
+        if claim - start > cap:                     # already overwritten or in progress
+            skipped = min(claim - cap, count) - start
+            self.lost += skipped
+            start += skipped
+        end = count if max_rows is None else min(count, start + max_rows)
+        n = end - start
+        if n <= 0:
+            self._read_count = start
+            return np.empty((0, self.width))
+        i = start % cap
+        first = min(n, cap - i)
+        out = np.empty((n, self.width))
+        out[:first] = self._rows[i:i + first]
+        if n > first:
+            out[first:] = self._rows[:n - first]
+        # Rows the producer claimed while we copied may be torn
+        overwritten = int(self._header[_W_CLAIM]) - cap - start
+        if overwritten > 0:
+            overwritten = min(overwritten, n)
+            self.lost += overwritten
+            out = out[overwritten:]
+        self._read_count = end
+        return out
+
+    # ── Lifetime ─────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Detach from the block; the creator also frees it."""
+        self._header = self._rows = None
+        try:
+            self._shm.close()
+        except BufferError:
+            pass                        # a caller still holds a view; freed with it
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            self._owner = False
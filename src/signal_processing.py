@@ -62,6 +62,67 @@ def compute_rms(signal_data):
     return float(np.sqrt(np.mean(sig ** 2)))
 
 
+_STATS_CHUNK_ROWS = 65_536
+
+
+def compute_channel_stats(columns, chunk_rows=_STATS_CHUNK_ROWS):
+    """
+    Computes finite-sample statistics for many channels in one fused pass.
+
+    Columns are copied chunk by chunk into a single preallocated
+    ``(n_channels, chunk_rows)`` float64 block, and count, sum, sum of
+    squares, min and max are accumulated for every channel at once.
+    Non-finite samples are ignored.  Temporary memory is bounded by the
+    chunk size, not by the row count.
+
+    Args:
+        columns: Sequence of 1-D array-likes.  Lengths may differ.
+        chunk_rows: Rows processed per block.
+
+    Returns:
+        dict: ``count``, ``min``, ``max``, ``mean`` and ``rms`` arrays, one
+        entry per input column.  Statistics of columns with no finite
+        samples are NaN and their count is 0.
+    """
+    cols = [np.asarray(c).reshape(-1) for c in columns]
+    k = len(cols)
+    count = np.zeros(k, dtype=np.int64)
+    total = np.zeros(k, dtype=np.float64)
+    total_sq = np.zeros(k, dtype=np.float64)
+    lo = np.full(k, np.nan)
+    hi = np.full(k, np.nan)
+    n_rows = max((c.size for c in cols), default=0)
+
+    if k and n_rows:
+        chunk_rows = max(1, min(int(chunk_rows), n_rows))
+        block = np.empty((k, chunk_rows), dtype=np.float64)
+        finite = np.empty((k, chunk_rows), dtype=bool)
+        for start in range(0, n_rows, chunk_rows):
+            stop = min(start + chunk_rows, n_rows)
+            width = stop - start
+            view = block[:, :width]
+            mask = finite[:, :width]
+            for j, col in enumerate(cols):
+                seg = col[start:stop]
+                view[j, :seg.size] = seg
+                view[j, seg.size:] = np.nan
+            np.isfinite(view, out=mask)
+            count += mask.sum(axis=1)
+            # Turn +/-inf into NaN so fmin/fmax skip them, then zero the
+            # gaps for the sums.
+            np.copyto(view, np.nan, where=~mask)
+            lo = np.fmin(lo, np.fmin.reduce(view, axis=1))
+            hi = np.fmax(hi, np.fmax.reduce(view, axis=1))
+            np.copyto(view, 0.0, where=~mask)
+            total += view.sum(axis=1)
+            total_sq += np.einsum("ij,ij->i", view, view)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(count > 0, total / count, np.nan)
+        rms = np.where(count > 0, np.sqrt(total_sq / count), np.nan)
+    return {"count": count, "min": lo, "max": hi, "mean": mean, "rms": rms}
+
+
 def compute_thd(signal_data, fundamental_freq=60.0, fs=None, time_data=None, n_harmonics=10):
     """
     Computes Total Harmonic Distortion from a signal buffer.
@@ -0,0 +1,235 @@
+"""
+Constant-time window statistics over full-resolution channel arrays.
+
+``WindowStatsIndex`` answers mean / RMS / min / max queries for any time
+window ``[t0, t1]`` without re-scanning the samples in that window:
+
+  - mean and RMS come from prefix sums of the (mean-centred) values and
+    their squares, so a query is two subtractions per statistic;
+  - min and max come from per-block extremes plus a sparse table over the
+    blocks, so a query inspects at most two partial blocks and two table
+    entries regardless of the window length.
+
+Per-channel structures are built lazily on first query and then reused, so
+only the channels the user actually inspects pay the build cost;
+:meth:`WindowStatsIndex.prepare` builds them up front instead.
+Non-finite samples are ignored, matching ``compute_channel_stats``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.file_ingestion import ImportedDataset
+
+logger = logging.getLogger(__name__)
+
+_BLOCK_SIZE = 256
+
+
+@dataclass
+class WindowStats:
+    """Statistics for one channel over one time window."""
+
+    channel: str
+    t_start: float
+    t_end: float
+    sample_count: int
+    mean: float
+    rms: float
+    min: float
+    max: float
+
+    @property
+    def peak_to_peak(self) -> float:
+        return self.max - self.min
+
+    def to_dict(self) -> dict:
+        return {
+            "channel": self.channel,
+            "t_start": self.t_start,
+            "t_end": self.t_end,
+            "sample_count": self.sample_count,
+            "mean": self.mean,
+            "rms": self.rms,
+            "min": self.min,
+            "max": self.max,
+            "peak_to_peak": self.peak_to_peak,
+        }
+
+
+class _ChannelIndex:
+    __slots__ = ("center", "count", "total", "total_sq", "block_min", "block_max", "raw")
+
+    def __init__(self, values: np.ndarray, block_size: int):
+        raw = np.asarray(values, dtype=np.float64).reshape(-1)
+        finite = np.isfinite(raw)
+        all_finite = bool(finite.all())
+        self.raw = raw
+        self.center = float(raw[finite].mean()) if finite.any() else 0.0
+
+        centred = raw - self.center
+        if not all_finite:
+            centred[~finite] = 0.0
+        n = raw.size
+        self.total = np.zeros(n + 1, dtype=np.float64)
+        np.cumsum(centred, out=self.total[1:])
+        self.total_sq = np.zeros(n + 1, dtype=np.float64)
+        np.cumsum(centred * centred, out=self.total_sq[1:])
+        if all_finite:
+            self.count = None
+        else:
+            self.count = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(finite, out=self.count[1:])
+
+        n_blocks = -(-n // block_size)
+        padded = np.full(n_blocks * block_size, np.nan)
+        padded[:n] = raw
+        if not all_finite:
+            padded[:n][~finite] = np.nan
+        blocks = padded.reshape(n_blocks, block_size)
+        self.block_min = _sparse_table(np.fmin.reduce(blocks, axis=1), np.fmin)
+        self.block_max = _sparse_table(np.fmax.reduce(blocks, axis=1), np.fmax)
+
+    def samples(self, i0: int, i1: int) -> int:
+        if self.count is None:
+            return i1 - i0
+        return int(self.count[i1] - self.count[i0])
+
+
+def _sparse_table(level0: np.ndarray, op) -> list[np.ndarray]:
+    table = [level0]
+    width = 1
+    while 2 * width <= level0.size:
+        prev = table[-1]
+        table.append(op(prev[:-width], prev[width:]))
+        width *= 2
+    return table
+
+
+def _table_query(table: list[np.ndarray], b0: int, b1: int, op) -> float:
+    """Reduce blocks ``[b0, b1)`` with *op* using two overlapping table entries."""
+    level = int(b1 - b0).bit_length() - 1
+    row = table[level]
+    return float(op(row[b0], row[b1 - (1 << level)]))
+
+
+class WindowStatsIndex:
+    """
+    O(1) time-window statistics for every channel of a dataset.
+
+    Args:
+        time:       Monotonic time axis in seconds.
+        channels:   Channel name → 1-D array aligned with *time*.
+        block_size: Samples per min/max block.  Smaller blocks make the
+                    partial-block scan cheaper at the cost of a larger table.
+    """
+
+    def __init__(
+        self,
+        time: np.ndarray,
+        channels: dict[str, np.ndarray],
+        block_size: int = _BLOCK_SIZE,
+    ):
+        self.time = np.asarray(time, dtype=np.float64).reshape(-1)
+        self.channels = {
+            name: arr for name, arr in channels.items()
+            if np.asarray(arr).reshape(-1).size == self.time.size
+        }
+        self.block_size = max(1, int(block_size))
+        self._indices: dict[str, _ChannelIndex] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_dataset(cls, dataset: ImportedDataset, block_size: int = _BLOCK_SIZE) -> "WindowStatsIndex":
+        return cls(dataset.time, dataset.channels, block_size=block_size)
+
+    def _channel_index(self, channel: str) -> _ChannelIndex:
+        idx = self._indices.get(channel)
+        if idx is None:
+            with self._lock:
+                idx = self._indices.get(channel)
+                if idx is None:
+                    idx = _ChannelIndex(self.channels[channel], self.block_size)
+                    self._indices[channel] = idx
+        return idx
+
+    def prepare(self, channels: list[str] | tuple[str, ...] | None = None) -> None:
+        """Build the structures of *channels* (default: all) now, e.g. on a worker thread."""
+        names = self.channels if channels is None else [c for c in channels if c in self.channels]
+        for name in names:
+            self._channel_index(name)
+
+    def sample_range(self, t0: float, t1: float) -> tuple[int, int]:
+        """Return the half-open sample range ``[i0, i1)`` covering ``[t0, t1]``."""
+        if t1 < t0:
+            t0, t1 = t1, t0
+        i0 = int(np.searchsorted(self.time, t0, side="left"))
+        i1 = int(np.searchsorted(self.time, t1, side="right"))
+        return i0, max(i0, i1)
+
+    def _extreme(self, idx: _ChannelIndex, i0: int, i1: int, op, table) -> float:
+        bs = self.block_size
+        b0 = -(-i0 // bs)          # first full block
+        b1 = i1 // bs              # one past the last full block
+        parts: list[float] = []
+        if b0 >= b1:
+            seg = idx.raw[i0:i1]
+            seg = seg[np.isfinite(seg)]
+            return float(op.reduce(seg)) if seg.size else float("nan")
+        parts.append(_table_query(table, b0, b1, op))
+        for lo, hi in ((i0, b0 * bs), (b1 * bs, i1)):
+            if hi > lo:
+                seg = idx.raw[lo:hi]
+                seg = seg[np.isfinite(seg)]
+                if seg.size:
+                    parts.append(float(op.reduce(seg)))
+        return float(op.reduce(np.asarray(parts)))
+
+    def window_stats(self, channel: str, t0: float, t1: float) -> WindowStats:
+        """
+        Return statistics for *channel* over ``[t0, t1]`` seconds.
+
+        Raises:
+            KeyError: if *channel* is not indexed.
+        """
+        if channel not in self.channels:
+            raise KeyError(channel)
+        i0, i1 = self.sample_range(t0, t1)
+        idx = self._channel_index(channel)
+        count = idx.samples(i0, i1)
+        t_start = float(self.time[i0]) if i0 < self.time.size else float(t0)
+        t_end = float(self.time[i1 - 1]) if i1 > i0 else t_start
+        if count == 0:
+            nan = float("nan")
+            return WindowStats(channel, t_start, t_end, 0, nan, nan, nan, nan)
+
+        s = float(idx.total[i1] - idx.total[i0])
+        ss = float(idx.total_sq[i1] - idx.total_sq[i0])
+        mean_c = s / count
+        mean = idx.center + mean_c
+        # E[x^2] = E[c^2] + 2*m*E[c] + m^2 with c = x - m.
+        mean_sq = ss / count + 2.0 * idx.center * mean_c + idx.center * idx.center
+        rms = float(np.sqrt(max(mean_sq, 0.0)))
+        lo = self._extreme(idx, i0, i1, np.fmin, idx.block_min)
+        hi = self._extreme(idx, i0, i1, np.fmax, idx.block_max)
+        return WindowStats(channel, t_start, t_end, count, float(mean), rms, lo, hi)
+
+    def window_stats_all(
+        self,
+        t0: float,
+        t1: float,
+        channels: list[str] | tuple[str, ...] | None = None,
+    ) -> dict[str, WindowStats]:
+        """Return :meth:`window_stats` for *channels* (default: all indexed)."""
+        names = self.channels if channels is None else [c for c in channels if c in self.channels]
+        return {name: self.window_stats(name, t0, t1) for name in names}
+
+    def window_slice(self, channel: str, t0: float, t1: float) -> tuple[np.ndarray, np.ndarray]:
+        """Return zero-copy ``(time, values)`` views for ``[t0, t1]``."""
+        i0, i1 = self.sample_range(t0, t1)
+        return self.time[i0:i1], np.asarray(self.channels[channel]).reshape(-1)[i0:i1]
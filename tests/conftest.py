@@ -22,3 +22,18 @@ def qapp():
     if app is None:
         app = QApplication(sys.argv)
     yield app
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_analysis_cache(tmp_path_factory):
+    """Keep the analysis and artifact caches out of the working tree during tests."""
+    names = ("REDBYTE_ANALYSIS_CACHE", "REDBYTE_ARTIFACT_CACHE")
+    previous = {name: os.environ.get(name) for name in names}
+    for name in names:
+        os.environ[name] = str(tmp_path_factory.mktemp(name.lower()))
+    yield
+    for name, value in previous.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
@@ -0,0 +1,140 @@
+import time
+
+import pytest
+
+import src.serial_reader as serial_reader
+from scripts.opalrt_stream_benchmark import OpalRTStandIn, message
+from src.acquisition import AcquisitionSource, MultiSourceAdapter
+from src.io_adapter import IOAdapter, OpalRTAdapter
+
+
+class SlowAdapter(IOAdapter):
+    """Polled source whose every read blocks, like a sluggish instrument."""
+
+    def __init__(self, period_s=0.5):
+        self.period_s = period_s
+        self.k = 0
+        self.commands = []
+
+    def connect(self, config):
+        return True
+
+    def disconnect(self):
+        pass
+
+    def read_frame(self):
+        time.sleep(self.period_s)
+        self.k += 1
+        return {"ts": float(self.k), "v_an": 1.0, "v_bn": 0.0, "v_cn": -1.0,
+                "i_a": 0.0, "i_b": 0.0, "i_c": 0.0, "freq": 60.0, "p_mech": 0.0}
+
+    def write_command(self, command_type, payload=None):
+        self.commands.append((command_type, payload))
+        return True
+
+
+def _collect(adapter, until):
+    frames = []
+    deadline = time.time() + 10.0
+    while not until(frames) and time.time() < deadline:
+        frames.extend(adapter.read_frames())
+    return frames
+
+
+def test_fast_socket_source_is_not_held_back_by_a_slow_polled_source():
+    # Device clock runs at the send rate, so "align" puts both sources on one timeline
+    server = OpalRTStandIn(600, 1_000.0, [message(k, 1_000.0) for k in range(600)]).start()
+    slow = SlowAdapter(period_s=0.5)
+    adapter = MultiSourceAdapter([
+        AcquisitionSource("opal", OpalRTAdapter(), {"host": server.host, "port": server.port}),
+        AcquisitionSource("bench", slow, clock="host"),
+    ], max_skew_s=0.2)
+    try:
+        assert adapter.connect()
+        frames = _collect(adapter, lambda f: sum(x["source"] == "opal" for x in f) >= 600
+                          and any(x["source"] == "bench" for x in f))
+        stats = {s.name: s for s in adapter.source_stats()}
+        received_at = adapter.received_at
+    finally:
+        adapter.disconnect()
+        server.close()
+
+    opal = [f for f in frames if f["source"] == "opal"]
+    assert [f["device_ts"] for f in opal] == [round(k / 1_000.0, 6) for k in range(600)]
+    assert any(f["source"] == "bench" for f in frames)
+    ts = [f["ts"] for f in frames]
+    assert ts == sorted(ts)
+
+    assert stats["opal"].transport == "selectable" and stats["bench"].transport == "polled"
+    assert stats["opal"].frames == 600 and stats["opal"].errors == 0
+    assert stats["opal"].latency_ms_max < 1000.0 * (0.2 + 0.2)
+    assert received_at is not None and received_at < time.perf_counter()
+
+
+def test_commands_are_routed_by_source_name():
+    first, second = SlowAdapter(0.01), SlowAdapter(0.01)
+    adapter = MultiSourceAdapter([AcquisitionSource("a", first), AcquisitionSource("b", second)])
+
+    assert adapter.write_command("SET_MODE", {"mode": "RUN"})
+    assert adapter.write_command("FAULT", {"source": "b", "type": "trip"})
+    assert not adapter.write_command("FAULT", {"source": "c"})
+    assert first.commands == [("SET_MODE", {"mode": "RUN"})]
+    assert second.commands == [("FAULT", {"type": "trip"})]
+    with pytest.raises(ValueError):
+        MultiSourceAdapter([AcquisitionSource("a", first), AcquisitionSource("a", second)])
+
+
+def test_serial_manager_publishes_merged_sources(qapp):
+    mgr = serial_reader.SerialManager()
+    blocks = []
+    mgr.frames_received.connect(blocks.append)
+    mgr.connect_sources([
+        AcquisitionSource("left", SlowAdapter(0.02), clock="host"),
+        AcquisitionSource("right", SlowAdapter(0.03), clock="host"),
+    ], max_skew_s=0.1)
+    try:
+        deadline = time.time() + 5.0
+        while time.time() < deadline and mgr.get_live_stats().frame_count < 20:
+            qapp.processEvents()
+            time.sleep(0.01)
+        stats = mgr.get_live_stats()
+    finally:
+        mgr.stop()
+    qapp.processEvents()
+
+    assert stats.source == "MULTI:left+right"
+    assert [s.name for s in stats.sources] == ["left", "right"]
+    assert all(s.frames > 0 for s in stats.sources)
+    names = {name for block in blocks for name in block.extras.get("source", [])}
+    assert names == {"left", "right"}
+
+
+def test_unmerged_sources_are_delivered_on_arrival_without_zero_fill(qapp):
+    class DcBoard(SlowAdapter):
+        def read_frame(self):
+            time.sleep(self.period_s)
+            self.k += 1
+            return {"t_ms": 1000 * self.k, "vdc": 400.0}
+
+    mgr = serial_reader.SerialManager()
+    seen = []
+    mgr.add_frame_sink(seen.extend)
+    mgr.connect_sources([
+        AcquisitionSource("scope", SlowAdapter(0.01), clock="host"),
+        AcquisitionSource("board", DcBoard(0.3), clock="host"),
+    ], merge=False)
+    try:
+        deadline = time.time() + 10.0
+        while time.time() < deadline and sum(f["source"] == "board" for f in seen) < 3:
+            time.sleep(0.01)
+        stats = {s.name: s for s in mgr.adapter.source_stats()}
+    finally:
+        mgr.stop()
+    qapp.processEvents()
+
+    # The scope never waits for its silent sibling's watermark
+    assert stats["scope"].latency_ms_max < 50.0
+    board = [f for f in seen if f["source"] == "board"]
+    assert board and board[0]["v_dc"] == 400.0
+    assert not {"v_an", "i_a", "freq", "p_mech"} & board[0].keys()
+    assert all(f["v_an"] == 1.0 for f in seen if f["source"] == "scope")
@@ -0,0 +1,88 @@
+import math
+
+import numpy as np
+
+from src.analysis_cache import AnalysisCache, analysis_cache_key
+from src.compliance_checker import evaluate_session
+from src.dataset_converter import dataset_to_session
+from src.event_detector import DetectedEvent
+from src.file_ingestion import ImportedDataset
+from src.session_analysis import compute_session_metrics
+
+
+def _hashed_dataset(source_hash: str = "ab" * 32, scale: float = 1.0) -> ImportedDataset:
+    sample_rate = 1000.0
+    time = np.arange(1200, dtype=np.float64) / sample_rate
+    peak = 120.0 * math.sqrt(2.0)
+    channels = {
+        "v_an": peak * np.sin(2.0 * math.pi * 60.0 * time),
+    }
+    dataset = ImportedDataset(
+        source_type="rigol_csv",
+        source_path="/fake/hashed.csv",
+        channels=channels,
+        time=time,
+        sample_rate=sample_rate,
+        duration=float(time[-1] - time[0]),
+        raw_headers=["CH1(V)"],
+        meta={
+            "source_hash_sha256": source_hash,
+            "applied_mapping": {"CH1(V)": "v_an"},
+            "scale_factors": {"v_an": scale},
+        },
+    )
+    return dataset
+
+
+def _hashed_capsule(source_hash: str = "ab" * 32, scale: float = 1.0) -> dict:
+    return dataset_to_session(_hashed_dataset(source_hash, scale))
+
+
+def test_cache_key_tracks_hash_mapping_and_scale():
+    base = analysis_cache_key(_hashed_capsule())
+
+    assert base == analysis_cache_key(_hashed_capsule())
+    assert base != analysis_cache_key(_hashed_capsule(source_hash="cd" * 32))
+    assert base != analysis_cache_key(_hashed_capsule(scale=2.0))
+    assert analysis_cache_key({"meta": {}, "frames": []}) is None
+
+
+def test_cache_round_trips_metrics_events_and_compliance(tmp_path):
+    cache = AnalysisCache(tmp_path)
+    capsule = _hashed_capsule()
+    summary = compute_session_metrics(capsule, events=[])
+    results = evaluate_session(capsule, profile="project_demo")
+    events = [DetectedEvent("voltage_sag", 0.1, 0.2, "v_an", "warning", "sag", {"depth": 0.5})]
+
+    assert cache.load_metrics(capsule) is None
+    assert cache.store_metrics(capsule, summary)
+    assert cache.store_events(capsule, events)
+    assert cache.store_compliance(capsule, "project_demo", results)
+
+    reopened = _hashed_capsule()
+    fresh = AnalysisCache(tmp_path)
+    assert fresh.load_metrics(reopened)["phase_voltage"] == summary["phase_voltage"]
+    assert fresh.load_events(reopened) == events
+    assert [r["status"] for r in fresh.load_compliance(reopened, "project_demo")] == [
+        r["status"] for r in results
+    ]
+    assert fresh.load_compliance(reopened, "ieee_519_thd") is None
+    assert fresh.load_metrics(_hashed_capsule(scale=2.0)) is None
+
+
+def test_uncacheable_capsule_and_corrupt_entry_are_misses(tmp_path):
+    cache = AnalysisCache(tmp_path)
+    assert cache.store_metrics({"meta": {}, "frames": []}, {"x": 1}) is False
+
+    capsule = _hashed_capsule()
+    (tmp_path / f"{analysis_cache_key(capsule)}.json").write_text("{not json")
+    assert cache.load_metrics(capsule) is None
+
+
+def test_cache_key_tracks_the_analysed_data():
+    saved = _hashed_capsule()
+    imported = dict(saved, _dataset=_hashed_dataset())
+    decimated = dict(saved, frames=saved["frames"][::2])
+
+    keys = [analysis_cache_key(c) for c in (saved, imported, decimated)]
+    assert None not in keys and len(set(keys)) == 3
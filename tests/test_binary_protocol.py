@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from scripts.serial_loopback_benchmark import CHANNELS, PtyDevice, run_loopback
+from src.binary_protocol import FrameDecoder, FrameEncoder
+from src.io_adapter import SerialAdapter
+
+needs_pty = pytest.mark.skipif(os.name != "posix", reason="pty loopback needs POSIX")
+
+
+def _rows(n):
+    return [(k * 1e-4, [float(k + ch) for ch in range(len(CHANNELS))]) for k in range(n)]
+
+
+def test_frames_round_trip_across_arbitrary_chunk_boundaries():
+    encoder = FrameEncoder(CHANNELS)
+    rows = _rows(25)
+    stream = encoder.channel_map() + b"".join(encoder.samples(rows[i:i + 5]) for i in range(0, 25, 5))
+    decoder = FrameDecoder()
+
+    frames = []
+    for i in range(0, len(stream), 7):
+        frames += decoder.feed(stream[i:i + 7])
+
+    assert decoder.channels == CHANNELS
+    assert [f["ts"] for f in frames] == [ts for ts, _ in rows]
+    assert frames[3]["i_a"] == pytest.approx(6.0) and frames[24]["p_mech"] == pytest.approx(31.0)
+    assert decoder.stats.samples == 25 and decoder.stats.crc_errors == 0
+
+
+def test_corrupt_frame_is_dropped_and_stream_resynchronises():
+    encoder = FrameEncoder(CHANNELS)
+    good = [encoder.samples(_rows(1)) for _ in range(3)]
+    corrupt = bytearray(good[1])
+    corrupt[12] ^= 0xFF
+    decoder = FrameDecoder(CHANNELS)
+
+    frames = decoder.feed(b"noise{\"ts\":1}\n" + good[0] + bytes(corrupt) + good[2])
+
+    assert len(frames) == 2
+    assert decoder.stats.crc_errors == 1 and decoder.stats.dropped_frames == 1
+    assert decoder.stats.bytes_discarded >= len(b"noise{\"ts\":1}\n")
+
+
+@needs_pty
+def test_serial_adapter_negotiates_binary_over_pty_loopback():
+    result = run_loopback("binary", 2_000, batch=4, timeout=30.0)
+
+    assert result["protocol"] == "binary"
+    assert result["frames"] == 2_000
+    assert set(CHANNELS) <= result["last"].keys()
+    assert result["stats"].crc_errors == 0 and result["stats"].dropped_frames == 0
+
+
+@needs_pty
+def test_binary_only_connect_fails_when_device_does_not_answer():
+    device = PtyDevice("json", 0)
+    adapter = SerialAdapter()
+    try:
+        assert adapter.connect({"port": device.port, "protocol": "binary", "handshake_timeout": 0.2}) is False
+        assert adapter.conn is None
+    finally:
+        device.close()
@@ -0,0 +1,141 @@
+import csv
+import gzip
+import json
+
+import numpy as np
+import pandas as pd
+
+from src.columnar_csv import format_block, open_csv_output, write_csv_blocks, write_frames_csv
+from src.csv_exporter import CSVExporter
+from src.file_ingestion import ImportedDataset
+from src.recorder import Recorder
+from src.report_generator import _write_dataset_csv
+
+
+def test_format_block_writes_absent_and_nan_cells_empty():
+    text = format_block([np.array([0.0, 0.5]), None, np.array([1.25, np.nan])], 2)
+    assert text == "0,,1.25\n0.5,,\n"
+
+
+def test_write_csv_blocks_streams_chunks_and_reports_progress(tmp_path):
+    values = np.arange(10, dtype=float) / 4
+    seen = []
+    path = tmp_path / "out.csv.gz"
+    with open_csv_output(path, "gzip") as handle:
+        rows = write_csv_blocks(
+            handle, ["a", "b"], values.size,
+            lambda start, stop: [values[start:stop], -values[start:stop]],
+            chunk_rows=4,
+            progress=lambda done, total: seen.append((done, total)),
+        )
+
+    assert rows == 10
+    assert seen == [(4, 10), (8, 10), (10, 10)]
+    with gzip.open(path, "rt") as handle:
+        frame = pd.read_csv(handle)
+    assert np.allclose(frame["a"], values) and np.allclose(frame["b"], -values)
+
+
+def test_full_resolution_dataset_csv_round_trips_compressed(tmp_path):
+    t = np.arange(70_000) / 10_000.0
+    dataset = ImportedDataset(
+        source_type="rigol_csv",
+        source_path="/fake/scope.csv",
+        channels={"v_an": 170.0 * np.sin(2 * np.pi * 60.0 * t), "freq": np.full(t.size, 60.0)},
+        time=t,
+        sample_rate=10_000.0,
+        duration=float(t[-1]),
+        raw_headers=["v_an", "freq"],
+    )
+    progress = []
+
+    result = _write_dataset_csv(
+        dataset, {}, tmp_path / "normalized_frames.csv",
+        include_full_resolution=True, compression="gzip",
+        progress=lambda done, total: progress.append(done),
+    )
+
+    assert result["path"].endswith("normalized_frames.csv.gz")
+    assert result["rows_written"] == t.size
+    assert progress[-1] == t.size and len(progress) > 1
+    with gzip.open(result["path"], "rt") as handle:
+        frame = pd.read_csv(handle, comment="#")
+    assert list(frame.columns) == ["ts", "freq", "v_an"]
+    assert np.allclose(frame["v_an"], dataset.channels["v_an"], atol=1e-9)
+
+
+def test_frames_csv_keeps_types_quotes_text_and_leaves_gaps_empty(tmp_path):
+    frames = [
+        {"ts": 1_700_000_000.123456, "frame_id": 7, "v_an": 120.0, "note": 'sag, "deep"'},
+        {"ts": 1_700_000_000.223456, "frame_id": 8, "ok": True},
+    ]
+    path = tmp_path / "frames.csv"
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        write_frames_csv(handle, frames, ["ts", "frame_id", "v_an", "note", "ok"])
+
+    with open(path, newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert rows[0] == {"ts": "1700000000.123456", "frame_id": "7", "v_an": "120.0",
+                       "note": 'sag, "deep"', "ok": ""}
+    assert rows[1]["v_an"] == "" and rows[1]["note"] == "" and rows[1]["ok"] == "True"
+
+
+def test_smart_and_legacy_csv_write_absent_channels_empty(tmp_path):
+    frames = [{"ts": 1.0 + i / 1000, "v_an": float(i % 9), "freq": 60.0} for i in range(64)]
+    session_path = tmp_path / "session.json"
+    session_path.write_text(json.dumps({"meta": {}, "frames": frames, "events": []}))
+
+    smart = Recorder.__new__(Recorder).export_smart_csv(
+        str(session_path), out_path=str(tmp_path / "smart.csv"))
+    simple = CSVExporter().export_session(
+        str(session_path), str(tmp_path / "simple.csv"), format_type="simple", include_metadata=False)
+    analysis = CSVExporter().export_session(
+        str(session_path), str(tmp_path / "analysis.csv"), format_type="analysis", include_metadata=False)
+
+    smart_rows = pd.read_csv(smart, keep_default_na=False, dtype=str)
+    assert (smart_rows["v_bn"] == "").all() and (smart_rows["i_a"] == "").all()
+    assert (smart_rows["fault"] == "").all() and (smart_rows["insight"] == "0").all()
+    simple_rows = pd.read_csv(simple, keep_default_na=False, dtype=str)
+    assert (simple_rows["i_c"] == "").all() and simple_rows["v_an"].iloc[1] == "1.0"
+    analysis_rows = pd.read_csv(analysis, keep_default_na=False, dtype=str)
+    assert (analysis_rows["v_rms"] == "").all()         # derived from absent channels
+    assert list(analysis_rows["sample_index"][:3]) == ["0", "1", "2"]
+
+
+
+def test_frames_csv_formats_complete_and_gappy_blocks_alike(tmp_path):
+    frames = [
+        {"ts": 1.0, "count": 7, "v_an": 1 / 3},
+        {"ts": 2.0, "count": 2 ** 60, "v_an": 2 / 3},
+    ]
+    dense = tmp_path / "dense.csv"
+    with open(dense, "w", newline="", encoding="utf-8") as handle:
+        write_frames_csv(handle, frames, ["ts", "count", "v_an"])
+    sparse = tmp_path / "sparse.csv"
+    with open(sparse, "w", newline="", encoding="utf-8") as handle:
+        write_frames_csv(handle, frames[:1] + [{"ts": 3.0}], ["ts", "count", "v_an"])
+
+    assert dense.read_text(encoding="utf-8").splitlines()[1:] == [
+        "1.0,7,0.333333333333", "2.0,1152921504606846976,0.666666666667",
+    ]
+    assert sparse.read_text(encoding="utf-8").splitlines()[1:] == ["1.0,7,0.333333333333", "3.0,,"]
+
+
+def test_column_format_is_decided_once_across_chunks(tmp_path):
+    frames = [
+        {"ts": 0.0, "v_an": 120.0, "count": 7},
+        {"ts": 1.0, "v_an": 121.0, "count": 8},
+        {"ts": 2.0, "v_an": 120.0, "count": None},
+        {"ts": 3.0, "v_an": 120.5, "count": 2 ** 60},
+        {"ts": 4.0, "v_an": float("inf"), "count": 9},
+        {"ts": 5.0, "v_an": None, "count": 10},
+    ]
+    path = tmp_path / "chunks.csv"
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        write_frames_csv(handle, frames, ["ts", "v_an", "count"], chunk_rows=2)
+
+    assert path.read_text(encoding="utf-8").splitlines()[1:] == [
+        "0.0,120.0,7", "1.0,121.0,8",
+        "2.0,120.0,", "3.0,120.5,1152921504606846976",   # whole-valued chunk, then a fractional one
+        "4.0,inf,9", "5.0,,10",
+    ]
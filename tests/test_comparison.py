@@ -473,3 +473,78 @@ def test_detect_duplicate_missing_channel_returns_none():
     a = _ds(200, {"p_mech": sig})
     b = _ds(200, {"v_an": sig.copy()})
     assert detect_duplicate_datasets(a, b, channel="p_mech") is None
+
+
+def test_align_long_capture_uses_bounded_search_with_subsample_precision():
+    """2M-sample capture: bounded coarse/refine search recovers a fractional lag."""
+    sr = 100_000.0
+    n = 2_000_000
+    rng = np.random.default_rng(11)
+    base = rng.standard_normal(n + 20_000)
+    # Smooth the noise so a 0.5-sample delay is well defined, then shift it.
+    base = np.convolve(base, np.hanning(9) / np.hanning(9).sum(), mode="same")
+    grid = np.arange(base.size, dtype=np.float64)
+    shifted = np.interp(grid + 0.5, grid, base)
+    a = _ds(n, {"v_an": base[:n]}, sample_rate=sr)
+    b = _ds(n, {"v_an": shifted[7_000: 7_000 + n]}, sample_rate=sr)
+
+    offset, confidence = align_datasets(a, b, channel="v_an", max_offset_s=0.5)
+
+    assert offset * sr == pytest.approx(7_000.5, abs=0.2)
+    assert confidence > 0.9
+
+
+def test_align_joint_combines_channels_and_ignores_missing():
+    from src.comparison import align_datasets_joint
+
+    n = 3000
+    sr = 1000.0
+    shift = 40
+    rng = np.random.default_rng(5)
+    long_a = rng.standard_normal(n + shift)
+    long_b = rng.standard_normal(n + shift)
+    a = _ds(n, {"v_an": long_a[:n], "v_bn": long_b[:n]}, sample_rate=sr)
+    b = _ds(
+        n,
+        {"v_an": long_a[shift: shift + n], "v_bn": long_b[shift: shift + n]},
+        sample_rate=sr,
+    )
+
+    offset, confidence = align_datasets_joint(
+        a, b, ["v_an", "v_bn", "freq"], max_offset_s=0.1
+    )
+    assert offset == pytest.approx(0.04, abs=1e-3)
+    assert confidence > 0.9
+    assert align_datasets_joint(a, b, ["freq"], max_offset_s=0.1) == (0.0, 0.0)
+
+
+# ---------------------------------------------------------------------------
+# Cross-rate comparison (polyphase resampling)
+# ---------------------------------------------------------------------------
+
+def test_cross_rate_compare_rejects_out_of_band_content():
+    """
+    A 50 kHz capture carrying a 9.7 kHz ripple compared against a clean
+    1 kHz export: plain interpolation aliases the ripple into the 1 kHz grid,
+    the polyphase path filters it out before decimation.
+    """
+    from src.resampling import default_resample_cache
+
+    fast_sr, slow_sr, n_slow = 50_000.0, 1_000.0, 1_000
+    t_fast = np.arange(int(n_slow * fast_sr / slow_sr)) / fast_sr
+    clean = lambda t: 10.0 * np.sin(2 * np.pi * 60.0 * t)
+    a = ImportedDataset(
+        source_type="rigol_csv", source_path="/fake/fast.csv",
+        channels={"v_an": clean(t_fast) + 2.0 * np.sin(2 * np.pi * 9_700.0 * t_fast)},
+        time=t_fast, sample_rate=fast_sr, duration=float(t_fast[-1]), raw_headers=["v_an"],
+    )
+    b = _ds(n_slow, {"v_an": clean(np.arange(n_slow) / slow_sr)}, sample_rate=slow_sr)
+
+    cache = default_resample_cache()
+    misses = cache.misses
+    result = compare_channels(a, b, "v_an")
+    assert result.rms_error < 0.05
+    assert result.n_samples_compared == n_slow
+
+    compare_channels(a, b, "v_an")
+    assert cache.misses == misses + 2      # second comparison is served from cache
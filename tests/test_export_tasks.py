@@ -0,0 +1,50 @@
+import pytest
+
+from src.export_tasks import EXPORT_MODE_ENV, ExportTask, run_export_tasks
+from src.session_exporter import _render_series_base64, quick_export
+
+
+def _boom():
+    raise ValueError("disk full")
+
+
+@pytest.mark.parametrize("mode", ["serial", "threads"])
+def test_tasks_are_isolated_and_report_progress(monkeypatch, mode):
+    monkeypatch.setenv(EXPORT_MODE_ENV, mode)
+    seen = []
+    run = run_export_tasks(
+        [
+            ExportTask("plot", _render_series_base64,
+                       ([(0, "v_an", [0.0, 1.0], [1.0, 2.0])], "V", "Voltage (V)"), kind="plot"),
+            ExportTask("broken", _boom),
+            ExportTask("value", lambda: 42),
+        ],
+        progress=lambda done, total, name: seen.append((done, total, name)),
+    )
+
+    assert run.results["value"] == 42
+    assert run.results["plot"].startswith("iVBOR")      # base64 PNG header
+    assert isinstance(run.errors["broken"], ValueError)
+    assert [d for d, _, _ in seen] == [1, 2, 3]
+    assert {name for _, _, name in seen} == {"plot", "broken", "value"}
+    assert set(run.durations) == {"plot", "broken", "value"}
+
+
+def test_quick_export_reports_progress_and_keeps_artifact_order(tmp_path, monkeypatch):
+    monkeypatch.setenv(EXPORT_MODE_ENV, "threads")
+    frames = [
+        {"ts": i * 0.001, "v_an": float(i % 7), "v_ab": float(i % 5), "freq": 60.0}
+        for i in range(200)
+    ]
+    capsule = {"meta": {"session_id": "quick"}, "frames": frames, "events": [], "import_meta": {}}
+    seen = []
+
+    result = quick_export(capsule, base_dir=str(tmp_path), progress=lambda *a: seen.append(a))
+
+    names = [a["name"] for a in result["artifacts"]]
+    assert names == [
+        "HTML Report", "Phase Voltage PNG", "Line-to-Line Voltage PNG",
+        "Metrics JSON", "Events JSON", "Metadata JSON", "Preview CSV",
+    ]
+    assert seen[-1][0] == seen[-1][1]
+    assert all(a["size_bytes"] > 0 for a in result["artifacts"])
@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+import src.serial_reader as serial_reader
+from src.frame_queue import FrameQueue
+from src.recorder import Recorder
+
+
+def test_drop_oldest_and_coalesce_bound_the_queue_and_count_drops():
+    q = FrameQueue(capacity=10, policy="drop_oldest")
+    assert q.put([1, 2, 3, 4]) is True           # first put wakes the consumer
+    assert q.put([5, 6, 7, 8]) is False          # wake-up already pending
+    q.put([9, 10, 11])
+    assert q.drain() == [[5, 6, 7, 8], [9, 10, 11]]
+    stats = q.stats()
+    assert (stats.depth, stats.depth_peak, stats.dropped) == (0, 8, 4)
+    assert q.put([12]) is True
+
+    q = FrameQueue(capacity=10, policy="coalesce")
+    q.put([1, 2])
+    q.put([3])
+    assert q.drain() == [[3]] and q.stats().dropped == 2
+    with pytest.raises(ValueError):
+        FrameQueue(policy="newest")
+
+
+def test_block_policy_waits_for_the_consumer():
+    q = FrameQueue(capacity=4, policy="block")
+    q.put([1, 2, 3])
+    done = threading.Event()
+    producer = threading.Thread(target=lambda: (q.put([4, 5]), done.set()))
+    producer.start()
+    assert not done.wait(0.2)
+
+    assert q.drain() == [[1, 2, 3]]
+    assert done.wait(1.0)
+    producer.join()
+    stats = q.stats()
+    assert stats.dropped == 0 and stats.depth == 2 and stats.wait_ms_max >= 150.0
+
+
+class StreamAdapter:
+    def __init__(self, n):
+        self.frames = [{"ts": float(i), "v_an": float(i)} for i in range(1, n + 1)]
+
+    def connect(self, config):
+        return True
+
+    def disconnect(self):
+        pass
+
+    def read_frames(self):
+        frames, self.frames = self.frames[:50], self.frames[50:]
+        return frames
+
+    def write_command(self, command_type, payload=None):
+        return True
+
+
+def test_recorder_keeps_every_frame_while_a_stalled_display_drops(monkeypatch, qapp, tmp_path):
+    from ui.live_status_panel import LiveStatusPanel
+
+    n = 5_000
+    monkeypatch.setattr(serial_reader, "SerialAdapter", lambda: StreamAdapter(n))
+    mgr = serial_reader.SerialManager(block_rate_hz=1000.0, queue_capacity=500)
+    recorder = Recorder(data_dir=str(tmp_path))
+    mgr.add_frame_sink(recorder.log_frames)
+    shown = []
+    mgr.frames_received.connect(lambda block: shown.extend(block.ts.tolist()))
+    recorder.start()
+
+    mgr.connect_serial("COM_TEST")              # GUI thread busy: no events processed
+    deadline = time.time() + 5.0
+    while mgr.get_live_stats().frame_count < n and time.time() < deadline:
+        time.sleep(0.01)
+    mgr.stop()
+    qapp.processEvents()
+    stats = mgr.get_live_stats()
+
+    assert [f["ts"] for f in recorder.to_capsule()["frames"]] == [float(i) for i in range(1, n + 1)]
+    recorder.stop()
+    assert 0 < len(shown) <= 500 + 50 and shown[-1] == float(n)
+    assert stats.frames_dropped == n - len(shown)
+    assert stats.queue_policy == "drop_oldest" and stats.queue_depth == 0
+
+    panel = LiveStatusPanel()
+    stats.connected = True
+    panel.update_stats(stats)
+    assert f"{stats.frames_dropped:,} dropped" in panel._queue_lbl.text()
@@ -0,0 +1,64 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.channel_mapping import ChannelMapper
+from src.file_ingestion import ingest_file
+from src.headless_analysis import _package_dirs, analyze_file, resolve_mapping
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SAMPLE_CSV = REPO_ROOT / "sample_data" / "demo_three_phase.csv"
+SAMPLE_CAPSULE = REPO_ROOT / "sample_data" / "demo_session.json"
+
+
+def test_analyze_command_emits_json_lines_without_importing_qt(tmp_path):
+    script = (
+        "import sys\n"
+        "from src.headless_analysis import main\n"
+        "code = main(sys.argv[1:])\n"
+        "loaded = [m for m in sys.modules if m.split('.')[0] in ('PyQt6', 'pyqtgraph', 'ui')]\n"
+        "print('QT:' + ','.join(loaded), file=sys.stderr)\n"
+        "sys.exit(code)\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script, str(SAMPLE_CSV), str(SAMPLE_CAPSULE),
+         str(tmp_path / "missing.csv"), "--jobs", "2", "--export", str(tmp_path / "out")],
+        cwd=REPO_ROOT, capture_output=True, text=True, timeout=600,
+    )
+
+    assert "QT:\n" in proc.stderr
+    assert proc.returncode == 1                      # one input failed
+    records = [json.loads(line) for line in proc.stdout.splitlines()]
+    assert [Path(r["path"]).name for r in records] == [
+        "demo_three_phase.csv", "demo_session.json", "missing.csv"]
+    ok = records[0]
+    assert ok["status"] == "ok" and ok["scale_factors"] == {"v_an": 100.0, "v_bn": 100.0, "v_cn": 100.0}
+    assert {"ingest", "map", "detect", "metrics", "compliance", "export"} <= ok["timings_s"].keys()
+    assert ok["compliance"]["checks"] and ok["metrics"]["session"]["sample_count"] == ok["rows"]
+    assert (Path(ok["package"]) / "evidence_report.html").exists()
+    assert records[2]["status"] == "error" and records[2]["stage"] == "ingest"
+
+
+def test_saved_mapping_profile_is_applied_and_unknown_profile_fails(tmp_path):
+    profiles = tmp_path / "mappings.json"
+    ChannelMapper(str(profiles)).save_profile(
+        "scope_ab", {"CH1(V)": "v_an", "CH2(V)": "v_bn", "CH3(V)": "aux_ch4"})
+
+    record = analyze_file(str(SAMPLE_CSV), mapping_profile="scope_ab", profiles_path=str(profiles))
+    missing = analyze_file(str(SAMPLE_CSV), mapping_profile="nope", profiles_path=str(profiles))
+
+    assert record["status"] == "ok"
+    assert {"v_an", "v_bn", "aux_ch4"} <= set(record["channels"]) and "v_cn" not in record["channels"]
+    assert missing["status"] == "error" and missing["stage"] == "map"
+    assert "scope_ab" in missing["error"]
+    with pytest.raises(ValueError):
+        resolve_mapping(ingest_file(str(SAMPLE_CSV)), ChannelMapper(str(profiles)), "nope")
+
+
+def test_package_dirs_are_unique_per_input_stem():
+    dirs = _package_dirs(["a/run.csv", "b/run.csv", "c/other.json"], "out")
+    assert [Path(d).name for d in dirs] == ["run", "run_2", "other"]
+    assert _package_dirs(["a.csv"], None) == [None]
@@ -0,0 +1,99 @@
+import json
+import time
+
+import pytest
+
+import src.serial_reader as serial_reader
+from src.latency_probe import STAGES, LatencyHistogram, LatencyProbes
+
+
+def test_histogram_percentiles_and_json_export(tmp_path):
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):                     # 1 … 100 ms
+        histogram.record(ms / 1000.0)
+    summary = histogram.summary()
+    assert summary["count"] == 100 and summary["max_ms"] == 100.0
+    assert summary["mean_ms"] == pytest.approx(50.5)
+    # Bucket upper edges: within one bucket width (~12 %) above the exact value
+    for q, exact in ((50, 50.0), (95, 95.0), (99, 99.0)):
+        assert exact <= summary[f"p{q}_ms"] <= exact * 1.13
+    assert LatencyHistogram().summary()["p99_ms"] == 0.0
+
+    probes = LatencyProbes(enabled=True)
+    probes.record_many("rendered", [time.perf_counter() - 0.010] * 3)
+    data = json.loads(probes.export_json(tmp_path / "lat.json").read_text())
+    assert list(data["stages"]) == list(STAGES)
+    rendered = data["stages"]["rendered"]
+    assert rendered["count"] == 3 and 10.0 <= rendered["p50_ms"] < 12.0
+    assert sum(n for _, n in rendered["buckets"]) == 3
+    probes.reset()
+    assert probes.summary()["rendered"]["count"] == 0
+
+
+class StreamAdapter:
+    def __init__(self, n):
+        self.frames = [{"ts": float(i), "v_an": float(i)} for i in range(1, n + 1)]
+
+    def connect(self, config):
+        return True
+
+    def disconnect(self):
+        pass
+
+    def read_frames(self):
+        frames, self.frames = self.frames[:50], self.frames[50:]
+        if frames:
+            self.received_at = time.perf_counter() - 0.020     # came off the wire 20 ms ago
+        return frames
+
+    def write_command(self, command_type, payload=None):
+        return True
+
+
+def _run(mgr, qapp, n):
+    blocks = []
+    mgr.frames_received.connect(blocks.append)
+    mgr.connect_serial("COM_TEST")
+    deadline = time.time() + 5.0
+    while sum(len(b) for b in blocks) < n and time.time() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+    mgr.stop()
+    qapp.processEvents()
+    return blocks
+
+
+def test_probes_time_every_stage_through_to_the_scope(monkeypatch, qapp):
+    from ui.inverter_scope import InverterScope
+    from ui.latency_panel import LatencyPanel
+
+    monkeypatch.setattr(serial_reader, "SerialAdapter", lambda: StreamAdapter(2_000))
+    mgr = serial_reader.SerialManager(block_rate_hz=100.0)
+    scope = InverterScope(mgr)
+    scope.render_timer.stop()
+    other_view = InverterScope(mgr)                 # e.g. the diagnostics page's scope
+    other_view.render_timer.stop()
+    mgr.latency_probes.set_renderer(scope)
+    panel = LatencyPanel(mgr.latency_probes)
+
+    blocks = _run(mgr, qapp, 2_000)                 # probes off
+    assert blocks and all(b.received_at is None for b in blocks)
+    scope._update_plot()
+    assert all(s["count"] == 0 for s in mgr.latency_probes.summary().values())
+
+    panel.set_enabled(True)
+    blocks = _run(mgr, qapp, 2_000)
+    other_view._update_plot()
+    scope._update_plot()
+    summary = mgr.latency_probes.summary()
+    assert all(b.received_at is not None for b in blocks)
+    assert summary["normalize"]["count"] >= len(blocks)
+    assert summary["emit"]["count"] == summary["handled"]["count"] == len(blocks)
+    assert summary["rendered"]["count"] == len(blocks)
+    assert summary["normalize"]["p50_ms"] <= summary["rendered"]["p99_ms"]
+    assert summary["normalize"]["p50_ms"] >= 20.0    # timed from the adapter's own stamp
+
+    panel.refresh()
+    assert panel._table.item(STAGES.index("handled"), 0).text() == f"{len(blocks):,}"
+    panel.set_enabled(False)
+    assert mgr.latency_probes.enabled is False
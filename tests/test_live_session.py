@@ -120,7 +120,7 @@ def test_recorder_to_capsule_does_not_stop_recording():
     assert rec.is_recording is True
     # We can still log more frames
     rec.log_frame(_make_test_frames(1)[0])
-    assert len(rec.buffer) == 6
+    assert rec.frame_count == 6
 
 
 def test_recorder_to_capsule_returns_copy_not_reference():
@@ -132,7 +132,8 @@ def test_recorder_to_capsule_returns_copy_not_reference():
     capsule = rec.to_capsule()
     # Mutating the capsule frames list must not mutate the recorder buffer
     capsule["frames"].clear()
-    assert len(rec.buffer) == 5
+    assert rec.frame_count == 5
+    assert len(rec.to_capsule()["frames"]) == 5
 
 
 def test_recorder_to_capsule_detects_channels():
@@ -0,0 +1,56 @@
+import json
+import struct
+
+import pytest
+
+from scripts.telemetry_load_generator import FrameEncoder, LoadProfile
+from tests.test_binary_protocol import needs_pty
+
+
+def test_profiles_schedule_the_requested_pattern():
+    steady = LoadProfile(rate_hz=1000.0, duration_s=1.0)
+    assert steady.total_frames() == 1000
+    assert steady.frames_due(0.0) == 1 and steady.frames_due(0.0105) == 11
+    assert steady.send_time(500) == pytest.approx(0.5)
+
+    burst = LoadProfile(rate_hz=1000.0, duration_s=1.0, pattern="burst", burst_size=100)
+    assert burst.total_frames() == 1000
+    assert burst.frames_due(0.0) == 100 and burst.frames_due(0.099) == 100
+    assert burst.frames_due(0.1) == 200 and burst.send_time(199) == pytest.approx(0.1)
+
+    on_off = LoadProfile(rate_hz=1000.0, duration_s=2.0, pattern="on_off", on_s=0.25, off_s=0.75)
+    assert on_off.total_frames() == 500                   # 250 per 1 s period
+    assert on_off.frames_due(0.5) == 250 and on_off.send_time(250) == pytest.approx(1.0)
+
+    assert LoadProfile(channels=3).channel_names() == ("v_an", "v_bn", "v_cn")
+    assert LoadProfile(channels=10).channel_names()[-2:] == ("aux_00", "aux_01")
+    with pytest.raises(ValueError):
+        LoadProfile(pattern="sawtooth")
+
+
+def test_encoder_writes_both_wire_formats():
+    profile = LoadProfile(rate_hz=2000.0, channels=12)
+    data = FrameEncoder(profile, "opal").encode(0, 3, 100.0, profile.send_time)
+    frames = []
+    while data:
+        (n,) = struct.unpack(">I", data[:4])
+        frames.append(json.loads(data[4:4 + n]))
+        data = data[4 + n:]
+    assert [f["ts"] for f in frames] == [100.0, 100.0005, 100.001]
+    assert list(frames[0])[1:] == list(profile.channel_names())
+
+    lines = FrameEncoder(profile, "serial").encode(5, 7, 0.0, profile.send_time).split(b"\n")
+    assert lines[-1] == b"" and json.loads(lines[1])["ts"] == 0.003
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("transport", ["opal", pytest.param("serial", marks=needs_pty)])
+def test_live_chain_records_every_frame_under_load(transport, qapp):
+    from scripts.live_pipeline_benchmark import run_case
+
+    result = run_case(transport, LoadProfile(rate_hz=2000.0, channels=12, duration_s=1.0,
+                                             pattern="burst", burst_size=200))
+    assert result["sent"] == 2000
+    assert result["recorded"] == 2000 and result["lost"] == 0
+    assert 0.0 < result["e2e_ms_p50"] <= result["e2e_ms_p99"] <= result["e2e_ms_max"]
+    assert result["render_ms_p99"] > 0.0
@@ -1,6 +1,12 @@
 import time
 
-from src.models import make_insight_event, normalize_frame
+from src.models import (
+    _normalize_uncompiled,
+    frame_schema,
+    make_insight_event,
+    normalize_frame,
+    normalize_frames,
+)
 
 
 def test_normalize_frame_canonical_keys_passthrough():
@@ -64,6 +70,49 @@ def test_normalize_frame_missing_required_floats_filled_with_zero():
     assert f["p_mech"] == 0.0
 
 
+def test_compiled_schema_matches_key_by_key_normalisation():
+    raws = [
+        {"Va": 1.0, "v_an": 2.0, "t_ms": 1500, "p_kw": "2", "freq": "bad"},
+        {"v_an": 2.0, "Va": 1.0, "t_ms": "x", "q_kvar": None, "fault_type": "sag"},
+        {"ts": -1.0, "Ia": "3.5", "i_a": None, "status": "run"},
+        {"time": 4.0, "timestamp": 5.0, "vdc": 400},
+    ]
+    for raw in raws + raws:
+        expected = _normalize_uncompiled(raw)
+        actual = normalize_frame(raw)
+        assert list(actual) == list(expected)
+        expected.pop("ts"), actual.pop("ts")       # wall-clock fallback for some
+        assert actual == expected
+
+    first, second, third, fourth = (normalize_frame(raw) for raw in raws)
+    assert (first["ts"], first["v_an"], first["p_mech"], first["freq"]) == (1.5, 2.0, 2000.0, 0.0)
+    assert (second["v_an"], second["q"]) == (2.0, None)
+    assert third["ts"] > 1e9 and third["i_a"] == 0.0
+    assert fourth["ts"] == 4.0
+    assert frame_schema(raws[0]) is frame_schema(dict(raws[0]))
+
+
+def test_normalize_frames_switches_schema_and_reports_present_channels():
+    canonical = {"ts": 1.0, "v_an": 1.0, "i_a": 2.0, "freq": 60.0}
+    arduino = {"t_ms": 2000, "vdc": 400.0}
+    reordered = {"vdc": 401.0, "t_ms": 3000}
+    frames, present = normalize_frames([canonical, arduino, reordered, canonical])
+    assert [f["ts"] for f in frames] == [1.0, 2.0, 3.0, 1.0]
+    assert frames[2]["v_dc"] == 401.0 and frames[2]["p_mech"] == 0.0
+    assert present == {"v_an", "i_a", "freq", "v_dc"}
+    frames, present = normalize_frames([canonical])
+    assert present is frame_schema(canonical).present
+
+
+def test_normalize_frames_can_leave_missing_channels_absent():
+    dc_board = {"t_ms": 2000, "vdc": 400.0, "source": "board"}
+    frames, present = normalize_frames([dc_board], fill_missing=False)
+    assert frames == [{"ts": 2.0, "v_dc": 400.0, "source": "board"}]
+    assert present == {"v_dc", "source"}
+    assert normalize_frame(dc_board)["v_an"] == 0.0
+    assert normalize_frames([dc_board])[0][0]["i_a"] == 0.0
+
+
 def test_make_insight_event_defaults_and_fields():
     evt = make_insight_event(
         ts=12.3,
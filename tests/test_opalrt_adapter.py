@@ -0,0 +1,73 @@
+import json
+import socket
+import struct
+
+from scripts.opalrt_stream_benchmark import message, run_stream
+from src.io_adapter import OpalRTAdapter
+
+
+class ChunkedSocket:
+    """Socket stand-in delivering a byte stream in fixed-size recv_into chunks."""
+
+    def __init__(self, data, chunk):
+        self.data = data
+        self.chunk = chunk
+        self.pos = 0
+
+    def recv_into(self, buf):
+        if self.pos >= len(self.data):
+            raise socket.timeout()
+        n = min(self.chunk, len(buf), len(self.data) - self.pos)
+        buf[:n] = self.data[self.pos:self.pos + n]
+        self.pos += n
+        return n
+
+    def close(self):
+        pass
+
+
+def _adapter(data, chunk):
+    adapter = OpalRTAdapter()
+    adapter.sock = ChunkedSocket(data, chunk)
+    adapter._connected = True
+    return adapter
+
+
+def _encode(obj):
+    payload = obj if isinstance(obj, bytes) else json.dumps(obj).encode("utf-8")
+    return struct.pack(">I", len(payload)) + payload
+
+
+def test_every_message_is_returned_across_chunk_boundaries_and_buffer_growth():
+    big = {"ts": 5.0, "wave": list(range(30_000))}   # larger than the receive buffer
+    stream = b"".join(message(k) for k in range(1, 5)) + _encode(big) + message(6)
+    adapter = _adapter(stream, chunk=999)
+
+    frames = []
+    for _ in range(len(stream) // 999 + 2):
+        frames.extend(adapter.read_frames())
+
+    assert [f["ts"] for f in frames] == [1e-4, 2e-4, 3e-4, 4e-4, 5.0, 6e-4]
+    assert frames[4]["wave"][-1] == 29_999
+    assert len(adapter._rx) > OpalRTAdapter.RECV_BUFFER_BYTES
+    assert adapter._connected
+
+
+def test_malformed_messages_are_skipped_without_losing_the_stream():
+    stream = (_encode({"ts": 1.0}) + _encode(b"{not json") + _encode([1, 2])
+              + _encode({"ts": 2.0}) + struct.pack(">I", OpalRTAdapter.MAX_MESSAGE_BYTES + 1))
+    adapter = _adapter(stream, chunk=len(stream))
+
+    frames = adapter.read_frames()
+
+    assert [f["ts"] for f in frames] == [1.0, 2.0]
+    assert adapter.malformed_messages == 3
+    assert adapter.read_frame() is None
+
+
+def test_stand_in_server_stream_arrives_complete_and_in_order():
+    result = run_stream(5_000, rate_hz=0.0, timeout=30.0)
+
+    assert result["frames"] == 5_000
+    assert result["first"]["ts"] == 0.0 and result["last"]["ts"] == round(4_999 / 10_000.0, 6)
+    assert result["malformed"] == 0
@@ -0,0 +1,43 @@
+import numpy as np
+
+from src.plot_decimation import columns_for, envelope_decimate
+from src.session_exporter import _group_series
+
+
+def test_envelope_keeps_short_transient_that_striding_drops():
+    t = np.arange(2_000_003) / 1e6
+    y = np.sin(2 * np.pi * 60.0 * t)
+    y[1_000_037:1_000_040] = -900.0       # three-sample transient off any stride grid
+
+    assert y[::200].min() > -2.0           # the old [::step] reduction misses it
+    t_out, y_out = envelope_decimate(t, y, columns_for(12, 140))
+
+    assert t_out.size <= 2 * columns_for(12, 140)
+    assert y_out.min() == -900.0
+    assert y_out.max() == y.max()
+    assert np.all(np.diff(t_out) >= 0)     # min/max kept in sample order
+
+
+def test_envelope_breaks_line_across_nan_gaps_and_passes_small_series():
+    t = np.arange(10_000, dtype=float)
+    y = np.ones_like(t)
+    y[4_000:6_000] = np.nan
+
+    _, y_out = envelope_decimate(t, y, 100)
+    assert np.isnan(y_out).any()
+    assert np.nanmax(y_out) == 1.0
+
+    t_small, y_small = envelope_decimate(t[:50], y[:50], 100)
+    assert t_small.size == 50 and np.array_equal(y_small, y[:50])
+
+
+def test_html_group_series_are_reduced_per_channel():
+    frames = [{"ts": i * 1e-4, "v_an": float(i % 13), "v_bn": None} for i in range(50_000)]
+    frames[12_345]["v_an"] = 500.0
+
+    series = _group_series(frames, ["v_an", "v_bn"])
+
+    assert [ch for _, ch, _, _ in series] == ["v_an"]   # absent channel not plotted
+    _, _, t, values = series[0]
+    assert t.size == values.size <= 2 * columns_for(9, 90)
+    assert values.max() == 500.0
@@ -0,0 +1,144 @@
+import time
+
+import numpy as np
+import pytest
+
+import src.serial_reader as serial_reader
+from src.io_adapter import IOAdapter
+from src.process_acquisition import ProcessAcquisitionAdapter
+from src.shared_ring import SharedRing
+
+
+class BurstAdapter(IOAdapter):
+    """Arduino-style raw frames, 100 per read; the last command shows up as ``status``."""
+
+    TOTAL = 2_000
+
+    def __init__(self):
+        self.k = 0
+        self.status = "idle"
+
+    def connect(self, config):
+        return True
+
+    def disconnect(self):
+        pass
+
+    def read_frame(self):
+        frames = self.read_frames()
+        return frames[0] if frames else None
+
+    def read_frames(self):
+        frames = []
+        while self.k < self.TOTAL and len(frames) < 100:
+            self.k += 1
+            frames.append({"t_ms": self.k, "vdc": 400.0 + self.k,
+                           "fault_type": "sag" if self.k % 2 else None, "status": self.status})
+        return frames
+
+    def write_command(self, command_type, payload=None):
+        self.status = payload["mode"]
+        self.TOTAL += 1
+        return True
+
+
+class StampedBurstAdapter(BurstAdapter):
+    """BurstAdapter whose frames came off the transport a quarter second before the read."""
+
+    def read_frames(self):
+        self.received_at = time.perf_counter() - 0.25
+        return super().read_frames()
+
+
+def _drain(adapter, n, timeout=20.0):
+    frames = []
+    deadline = time.time() + timeout
+    while len(frames) < n and time.time() < deadline:
+        frames.extend(adapter.read_frames())
+        time.sleep(0.001)
+    return frames
+
+
+def test_shared_ring_counts_overwritten_rows_as_lost():
+    ring = SharedRing(capacity=8, width=2)
+    reader = SharedRing(capacity=8, width=2, name=ring.name)
+    try:
+        ring.write(np.array([[k, -k] for k in range(5)], dtype=float))
+        assert reader.read()[:, 0].tolist() == [0, 1, 2, 3, 4]
+
+        ring.write(np.array([[k, -k] for k in range(5, 25)], dtype=float))
+        assert reader.read()[:, 0].tolist() == list(range(17, 25))
+        assert reader.lost == 12 and reader.read().shape == (0, 2)
+
+        # A write in progress (claimed, not yet published) tears exactly the
+        # unread rows whose slots it reaches.
+        ring.write(np.array([[25, -25]], dtype=float))
+        ring._header[3] = 33                        # rows 26..32: row 25 intact
+        assert reader.read()[:, 0].tolist() == [25] and reader.lost == 12
+        ring.write(np.array([[26, -26]], dtype=float))
+        ring._header[3] = 35                        # row 34 overwrites row 26
+        assert reader.read().shape == (0, 2) and reader.lost == 13
+        with pytest.raises(ValueError):
+            SharedRing(capacity=4, width=2, name=ring.name)
+    finally:
+        reader.close()
+        ring.close()
+
+
+def test_child_process_delivers_normalized_frames_and_commands():
+    adapter = ProcessAcquisitionAdapter(StampedBurstAdapter)
+    assert adapter.connect()
+    try:
+        frames = _drain(adapter, BurstAdapter.TOTAL)
+        assert adapter.write_command("SET_MODE", {"mode": "run"})
+        frames += _drain(adapter, 1)
+        avg_ms, max_ms = adapter.latency_ms()
+        # Receive is the child adapter's stamp, carried across the ring
+        assert time.perf_counter() - adapter.received_at >= 0.25
+    finally:
+        adapter.disconnect()
+
+    assert len(frames) == BurstAdapter.TOTAL + 1
+    first, last = frames[0], frames[-1]
+    assert first["ts"] == pytest.approx(0.001) and first["v_dc"] == 401.0
+    assert first["v_an"] == 0.0 and "angle" not in first
+    assert (first["fault_type"], frames[1]["fault_type"]) == ("sag", None)
+    assert (first["status"], last["status"]) == ("idle", "run")
+    assert adapter.present_channels == {"v_dc", "fault_type", "status"}
+    assert adapter.frames_lost == 0
+    assert 250.0 <= avg_ms <= max_ms
+
+
+def test_frames_the_gui_process_does_not_read_in_time_are_counted_lost():
+    adapter = ProcessAcquisitionAdapter(BurstAdapter, capacity=256)
+    assert adapter.connect()
+    try:
+        deadline = time.time() + 20.0
+        while adapter._ring.written < BurstAdapter.TOTAL and time.time() < deadline:
+            time.sleep(0.01)
+        frames = adapter.read_frames()
+    finally:
+        adapter.disconnect()
+
+    assert len(frames) == 256
+    assert frames[-1]["ts"] == pytest.approx(BurstAdapter.TOTAL / 1000.0)
+    assert adapter.frames_lost == BurstAdapter.TOTAL - 256
+
+
+def test_serial_manager_reports_loss_and_latency_out_of_process(qapp):
+    mgr = serial_reader.SerialManager()
+    mgr.connect_serial("MOCK", acquisition_process=True)
+    try:
+        assert isinstance(mgr.adapter, ProcessAcquisitionAdapter)
+        deadline = time.time() + 20.0
+        while mgr.get_live_stats().frame_count < 10 and time.time() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+        stats = mgr.get_live_stats()
+    finally:
+        mgr.stop()
+    qapp.processEvents()
+
+    assert stats.frame_count >= 10 and stats.frames_lost == 0
+    assert 0.0 < stats.latency_ms_max < 1000.0
+    assert {"v_an", "i_a", "freq", "angle"} <= stats.present_channels
@@ -58,3 +58,70 @@ def test_data_capsule_structure(recorder):
     assert len(data["events"]) == 1
     assert data["frames"][0]["v"] == 100
     assert data["events"][0]["type"] == "TEST_EVENT"
+
+
+def _frames(n, start=0):
+    return [{"ts": 1.0 + (start + k) * 0.001, "v_an": float(start + k), "freq": 60.0} for k in range(n)]
+
+def test_frames_stream_to_spool_and_memory_stays_bounded(recorder):
+    recorder.chunk_frames = 50
+    recorder.start()
+    for frame in _frames(1000):
+        recorder.log_frame(frame)
+        assert len(recorder.buffer) < 50
+
+    capsule = recorder.to_capsule()
+    assert os.path.exists(recorder.spool_path)
+    assert [f["v_an"] for f in capsule["frames"]] == [float(k) for k in range(1000)]
+    assert capsule["meta"]["frame_count"] == 1000
+
+    filepath = recorder.stop()
+    with open(filepath) as f:
+        data = json.load(f)
+    assert len(data["frames"]) == 1000 and data["frames"][-1]["v_an"] == 999.0
+    assert data["meta"]["sample_rate_estimate"] == pytest.approx(1000.0)
+    assert os.listdir(TEST_DIR) == [os.path.basename(filepath)]
+
+def test_interrupted_recording_is_recovered_from_spool(recorder):
+    recorder.chunk_frames = 50
+    recorder.start()
+    for frame in _frames(10):
+        recorder.log_frame(frame)
+    recorder.log_event("fault", "voltage_sag")
+    for frame in _frames(110, start=10):
+        recorder.log_frame(frame)
+    recorder._writer.sync()
+    with open(recorder.spool_path, "a") as f:
+        f.write('{"ts": 9.9, "v_an"')          # torn write at the moment of the crash
+
+    filepath = Recorder.recover(recorder.spool_path)
+
+    with open(filepath) as f:
+        data = json.load(f)
+    assert data["meta"]["recovered"] is True
+    assert data["meta"]["session_id"] == recorder.session_id
+    assert len(data["frames"]) == 100           # the 20-frame tail was still in memory
+    assert [e["details"] for e in data["events"]] == ["voltage_sag"]
+
+def test_capsule_reads_the_spool_outside_the_lock(recorder, monkeypatch):
+    import src.recorder as recorder_module
+
+    recorder.chunk_frames = 50
+    recorder.start()
+    for frame in _frames(120):
+        recorder.log_frame(frame)
+    read_frame_lines = recorder_module._frame_lines
+
+    def frame_lines(*args, **kwargs):
+        assert not recorder._lock._is_owned()
+        for frame in _frames(100, start=120):   # recording carries on meanwhile
+            recorder.log_frame(frame)
+        recorder._writer.sync()
+        yield from read_frame_lines(*args, **kwargs)
+
+    monkeypatch.setattr(recorder_module, "_frame_lines", frame_lines)
+    capsule = recorder.to_capsule()
+    assert [f["v_an"] for f in capsule["frames"]] == [float(k) for k in range(120)]
+    monkeypatch.undo()
+    assert len(recorder.to_capsule()["frames"]) == 220
+    recorder.stop()
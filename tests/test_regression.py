@@ -0,0 +1,138 @@
+import math
+import time
+
+import numpy as np
+import pytest
+
+from src.file_ingestion import ImportedDataset
+from src.regression import BaselineReference, run_features, run_regression
+
+
+def _run(gain: float = 1.0, freq_dip: float = 0.0, n: int = 6000, t0: float = 0.0,
+         label: str = "run") -> ImportedDataset:
+    sample_rate = 5000.0
+    time_axis = np.arange(n, dtype=np.float64) / sample_rate
+    peak = 120.0 * math.sqrt(2.0)
+    freq = np.full(n, 60.0)
+    freq[n // 2: n // 2 + 100] -= freq_dip
+    channels = {
+        "v_an": gain * peak * np.sin(2.0 * math.pi * 60.0 * time_axis),
+        "v_bn": peak * np.sin(2.0 * math.pi * 60.0 * time_axis - 2.0 * math.pi / 3.0),
+        "freq": freq,
+    }
+    return ImportedDataset(
+        source_type="rigol_csv",
+        source_path=f"/fake/{label}.csv",
+        channels=channels,
+        time=time_axis + t0,
+        sample_rate=sample_rate,
+        duration=float(time_axis[-1]),
+        raw_headers=list(channels),
+    )
+
+
+def test_run_features_reports_thd_and_nadir():
+    features = run_features(_run(freq_dip=0.4))
+
+    assert set(features.thd_pct) == {"v_an", "v_bn"}
+    assert features.thd_pct["v_an"] < 1.0
+    assert math.isclose(features.nadir_hz, 59.6)
+    assert features.recovery_time_s == 0.0
+
+
+def test_recovery_time_is_the_longest_sag_not_the_span_between_sags():
+    dataset = _run(n=10000)
+    v_an = dataset.channels["v_an"]
+    v_an[3000:3250] *= 0.5                 # 50 ms sag
+    v_an[7000:7500] *= 0.5                 # 100 ms sag, 0.8 s after the first
+    features = run_features(dataset)
+
+    assert 0.09 <= features.recovery_time_s <= 0.12
+
+
+def test_regression_ranks_runs_by_deviation_from_baseline():
+    baseline = BaselineReference(_run(label="golden"), label="golden")
+    matrix = run_regression(
+        baseline,
+        {
+            "identical": _run(t0=12.5),
+            "mild": _run(gain=1.1),
+            "severe": _run(gain=1.5, freq_dip=0.3),
+        },
+        max_workers=3,
+    )
+
+    assert matrix.baseline_label == "golden"
+    assert matrix.ranking == ["severe", "mild", "identical"]
+    assert matrix.run_scores["identical"] < 1e-9
+    assert not matrix.errors
+
+    by_key = {(e.run_label, e.channel): e for e in matrix.entries}
+    assert by_key[("severe", "v_bn")].rmse < 1e-9
+    assert by_key[("severe", "v_an")].rmse > by_key[("mild", "v_an")].rmse
+    assert math.isclose(by_key[("severe", "v_an")].nadir_delta_hz, -0.3, abs_tol=1e-9)
+    assert by_key[("severe", "freq")].thd_delta_pct is None
+
+    rows = matrix.rows()
+    assert rows[0]["rank"] == 1 and rows[0]["run"] == "severe"
+    assert rows[-1]["run"] == "identical"
+
+
+def test_regression_isolates_failed_runs_and_writes_csv(tmp_path):
+    matrix = run_regression(
+        _run(label="golden"),
+        [_run(gain=1.2, label="candidate"), str(tmp_path / "missing.csv")],
+        max_workers=2,
+    )
+
+    assert matrix.ranking == ["candidate.csv"]
+    assert "missing.csv" in matrix.errors
+
+    out = matrix.to_csv(str(tmp_path / "out" / "regression.csv"))
+    with open(out) as fh:
+        lines = fh.read().splitlines()
+    assert lines[0].startswith("rank,run,channel,rmse")
+    assert len(lines) == 1 + len(matrix.entries)
+
+
+def test_comparison_panel_regression_table(qapp, monkeypatch):
+    from src.dataset_converter import dataset_to_session
+    from ui.comparison_panel import ComparisonPanel
+
+    def _session(label, gain):
+        dataset = _run(gain=gain, label=label)
+        return {"label": label, "data": dataset_to_session(dataset), "_dataset": dataset}
+
+    panel = ComparisonPanel()
+    base, mild, severe = _session("base", 1.0), _session("mild", 1.1), _session("severe", 1.4)
+    panel.set_sessions(base, mild)
+    panel.set_candidate_sessions([mild, severe])
+    panel.run_regression([])
+
+    deadline = time.time() + 20.0
+    while panel._last_regression is None and time.time() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+
+    assert panel._last_regression is not None
+    assert panel._last_regression.ranking == ["severe", "mild"]
+    assert panel._regression_table.rowCount() == len(panel._last_regression.entries)
+    assert panel._regression_table.item(0, 1).text() == "severe"
+
+    # A second run reuses the prepared baseline instead of rebuilding it
+    reference = panel._baseline_ref
+    assert reference is not None
+    monkeypatch.setattr("ui.comparison_panel.BaselineReference",
+                        lambda *a, **k: pytest.fail("baseline rebuilt"))
+    panel._last_regression = None
+    panel.run_regression([])
+    deadline = time.time() + 20.0
+    while panel._last_regression is None and time.time() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    assert panel._last_regression.ranking == ["severe", "mild"]
+    assert panel._baseline_ref is reference
+    panel.set_sessions(mild, severe)
+    assert panel._baseline_ref is None
+    panel.clear()
+    assert panel._regression_table.rowCount() == 0
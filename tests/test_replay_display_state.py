@@ -162,3 +162,71 @@ def test_compare_auto_populates_after_overlay_load(qapp):
     assert result is not None
     assert result.channels
     assert studio._comparison_tab._selected_channel() is not None
+
+
+def test_region_stats_panel_reports_selected_window(qapp):
+    _ = qapp
+    ds = _make_dataset(duration_s=0.1, n=2000)
+    capsule = dataset_to_session(ds, session_id="region_test")
+    studio = ReplayStudio(Recorder(), _FakeSerialMgr())
+    studio.load_session_from_dict(capsule, label="region_test", is_primary=True)
+
+    studio.chk_region.setChecked(True)
+    table = studio._region_table
+    # The index is built on a worker; the table says so meanwhile
+    assert table.rowCount() == 1 and table.item(0, 0).text() == "building…"
+    deadline = time.time() + 10.0
+    while studio._region_index is None and time.time() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    index = studio._region_index
+    assert index is not None and set(index._indices) == set(index.channels)
+
+    studio._region.setRegion((0.0, 0.1))
+    studio._on_region_finished()
+    rows = {table.item(r, 0).text(): r for r in range(table.rowCount())}
+    assert "v_an" in rows
+    rms = float(table.item(rows["v_an"], 3).text())
+    assert abs(rms - 120.0 / np.sqrt(2.0)) < 1.0
+    assert float(table.item(rows["v_an"], 7).text()) < 5.0
+
+    # Too few cycles for a meaningful THD: stats still update, THD is blank.
+    studio._region.setRegion((0.0, 0.03))
+    studio._on_region_finished()
+    assert table.item(rows["v_an"], 7).text() == "—"
+
+    studio.chk_region.setChecked(False)
+    assert table.rowCount() == 0
+
+
+def test_reopening_a_large_session_reuses_its_capped_events(qapp, monkeypatch):
+    import ui.replay_studio as replay_studio
+    from src.analysis_cache import default_analysis_cache
+
+    ds = _make_dataset(duration_s=1.0, n=120_000)
+    ds.meta["source_hash_sha256"] = "ef" * 32
+    capsule = dataset_to_session(ds, session_id="large_events")
+    capsule["_dataset"] = ds
+    session = {"label": "large_events", "_dataset": ds, "data": capsule}
+
+    calls = []
+
+    def counting_detect_events(dataset):
+        calls.append(dataset.time.size)
+        return []
+
+    monkeypatch.setattr(replay_studio, "detect_events", counting_detect_events)
+    cache = default_analysis_cache()
+    studio = ReplayStudio(Recorder(), _FakeSerialMgr())
+    studio._start_background_event_detection(session)
+    deadline = time.time() + 10.0
+    while cache.load_events(capsule, max_samples=50_000) is None and time.time() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    assert calls and calls[0] < 120_000                # detection ran on the decimated copy
+    assert cache.load_events(capsule) is None          # full-resolution slot untouched
+
+    reopened = ReplayStudio(Recorder(), _FakeSerialMgr())
+    reopened._start_background_event_detection(session)
+    qapp.processEvents()
+    assert len(calls) == 1
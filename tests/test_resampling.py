@@ -0,0 +1,63 @@
+import gc
+
+import numpy as np
+
+from src.file_ingestion import ImportedDataset
+from src.resampling import ResampleCache, nice_rate, resample_uniform, uniform_rate
+
+
+def _dataset(n: int = 4000, sr: float = 4000.0) -> ImportedDataset:
+    t = np.arange(n) / sr
+    return ImportedDataset(
+        source_type="rigol_csv",
+        source_path="/fake/r.csv",
+        channels={"v_an": np.sin(2 * np.pi * 50.0 * t)},
+        time=t,
+        sample_rate=sr,
+        duration=float(t[-1]),
+        raw_headers=["v_an"],
+    )
+
+
+def test_uniform_rate_detects_jitter():
+    t = np.arange(1000) / 1000.0
+    assert abs(uniform_rate(t) - 1000.0) < 1e-6
+    jittered = t + np.random.default_rng(0).uniform(-2e-4, 2e-4, t.size)
+    assert uniform_rate(jittered) is None
+
+
+def test_nice_rate_rounds_down_to_125_series():
+    assert nice_rate(730.0) == 500.0
+    assert nice_rate(1999.0) == 1000.0
+    assert nice_rate(2000.0) == 2000.0
+    assert nice_rate(0.0) == 0.0
+
+
+def test_resample_uniform_polyphase_and_interp_fallback():
+    t = np.arange(10_000) / 10_000.0
+    y = np.sin(2 * np.pi * 10.0 * t)
+
+    t_out, y_out = resample_uniform(t, y, 1_000.0)
+    assert t_out.size == 1_000
+    assert np.allclose(np.diff(t_out), 1e-3)
+    assert np.max(np.abs(y_out[20:-20] - np.sin(2 * np.pi * 10.0 * t_out[20:-20]))) < 1e-2
+
+    t_jit = t.copy()
+    t_jit[1::2] += 3e-5
+    t_out, y_out = resample_uniform(t_jit, y, 1_000.0)
+    assert np.allclose(np.diff(t_out), 1e-3)
+    assert y_out.size == t_out.size
+
+
+def test_resample_cache_hits_and_drops_collected_datasets():
+    cache = ResampleCache()
+    dataset = _dataset()
+
+    first = cache.get(dataset, "v_an", 1000.0)
+    second = cache.get(dataset, "v_an", 1000.0)
+    assert first is second
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    del dataset, first, second
+    gc.collect()
+    assert len(cache) == 0
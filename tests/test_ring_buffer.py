@@ -0,0 +1,72 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+from hil_core.signals import SignalEngine
+from src.ring_buffer import RingBuffer
+
+
+def test_blocks_wrap_like_a_bounded_deque_and_views_share_storage():
+    ring = RingBuffer(("ts", "v"), capacity=7)
+    reference = deque(maxlen=7)
+    k = 0
+    for size in (3, 5, 1, 7, 0, 12, 2, 4):
+        block = np.arange(k, k + size, dtype=float)
+        ring.push_block(np.vstack([block, -block]))
+        reference.extend(block.tolist())
+        k += size
+
+        window = ring.latest()
+        assert window[0].tolist() == list(reference)
+        assert window[1].tolist() == [-x for x in reference]
+        assert ring.channel("ts", 3).tolist() == list(reference)[-3:]
+        assert np.shares_memory(window, ring.latest(2))
+        assert window.base is not None and window[0].flags.c_contiguous
+
+
+def test_push_columns_fills_absent_channels_and_rejects_ragged_input():
+    ring = RingBuffer(("ts", "a", "b"), capacity=4)
+    ring.push_columns({"ts": [1.0, 2.0], "a": [3.0, 4.0], "unknown": [0.0, 0.0]})
+    ring.push([3.0, 5.0, 6.0])
+
+    assert len(ring) == 3 and "b" in ring
+    assert ring.channel("a").tolist() == [3.0, 4.0, 5.0]
+    assert np.isnan(ring.channel("b", 3)[:2]).all()
+    with pytest.raises(ValueError):
+        ring.push_columns({"ts": [1.0], "a": [1.0, 2.0]})
+    with pytest.raises(ValueError):
+        ring.push_block(np.zeros((2, 5)))
+
+    ring.clear()
+    assert len(ring) == 0 and ring.latest().shape == (3, 0)
+
+
+def test_windowed_stats_are_per_channel():
+    ring = RingBuffer(("x", "y"), capacity=100)
+    t = np.arange(100) / 100.0
+    ring.push_block(np.vstack([np.sin(2 * np.pi * 5 * t) * 2.0, np.full(100, -3.0)]))
+
+    assert ring.rms() == pytest.approx([np.sqrt(2.0), 3.0])
+    assert ring.peak() == pytest.approx([2.0, 3.0], abs=1e-9)
+    assert ring.mean(10)[1] == pytest.approx(-3.0)
+    assert RingBuffer(("x",), 4).rms().tolist() == [0.0]
+
+
+def test_signal_engine_keeps_channels_aligned_with_time():
+    engine = SignalEngine(buffer_size=8)
+    for i in range(10):
+        channels = {"Va": float(i)}
+        if i % 2:
+            channels["Ib"] = float(-i)
+        engine.push_sample(channels, timestamp=i * 0.1)
+    engine.push_samples([1.0, 1.1], {"Va": [10.0, 11.0], "i_b": [-10.0, -11.0]})
+
+    t, va = engine.get_channel_data("v_an")
+    t_ib, ib = engine.get_channel_data("Ib")
+    assert va.tolist() == [4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0]
+    assert t_ib.tolist() == pytest.approx([0.5, 0.7, 0.9, 1.0, 1.1])
+    assert ib.tolist() == [-5.0, -7.0, -9.0, -10.0, -11.0]
+    assert engine.get_channel_data("v_bn")[1].size == 0 and engine.get_rms("v_bn") == 0.0
+    assert engine.current_time == pytest.approx(1.1)
+    assert engine.get_all_channels()["i_b"] == ib.tolist()
@@ -1,8 +1,10 @@
 import time
 
+import numpy as np
 import pytest
 
 import src.serial_reader as serial_reader
+from src.frame_block import FrameBlock, connect_frame_stream
 
 
 class FakeAdapter:
@@ -48,6 +50,26 @@ def test_serial_manager_switch_and_command(monkeypatch):
     assert any(cmd[0] == "fault_sag" for cmd in fake.commands)
 
 
+def test_opal_address_without_a_port_reports_a_failed_connection(monkeypatch):
+    configs = []
+    fake = FakeAdapter()
+    fake.connect = lambda config: configs.append(config) or True
+    monkeypatch.setattr(serial_reader, "OpalRTAdapter", lambda: fake)
+
+    mgr = serial_reader.SerialManager()
+    status = []
+    mgr.connection_status.connect(lambda ok, port: status.append((ok, port)))
+    for bad in ("OPAL:rt-target", "OPAL:rt-target:", "OPAL:rt-target:70000"):
+        mgr.connect_serial(bad)
+    assert status == [(False, "OPAL:rt-target"), (False, "OPAL:rt-target:"),
+                      (False, "OPAL:rt-target:70000")]
+    assert not mgr.running and configs == []
+
+    mgr.connect_serial("OPAL:rt-target:5200")
+    mgr.stop()
+    assert configs == [{"host": "rt-target", "port": 5200}]
+
+
 def test_serial_manager_mock_mode(monkeypatch, qapp):
     """Test mock mode with proper Qt event loop handling"""
     from PyQt6.QtTest import QTest
@@ -71,3 +93,106 @@ def test_serial_manager_mock_mode(monkeypatch, qapp):
     
     assert len(received) >= 1, "No frames received from mock mode"
     assert "v_an" in received[0]
+
+
+class ChunkedConn:
+    """pyserial stand-in that returns one scripted chunk per read."""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    @property
+    def in_waiting(self):
+        return len(self.chunks[0]) if self.chunks else 0
+
+    def read(self, size=1):
+        return self.chunks.pop(0) if self.chunks else b""
+
+    def close(self):
+        pass
+
+
+def test_serial_adapter_batches_lines_and_carries_partial_line():
+    from src.io_adapter import SerialAdapter
+
+    adapter = SerialAdapter()
+    adapter.conn = ChunkedConn([
+        b'{"ts": 1, "v_an": 1.5}\n{"ts": 2, "v_a',
+        b'n": 2.5}\n\n{bad json}\n{"ts": 3}\r\n',
+    ])
+
+    first = adapter.read_frames()
+    second = adapter.read_frames()
+
+    assert first == [{"ts": 1, "v_an": 1.5}]
+    assert second == [{"ts": 2, "v_an": 2.5}, {"ts": 3}]
+    assert adapter.malformed_lines == 1
+    assert adapter.read_frames() == []
+
+
+def test_reader_loop_emits_every_frame_of_a_batch(monkeypatch, qapp):
+    class BatchAdapter(FakeAdapter):
+        def read_frames(self):
+            frames, self.frames = self.frames, []
+            return frames
+
+    batch = BatchAdapter(frames=[{"ts": float(i), "v_an": float(i)} for i in range(1, 51)])
+    monkeypatch.setattr(serial_reader, "SerialAdapter", lambda: batch)
+
+    mgr = serial_reader.SerialManager()
+    received = []
+    mgr.frame_received.connect(lambda f: received.append(f["ts"]))
+    mgr.connect_serial("COM_TEST")
+    deadline = time.time() + 2.0
+    while len(received) < 50 and time.time() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    mgr.stop()
+
+    assert received == [float(i) for i in range(1, 51)]
+    assert mgr.get_live_stats().frame_count == 50
+
+
+def test_frame_block_columns_fill_missing_samples():
+    block = FrameBlock.from_frames([
+        {"ts": 0.0, "v_an": 1.0, "fault_type": None},
+        {"ts": 0.1, "fault_type": "sag"},
+    ])
+
+    assert len(block) == 2 and "v_an" in block and "i_a" not in block
+    assert block.column("v_an", 0.0).tolist() == [1.0, 0.0]
+    assert block.column("i_a", 60.0).tolist() == [60.0, 60.0]
+    assert block.extras["fault_type"] == [None, "sag"]
+    assert block.last("fault_type") == "sag"
+
+
+def test_reader_loop_batches_blocks_and_keeps_legacy_frames(monkeypatch, qapp):
+    class StreamAdapter(FakeAdapter):
+        def read_frames(self):
+            frames, self.frames = self.frames[:10], self.frames[10:]
+            return frames
+
+    n = 2_000
+    stream = StreamAdapter(frames=[{"ts": float(i), "v_an": float(i)} for i in range(1, n + 1)])
+    monkeypatch.setattr(serial_reader, "SerialAdapter", lambda: stream)
+
+    mgr = serial_reader.SerialManager(block_rate_hz=50.0)
+    blocks, legacy = [], []
+    connect_frame_stream(mgr, blocks.append)
+    mgr.frame_received.connect(lambda f: legacy.append(f["ts"]))
+    mgr.connect_serial("COM_TEST")
+    deadline = time.time() + 5.0
+    while len(legacy) < n and time.time() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    mgr.stop()
+    qapp.processEvents()
+
+    assert legacy == [float(i) for i in range(1, n + 1)]
+    assert np.concatenate([b.ts for b in blocks]).tolist() == legacy
+    assert len(blocks) < n // 10
+
+    # Frames injected on the per-frame signal reach block subscribers.
+    mgr.frame_received.emit({"ts": -1.0, "v_an": 2.0})
+    assert blocks[-1].column("v_an").tolist() == [2.0]
+    assert legacy[-1] == -1.0
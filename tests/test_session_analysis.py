@@ -1,10 +1,13 @@
 import json
 import math
+from dataclasses import replace
 
 import numpy as np
 
+from src.artifact_cache import ArtifactCache, dataset_fingerprint
 from src.compliance_checker import evaluate_session
 from src.dataset_converter import dataset_to_session
+from src.dataset_archive import load_dataset_npz, write_dataset_npz
 from src.derived_channels import compute_line_to_line_channels
 from src.file_ingestion import ImportedDataset
 from src.report_generator import generate_evidence_package
@@ -194,3 +197,88 @@ def test_evidence_package_can_downsample_preview_csv(tmp_path):
     assert metadata["normalized_csv"]["rows_written"] <= 120
     assert "metrics computed on full-resolution data" in metadata["normalized_csv"]["note"]
     assert len(csv_lines) <= 121
+
+
+def test_evidence_package_ships_full_resolution_binary_dataset(tmp_path):
+    source = _p_mech_only_dataset(n=1200)
+    capsule = dataset_to_session(source)
+    session_path = tmp_path / "p_mech_session.json"
+    session_path.write_text(json.dumps(capsule), encoding="utf-8")
+
+    artifacts = generate_evidence_package(
+        session_path=str(session_path),
+        output_dir=str(tmp_path / "evidence"),
+        preview_csv_max_rows=120,
+    )
+
+    metadata = json.loads((tmp_path / "evidence" / "metadata.json").read_text(encoding="utf-8"))
+    restored = load_dataset_npz(artifacts["dataset_npz"])
+
+    assert metadata["normalized_npz"]["rows_written"] == 1200
+    assert restored.row_count == 1200
+    assert restored.meta["units"]["p_mech"] == "W"
+    assert np.allclose(restored.channels["p_mech"], source.channels["p_mech"])
+
+
+def test_dataset_archive_keeps_time_axis_and_mapped_source_units(tmp_path):
+    time = 1_700_000_000.0 + np.arange(4) / 1000.0
+    dataset = ImportedDataset(
+        source_type="generic_csv",
+        source_path="/fake/inverter.csv",
+        channels={"v_an": np.zeros(4), "p_inv": np.ones(4), "Idc(A)": np.ones(4), "mode": np.ones(4)},
+        time=time,
+        sample_rate=1000.0,
+        duration=0.003,
+        raw_headers=["Va", "Pinv(W)", "Idc(A)", "mode"],
+        meta={"applied_mapping": {"Va": "v_an", "Pinv(W)": "p_inv"}},
+    )
+
+    restored = load_dataset_npz(write_dataset_npz(dataset, tmp_path / "d.npz")["path"])
+
+    assert np.array_equal(restored.time, time)
+    assert restored.meta["units"] == {"v_an": "V", "p_inv": "W", "Idc(A)": "A", "mode": ""}
+
+
+def test_evidence_reexport_reuses_cached_artifacts_across_profiles(tmp_path):
+    capsule = dataset_to_session(_p_mech_only_dataset(n=1200))
+    session_path = tmp_path / "p_mech_session.json"
+    session_path.write_text(json.dumps(capsule), encoding="utf-8")
+    cache = ArtifactCache(tmp_path / "cache")
+
+    first = generate_evidence_package(
+        session_path=str(session_path), output_dir=str(tmp_path / "a"),
+        profile="project_demo", artifact_cache=cache,
+    )
+    second = generate_evidence_package(
+        session_path=str(session_path), output_dir=str(tmp_path / "b"),
+        profile="ieee_2800_inspired", artifact_cache=cache,
+    )
+
+    assert (cache.misses, cache.hits) == (5, 5)
+    for name in ("waveform_overview.png", "normalized_frames.csv", "normalized_dataset.npz"):
+        assert (tmp_path / "a" / name).read_bytes() == (tmp_path / "b" / name).read_bytes()
+    assert second["dataset_npz"] == str((tmp_path / "b" / "normalized_dataset.npz").resolve())
+    assert first["compliance_json"] != second["compliance_json"]
+    assert not list((tmp_path / "b").glob(".*.tmp"))
+
+
+def test_artifact_cache_fingerprints_the_data_and_evicts_least_recently_used(tmp_path):
+    full = _p_mech_only_dataset(n=1200)
+    saved = dataset_to_session(full)
+    imported = dict(saved, _dataset=full)
+    assert dataset_fingerprint(imported, full) != dataset_fingerprint(saved, full)
+    decimated = replace(full, time=full.time[::2], channels={k: v[::2] for k, v in full.channels.items()})
+    assert dataset_fingerprint(imported, full) != dataset_fingerprint(imported, decimated)
+
+    cache = ArtifactCache(tmp_path / "cache", max_bytes=2500)
+    for name in ("a", "b", "c"):
+        produced = tmp_path / f"{name}.bin"
+        produced.write_bytes(b"x" * 1000)
+        assert cache.store(name * 64, produced, {"path": str(produced)})
+        if name == "b":
+            assert cache.fetch("a" * 64, tmp_path / "a_again.bin")[0]   # a is now most recent
+
+    assert cache.evictions == 1 and cache.size_bytes() <= 2500
+    assert not cache.fetch("b" * 64, tmp_path / "b_again.bin")[0]
+    assert cache.fetch("a" * 64, tmp_path / "a_again.bin")[0]
+    assert cache.fetch("c" * 64, tmp_path / "c_again.bin")[0]
@@ -1,7 +1,12 @@
 import numpy as np
 import pytest
 
-from src.signal_processing import compute_rms, compute_thd, extract_three_phase_phasors
+from src.signal_processing import (
+    compute_channel_stats,
+    compute_rms,
+    compute_thd,
+    extract_three_phase_phasors,
+)
 
 
 def _make_sine(freq, fs, duration, amplitude=1.0, phase=0.0):
@@ -56,3 +61,29 @@ def test_compute_thd_noisy_signal_stability():
 
     thd = compute_thd(sig, fundamental_freq=60.0, time_data=t, n_harmonics=10)
     assert thd >= 0.0
+
+
+def test_compute_channel_stats_matches_per_channel_numpy_across_chunks():
+    rng = np.random.default_rng(7)
+    a = rng.normal(3.0, 2.0, 10_007)
+    b = rng.uniform(-5.0, 1.0, 10_007)
+    b[[5, 500, 9_000]] = [np.nan, np.inf, -np.inf]
+    short = np.arange(100, dtype=np.int32)
+
+    stats = compute_channel_stats([a, b, short], chunk_rows=1_000)
+
+    for idx, arr in enumerate((a, b, short.astype(float))):
+        valid = arr[np.isfinite(arr)]
+        assert stats["count"][idx] == valid.size
+        assert stats["min"][idx] == pytest.approx(valid.min())
+        assert stats["max"][idx] == pytest.approx(valid.max())
+        assert stats["mean"][idx] == pytest.approx(valid.mean())
+        assert stats["rms"][idx] == pytest.approx(compute_rms(valid))
+
+
+def test_compute_channel_stats_handles_all_nan_and_empty_columns():
+    stats = compute_channel_stats([np.full(10, np.nan), np.array([])])
+
+    assert stats["count"].tolist() == [0, 0]
+    assert np.isnan(stats["min"]).all()
+    assert np.isnan(stats["rms"]).all()
@@ -60,4 +60,4 @@ def test_phasor_and_replay_smoke(tmp_path):
     assert len(replay.sessions[0]["frames"]) == len(frames)
 
     # Ensure phasor buffer filled
-    assert len(phasor._buf["v_a"]) > 0
+    assert len(phasor._buf) > 0
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from src.window_index import WindowStatsIndex
+
+
+def _reference(values: np.ndarray) -> dict:
+    valid = values[np.isfinite(values)]
+    return {
+        "count": valid.size,
+        "mean": valid.mean(),
+        "rms": np.sqrt(np.mean(valid ** 2)),
+        "min": valid.min(),
+        "max": valid.max(),
+    }
+
+
+def test_window_stats_match_direct_computation_for_random_windows():
+    rng = np.random.default_rng(3)
+    n = 50_000
+    time = np.arange(n) / 10_000.0
+    values = 400.0 + 170.0 * np.sin(2 * np.pi * 60.0 * time) + rng.normal(0, 1, n)
+    values[[10, 777, 40_000]] = [np.nan, np.inf, -np.inf]
+    index = WindowStatsIndex(time, {"v_an": values}, block_size=64)
+
+    for _ in range(100):
+        t0, t1 = sorted(rng.uniform(0.0, time[-1], 2))
+        stats = index.window_stats("v_an", t0, t1)
+        i0, i1 = index.sample_range(t0, t1)
+        if i1 - i0 < 4:
+            continue
+        ref = _reference(values[i0:i1])
+        assert stats.sample_count == ref["count"]
+        assert stats.mean == pytest.approx(ref["mean"], rel=1e-9)
+        assert stats.rms == pytest.approx(ref["rms"], rel=1e-9)
+        assert stats.min == ref["min"]
+        assert stats.max == ref["max"]
+
+
+def test_window_stats_empty_window_and_unknown_channel():
+    time = np.arange(10, dtype=float)
+    index = WindowStatsIndex(time, {"x": np.arange(10, dtype=float)})
+
+    empty = index.window_stats("x", 20.0, 30.0)
+    assert empty.sample_count == 0
+    assert np.isnan(empty.rms)
+
+    single = index.window_stats("x", 4.0, 4.0)
+    assert single.sample_count == 1
+    assert single.min == single.max == 4.0
+
+    with pytest.raises(KeyError):
+        index.window_stats("missing", 0.0, 1.0)
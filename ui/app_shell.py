@@ -12,6 +12,7 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
 from PyQt6.QtCore import Qt, QTimer
 
 from src.serial_reader import SerialManager
+from src.frame_block import connect_frame_stream
 from src.recorder import Recorder
 from src.insight_engine import InsightEngine
 from src.simulation_controller import SimulationController
@@ -85,13 +86,14 @@ class AppShell(QMainWindow):
         self.sim_ctrl = SimulationController()
         self.scenario_ctrl = ScenarioController()
 
-        # Auto-save frames to recorder when recording
-        self.serial_mgr.frame_received.connect(self._on_frame)
+        # Auto-save frames to recorder when recording.  The recorder is a
+        # frame sink so it gets every frame even if the display drops some.
+        self.serial_mgr.add_frame_sink(self.recorder.log_frames)
+        connect_frame_stream(self.serial_mgr, self._on_frames)
 
-    def _on_frame(self, frame: dict):
-        if self.recorder.is_recording:
-            self.recorder.log_frame(frame)
-        self.insight_engine.update(frame)
+    def _on_frames(self, block):
+        for frame in block.frames:
+            self.insight_engine.update(frame)
 
     # ──────────────────────────────────────────────────────────────
     # UI construction
@@ -9,25 +9,33 @@ Layout:
   Overlay plot — both channels overlaid (A = solid, B = dashed)
   Delta plot — (A − B) trace
   Metrics row — per-channel RMS / peak / correlation chips
+  Regression table — N-way ranking of every loaded/selected run against A
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import threading
 from typing import Optional
 
 import numpy as np
 import pyqtgraph as pg
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QComboBox,
     QDoubleSpinBox,
+    QFileDialog,
     QFrame,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QPushButton,
     QScrollArea,
     QSplitter,
+    QTableWidget,
+    QTableWidgetItem,
     QVBoxLayout,
     QWidget,
 )
@@ -35,10 +43,12 @@ from PyQt6.QtWidgets import (
 from src.comparison import (
     ComparisonResult,
     align_datasets,
+    align_datasets_joint,
     compare_datasets,
     dataset_from_capsule,
     find_overlapping_channels,
 )
+from src.regression import BaselineReference, RegressionMatrix, run_regression
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +61,8 @@ _CHANNEL_COLORS = [
 ]
 _DELTA_COLOR = "#94a3b8"     # slate
 
+_REGRESSION_COLUMNS = ["Rank", "Run", "Channel", "RMSE", "ΔTHD %", "ΔNadir Hz", "ΔRecovery s"]
+
 
 class ComparisonPanel(QWidget):
     """
@@ -59,13 +71,26 @@ class ComparisonPanel(QWidget):
     Call :meth:`set_sessions` whenever the caller has a primary session (A)
     and an overlay session (B) ready. The panel auto-renders an initial
     overlay and delta as soon as both sessions are present.
+
+    :meth:`set_candidate_sessions` supplies every other loaded run for the
+    N-way regression ranking against A (Regression… button).  Session A is
+    prepared as a :class:`~src.regression.BaselineReference` on the first
+    run and reused until A changes.
     """
 
+    # RegressionMatrix | str error, (session A, BaselineReference) | None, generation
+    _regression_ready = pyqtSignal(object, object, int)
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._session_a: Optional[dict] = None
         self._session_b: Optional[dict] = None
+        self._candidate_sessions: list[dict] = []
         self._last_result: Optional[ComparisonResult] = None
+        self._last_regression: Optional[RegressionMatrix] = None
+        self._baseline_ref: Optional[BaselineReference] = None   # built for _session_a
+        self._regression_generation = 0
+        self._regression_ready.connect(self._on_regression_ready)
         self._build()
 
     # ------------------------------------------------------------------
@@ -83,6 +108,8 @@ class ComparisonPanel(QWidget):
             session_a: Primary / reference session.
             session_b: Comparison session.
         """
+        if session_a is not self._session_a:
+            self._baseline_ref = None
         self._session_a = session_a
         self._session_b = session_b
 
@@ -92,6 +119,10 @@ class ComparisonPanel(QWidget):
         )
         self._btn_compare.setEnabled(True)
         self._btn_compare.setToolTip("")
+        self._btn_regression.setEnabled(True)
+        self._btn_regression.setToolTip(
+            "Rank every loaded overlay (plus optional files) against the baseline"
+        )
 
         label_a = session_a.get("label", "Dataset A")
         label_b = session_b.get("label", "Dataset B")
@@ -109,11 +140,28 @@ class ComparisonPanel(QWidget):
         self._on_auto_align()
         self._on_compare()
 
+    def set_candidate_sessions(self, sessions: list[dict]) -> None:
+        """
+        Provide the runs to rank against A in regression mode.
+
+        Args:
+            sessions: Session dicts in the same shape as :meth:`set_sessions`.
+        """
+        self._candidate_sessions = [s for s in sessions if s is not self._session_a]
+
     def clear(self) -> None:
         """Reset panel to empty state."""
         self._session_a = None
         self._session_b = None
+        self._candidate_sessions = []
         self._last_result = None
+        self._last_regression = None
+        self._baseline_ref = None
+        self._regression_generation += 1
+        self._btn_regression.setEnabled(False)
+        self._regression_status.setText("")
+        self._regression_table.setRowCount(0)
+        self._regression_table.setVisible(False)
         self._lbl_a.setText("A: —")
         self._lbl_b.setText("B: —")
         self._channel_combo.clear()
@@ -166,10 +214,13 @@ class ComparisonPanel(QWidget):
         self._btn_compare.setObjectName("AccentButton")
         self._btn_compare.clicked.connect(self._on_compare)
 
+        self._btn_regression = QPushButton("Regression…")
+        self._btn_regression.clicked.connect(self._on_regression)
+
         for w in [self._lbl_a, self._vs_lbl, self._lbl_b,
                   self._channel_combo,
                   self._btn_align, offset_lbl, self._offset_spin,
-                  self._btn_compare]:
+                  self._btn_compare, self._btn_regression]:
             ctrl.addWidget(w)
         ctrl.addStretch()
         root.addLayout(ctrl)
@@ -179,6 +230,8 @@ class ComparisonPanel(QWidget):
         self._btn_align.setToolTip("Load two sessions first")
         self._btn_compare.setEnabled(False)
         self._btn_compare.setToolTip("Load two sessions first")
+        self._btn_regression.setEnabled(False)
+        self._btn_regression.setToolTip("Load two sessions first")
 
         # ── Empty state guidance (shown until both sessions loaded) ──
         self._empty_hint = QLabel(
@@ -243,6 +296,22 @@ class ComparisonPanel(QWidget):
         metrics_scroll.setWidget(self._metrics_inner)
         root.addWidget(metrics_scroll)
 
+        # ── Regression ranking (hidden until a regression run) ────
+        self._regression_status = QLabel("")
+        self._regression_status.setStyleSheet("color: #94a3b8; font-size: 9pt; padding: 2px 4px;")
+        root.addWidget(self._regression_status)
+
+        self._regression_table = QTableWidget(0, len(_REGRESSION_COLUMNS))
+        self._regression_table.setHorizontalHeaderLabels(_REGRESSION_COLUMNS)
+        self._regression_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._regression_table.verticalHeader().setVisible(False)
+        self._regression_table.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.ResizeToContents
+        )
+        self._regression_table.setMaximumHeight(200)
+        self._regression_table.setVisible(False)
+        root.addWidget(self._regression_table)
+
         # placeholder curves
         self._overlay_curves_a: list = []
         self._overlay_curves_b: list = []
@@ -263,15 +332,21 @@ class ComparisonPanel(QWidget):
             return
 
         channel = self._selected_channel()
-        if not channel:
-            channels = find_overlapping_channels(ds_a, ds_b)
+        if channel:
+            offset_s, confidence = align_datasets(ds_a, ds_b, channel=channel,
+                                                   max_offset_s=1.0)
+        else:
+            # No channel picked: align on every shared signal jointly.
+            channels = [
+                ch for ch in find_overlapping_channels(ds_a, ds_b)
+                if ch not in {"status", "display_time_s"}
+            ]
             if not channels:
                 self._align_info.setText("No overlapping channels — cannot auto-align.")
                 return
-            channel = channels[0]
-
-        offset_s, confidence = align_datasets(ds_a, ds_b, channel=channel,
-                                               max_offset_s=1.0)
+            offset_s, confidence = align_datasets_joint(ds_a, ds_b, channels,
+                                                         max_offset_s=1.0)
+            channel = ", ".join(channels)
         self._offset_spin.setValue(round(offset_s * 1000.0, 1))
 
         conf_pct = int(confidence * 100)
@@ -314,6 +389,114 @@ class ComparisonPanel(QWidget):
         self._last_result = result
         self._render(ds_a, ds_b, result)
 
+    def _on_regression(self) -> None:
+        if self._session_a is None:
+            return
+        paths, _ = QFileDialog.getOpenFileNames(
+            self,
+            "Add Runs for Regression (Cancel to use loaded overlays only)",
+            "",
+            "Data Files (*.csv *.xlsx *.xls *.json);;All Files (*)",
+        )
+        self.run_regression(paths)
+
+    def run_regression(self, paths: Optional[list[str]] = None) -> None:
+        """
+        Rank loaded overlay sessions plus *paths* against session A.
+
+        The comparison runs on a background thread; results land in the
+        regression table.
+        """
+        if self._session_a is None:
+            return
+        try:
+            candidates: dict = {}
+            for i, session in enumerate(self._candidate_sessions):
+                label = session.get("label") or f"run_{i + 1}"
+                candidates[label] = self._analysis_dataset(session)
+        except Exception as exc:
+            logger.warning("Regression: cannot build datasets: %s", exc)
+            self._regression_status.setText(f"Regression unavailable: {exc}")
+            return
+        for path in paths or []:
+            label = os.path.basename(path)
+            if label in candidates:
+                label = path
+            candidates[label] = path
+        if not candidates:
+            self._regression_status.setText("No runs to compare against the baseline.")
+            return
+
+        self._regression_generation += 1
+        generation = self._regression_generation
+        session_a = self._session_a
+        baseline_label = session_a.get("label", "baseline")
+        reference = self._baseline_ref
+        self._btn_regression.setEnabled(False)
+        self._regression_status.setText(
+            f"Running regression: {len(candidates)} run(s) vs '{baseline_label}'…"
+        )
+
+        def _worker():
+            built = None
+            try:
+                baseline = reference
+                if baseline is None:
+                    # Resampled once here, then reused by every later run against A
+                    baseline = BaselineReference(self._analysis_dataset(session_a),
+                                                 label=baseline_label)
+                    built = (session_a, baseline)
+                result = run_regression(baseline, candidates, baseline_label=baseline_label)
+            except Exception as exc:
+                logger.warning("Regression failed: %s", exc)
+                result = str(exc)
+            try:
+                self._regression_ready.emit(result, built, generation)
+            except RuntimeError:
+                pass
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _on_regression_ready(self, result, built, generation: int) -> None:
+        if built is not None and built[0] is self._session_a:
+            self._baseline_ref = built[1]
+        if generation != self._regression_generation:
+            return
+        self._btn_regression.setEnabled(self._session_a is not None)
+        if isinstance(result, str):
+            self._regression_status.setText(f"Regression failed: {result}")
+            return
+        self._last_regression = result
+        self._populate_regression_table(result)
+
+    def _populate_regression_table(self, matrix: RegressionMatrix) -> None:
+        def _fmt(value, spec: str) -> str:
+            if value is None or value != value:
+                return "—"
+            return format(value, spec)
+
+        rows = matrix.rows()
+        table = self._regression_table
+        table.setRowCount(len(rows))
+        for r, row in enumerate(rows):
+            cells = [
+                str(row["rank"]),
+                row["run"],
+                row["channel"],
+                _fmt(row["rmse"], ".4g"),
+                _fmt(row["thd_delta_pct"], "+.3f"),
+                _fmt(row["nadir_delta_hz"], "+.3f"),
+                _fmt(row["recovery_delta_s"], "+.3f"),
+            ]
+            for c, text in enumerate(cells):
+                table.setItem(r, c, QTableWidgetItem(text))
+        table.setVisible(True)
+
+        status = f"Regression vs '{matrix.baseline_label}': worst → best: " + ", ".join(matrix.ranking)
+        if matrix.errors:
+            status += "  |  failed: " + ", ".join(sorted(matrix.errors))
+        self._regression_status.setText(status)
+
     # ------------------------------------------------------------------
     # Render
     # ------------------------------------------------------------------
@@ -0,0 +1,121 @@
+"""
+Background runner for evidence exports.
+
+``quick_export`` and ``generate_evidence_package`` accept a ``progress``
+callback; :class:`ExportRunner` calls them on a daemon thread and relays
+progress and completion to the UI thread through Qt signals, so the window
+stays responsive while artifacts are written.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtWidgets import QProgressDialog, QWidget
+
+logger = logging.getLogger(__name__)
+
+
+class ExportRunner(QObject):
+    """
+    Run one export function off the UI thread.
+
+    Signals:
+        progress(done, total, artifact_name)
+        finished(result)  — the export function's return value
+        failed(message)
+    """
+
+    progress = pyqtSignal(int, int, str)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._thread: Optional[threading.Thread] = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, export_fn: Callable[..., Any], **kwargs) -> bool:
+        """
+        Call ``export_fn(progress=..., **kwargs)`` on a worker thread.
+
+        Returns False (and does nothing) if an export is already running.
+        """
+        if self.is_running():
+            return False
+
+        def _progress(done: int, total: int, name: str) -> None:
+            try:
+                self.progress.emit(done, total, name)
+            except RuntimeError:
+                pass
+
+        def _worker() -> None:
+            try:
+                result = export_fn(progress=_progress, **kwargs)
+            except Exception as exc:
+                logger.error("Export failed: %s", exc)
+                try:
+                    self.failed.emit(str(exc))
+                except RuntimeError:
+                    pass
+                return
+            try:
+                self.finished.emit(result)
+            except RuntimeError:
+                pass
+
+        self._thread = threading.Thread(target=_worker, daemon=True, name="evidence-export")
+        self._thread.start()
+        return True
+
+
+def quick_export_summary(result: dict) -> str:
+    """Message-box text for a ``quick_export`` result."""
+    artifact_lines = "\n".join(
+        f"  {a['name']}: {a['size_bytes']:,} bytes"
+        for a in result["artifacts"]
+    )
+    return (
+        f"Evidence package exported to:\n{result['export_dir']}\n\n"
+        f"Artifacts ({len(result['artifacts'])}):\n{artifact_lines}\n\n"
+        f"Total: {result['total_bytes']:,} bytes"
+    )
+
+
+def attach_progress_dialog(parent: QWidget, runner: ExportRunner, title: str) -> QProgressDialog:
+    """Show a non-modal progress dialog that follows *runner* and closes when it ends."""
+    dialog = QProgressDialog(title, None, 0, 0, parent)
+    dialog.setWindowTitle(title)
+    dialog.setWindowModality(Qt.WindowModality.NonModal)
+    dialog.setMinimumDuration(300)
+    dialog.setAutoClose(False)
+    dialog.setAutoReset(False)
+
+    def _on_progress(done: int, total: int, name: str) -> None:
+        dialog.setMaximum(total)
+        dialog.setValue(done)
+        dialog.setLabelText(f"{title}\n{done}/{total} — {name}")
+
+    def _close(*_args) -> None:
+        for signal, slot in (
+            (runner.progress, _on_progress),
+            (runner.finished, _close),
+            (runner.failed, _close),
+        ):
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass
+        dialog.close()
+        dialog.deleteLater()
+
+    runner.progress.connect(_on_progress)
+    runner.finished.connect(_close)
+    runner.failed.connect(_close)
+    return dialog
@@ -5,8 +5,10 @@ import logging
 import numpy as np
 import collections
 import pyqtgraph as pg
-from src.signal_processing import compute_fft, compute_rms, compute_thd
+from src.signal_processing import compute_fft, compute_thd
 from src.config_manager import ConfigManager
+from src.frame_block import connect_frame_stream
+from src.ring_buffer import RingBuffer
 from ui.overlay import OverlayMessage
 
 logger = logging.getLogger(__name__)
@@ -26,15 +28,17 @@ class InverterScope(QWidget):
         ConfigManager.load()
         self.channels = ConfigManager.get_channel_config()
         
-        # Data Buffers (Optimized with collections.deque)
+        # Data buffer: time in row 0, then one row per configured channel
         self.buffer_size = 500
-        self.time_data = collections.deque(maxlen=self.buffer_size)
-        self.data = {k: collections.deque(maxlen=self.buffer_size) for k in self.channels.keys()}
+        self._ring = RingBuffer(('ts',) + tuple(self.channels.keys()), self.buffer_size)
 
         # Store (t_arr, y_arr) snapshots to keep shapes aligned
         self._trail_buffers = {k: collections.deque(maxlen=3) for k in self.channels.keys()}
         self._trail_curves = {k: [] for k in self.channels.keys()}
         self._frame_count = 0
+        # Latency probe stamps of blocks not yet drawn (see src.latency_probe)
+        self._probes = getattr(serial_mgr, "latency_probes", None)
+        self._render_stamps = []
         
         self._init_ui()
 
@@ -45,7 +49,7 @@ class InverterScope(QWidget):
         self.render_timer.timeout.connect(self._update_plot)
         self.render_timer.start(40) # 25Hz update rate is plenty for human eyes
         
-        self.serial_mgr.frame_received.connect(self._on_frame)
+        connect_frame_stream(self.serial_mgr, self._on_frames)
         self.paused = False
 
     def _init_ui(self):
@@ -149,34 +153,31 @@ class InverterScope(QWidget):
                 curve = target_plot.plot(pen=pen)
                 self._trail_curves[ch].append(curve)
 
-    @pyqtSlot(dict)
-    def _on_frame(self, frame):
+    def _on_frames(self, block):
         if self.paused: return
-        try:
-            ts = frame.get('ts', 0)
-            self.time_data.append(ts)
-            for ch in self.data:
-                self.data[ch].append(frame.get(ch, 0.0))
-        except Exception:
-            pass
+        columns = {ch: block.column(ch, 0.0) for ch in self.channels}
+        columns['ts'] = np.nan_to_num(block.ts, nan=0.0)
+        self._ring.push_columns(columns)
+        if block.received_at is not None:
+            self._render_stamps.append(block.received_at)
 
     def _update_plot(self):
-        if not self.time_data or self.paused: return
+        if not len(self._ring) or self.paused: return
         
-        # Batch conversions for performance
-        t_arr = np.array(self.time_data)
+        # One contiguous copy per tick: pyqtgraph keeps references to the
+        # arrays it is given and the ring keeps being written between paints.
+        data = dict(zip(self._ring.channels, self._ring.latest().copy()))
+        t_arr = data.pop('ts')
+        rms = dict(zip(self._ring.channels, self._ring.rms()))
         for ch, trace in self.traces.items():
-            if ch in self.data:
-                y_arr = np.array(self.data[ch])
-                if len(t_arr) != len(y_arr):
-                    continue
-                trace.setData(t_arr, y_arr)
+            if ch in data:
+                trace.setData(t_arr, data[ch])
         
         # Update energy ribbon overlays (RMS bands with THD color saturation)
         for phase, ch_key in [('a', 'v_an'), ('b', 'v_bn'), ('c', 'v_cn')]:
-            if ch_key in self.data and len(self.data[ch_key]) > 0:
-                y_arr = np.array(self.data[ch_key])
-                rms_val = compute_rms(y_arr)
+            if ch_key in data:
+                y_arr = data[ch_key]
+                rms_val = rms[ch_key]
                 
                 # Create ribbon at RMS level
                 if len(t_arr) == len(y_arr):
@@ -193,8 +194,8 @@ class InverterScope(QWidget):
                         pass
 
         if self.combo_mode.currentText() == "Spectrum":
-            if 'v_an' in self.data:
-                y_arr = np.array(self.data['v_an'])
+            if 'v_an' in data:
+                y_arr = data['v_an']
                 if len(t_arr) == len(y_arr) and len(t_arr) > 4:
                     freqs, mags = compute_fft(t_arr, y_arr)
                     self.spectrum_curve.setData(freqs, mags)
@@ -202,21 +203,24 @@ class InverterScope(QWidget):
         # Update ghost trails every few frames
         self._frame_count += 1
         if self._frame_count % 4 == 0:
-            for ch in self.data:
-                y_arr = np.array(self.data[ch])
-                if len(t_arr) != len(y_arr):
-                    continue
-                self._trail_buffers[ch].append((t_arr.copy(), y_arr.copy()))
+            for ch, y_arr in data.items():
+                self._trail_buffers[ch].append((t_arr, y_arr))
                 trails = list(self._trail_buffers[ch])
                 for idx, curve in enumerate(self._trail_curves[ch]):
                     if idx < len(trails):
                         t_hist, y_hist = trails[-(idx+1)]
                         if len(t_hist) == len(y_hist):
                             curve.setData(t_hist, y_hist)
+
+        if self._render_stamps:
+            # One designated scope times "rendered"; others would count each block again
+            if self._probes is not None and self._probes.claim_renderer(self):
+                self._probes.record_many("rendered", self._render_stamps)
+            self._render_stamps = []
     
     def _on_mouse_hover(self, pos):
         """Show mini-FFT sparkline when hovering over waveform"""
-        if not self.time_data or len(self.time_data) < 32:
+        if len(self._ring) < 32:
             self.mini_fft_label.hide()
             return
         
@@ -225,7 +229,7 @@ class InverterScope(QWidget):
         t_cursor = mouse_point.x()
         
         # Find nearest time index
-        t_arr = np.array(self.time_data)
+        t_arr = self._ring.channel('ts')
         idx = np.argmin(np.abs(t_arr - t_cursor))
         
         # Extract window around cursor
@@ -238,8 +242,8 @@ class InverterScope(QWidget):
             return
         
         # Compute FFT for window
-        if 'v_an' in self.data:
-            y_window = np.array(list(self.data['v_an']))[start_idx:end_idx]
+        if 'v_an' in self._ring:
+            y_window = self._ring.channel('v_an')[start_idx:end_idx]
             t_window = t_arr[start_idx:end_idx]
             
             if len(t_window) > 4 and len(y_window) == len(t_window):
@@ -281,8 +285,6 @@ class InverterScope(QWidget):
             self.plot_s.show()
 
     def clear_data(self):
-        self.time_data.clear()
-        for k in self.data:
-            self.data[k].clear()
+        self._ring.clear()
         for trace in self.traces.values():
             trace.clear()
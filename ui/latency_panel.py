@@ -0,0 +1,135 @@
+"""
+LatencyPanel — per-stage live pipeline latency (p50 / p95 / p99).
+
+Shows the histograms of a :class:`~src.latency_probe.LatencyProbes`
+(``SerialManager.latency_probes``): one row per stage, timed from the
+reader thread receiving the frames.  The probes are off until enabled here;
+Export writes the histograms to JSON.
+
+Displayed in DiagnosticsPage under the fault injector, and from Tools →
+Pipeline Latency in the Diagnostics launcher.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import (QCheckBox, QFileDialog, QHBoxLayout, QHeaderView, QLabel,
+                             QPushButton, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget)
+
+from src.latency_probe import STAGES, LatencyProbes
+
+logger = logging.getLogger(__name__)
+
+_REFRESH_MS = 1000
+_COLUMNS = (("count", "Blocks"), ("p50_ms", "p50 ms"), ("p95_ms", "p95 ms"),
+            ("p99_ms", "p99 ms"), ("max_ms", "max ms"))
+_STAGE_LABELS = {
+    "normalize": "receive → normalized",
+    "emit":      "→ signal emitted",
+    "handled":   "→ subscribers done",
+    "rendered":  "→ plot rendered",
+}
+_NEUTRAL_COLOR = "#94a3b8"
+
+
+class LatencyPanel(QWidget):
+    """Table of stage latencies with enable / reset / export controls.
+
+    Wire it up::
+
+        panel = LatencyPanel(serial_mgr.latency_probes)
+    """
+
+    def __init__(self, probes: LatencyProbes, parent=None):
+        super().__init__(parent)
+        self.setObjectName("LatencyPanel")
+        self.probes = probes
+        self._build()
+        self._timer = QTimer(self)
+        self._timer.setInterval(_REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+        self._enable.setChecked(probes.enabled)
+        self.refresh()
+
+    def _build(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 4, 8, 4)
+        layout.setSpacing(4)
+
+        controls = QHBoxLayout()
+        self._enable = QCheckBox("Latency probes")
+        self._enable.setToolTip("Time every frame block from adapter receive to plot render")
+        self._enable.toggled.connect(self.set_enabled)
+        controls.addWidget(self._enable)
+        controls.addStretch()
+        btn_reset = QPushButton("Reset")
+        btn_reset.clicked.connect(self.reset)
+        controls.addWidget(btn_reset)
+        btn_export = QPushButton("Export JSON…")
+        btn_export.clicked.connect(self._choose_export_path)
+        controls.addWidget(btn_export)
+        layout.addLayout(controls)
+
+        self._table = QTableWidget(len(STAGES), len(_COLUMNS))
+        self._table.setHorizontalHeaderLabels([label for _, label in _COLUMNS])
+        self._table.setVerticalHeaderLabels([_STAGE_LABELS.get(s, s) for s in STAGES])
+        self._table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self._table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        for row in range(len(STAGES)):
+            for col in range(len(_COLUMNS)):
+                self._table.setItem(row, col, QTableWidgetItem("—"))
+        layout.addWidget(self._table)
+
+        self._status = QLabel("")
+        self._status.setStyleSheet(f"color:{_NEUTRAL_COLOR}; font-size:11px;")
+        layout.addWidget(self._status)
+
+    # ── Public API ──────────────────────────────────────────────────────
+
+    def set_enabled(self, enabled: bool):
+        self.probes.enabled = enabled
+        if self._enable.isChecked() != enabled:
+            self._enable.setChecked(enabled)
+        if enabled:
+            self._timer.start()
+        else:
+            self._timer.stop()
+        self.refresh()
+
+    def reset(self):
+        self.probes.reset()
+        self.refresh()
+
+    def refresh(self):
+        summary = self.probes.summary()
+        for row, stage in enumerate(STAGES):
+            stats = summary[stage]
+            for col, (key, _) in enumerate(_COLUMNS):
+                value = stats[key]
+                text = f"{value:,}" if key == "count" else (f"{value:.2f}" if stats["count"] else "—")
+                self._table.item(row, col).setText(text)
+        state = "on" if self.probes.enabled else "off"
+        self._status.setText(f"Probes {state} — latencies measured from adapter receive")
+
+    def export_json(self, path) -> Path:
+        path = self.probes.export_json(path)
+        self._status.setText(f"Exported → {path}")
+        return path
+
+    # ── Internals ───────────────────────────────────────────────────────
+
+    def _choose_export_path(self):
+        default = f"latency_{time.strftime('%Y%m%d_%H%M%S')}.json"
+        path, _ = QFileDialog.getSaveFileName(self, "Export Latency Histograms", default,
+                                              "JSON Files (*.json)")
+        if not path:
+            return
+        try:
+            self.export_json(path)
+        except OSError as e:
+            logger.error(f"Latency export failed: {e}")
+            self._status.setText(f"Export failed: {e}")
@@ -1,7 +1,7 @@
 """
 LiveStatusPanel — compact one-line status bar for live telemetry.
 
-Shows:  [SOURCE badge]  fps  •  active channels  •  last-frame age  •  warnings
+Shows:  [SOURCE badge]  fps  •  active channels  •  display queue  •  last-frame age  •  warnings
 
 Updates whenever SerialManager emits ``live_stats_updated``.
 Displayed in DiagnosticsPage above the SystemHealthCard during live/demo sessions.
@@ -76,6 +76,15 @@ class LiveStatusPanel(QWidget):
         self._ch_lbl.setStyleSheet(f"color:{_NEUTRAL_COLOR}; font-size:11px;")
         layout.addWidget(self._ch_lbl)
 
+        self._queue_lbl = QLabel("")
+        self._queue_lbl.setObjectName("LiveQueue")
+        self._queue_lbl.setStyleSheet(f"color:{_NEUTRAL_COLOR}; font-size:11px;")
+        self._queue_lbl.setToolTip(
+            "Display queue: frames waiting for the UI and how long they waited.\n"
+            "dropped: frames skipped by the display only (recordings keep them).\n"
+            "lost: frames lost before recording (acquisition process overrun).")
+        layout.addWidget(self._queue_lbl)
+
         self._age_lbl = QLabel("")
         self._age_lbl.setObjectName("LiveAge")
         self._age_lbl.setStyleSheet(f"color:{_NEUTRAL_COLOR}; font-size:11px;")
@@ -113,6 +122,7 @@ class LiveStatusPanel(QWidget):
             )
             self._fps_lbl.setText("—")
             self._ch_lbl.setText("no channels")
+            self._queue_lbl.setText("")
             self._age_lbl.setText("")
             self._warn_lbl.setText("")
             self._stale_timer.stop()
@@ -154,6 +164,9 @@ class LiveStatusPanel(QWidget):
         else:
             self._ch_lbl.setText("no channels yet")
 
+        # Display queue
+        self._update_queue(stats)
+
         # Warnings
         if stats.warnings:
             self._warn_lbl.setText("⚠  " + stats.warnings[0])
@@ -162,6 +175,19 @@ class LiveStatusPanel(QWidget):
 
         # Age is updated by stale timer — no need to update here
 
+    def _update_queue(self, stats: LiveStats) -> None:
+        if not stats.connected:
+            self._queue_lbl.setText("")
+            return
+        text = f"•  queue {stats.queue_depth}  wait {stats.queue_wait_ms_avg:.0f} ms"
+        if stats.frames_dropped:
+            text += f"  •  {stats.frames_dropped:,} dropped"
+        if stats.frames_lost:
+            text += f"  •  {stats.frames_lost:,} lost"
+        color = _WARNING_COLOR if stats.frames_dropped or stats.frames_lost else _NEUTRAL_COLOR
+        self._queue_lbl.setText(text)
+        self._queue_lbl.setStyleSheet(f"color:{color}; font-size:11px;")
+
     # ──────────────────────────────────────────────────────────────
     # Stale detection
     # ──────────────────────────────────────────────────────────────
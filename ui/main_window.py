@@ -64,7 +64,7 @@ class MainWindow(QMainWindow):
         self.csv_exporter = CSVExporter()
         
         # Connect backend
-        self.serial_mgr.frame_received.connect(self.recorder.log_frame)
+        self.serial_mgr.add_frame_sink(self.recorder.log_frames)
         self.scenario_ctrl.event_triggered.connect(self._on_scenario_event)
         self.serial_mgr.frame_received.connect(self.insight_engine.update)
         self.serial_mgr.frame_received.connect(self._on_frame)
@@ -2,6 +2,7 @@ import os
 import json
 import time
 import logging
+import threading
 import webbrowser
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QStackedWidget,
                              QPushButton, QLabel, QFileDialog, QFrame,
@@ -9,6 +10,9 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QStackedWidget,
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QColor
 
+from src.analysis_cache import default_analysis_cache
+from src.artifact_cache import default_artifact_cache
+from ui.export_runner import ExportRunner, attach_progress_dialog, quick_export_summary
 from ui.validation_dashboard import ValidationDashboard
 
 logger = logging.getLogger(__name__)
@@ -29,6 +33,31 @@ def _serializable_capsule(capsule: dict) -> dict:
     }
 
 
+def _evidence_package_task(session_data: dict, session_path: str | None,
+                           events: list | None, progress=None, **kwargs) -> dict:
+    """
+    ExportRunner worker for the evidence package: writes the temp session
+    file when the capsule has none, computes the metrics, then generates.
+    """
+    from src.report_generator import generate_evidence_package
+    from src.session_analysis import compute_session_metrics
+
+    if session_path is None:
+        import tempfile
+        fd, session_path = tempfile.mkstemp(suffix=".json", prefix="evidence_session_")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(_serializable_capsule(session_data), fh, indent=2)
+    metrics = compute_session_metrics(session_data, events=events)
+    return generate_evidence_package(
+        session_path=session_path,
+        events=events,
+        metrics=metrics,
+        session_data=session_data,
+        progress=progress,
+        **kwargs,
+    )
+
+
 class CompliancePage(QWidget):
     """
     Compliance surface — load a session, run IEEE tests, see scored results.
@@ -37,10 +66,18 @@ class CompliancePage(QWidget):
       no_session  — prompt to load
       loaded      — session ready, prompt to run
       results     — results visible with check cards + export
+
+    Results are persisted per profile in the analysis sidecar cache, so a
+    re-opened source file shows its last results immediately; evaluation
+    only runs (in a background thread) when nothing is cached for the key.
     """
 
+    # Internal: background evaluation result (results, profile, generation)
+    _bg_compliance_ready = pyqtSignal(list, str, int)
+
     def __init__(self, scenario_ctrl, parent=None):
         super().__init__(parent)
+        self._load_generation = 0
         self._session_path = None
         self._session_data = None
         self._active_profile = "ieee_2800_inspired"
@@ -109,6 +146,7 @@ class CompliancePage(QWidget):
         bottom.events_clicked.connect(self._on_export_events_csv)
         bottom.bundle_clicked.connect(self._on_export_evidence_package)
         bottom.quick_export_clicked.connect(self._on_quick_export)
+        self._bg_compliance_ready.connect(self._on_bg_compliance_ready)
 
     # ─────────────────────────────────────────────────────────────
     # Public API
@@ -130,6 +168,8 @@ class CompliancePage(QWidget):
             self._scorecard.setVisible(False)
             self._stack.setCurrentIndex(1)
             self._state = "loaded"
+            self._load_generation += 1
+            self._show_cached_results()
         except Exception as exc:
             logger.error(f"Failed to load compliance session: {exc}")
 
@@ -161,13 +201,16 @@ class CompliancePage(QWidget):
         self._scorecard.setVisible(False)
         self._stack.setCurrentIndex(1)
         self._state = "loaded"
+        self._load_generation += 1
         logger.info("Compliance page pre-loaded from imported capsule: %s", name)
+        self._show_cached_results()
 
     def clear_session(self) -> None:
         """Reset Compliance to its unloaded state so Tools -> Reset Session is truthful."""
         self._session_path = None
         self._session_data = None
         self._state = "no_session"
+        self._load_generation += 1
         self._last_results = []
         self._last_events = []
         self._last_annotations = {}
@@ -201,13 +244,52 @@ class CompliancePage(QWidget):
     def _on_run_tests(self):
         if not self._session_data:
             return
-        try:
-            from src.compliance_checker import evaluate_session
-            results = evaluate_session(self._session_data, profile=self._active_profile)
-        except Exception as exc:
-            logger.error(f"Compliance check failed: {exc}")
+        if self._show_cached_results():
             return
 
+        capsule = self._session_data
+        profile = self._active_profile
+        generation = self._load_generation
+        cache = default_analysis_cache()
+
+        def _worker():
+            try:
+                from src.compliance_checker import evaluate_session
+                t0 = time.perf_counter()
+                results = evaluate_session(capsule, profile=profile)
+                cache.store_compliance(capsule, profile, results)
+                logger.info(
+                    "compliance.evaluate.end: %s (%.3fs)", profile, time.perf_counter() - t0
+                )
+            except Exception as exc:
+                logger.error(f"Compliance check failed: {exc}")
+                return
+            try:
+                self._bg_compliance_ready.emit(results, profile, generation)
+            except RuntimeError:
+                pass  # Page was destroyed before the worker finished.
+
+        threading.Thread(target=_worker, daemon=True, name=f"compliance-{profile}").start()
+
+    def _show_cached_results(self) -> bool:
+        """Show cached results for the active profile; return True on a hit."""
+        if not self._session_data:
+            return False
+        results = default_analysis_cache().load_compliance(
+            self._session_data, self._active_profile
+        )
+        if results is None:
+            return False
+        logger.info("compliance.cache.hit: %s", self._active_profile)
+        self._apply_results(results)
+        return True
+
+    def _on_bg_compliance_ready(self, results: list, profile: str, generation: int) -> None:
+        if generation != self._load_generation or profile != self._active_profile:
+            return  # Stale: session or profile changed while evaluating.
+        self._apply_results(results)
+
+    def _apply_results(self, results: list) -> None:
         passed   = sum(1 for r in results if r.get("status") == "PASS")
         total    = sum(1 for r in results if r.get("status") in {"PASS", "FAIL"})
         na_count = sum(1 for r in results if r.get("status") == "N/A")
@@ -231,6 +313,7 @@ class CompliancePage(QWidget):
         self._active_profile = profile_id
         self._ready.set_profile(profile_id)
         self._top_bar.set_profile_description(_PROFILE_DESCRIPTIONS.get(profile_id, ""))
+        self._show_cached_results()
 
     def _on_export_html(self):
         if not self._session_data:
@@ -275,35 +358,46 @@ class CompliancePage(QWidget):
             except Exception as exc:
                 logger.error(f"Events CSV export failed: {exc}")
 
+    def _export_runner_for(self, on_finished) -> ExportRunner | None:
+        """Return an idle runner wired to *on_finished*, or None if busy."""
+        runner = getattr(self, "_export_runner", None)
+        if runner is not None and runner.is_running():
+            from PyQt6.QtWidgets import QMessageBox
+            QMessageBox.information(
+                self, "Export in Progress",
+                "An evidence export is already running. Wait for it to finish and try again.",
+            )
+            return None
+        runner = ExportRunner(self)
+        runner.finished.connect(on_finished)
+        runner.failed.connect(lambda message: logger.error(f"Export failed: {message}"))
+        self._export_runner = runner
+        return runner
+
     def _on_quick_export(self):
         """Write evidence package to artifacts/evidence_exports/ without a file dialog."""
         if not self._session_data:
             return
-        try:
-            from src.session_exporter import quick_export
-            result = quick_export(
-                self._session_data,
-                events=self._last_events or [],
-                compliance_results=self._last_results or None,
-                base_dir="artifacts/evidence_exports",
-            )
-            export_dir = result["export_dir"]
-            artifact_lines = "\n".join(
-                f"  {a['name']}: {a['size_bytes']:,} bytes"
-                for a in result["artifacts"]
-            )
-            from PyQt6.QtWidgets import QMessageBox
-            msg = QMessageBox(self)
-            msg.setWindowTitle("Quick Export Complete")
-            msg.setText(
-                f"Evidence package exported to:\n{export_dir}\n\n"
-                f"Artifacts ({len(result['artifacts'])}):\n{artifact_lines}\n\n"
-                f"Total: {result['total_bytes']:,} bytes"
-            )
-            msg.setIcon(QMessageBox.Icon.Information)
-            msg.exec()
-        except Exception as exc:
-            logger.error(f"Quick export failed: {exc}")
+        runner = self._export_runner_for(self._on_quick_export_finished)
+        if runner is None:
+            return
+        from src.session_exporter import quick_export
+        runner.start(
+            quick_export,
+            capsule=self._session_data,
+            events=self._last_events or [],
+            compliance_results=self._last_results or None,
+            base_dir="artifacts/evidence_exports",
+        )
+        attach_progress_dialog(self, runner, "Exporting evidence package…")
+
+    def _on_quick_export_finished(self, result: dict) -> None:
+        from PyQt6.QtWidgets import QMessageBox
+        msg = QMessageBox(self)
+        msg.setWindowTitle("Quick Export Complete")
+        msg.setText(quick_export_summary(result))
+        msg.setIcon(QMessageBox.Icon.Information)
+        msg.exec()
 
     def _on_export_evidence_package(self):
         if not self._session_data:
@@ -313,28 +407,22 @@ class CompliancePage(QWidget):
         )
         if not folder:
             return
-        try:
-            from src.report_generator import generate_evidence_package
-            from src.session_analysis import compute_session_metrics
-            temp_path = self._session_path
-            if temp_path is None:
-                import tempfile
-                fd, temp_path = tempfile.mkstemp(suffix=".json", prefix="evidence_session_")
-                os.close(fd)
-                with open(temp_path, "w", encoding="utf-8") as fh:
-                    json.dump(_serializable_capsule(self._session_data), fh, indent=2)
-
-            generate_evidence_package(
-                session_path=temp_path,
-                output_dir=folder,
-                profile=self._active_profile,
-                compliance_results=self._last_results or None,
-                events=self._last_events or None,
-                metrics=compute_session_metrics(self._session_data, events=self._last_events or None),
-                session_data=self._session_data,
-            )
-        except Exception as exc:
-            logger.error(f"Evidence package export failed: {exc}")
+        runner = self._export_runner_for(
+            lambda result: logger.info("Evidence package written: %s", result.get("html"))
+        )
+        if runner is None:
+            return
+        runner.start(
+            _evidence_package_task,
+            session_data=self._session_data,
+            session_path=self._session_path,
+            events=self._last_events or None,
+            output_dir=folder,
+            profile=self._active_profile,
+            compliance_results=self._last_results or None,
+            artifact_cache=default_artifact_cache(),
+        )
+        attach_progress_dialog(self, runner, "Generating evidence package…")
 
 
 # ─────────────────────────────────────────────────────────────────
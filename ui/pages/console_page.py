@@ -15,6 +15,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
                               QLabel, QFrame, QPushButton)
 from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSlot
 
+from src.frame_block import connect_frame_stream
 from ui.inverter_scope import InverterScope
 from ui.phasor_view import PhasorView
 from ui.insights_panel import InsightsPanel
@@ -49,7 +50,7 @@ class ConsolePage(QWidget):
         # ── Header bar ───────────────────────────────────────────────────────
         self._header = _ConsoleHeaderBar()
         root.addWidget(self._header)
-        serial_mgr.frame_received.connect(self._header.on_frame)
+        connect_frame_stream(serial_mgr, self._header.on_frames)
         insight_engine.insight_emitted.connect(self._header.on_insight)
 
         # ── Body: three columns ──────────────────────────────────────────────
@@ -61,6 +62,10 @@ class ConsolePage(QWidget):
         # Left: waveform scope (stretches to fill remaining width)
         self.scope = InverterScope(serial_mgr)
         body_layout.addWidget(self.scope, stretch=1)
+        # The main live view is the one timed by the "rendered" latency stage
+        probes = getattr(serial_mgr, "latency_probes", None)
+        if probes is not None:
+            probes.set_renderer(self.scope)
 
         # Center: phasor (top) + IEEE compliance panel (bottom)
         center_split = QSplitter(Qt.Orientation.Vertical)
@@ -192,6 +197,10 @@ class _ConsoleHeaderBar(QFrame):
 
     # ── Slots ─────────────────────────────────────────────────────────────────
 
+    def on_frames(self, block):
+        for frame in block.frames:
+            self.on_frame(frame)
+
     def on_frame(self, frame: dict):
         """Buffer frame data; applied at _METRICS_UPDATE_MS rate."""
         self._pending["freq"]  = frame.get("freq")
@@ -3,11 +3,13 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
                              QPushButton, QLabel, QFrame)
 from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSlot
 
+from src.frame_block import connect_frame_stream
 from ui.inverter_scope import InverterScope
 from ui.phasor_view import PhasorView
 from ui.fault_injector import FaultInjector
 from ui.insights_panel import InsightsPanel
 from ui.live_status_panel import LiveStatusPanel
+from ui.latency_panel import LatencyPanel
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +25,7 @@ class DiagnosticsPage(QWidget):
 
     Layout:
       [SystemHealthCard — status badge, current issue, key metrics]
-      [InverterScope (55%) | PhasorView / FaultInjector (30%) | InsightsPanel (15%)]
+      [InverterScope (55%) | PhasorView / FaultInjector / LatencyPanel (30%) | InsightsPanel (15%)]
     """
 
     def __init__(self, serial_mgr, scenario_ctrl, insight_engine,
@@ -50,7 +52,7 @@ class DiagnosticsPage(QWidget):
         root.addWidget(self._health)
 
         # Wire health card to live data (throttled internally)
-        serial_mgr.frame_received.connect(self._health.on_frame)
+        connect_frame_stream(serial_mgr, self._health.on_frames)
         insight_engine.insight_emitted.connect(self._health.on_insight)
 
         # Insight batcher — buffers events, flushes to panel every 2s
@@ -84,9 +86,11 @@ class DiagnosticsPage(QWidget):
         right_split.setHandleWidth(2)
         self.phasor = PhasorView(serial_mgr)
         self.fault_injector = FaultInjector(scenario_ctrl, serial_mgr)
+        self.latency = LatencyPanel(serial_mgr.latency_probes)
         right_split.addWidget(self.phasor)
         right_split.addWidget(self.fault_injector)
-        right_split.setSizes([300, 220])
+        right_split.addWidget(self.latency)
+        right_split.setSizes([300, 220, 180])
         main_split.addWidget(right_split)
 
         main_split.addWidget(self.insights)
@@ -218,6 +222,10 @@ class _SystemHealthCard(QFrame):
         f.setObjectName("HealthDivider")
         return f
 
+    def on_frames(self, block):
+        for frame in block.frames:
+            self.on_frame(frame)
+
     def on_frame(self, frame: dict):
         """Buffer frame data — applied at _METRICS_UPDATE_MS rate."""
         self._pending["rms"]  = frame.get("v_rms")
@@ -4,7 +4,9 @@ import pyqtgraph as pg
 import numpy as np
 import math
 import collections
-from src.signal_processing import extract_three_phase_phasors, compute_rms
+from src.signal_processing import extract_three_phase_phasors
+from src.frame_block import connect_frame_stream
+from src.ring_buffer import RingBuffer
 from ui.overlay import OverlayMessage
 
 PHASOR_BUF_SIZE = 200  # Samples buffered for phasor extraction (~4 cycles at 50Hz/60Hz)
@@ -132,18 +134,13 @@ class PhasorView(QWidget):
         self.layout.addLayout(info_layout)
 
         # Internal Buffers for phasor extraction
-        self._buf = {
-            'v_a': collections.deque(maxlen=PHASOR_BUF_SIZE),
-            'v_b': collections.deque(maxlen=PHASOR_BUF_SIZE),
-            'v_c': collections.deque(maxlen=PHASOR_BUF_SIZE),
-            'ts': collections.deque(maxlen=PHASOR_BUF_SIZE),
-        }
+        self._buf = RingBuffer(('ts', 'v_an', 'v_bn', 'v_cn'), PHASOR_BUF_SIZE)
 
         self.render_timer = QTimer()
         self.render_timer.timeout.connect(self._render_phasors)
         self.render_timer.start(80)  # ~12Hz for phasor update (computation-heavy)
 
-        self.serial_mgr.frame_received.connect(self._on_frame)
+        connect_frame_stream(self.serial_mgr, self._on_frames)
 
     def _on_scale_changed(self, val):
         self._set_range(val)
@@ -153,39 +150,35 @@ class PhasorView(QWidget):
         self.plot_widget.setXRange(-val, val)
         self.plot_widget.setYRange(-val, val)
 
-    @pyqtSlot(dict)
-    def _on_frame(self, frame):
-        # Detect on first frame whether this source provides 3-phase channels
+    def _on_frames(self, block):
+        # Detect on first block whether this source provides 3-phase channels
         if self._has_3phase is None:
-            self._has_3phase = "v_an" in frame
+            self._has_3phase = "v_an" in block
             if not self._has_3phase:
                 self.render_timer.stop()
                 self._na_label.show()
                 return
         if not self._has_3phase:
             return
-        self._buf['v_a'].append(frame.get('v_an', 0))
-        self._buf['v_b'].append(frame.get('v_bn', 0))
-        self._buf['v_c'].append(frame.get('v_cn', 0))
-        self._buf['ts'].append(frame.get('ts', 0))
+        self._buf.push_columns({
+            'ts': np.nan_to_num(block.ts, nan=0.0),
+            'v_an': block.column('v_an', 0),
+            'v_bn': block.column('v_bn', 0),
+            'v_cn': block.column('v_cn', 0),
+        })
 
     def _render_phasors(self):
-        if len(self._buf['v_a']) < 32:
+        if len(self._buf) < 32:
             return
 
         # Extract real phasors using Hilbert transform
-        va = list(self._buf['v_a'])
-        vb = list(self._buf['v_b'])
-        vc = list(self._buf['v_c'])
-        ts = list(self._buf['ts'])
+        ts, va, vb, vc = self._buf.latest()
 
         result = extract_three_phase_phasors(va, vb, vc, time_data=ts)
 
         if result is None:
             # Fallback: just show RMS with default angles
-            rms_a = compute_rms(va)
-            rms_b = compute_rms(vb)
-            rms_c = compute_rms(vc)
+            _, rms_a, rms_b, rms_c = self._buf.rms()
             self._draw_vector('v_a', rms_a, 90)
             self._draw_vector('v_b', rms_b, -30)
             self._draw_vector('v_c', rms_c, 210)
@@ -284,8 +277,7 @@ class PhasorView(QWidget):
         """Reset 3-phase detection state — call when a new session is loaded."""
         self._has_3phase = None
         self._na_label.hide()
-        for key in self._buf:
-            self._buf[key].clear()
+        self._buf.clear()
         for key in self._trail_history:
             self._trail_history[key].clear()
         if not self.render_timer.isActive():
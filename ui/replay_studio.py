@@ -16,14 +16,27 @@ from src.signal_processing import compute_rms, compute_thd, compute_fft
 from src.event_detector import detect_events
 from src.comparison import dataset_from_capsule
 from src.derived_channels import ensure_capsule_derived_channels
-from src.session_analysis import build_metric_rows, compute_session_metrics
+from src.session_analysis import build_metric_rows, compute_session_metrics, dataset_for_analysis
+from src.analysis_cache import default_analysis_cache
+from src.window_index import WindowStatsIndex
 from ui.comparison_panel import ComparisonPanel
+from ui.export_runner import ExportRunner, attach_progress_dialog, quick_export_summary
 from ui.event_lane import EventLane
 
 logger = logging.getLogger(__name__)
 
+# THD in the region panel runs an FFT over the window; cap its length so a
+# full-capture selection stays interactive on release.
+_REGION_THD_MAX_SAMPLES = 1 << 18
+# Fewer fundamental cycles than this leak too much for a meaningful THD.
+_REGION_THD_MIN_CYCLES = 5
 
-def _cap_dataset_for_events(dataset, max_samples: int = 50_000):
+
+# Event detection runs on at most this many samples (see _cap_dataset_for_events).
+_EVENT_MAX_SAMPLES = 50_000
+
+
+def _cap_dataset_for_events(dataset, max_samples: int = _EVENT_MAX_SAMPLES):
     """
     Return a downsampled copy of *dataset* so event detection never blocks
     the main thread on huge full-resolution recordings.
@@ -46,6 +59,25 @@ def _cap_dataset_for_events(dataset, max_samples: int = 50_000):
     return _dc_replace(dataset, time=new_time, channels=new_channels, sample_rate=new_sr)
 
 
+def _build_region_index(primary: dict) -> tuple[WindowStatsIndex, float]:
+    """Window index over a primary session's full-res data, and its display time offset."""
+    full_res = primary.get('_dataset')
+    dataset = full_res if full_res is not None else dataset_for_analysis(primary['data'])
+    # Display time is relative to the first replay frame.  Imported
+    # datasets keep their raw time axis (frame ts is raw time); datasets
+    # rebuilt from frames already start at zero.
+    frames = primary.get('frames') or []
+    if full_res is not None and frames and frames[0].get('ts') is not None:
+        offset = float(frames[0]['ts'])
+    else:
+        offset = float(dataset.time[0]) if dataset.time.size else 0.0
+    channels = {
+        ch: arr for ch, arr in dataset.channels.items()
+        if ch not in {'display_time_s', 'status'}
+    }
+    return WindowStatsIndex(dataset.time, channels), offset
+
+
 class ReplayStudio(QWidget):
     """
     Advanced Replay Interface with:
@@ -61,6 +93,7 @@ class ReplayStudio(QWidget):
     # Internal signals: background worker → Qt main-thread UI update.
     _bg_analysis_ready = pyqtSignal(dict, str)   # (result_dict, session_label)
     _bg_events_ready   = pyqtSignal(list, str)   # (events_list, session_label)
+    _region_index_ready = pyqtSignal(object, float, int)  # (index | None, time offset, generation)
 
     def __init__(self, recorder, serial_mgr):
         super().__init__()
@@ -115,6 +148,13 @@ class ReplayStudio(QWidget):
         self.chk_link_axes.setToolTip("Keep the replay plots on the same time window")
         self.chk_link_axes.toggled.connect(self._set_axes_linked)
 
+        self.chk_region = QCheckBox("Region Stats")
+        self.chk_region.setToolTip(
+            "Drag a window on the phase-voltage plot to measure RMS, mean, extremes and THD"
+        )
+        self.chk_region.setEnabled(False)
+        self.chk_region.toggled.connect(self._set_region_enabled)
+
         self.lbl_time = QLabel("0.00s")
 
         ctrl.addWidget(self.btn_load)
@@ -123,6 +163,7 @@ class ReplayStudio(QWidget):
         ctrl.addWidget(self.btn_play)
         ctrl.addWidget(self.btn_reset_zoom)
         ctrl.addWidget(self.chk_link_axes)
+        ctrl.addWidget(self.chk_region)
         ctrl.addWidget(self.btn_export)
         ctrl.addWidget(self.btn_quick_export)
         ctrl.addWidget(self.lbl_time)
@@ -177,6 +218,34 @@ class ReplayStudio(QWidget):
         self.plot_wave.addLegend()
         wave_layout.addWidget(self.plot_wave, stretch=3)
 
+        # Region metrics (full-resolution stats for the selected window)
+        self._region = pg.LinearRegionItem(
+            values=(0.0, 0.1),
+            brush=pg.mkBrush(56, 189, 248, 40),
+            pen=pg.mkPen('#38bdf8', width=1),
+        )
+        self._region.setVisible(False)
+        self._region.sigRegionChanged.connect(self._on_region_changed)
+        self._region.sigRegionChangeFinished.connect(self._on_region_finished)
+        self._region_index: WindowStatsIndex | None = None
+        self._region_time_offset = 0.0
+        self._region_generation = 0     # bumped whenever the primary session changes
+        self._region_building = False
+        self._region_unavailable = False
+        self._region_index_ready.connect(self._on_region_index_ready)
+        self._region_table = QTableWidget(0, 8)
+        self._region_table.setHorizontalHeaderLabels(
+            ["Channel", "Samples", "Mean", "RMS", "Min", "Max", "P-P", "THD %"]
+        )
+        self._region_table.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Stretch
+        )
+        self._region_table.verticalHeader().setVisible(False)
+        self._region_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self._region_table.setMaximumHeight(150)
+        self._region_table.setVisible(False)
+        wave_layout.addWidget(self._region_table)
+
         self.plot_line = pg.PlotWidget(title="Line-to-Line Voltages")
         self.plot_line.setBackground('#0b0f14')
         self.plot_line.showGrid(x=True, y=True, alpha=0.3)
@@ -461,6 +530,8 @@ class ReplayStudio(QWidget):
         self.plot_wave.addItem(self.scrubber)
         self.plot_wave.addItem(self._crosshair_v, ignoreBounds=True)
         self.plot_wave.addItem(self._crosshair_h, ignoreBounds=True)
+        self.plot_wave.addItem(self._region, ignoreBounds=True)
+        self._reset_region_index()
         self.plot_line.clear()
         self.plot_current.clear()
         self.plot_aux.clear()
@@ -921,6 +992,8 @@ class ReplayStudio(QWidget):
         self.plot_wave.addItem(self.scrubber)
         self.plot_wave.addItem(self._crosshair_v, ignoreBounds=True)
         self.plot_wave.addItem(self._crosshair_h, ignoreBounds=True)
+        self.plot_wave.addItem(self._region, ignoreBounds=True)
+        self._reset_region_index()
         self.plot_line.clear()
         self.plot_current.clear()
         self.plot_aux.clear()
@@ -939,6 +1012,7 @@ class ReplayStudio(QWidget):
         self.tabs.setCurrentIndex(0)
         self._comparison_tab.clear()
         self._event_lane.clear()
+        self.chk_region.setChecked(False)
         self._sync_button_state()
 
     def _sync_button_state(self) -> None:
@@ -955,11 +1029,13 @@ class ReplayStudio(QWidget):
         self.btn_export.setToolTip("" if has else "Load a session first")
         self.btn_quick_export.setEnabled(has)
         self.btn_reset_zoom.setEnabled(has)
+        self.chk_region.setEnabled(has)
 
     def _update_comparison_tab(self) -> None:
         """Auto-populate the Compare tab when two sessions are available."""
         if len(self.sessions) >= 2:
             self._comparison_tab.set_sessions(self.sessions[0], self.sessions[1])
+            self._comparison_tab.set_candidate_sessions(self.sessions[1:])
         else:
             self._comparison_tab.clear()
 
@@ -993,6 +1069,15 @@ class ReplayStudio(QWidget):
         """Run metrics computation in a daemon thread; deliver result via Qt signal."""
         label = session.get('label', '')
         data = session.get('data', {})
+        cache = default_analysis_cache()
+
+        cached = cache.load_metrics(data)
+        if cached is not None:
+            logger.info("metrics.cache.hit: %s", label)
+            self._on_bg_analysis_ready(
+                {'summary': cached, 'rows': build_metric_rows(cached)}, label
+            )
+            return
 
         def _worker():
             try:
@@ -1000,6 +1085,7 @@ class ReplayStudio(QWidget):
                 logger.info("metrics.compute.start: %s", label)
                 # Pass events=[] to skip redundant detect_events inside metrics.
                 summary = compute_session_metrics(data, events=[])
+                cache.store_metrics(data, summary)
                 rows = build_metric_rows(summary)
                 logger.info("metrics.compute.end: %s (%.3fs)", label, time.perf_counter() - t0)
                 try:
@@ -1015,6 +1101,13 @@ class ReplayStudio(QWidget):
         """Run event detection in a daemon thread; deliver result via Qt signal."""
         label = session.get('label', '')
         dataset = session.get('_dataset')
+        cache = default_analysis_cache()
+
+        cached = cache.load_events(session.get('data', {}), max_samples=_EVENT_MAX_SAMPLES)
+        if cached is not None:
+            logger.info("event_detection.cache.hit: %s", label)
+            self._on_bg_events_ready(cached, label)
+            return
 
         def _worker():
             try:
@@ -1034,8 +1127,10 @@ class ReplayStudio(QWidget):
                             pass
                         return
                 # Cap to avoid multi-second FFT / corrcoef on full-resolution arrays.
-                ds = _cap_dataset_for_events(ds, max_samples=50_000)
-                events = detect_events(ds)
+                capped = _cap_dataset_for_events(ds, max_samples=_EVENT_MAX_SAMPLES)
+                events = detect_events(capped)
+                # Stored under the cap, apart from any full-resolution events
+                cache.store_events(session.get('data', {}), events, max_samples=_EVENT_MAX_SAMPLES)
                 logger.info(
                     "event_detection.end: %s (%.3fs) \u2014 %d events",
                     label, time.perf_counter() - t0, len(events),
@@ -1244,31 +1339,35 @@ class ReplayStudio(QWidget):
             return
         capsule = primary.get('data', {})
         events = primary.get('_events', [])
-        try:
-            from src.session_exporter import quick_export
-            result = quick_export(
-                capsule,
-                events=events,
-                compliance_results=None,
-                base_dir="artifacts/evidence_exports",
-            )
-            export_dir = result["export_dir"]
-            artifact_lines = "\n".join(
-                f"  {a['name']}: {a['size_bytes']:,} bytes"
-                for a in result["artifacts"]
-            )
-            from PyQt6.QtWidgets import QMessageBox
-            msg = QMessageBox(self)
-            msg.setWindowTitle("Quick Export Complete")
-            msg.setText(
-                f"Evidence package exported to:\n{export_dir}\n\n"
-                f"Artifacts ({len(result['artifacts'])}):\n{artifact_lines}\n\n"
-                f"Total: {result['total_bytes']:,} bytes"
-            )
-            msg.setIcon(QMessageBox.Icon.Information)
-            msg.exec()
-        except Exception as exc:
-            logger.error(f"Quick export failed: {exc}")
+        from src.session_exporter import quick_export
+
+        if getattr(self, '_export_runner', None) is None:
+            self._export_runner = ExportRunner(self)
+            self._export_runner.finished.connect(self._on_quick_export_finished)
+            self._export_runner.failed.connect(self._on_quick_export_failed)
+        if not self._export_runner.start(
+            quick_export,
+            capsule=capsule,
+            events=events,
+            compliance_results=None,
+            base_dir="artifacts/evidence_exports",
+        ):
+            return
+        self.btn_quick_export.setEnabled(False)
+        attach_progress_dialog(self, self._export_runner, "Exporting evidence package…")
+
+    def _on_quick_export_finished(self, result: dict) -> None:
+        self.btn_quick_export.setEnabled(bool(self.sessions))
+        from PyQt6.QtWidgets import QMessageBox
+        msg = QMessageBox(self)
+        msg.setWindowTitle("Quick Export Complete")
+        msg.setText(quick_export_summary(result))
+        msg.setIcon(QMessageBox.Icon.Information)
+        msg.exec()
+
+    def _on_quick_export_failed(self, message: str) -> None:
+        self.btn_quick_export.setEnabled(bool(self.sessions))
+        logger.error(f"Quick export failed: {message}")
 
     def _export_plot(self):
         if not self.sessions:
@@ -1324,6 +1423,128 @@ class ReplayStudio(QWidget):
 
     # ── Interactive analysis tools ─────────────────────────────────────────
 
+    # ── Region metrics ─────────────────────────────────────────────────────
+
+    def _set_region_enabled(self, enabled: bool) -> None:
+        """Show the draggable region and its metrics table."""
+        enabled = bool(enabled) and bool(self.sessions)
+        if enabled:
+            start_s, end_s = self._session_time_range
+            span = max(end_s - start_s, 1e-9)
+            mid = start_s + span / 2.0
+            self._region.setRegion((mid - span * 0.05, mid + span * 0.05))
+        self._region.setVisible(enabled)
+        self._region_table.setVisible(enabled)
+        if enabled:
+            self._on_region_finished()
+        else:
+            self._region_table.setRowCount(0)
+
+    def _reset_region_index(self) -> None:
+        """Drop the window index; a build still running for the old session is ignored."""
+        self._region_index = None
+        self._region_building = False
+        self._region_unavailable = False
+        self._region_generation += 1
+
+    def _start_region_index_build(self) -> None:
+        """Build the window index over the primary session's full-res data on a worker."""
+        if self._region_index is not None or self._region_building or self._region_unavailable:
+            return
+        primary = next((s for s in self.sessions if s.get('is_primary')), None)
+        if primary is None:
+            return
+        self._region_building = True
+        generation = self._region_generation
+
+        def _worker():
+            index, offset = None, 0.0
+            try:
+                index, offset = _build_region_index(primary)
+                index.prepare()
+            except Exception as exc:
+                logger.warning("Region metrics unavailable: %s", exc)
+                index = None
+            try:
+                self._region_index_ready.emit(index, offset, generation)
+            except RuntimeError:
+                pass  # Studio was GC'd before worker finished.
+
+        threading.Thread(target=_worker, daemon=True, name="region-index").start()
+
+    def _on_region_index_ready(self, index, offset: float, generation: int) -> None:
+        if generation != self._region_generation:
+            return  # Stale — primary session changed while building.
+        self._region_building = False
+        self._region_index = index
+        self._region_time_offset = offset
+        self._region_unavailable = index is None
+        if index is None:
+            self._region_table.setRowCount(0)
+        else:
+            self._update_region_table(include_thd=True)
+
+    def _region_channels(self, index: WindowStatsIndex) -> list[str]:
+        preferred = ('v_an', 'v_bn', 'v_cn', 'v_ab', 'v_bc', 'v_ca', 'i_a', 'i_b', 'i_c', 'freq')
+        ordered = [ch for ch in preferred if ch in index.channels]
+        return ordered + sorted(ch for ch in index.channels if ch not in preferred)
+
+    def _on_region_changed(self, *_args) -> None:
+        """Live update while dragging: O(1) stats only, no THD."""
+        self._update_region_table(include_thd=False)
+
+    def _on_region_finished(self, *_args) -> None:
+        self._update_region_table(include_thd=True)
+
+    def _update_region_table(self, include_thd: bool) -> None:
+        if not self._region.isVisible():
+            return
+        index = self._region_index
+        if index is None:
+            self._start_region_index_build()
+            self._region_table.setRowCount(0)
+            if self._region_building:
+                self._region_table.setRowCount(1)
+                self._region_table.setItem(0, 0, QTableWidgetItem("building…"))
+            return
+        x0, x1 = self._region.getRegion()
+        t0 = float(x0) + self._region_time_offset
+        t1 = float(x1) + self._region_time_offset
+        channels = self._region_channels(index)
+        stats = index.window_stats_all(t0, t1, channels)
+
+        def _fmt(value: float) -> str:
+            return "—" if not np.isfinite(value) else f"{value:.4g}"
+
+        self._region_table.setRowCount(len(channels))
+        for row, ch in enumerate(channels):
+            st = stats[ch]
+            thd_text = "—"
+            enough_cycles = (st.t_end - st.t_start) * 60.0 >= _REGION_THD_MIN_CYCLES
+            if include_thd and ch in ('v_an', 'v_bn', 'v_cn') and enough_cycles:
+                t_win, v_win = index.window_slice(ch, t0, t1)
+                if v_win.size > _REGION_THD_MAX_SAMPLES:
+                    t_win = t_win[:_REGION_THD_MAX_SAMPLES]
+                    v_win = v_win[:_REGION_THD_MAX_SAMPLES]
+                try:
+                    thd_text = f"{compute_thd(v_win, time_data=t_win):.2f}"
+                except Exception:
+                    logger.debug("Region THD failed for %s", ch, exc_info=True)
+            elif not include_thd and ch in ('v_an', 'v_bn', 'v_cn'):
+                thd_text = "…"  # recomputed when the drag finishes
+            values = [
+                ch,
+                f"{st.sample_count:,}",
+                _fmt(st.mean),
+                _fmt(st.rms),
+                _fmt(st.min),
+                _fmt(st.max),
+                _fmt(st.peak_to_peak),
+                thd_text,
+            ]
+            for col, text in enumerate(values):
+                self._region_table.setItem(row, col, QTableWidgetItem(text))
+
     def _on_mouse_moved(self, evt):
         """Track crosshair and readout on the Waveforms plot."""
         pos = evt[0]
@@ -5,6 +5,7 @@ import math
 import collections
 from src.signal_processing import compute_rms
 from src.opengl_check import get_opengl_fallback_message
+from src.frame_block import connect_frame_stream
 
 try:
     import pyqtgraph.opengl as gl
@@ -133,7 +134,7 @@ class System3DView(QWidget):
         self._add_text_label("INVERTER\n(VSM)", (-5, 0, 4))
         self._add_text_label("GRID/LOAD", (5, 0, 4))
 
-        self.serial_mgr.frame_received.connect(self._on_frame)
+        connect_frame_stream(self.serial_mgr, self._on_frames)
         if self.scenario_ctrl:
             self.scenario_ctrl.event_triggered.connect(self._on_event)
 
@@ -191,21 +192,20 @@ class System3DView(QWidget):
             self._fault_active = False
             self.inverter_box.setData(color=(0.2, 0.8, 0.2, 1), width=2)
 
-    @pyqtSlot(dict)
-    def _on_frame(self, frame):
+    def _on_frames(self, block):
         # Buffer current values for RMS
-        self._current_bufs['a'].append(frame.get('i_a', 0))
-        self._current_bufs['b'].append(frame.get('i_b', 0))
-        self._current_bufs['c'].append(frame.get('i_c', 0))
-        self._freq_buf.append(frame.get('freq', 60.0))
-        self._power_buf.append(frame.get('p_mech', 0))
-        if 'angle' in frame:
+        self._current_bufs['a'].extend(block.column('i_a', 0).tolist())
+        self._current_bufs['b'].extend(block.column('i_b', 0).tolist())
+        self._current_bufs['c'].extend(block.column('i_c', 0).tolist())
+        self._freq_buf.extend(block.column('freq', 60.0).tolist())
+        self._power_buf.extend(block.column('p_mech', 0).tolist())
+        if 'angle' in block:
             try:
-                self._angle_override = math.radians(float(frame.get('angle')))
+                self._angle_override = math.radians(float(block.last('angle')))
             except Exception:
                 self._angle_override = None
 
-        # Compute RMS currents for wire width
+        # Compute RMS currents for wire width (once per block)
         alpha = 0.15
         for p in ['a', 'b', 'c']:
             rms = compute_rms(list(self._current_bufs[p]))